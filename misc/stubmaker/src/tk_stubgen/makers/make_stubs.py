@@ -1,4 +1,6 @@
+import importlib
 import importlib.util
+import inspect
 import os
 import sys
 import logging
@@ -19,6 +21,7 @@ def make_stubs(
     # Making sure our module is imported from provided src-root even if
     # another version of the module is installed in the system
     override_module_import_path(module_root, src_root)
+    materialize_generated_methods = importlib.import_module(f'{module_root}.util.async_utils').materialize_generated_methods
 
     for module_name, module in traverse_modules(module_root, src_root, skip_modules=skip_modules):
 
@@ -32,6 +35,16 @@ def make_stubs(
         dst_dir = os.path.dirname(dst_path)
         os.makedirs(dst_dir, exist_ok=True)
 
+        # Lazily loaded names (PEP 562) appear in the module's __dict__ only after the first access
+        if hasattr(module, '__getattr__'):
+            for name in getattr(module, '__all__', []):
+                getattr(module, name)
+
+        # Asynchronous client methods are generated on the first access
+        for member in list(vars(module).values()):
+            if inspect.isclass(member) and member.__module__ == module_name:
+                materialize_generated_methods(member)
+
         # Actually creating a file
 
         builder = TolokaKitRepresentationTreeBuilder(
@@ -20,6 +20,7 @@ with open('README.md') as f:
 EXTRAS_REQUIRE = {
     'dev': ['respx', 'aiohttp', 'pytest', 'pytest-lazy-fixture', 'pytest-asyncio', 'pytest-mock'],
     'pandas': ['pandas'],
+    'orjson': ['orjson'],
     'autoquality': ['crowd-kit >= 1.0.0'],
     's3': ['boto3 >= 1.4.7'],
     'zookeeper': ['kazoo >= 2.6.1'],
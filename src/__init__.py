@@ -6,14 +6,23 @@ __all__ = [
     'util',
 ]
 
-from . import async_client
-from . import client
-from . import metrics
-from . import streaming
-from . import util
+import importlib
+import importlib.util
 
-try:
-    from . import autoquality  # noqa: F401
+# Subpackages are imported on the first access to keep `import toloka` fast. Importing `toloka.async_client` pulls in
+# the whole client, and `toloka.autoquality` pulls in scipy and crowd-kit.
+_LAZY_SUBMODULES = frozenset(('async_client', 'autoquality', 'client', 'metrics', 'streaming', 'util'))
+
+if importlib.util.find_spec('crowdkit') is not None:
     __all__.append('autoquality')
-except ImportError:
-    pass
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        # import_module sets the attribute of the package, so __getattr__ is called only once per submodule
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
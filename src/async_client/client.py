@@ -2,30 +2,52 @@ __all__ = [
     'AsyncTolokaClient',
 ]
 import asyncio
+import contextvars
 import datetime
 import functools
+import importlib.util
 import logging
+import os
+import tempfile
 import threading
-from decimal import Decimal
-from typing import Dict, Optional, Callable, List
+import time
+from typing import Any, AsyncGenerator, BinaryIO, Dict, Iterable, Iterator, Optional, Callable, List, Tuple, Union
 
-import attr
 import httpx
+from tqdm import tqdm
 from toloka.client.batch_create_results import FieldValidationError
 
-from ..client import TolokaClient, structure, unstructure
-from ..client.exceptions import (
-    raise_on_api_error,
-    ValidationApiError,
+# pandas is slow to import, so it is imported only when DataFrames are read
+PANDAS_INSTALLED = importlib.util.find_spec('pandas') is not None
+
+from ..client import (
+    _MAX_IDS_PER_WINDOW, _MAX_SESSIONS_WITHOUT_CLEANUP, _POLLING_INTERVAL_MULTIPLIER, _SHARD_PREFETCH_PAGES, TolokaClient,
+    structure, unstructure,
+)
+from ..client._attachments import get_attachment_path, get_partial_path, is_already_downloaded
+from ..client._batching import split_into_chunks
+from ..client._pagination import (
+    aiterate_search_results, aiterate_shards_in_tasks, aprefetch_in_task, make_shard_requests, plan_id_windows,
 )
+from ..client._tsv import read_tsv
+from ..client.assignment import GetAssignmentsTsvParameters
+from ..client.attachment import Attachment
+from ..client.exceptions import ValidationApiError
 from ..client.operations import Operation
+from ..client.primitives.bulk import BulkItemResult, iterate_bulk_results
+from ..client.primitives.instrumentation import get_response_size
 from ..client.primitives.parameter import IdempotentOperationParameters
 from ..client.primitives.retry import AsyncRetryingOverURLLibRetry
-from ..util._managing_headers import add_headers
+from ..client.search_requests import AttachmentSearchRequest
+from ..util._codegen import expand
+from ..util._managing_headers import add_headers, aiterate_in_context, top_level_method_var
 from ..util.async_utils import generate_async_methods_from
 
 logger = logging.getLogger(__name__)
 
+# Downloaded TSV files that are larger than this size are written to disk
+_MAX_IN_MEMORY_TSV_SIZE = 64 * 1024 * 1024
+
 
 @generate_async_methods_from(TolokaClient)
 class AsyncTolokaClient:
@@ -41,9 +63,11 @@ class AsyncTolokaClient:
         *args, **kwargs
     ):
         self._sync_client = TolokaClient(*args, **kwargs)
+        self._sessions: Dict[Tuple[int, int], httpx.AsyncClient] = {}
         self.retrying = AsyncRetryingOverURLLibRetry(
             base_url=str(self._session.base_url), retry=self._sync_client.retryer_factory(), reraise=True,
-            exception_to_retry=self.EXCEPTIONS_TO_RETRY,
+            exception_to_retry=self.EXCEPTIONS_TO_RETRY, hooks=self._sync_client.hooks,
+            rate_limiter=self._sync_client.rate_limiter,
         )
 
     def __getattr__(self, name):
@@ -53,17 +77,49 @@ class AsyncTolokaClient:
         return getattr(self._sync_client, name)
 
     def __getstate__(self):
-        return self.__dict__
+        state = self.__dict__.copy()
+        del state['_sessions']
+        return state
 
     def __setstate__(self, state):
         self.__dict__ = state
+        self._sessions = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes HTTP sessions and releases all connections.
+
+        Sessions that belong to other event loops can't be closed from the current one, so they are just dropped.
+        The client remains usable after closing: new sessions are opened on the next request.
+
+        Example:
+            >>> async with toloka.async_client.AsyncTolokaClient(token, 'PRODUCTION') as toloka_client:
+            >>>     print((await toloka_client.get_requester()).balance)
+            ...
+        """
+        await self._close_sessions()
+        self._sync_client.close()
+
+    async def _close_sessions(self) -> None:
+        event_loop_id = id(asyncio.get_event_loop())
+        sessions, self._sessions = self._sessions, {}
+        for (_, session_event_loop_id), session in sessions.items():
+            if session_event_loop_id == event_loop_id:
+                await session.aclose()
 
     @classmethod
     def from_sync_client(cls, client: TolokaClient) -> 'AsyncTolokaClient':
         async_client = cls.__new__(cls)
         async_client.__init__(
-            token=client.token, url=client.url, retries=client.retryer_factory(), timeout=client.default_timeout,
+            token=client.token, url=client.url, retryer_factory=client.retryer_factory, timeout=client.default_timeout,
             act_under_account_id=client.act_under_account_id, retry_quotas=None, verify=client.verify,
+            limits=client.limits, http2=client.http2, share_session=client.share_session, hooks=client.hooks,
+            transport=client.transport,
         )
         async_client._sync_client = client
         return async_client
@@ -72,41 +128,230 @@ class AsyncTolokaClient:
     def sync_client(self) -> TolokaClient:
         return self._sync_client
 
-    @functools.lru_cache(maxsize=128)
     def _session_for_thread_for_event_loop(self, thread_id: int, event_loop_id: int) -> httpx.AsyncClient:
-        client = httpx.AsyncClient(headers=self._headers, base_url=self.url, verify=self.verify)
-        return client
+        session = self._sessions.get((thread_id, event_loop_id))
+        if session is None:
+            if len(self._sessions) >= _MAX_SESSIONS_WITHOUT_CLEANUP:
+                # Sessions of finished threads can't be closed since their event loops are finished too
+                alive_thread_ids = {thread.ident for thread in threading.enumerate()}
+                self._sessions = {key: value for key, value in self._sessions.items() if key[0] in alive_thread_ids}
+            session = self._sessions[thread_id, event_loop_id] = httpx.AsyncClient(
+                headers=self._headers, base_url=self.url, verify=self.verify, http2=self.http2,
+                **({} if self.limits is None else {'limits': self.limits}),
+                **({} if self.transport is None else {'transport': self.transport}),
+            )
+        return session
 
     @property
     def _session(self):
         event_loop_id = id(asyncio.get_event_loop())
         return self._session_for_thread_for_event_loop(threading.current_thread().ident, event_loop_id)
 
-    async def _do_request_with_retries(self, method, path, **kwargs):
+    async def _do_request_with_retries(self, method, path, stream=False, **kwargs):
         @self.retrying.wraps
         async def wrapped(method, path, **kwargs):
-            response = await self._session.request(method, path, **kwargs)
-            raise_on_api_error(response)
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve(path)
+                if delay:
+                    await asyncio.sleep(delay)
+            request = self._session.build_request(method, path, **kwargs)
+            if self.hooks is None:
+                response = await self._session.send(request, stream=stream)
+            else:
+                response = await self._send_with_hooks(request, stream)
+            if stream and response.is_error:
+                await response.aread()
+            await self._raise_on_api_error(path, response)
             return response
 
         return await wrapped(method, path, **kwargs)
 
+    async def _send_with_hooks(self, request: httpx.Request, stream: bool) -> httpx.Response:
+        path = request.url.path
+        top_level_method = top_level_method_var.get(None)
+        self.hooks.on_request(
+            method=request.method, path=path, top_level_method=top_level_method,
+            bytes_out=int(request.headers.get('Content-Length', 0)),
+        )
+        response = None
+        start = time.perf_counter()
+        try:
+            response = await self._session.send(request, stream=stream)
+        finally:
+            self.hooks.on_response(
+                method=request.method, path=path, top_level_method=top_level_method,
+                status_code=None if response is None else response.status_code,
+                latency=time.perf_counter() - start, bytes_in=get_response_size(response),
+            )
+        return response
+
+    async def _structure(self, data, result_type, structure_func=structure):
+        return self._sync_client._structure(data, result_type, structure_func=structure_func)
+
     async def _request(self, method, path, **kwargs):
-        return (await self._raw_request(method, path, **kwargs)).json(parse_float=Decimal)
+        return self.json_codec.loads((await self._raw_request(method, path, **kwargs)).content)
+
+    if PANDAS_INSTALLED:
+        @expand('parameters')
+        @add_headers('async_client')
+        async def get_assignments_df(
+            self,
+            pool_id: str,
+            parameters: GetAssignmentsTsvParameters,
+            *,
+            chunksize: Optional[int] = None,
+            dtype: Union[None, str, Dict[str, str]] = None,
+        ) -> Union['pandas.DataFrame', Iterator['pandas.DataFrame']]:
+            """Asynchronous version of get_assignments_df
+
+            The response is downloaded to a temporary file first, so large pools are spilled to disk instead of memory.
+            Then the file is parsed as in the synchronous version.
+            """
+            logger.warning('Experimental method')
+            response = await self._raw_request('get', f'/new/requester/pools/{pool_id}/assignments.tsv',
+                                               params=unstructure(parameters), stream=True)
+            file = tempfile.SpooledTemporaryFile(max_size=_MAX_IN_MEMORY_TSV_SIZE)
+            try:
+                async for data in response.aiter_bytes():
+                    file.write(data)
+            except BaseException:
+                file.close()
+                raise
+            finally:
+                await response.aclose()
+            file.seek(0)
+            return read_tsv(file, chunksize, dtype, file.close)
+
+    @add_headers('async_client')
+    async def download_attachment(self, attachment_id: str, out: BinaryIO) -> None:
+        """Asynchronous version of download_attachment"""
+        response = await self._raw_request('get', f'/v1/attachments/{attachment_id}/download', stream=True)
+        try:
+            async for chunk in response.aiter_bytes():
+                out.write(chunk)
+        finally:
+            await response.aclose()
+
+    async def _download_attachment_to_dir(self, attachment: Attachment, target_dir: str) -> str:
+        path = get_attachment_path(attachment, target_dir)
+        response = await self._raw_request('get', f'/v1/attachments/{attachment.id}/download', stream=True)
+        try:
+            if is_already_downloaded(path, response):
+                return path
+            partial_path = get_partial_path(path)
+            with open(partial_path, 'wb') as out:
+                async for chunk in response.aiter_bytes():
+                    out.write(chunk)
+            os.replace(partial_path, path)
+        finally:
+            await response.aclose()
+        return path
+
+    @expand('request')
+    @add_headers('async_client')
+    async def download_attachments(
+        self,
+        request: AttachmentSearchRequest,
+        *,
+        target_dir: str,
+        concurrency: int = 8,
+        disable_progress: bool = False,
+    ) -> List[str]:
+        """Asynchronous version of download_attachments"""
+        os.makedirs(target_dir, exist_ok=True)
+        paths = []
+        pending = {}
+
+        async def collect_finished():
+            finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for download_task in finished:
+                paths[pending.pop(download_task)] = download_task.result()
+                progress_bar.update(1)
+
+        with tqdm(unit='file', disable=disable_progress) as progress_bar:
+            try:
+                # Attachments are taken from the listing only when there is room for a new download
+                async for attachment in self.get_attachments(request):
+                    if len(pending) >= concurrency:
+                        await collect_finished()
+                    pending[asyncio.ensure_future(self._download_attachment_to_dir(attachment, target_dir))] = len(paths)
+                    paths.append(None)
+                while pending:
+                    await collect_finished()
+            finally:
+                for download_task in pending:
+                    download_task.cancel()
+        return paths
+
+    @add_headers('async_client')
+    async def bulk(
+        self,
+        method: Union[str, Callable],
+        kwargs_iterable: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = False,
+        return_exceptions: bool = False,
+        disable_progress: bool = False,
+    ) -> AsyncGenerator[BulkItemResult, None]:
+        """Asynchronous version of bulk
+
+        `method` may also be any coroutine function.
+
+        Example:
+            >>> async for item in toloka_client.bulk(
+            >>>     toloka_client.reject_assignment,
+            >>>     ({'assignment_id': assignment_id, 'public_comment': 'Wrong answers'} for assignment_id in assignment_ids),
+            >>>     concurrency=16,
+            >>>     ordered=True,
+            >>> ):
+            >>>     print(item.index, item.result.status)
+            ...
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        total = len(kwargs_iterable) if hasattr(kwargs_iterable, '__len__') else None
+        with tqdm(total=total, unit='call', disable=disable_progress) as progress_bar:
+            async for item in iterate_bulk_results(method, kwargs_iterable, concurrency, ordered, return_exceptions):
+                progress_bar.update(1)
+                yield item
 
     async def _find_all(self, find_function, request, sort_field: str = 'id',
-                        items_field: str = 'items', batch_size: Optional[int] = None):
-        result = await find_function(request, sort=[sort_field], limit=batch_size)
-        items = getattr(result, items_field)
-        while result.has_more:
-            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
+                        items_field: str = 'items', batch_size: Optional[int] = None,
+                        parallelism: Optional[int] = None, prefetch_pages: Optional[int] = None):
+        # Pages are fetched in the context of the first step, so their requests keep the headers of the calling method
+        # wherever the items are consumed. The context is switched once per page, not once per item
+        ctx = contextvars.copy_context()
+        if parallelism and parallelism > 1:
+            result = await find_function(request, sort=[sort_field], limit=batch_size)
+            items = getattr(result, items_field)
+            if not result.has_more:
+                for item in items:
+                    yield item
+                return
+            # The last item is probed to split the remaining range into shards that are fetched concurrently
+            last_item = getattr(await find_function(request, sort=[f'-{sort_field}'], limit=1), items_field)[-1]
+            shard_requests = make_shard_requests(
+                request, sort_field, getattr(items[-1], sort_field), getattr(last_item, sort_field), parallelism,
+            )
             for item in items:
                 yield item
-            result = await find_function(request, sort=[sort_field])
-            items = getattr(result, items_field)
-
-        for item in items:
-            yield item
+            results = aiterate_shards_in_tasks(
+                functools.partial(
+                    aiterate_search_results, find_function, sort_field=sort_field, items_field=items_field,
+                    batch_size=batch_size,
+                ),
+                shard_requests,
+                max_workers=parallelism,
+                depth=prefetch_pages or _SHARD_PREFETCH_PAGES,
+            )
+        else:
+            results = aiterate_search_results(find_function, request, sort_field, items_field, batch_size)
+            if prefetch_pages:
+                results = aprefetch_in_task(results, prefetch_pages)
+        async for result in aiterate_in_context(ctx, results):
+            for item in getattr(result, items_field):
+                yield item
 
     @add_headers('async_client')
     async def wait_operation(
@@ -136,6 +381,73 @@ class AsyncTolokaClient:
             if datetime.datetime.now(datetime.timezone.utc) > wait_until_time:
                 raise TimeoutError
 
+    @add_headers('async_client')
+    async def wait_operations(
+        self,
+        ops: List[Operation],
+        timeout: datetime.timedelta = datetime.timedelta(minutes=10),
+        polling_interval: datetime.timedelta = datetime.timedelta(milliseconds=500),
+        max_polling_interval: datetime.timedelta = datetime.timedelta(seconds=30),
+        batch_status_checks: bool = False,
+    ) -> AsyncGenerator[Operation, None]:
+        """Asynchronous version of wait_operations"""
+        pending = {}
+        for op in ops:
+            if op.is_completed():
+                yield op
+            else:
+                pending[op.id] = op
+
+        initial_polling_interval = polling_interval
+        wait_until_time = datetime.datetime.now(datetime.timezone.utc) + timeout
+        while pending:
+            await asyncio.sleep(polling_interval.total_seconds())
+            completed_count = 0
+            for op in await self._poll_operations(pending, batch_status_checks):
+                if op.is_completed():
+                    del pending[op.id]
+                    completed_count += 1
+                    yield op
+            if not pending:
+                return
+            if datetime.datetime.now(datetime.timezone.utc) > wait_until_time:
+                raise TimeoutError
+            if completed_count:
+                polling_interval = initial_polling_interval
+            else:
+                polling_interval = min(polling_interval * _POLLING_INTERVAL_MULTIPLIER, max_polling_interval)
+
+    async def _start_sync_via_async(
+        self,
+        objects,
+        parameters: IdempotentOperationParameters,
+        url: str,
+        operation_type: Operation,
+        chunk_size: Optional[int] = None,
+        max_concurrent_operations: int = 1,
+    ) -> List[Operation]:
+        # Index objects to restore sequence in the future
+        is_single = not isinstance(objects, list)
+        if is_single:
+            objects._unexpected = {**objects._unexpected, '__item_idx': '0'}
+        else:
+            for item_idx, obj in enumerate(objects):
+                obj._unexpected = {**obj._unexpected, '__item_idx': str(item_idx)}
+
+        chunks = [(objects, parameters)] if is_single else split_into_chunks(objects, parameters, chunk_size)
+        semaphore = asyncio.Semaphore(max_concurrent_operations)
+
+        async def create_chunk(chunk, chunk_parameters):
+            async with semaphore:
+                insert_operation = await self._async_create_objects_idempotent(
+                    url, chunk, chunk_parameters, operation_type,
+                )
+                return await self.wait_operation(insert_operation, datetime.timedelta(minutes=60))
+
+        return list(await asyncio.gather(
+            *(create_chunk(chunk, chunk_parameters) for chunk, chunk_parameters in chunks)
+        ))
+
     async def _sync_via_async_pool_related(
             self,
             objects,
@@ -145,25 +457,35 @@ class AsyncTolokaClient:
             operation_type: Operation,
             output_id_field: str,
             get_method: Callable,
+            chunk_size: Optional[int] = None,
+            max_concurrent_operations: int = 1,
+            ids_only: bool = False,
     ):
+        if ids_only:
+            return await self._create_ids_via_async(
+                objects, parameters, url, operation_type, output_id_field, chunk_size, max_concurrent_operations,
+            )
         if not parameters.async_mode:
             response = await self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
+            return await self._structure(response, result_type)
         is_single = not isinstance(objects, list)
-        insert_operation = await self._start_sync_via_async(objects, parameters, url, operation_type)
+        insert_operations = await self._start_sync_via_async(
+            objects, parameters, url, operation_type, chunk_size, max_concurrent_operations,
+        )
 
         pools = {}
         validation_errors = {}
-        for log_item in await self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
-            else:
-                continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
-                numerated_ids[log_item.output[output_id_field]] = index
-            else:
-                validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
+        for insert_operation in insert_operations:
+            for log_item in await self.get_operation_log(insert_operation.id):
+                if '__item_idx' in log_item.input:
+                    index = log_item.input['__item_idx']
+                else:
+                    continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
+                if log_item.success:
+                    numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
+                    numerated_ids[log_item.output[output_id_field]] = index
+                else:
+                    validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
 
         # Like in sync methods Exception will raise
         # even if the skip_invalid_items=True but no objects are created
@@ -185,16 +507,28 @@ class AsyncTolokaClient:
     async def _collect_from_pools(self, get_method, pools):
         items = {}
         for pool_id, numerated_ids in pools.items():
-            obj_it = get_method(
-                pool_id=pool_id,
-                id_gte=min(numerated_ids.keys()),
-                id_lte=max(numerated_ids.keys()),
-            )
-            async for obj in obj_it:
-                if obj.id in numerated_ids:
-                    items[numerated_ids[obj.id]] = obj
+            for obj_id, obj in (await self._get_by_ids(get_method, numerated_ids, pool_id=pool_id)).items():
+                items[numerated_ids[obj_id]] = obj
         return items
 
+    async def _get_by_ids(
+        self, get_method, ids: Iterable[str], batch_size: Optional[int] = None, concurrency: int = 1, **filters,
+    ) -> Dict[str, Any]:
+        ids = set(ids)
+        batch_size = batch_size or _MAX_IDS_PER_WINDOW
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_window(window):
+            async with semaphore:
+                return [
+                    obj async for obj in get_method(id_gte=window[0], id_lte=window[1], batch_size=batch_size, **filters)
+                    if obj.id in ids
+                ]
+
+        windows = plan_id_windows(ids, max_ids_per_window=batch_size)
+        window_objects = await asyncio.gather(*(fetch_window(window) for window in windows))
+        return {obj.id: obj for objects in window_objects for obj in objects}
+
     async def _sync_via_async(
             self,
             objects: List,
@@ -204,24 +538,34 @@ class AsyncTolokaClient:
             operation_type: Operation,
             output_id_field: str,
             get_method: Callable,
+            chunk_size: Optional[int] = None,
+            max_concurrent_operations: int = 1,
+            ids_only: bool = False,
     ):
+        if ids_only:
+            return await self._create_ids_via_async(
+                objects, parameters, url, operation_type, output_id_field, chunk_size, max_concurrent_operations,
+            )
         if not parameters.async_mode:
             response = await self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
+            return await self._structure(response, result_type)
         is_single = not isinstance(objects, list)
-        insert_operation = await self._start_sync_via_async(objects, parameters, url, operation_type)
+        insert_operations = await self._start_sync_via_async(
+            objects, parameters, url, operation_type, chunk_size, max_concurrent_operations,
+        )
 
         item_id_to_idx = {}
         validation_errors = {}
-        for log_item in await self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
-            else:
-                continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                item_id_to_idx[log_item.output[output_id_field]] = index
-            else:
-                validation_errors[index] = log_item.output
+        for insert_operation in insert_operations:
+            for log_item in await self.get_operation_log(insert_operation.id):
+                if '__item_idx' in log_item.input:
+                    index = log_item.input['__item_idx']
+                else:
+                    continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
+                if log_item.success:
+                    item_id_to_idx[log_item.output[output_id_field]] = index
+                else:
+                    validation_errors[index] = log_item.output
 
         # Like as in sync methods Exception will raise
         # even if the skip_invalid_items=True but no objects are created
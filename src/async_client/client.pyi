@@ -3,7 +3,7 @@ __all__ = [
 ]
 import datetime
 import decimal
-import pandas
+import httpx
 import ssl
 import toloka.client
 import toloka.client.aggregation
@@ -19,7 +19,13 @@ import toloka.client.operation_log
 import toloka.client.operations
 import toloka.client.owner
 import toloka.client.pool
+import toloka.client.primitives.bulk
+import toloka.client.primitives.instrumentation
+import toloka.client.primitives.json_codec
+import toloka.client.primitives.rate_limiter
+import toloka.client.primitives.response_cache
 import toloka.client.project
+import toloka.client.record_batch
 import toloka.client.requester
 import toloka.client.search_requests
 import toloka.client.search_results
@@ -55,7 +61,16 @@ class AsyncTolokaClient:
         retry_quotas: typing.Union[typing.List[str], str, None] = 'MIN',
         retryer_factory: typing.Optional[typing.Callable[[], urllib3.util.retry.Retry]] = None,
         act_under_account_id: typing.Optional[str] = None,
-        verify: typing.Union[str, bool, ssl.SSLContext] = True
+        verify: typing.Union[str, bool, ssl.SSLContext] = True,
+        rate_limiter: typing.Optional[toloka.client.primitives.rate_limiter.RateLimiter] = None,
+        limits: typing.Optional[httpx.Limits] = None,
+        http2: bool = False,
+        share_session: bool = False,
+        cache: typing.Optional[toloka.client.primitives.response_cache.ResponseCache] = None,
+        json_codec: typing.Optional[toloka.client.primitives.json_codec.JsonCodec] = None,
+        lazy_search_results: bool = False,
+        hooks: typing.Optional[toloka.client.primitives.instrumentation.ClientHooks] = None,
+        transport: typing.Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None
     ): ...
 
     def __getattr__(self, name):
@@ -65,13 +80,139 @@ class AsyncTolokaClient:
         """
         ...
 
-    def __getstate__(self): ...
-
     def __setstate__(self, state): ...
 
+    async def __aenter__(self): ...
+
+    async def __aexit__(self, *exc_info): ...
+
+    async def close(self) -> None:
+        """Closes HTTP sessions and releases all connections.
+
+        Sessions that belong to other event loops can't be closed from the current one, so they are just dropped.
+        The client remains usable after closing: new sessions are opened on the next request.
+
+        Example:
+            >>> async with toloka.async_client.AsyncTolokaClient(token, 'PRODUCTION') as toloka_client:
+            >>>     print((await toloka_client.get_requester()).balance)
+            ...
+        """
+        ...
+
     @classmethod
     def from_sync_client(cls, client: toloka.client.TolokaClient) -> 'AsyncTolokaClient': ...
 
+    @typing.overload
+    async def get_assignments_df(
+        self,
+        pool_id: str,
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        chunksize: typing.Optional[int] = None,
+        dtype: typing.Union[None, str, typing.Dict[str, str]] = None
+    ) -> typing.Union['pandas.DataFrame', typing.Iterator['pandas.DataFrame']]:
+        """Asynchronous version of get_assignments_df
+
+        The response is downloaded to a temporary file first, so large pools are spilled to disk instead of memory.
+        Then the file is parsed as in the synchronous version.
+        """
+        ...
+
+    @typing.overload
+    async def get_assignments_df(
+        self,
+        pool_id: str,
+        *,
+        status: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Status]] = ...,
+        start_time_from: typing.Optional[datetime.datetime] = None,
+        start_time_to: typing.Optional[datetime.datetime] = None,
+        exclude_banned: typing.Optional[bool] = None,
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        chunksize: typing.Optional[int] = None,
+        dtype: typing.Union[None, str, typing.Dict[str, str]] = None
+    ) -> typing.Union['pandas.DataFrame', typing.Iterator['pandas.DataFrame']]:
+        """Asynchronous version of get_assignments_df
+
+        The response is downloaded to a temporary file first, so large pools are spilled to disk instead of memory.
+        Then the file is parsed as in the synchronous version.
+        """
+        ...
+
+    async def download_attachment(
+        self,
+        attachment_id: str,
+        out: typing.BinaryIO
+    ) -> None:
+        """Asynchronous version of download_attachment
+        """
+        ...
+
+    @typing.overload
+    async def download_attachments(
+        self,
+        request: toloka.client.search_requests.AttachmentSearchRequest,
+        *,
+        target_dir: str,
+        concurrency: int = 8,
+        disable_progress: bool = False
+    ) -> typing.List[str]:
+        """Asynchronous version of download_attachments
+        """
+        ...
+
+    @typing.overload
+    async def download_attachments(
+        self,
+        name: typing.Optional[str] = None,
+        type: typing.Optional[toloka.client.attachment.Attachment.Type] = None,
+        user_id: typing.Optional[str] = None,
+        assignment_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        owner_id: typing.Optional[str] = None,
+        owner_company_id: typing.Optional[str] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        target_dir: str,
+        concurrency: int = 8,
+        disable_progress: bool = False
+    ) -> typing.List[str]:
+        """Asynchronous version of download_attachments
+        """
+        ...
+
+    def bulk(
+        self,
+        method: typing.Union[str, typing.Callable],
+        kwargs_iterable: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = False,
+        return_exceptions: bool = False,
+        disable_progress: bool = False
+    ) -> typing.AsyncGenerator[toloka.client.primitives.bulk.BulkItemResult, None]:
+        """Asynchronous version of bulk
+
+        `method` may also be any coroutine function.
+
+        Example:
+            >>> async for item in toloka_client.bulk(
+            >>>     toloka_client.reject_assignment,
+            >>>     ({'assignment_id': assignment_id, 'public_comment': 'Wrong answers'} for assignment_id in assignment_ids),
+            >>>     concurrency=16,
+            >>>     ordered=True,
+            >>> ):
+            >>>     print(item.index, item.result.status)
+            ...
+        """
+        ...
+
     async def wait_operation(
         self,
         op: toloka.client.operations.Operation,
@@ -82,6 +223,18 @@ class AsyncTolokaClient:
         """
         ...
 
+    def wait_operations(
+        self,
+        ops: typing.List[toloka.client.operations.Operation],
+        timeout: datetime.timedelta = ...,
+        polling_interval: datetime.timedelta = ...,
+        max_polling_interval: datetime.timedelta = ...,
+        batch_status_checks: bool = False
+    ) -> typing.AsyncGenerator[toloka.client.operations.Operation, None]:
+        """Asynchronous version of wait_operations
+        """
+        ...
+
     @typing.overload
     async def aggregate_solutions_by_pool(self, request: toloka.client.aggregation.PoolAggregatedSolutionRequest) -> toloka.client.operations.AggregatedSolutionOperation:
         """Starts aggregation of responses in all completed tasks in a pool.
@@ -533,7 +686,9 @@ class AsyncTolokaClient:
     def get_assignments(
         self,
         request: toloka.client.search_requests.AssignmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.assignment.Assignment, None]:
         """Finds all assignments that match certain criteria.
 
@@ -544,6 +699,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned assignments limit for each request. The default batch_size  is 50. The maximum allowed batch_size  is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Assignment: The next matching assignment.
@@ -594,7 +751,9 @@ class AsyncTolokaClient:
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.assignment.Assignment, None]:
         """Finds all assignments that match certain criteria.
 
@@ -605,6 +764,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned assignments limit for each request. The default batch_size  is 50. The maximum allowed batch_size  is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Assignment: The next matching assignment.
@@ -619,6 +780,115 @@ class AsyncTolokaClient:
         """
         ...
 
+    async def get_assignments_by_ids(
+        self,
+        assignment_ids: typing.Iterable[str],
+        batch_size: typing.Optional[int] = None,
+        concurrency: int = 4
+    ) -> typing.Dict[str, toloka.client.assignment.Assignment]:
+        """Gets assignments with specified IDs.
+
+        IDs are sorted and grouped into ranges of close IDs. Assignments from every range are fetched with a single
+        search request or a few requests, so it is much faster than calling `get_assignment` for every ID.
+
+        Args:
+            assignment_ids: IDs of assignments.
+            batch_size: The maximum number of requested IDs in a range. It is also used as a limit of every search request. The maximum allowed batch_size is 100,000. Default: `None` (ranges contain up to 1,000 requested IDs).
+            concurrency: The number of ranges that are fetched concurrently. Default: `4`.
+
+        Returns:
+            Dict[str, Assignment]: Found assignments by their IDs. Assignments that are not found are missing.
+
+        Example:
+            >>> assignments = toloka_client.get_assignments_by_ids(['00001092da--61ef030400c684132d0da0de', '00001092da--61ef030400c684132d0da0df'])
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_table(
+        self,
+        request: toloka.client.search_requests.AssignmentSearchRequest,
+        batch_size: typing.Optional[int] = None
+    ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.record_batch.RecordBatch, None]:
+        """Finds all assignments that match certain criteria and returns them in a columnar layout.
+
+        Every page of search results is converted to a `RecordBatch` straight from the API response, without creating
+        `Assignment` objects. Every task of an assignment makes a row. Columns are described in
+        [RecordBatch.from_assignments](toloka.client.record_batch.RecordBatch.from_assignments.md).
+
+        Args:
+            request: Search criteria.
+            batch_size: Returned assignments limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+
+        Yields:
+            RecordBatch: Assignments from the next page of search results.
+
+        Example:
+            >>> batches = toloka_client.get_assignments_table(pool_id='1', status='ACCEPTED', batch_size=100000)
+            >>> df = toloka.client.record_batch.RecordBatch.concat(batches).to_pandas()
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_table(
+        self,
+        status: typing.Union[str, toloka.client.assignment.Assignment.Status, typing.List[typing.Union[str, toloka.client.assignment.Assignment.Status]]] = None,
+        task_id: typing.Optional[str] = None,
+        task_suite_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        user_id: typing.Optional[str] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        submitted_lt: typing.Optional[datetime.datetime] = None,
+        submitted_lte: typing.Optional[datetime.datetime] = None,
+        submitted_gt: typing.Optional[datetime.datetime] = None,
+        submitted_gte: typing.Optional[datetime.datetime] = None,
+        accepted_lt: typing.Optional[datetime.datetime] = None,
+        accepted_lte: typing.Optional[datetime.datetime] = None,
+        accepted_gt: typing.Optional[datetime.datetime] = None,
+        accepted_gte: typing.Optional[datetime.datetime] = None,
+        rejected_lt: typing.Optional[datetime.datetime] = None,
+        rejected_lte: typing.Optional[datetime.datetime] = None,
+        rejected_gt: typing.Optional[datetime.datetime] = None,
+        rejected_gte: typing.Optional[datetime.datetime] = None,
+        skipped_lt: typing.Optional[datetime.datetime] = None,
+        skipped_lte: typing.Optional[datetime.datetime] = None,
+        skipped_gt: typing.Optional[datetime.datetime] = None,
+        skipped_gte: typing.Optional[datetime.datetime] = None,
+        expired_lt: typing.Optional[datetime.datetime] = None,
+        expired_lte: typing.Optional[datetime.datetime] = None,
+        expired_gt: typing.Optional[datetime.datetime] = None,
+        expired_gte: typing.Optional[datetime.datetime] = None,
+        batch_size: typing.Optional[int] = None
+    ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.record_batch.RecordBatch, None]:
+        """Finds all assignments that match certain criteria and returns them in a columnar layout.
+
+        Every page of search results is converted to a `RecordBatch` straight from the API response, without creating
+        `Assignment` objects. Every task of an assignment makes a row. Columns are described in
+        [RecordBatch.from_assignments](toloka.client.record_batch.RecordBatch.from_assignments.md).
+
+        Args:
+            request: Search criteria.
+            batch_size: Returned assignments limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+
+        Yields:
+            RecordBatch: Assignments from the next page of search results.
+
+        Example:
+            >>> batches = toloka_client.get_assignments_table(pool_id='1', status='ACCEPTED', batch_size=100000)
+            >>> df = toloka.client.record_batch.RecordBatch.concat(batches).to_pandas()
+            ...
+        """
+        ...
+
     @typing.overload
     async def patch_assignment(
         self,
@@ -786,7 +1056,9 @@ class AsyncTolokaClient:
     def get_attachments(
         self,
         request: toloka.client.search_requests.AttachmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.attachment.Attachment, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -797,6 +1069,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned attachments limit for each request. The maximum allowed batch_size is 100.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Attachment: The next matching attachment.
@@ -827,7 +1101,9 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.attachment.Attachment, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -838,6 +1114,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned attachments limit for each request. The maximum allowed batch_size is 100.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Attachment: The next matching attachment.
@@ -850,39 +1128,19 @@ class AsyncTolokaClient:
         """
         ...
 
-    async def download_attachment(
-        self,
-        attachment_id: str,
-        out: typing.BinaryIO
-    ) -> None:
-        """Downloads specific attachment
-
-        Args:
-            attachment_id: ID of attachment.
-            out: File object where to put downloaded file.
-
-        Example:
-            How to download an attachment.
-
-            >>> with open('my_new_file.txt', 'wb') as out_f:
-            >>>     toloka_client.download_attachment(attachment_id='1', out=out_f)
-            ...
-        """
-        ...
-
     async def add_message_thread_to_folders(
         self,
         message_thread_id: str,
         folders: typing.Union[typing.List[typing.Union[toloka.client.message_thread.Folder, str]], toloka.client.message_thread.MessageThreadFolders]
     ) -> toloka.client.message_thread.MessageThread:
-        """Adds a message chain to one or more folders ("unread", "important" etc.)
+        """Adds a message thread to folders.
 
         Args:
-            message_thread_id: ID of message chain.
-            folders: List of folders, where to move chain.
+            message_thread_id: The ID of the message thread.
+            folders: A list of folders where to add the thread.
 
         Returns:
-            MessageThread: Full object by ID with updated folders.
+            MessageThread: The updated message thread.
 
         Example:
             >>> toloka_client.add_message_thread_to_folders(message_thread_id='1', folders=['IMPORTANT'])
@@ -892,20 +1150,19 @@ class AsyncTolokaClient:
 
     @typing.overload
     async def compose_message_thread(self, compose: toloka.client.message_thread.MessageThreadCompose) -> toloka.client.message_thread.MessageThread:
-        """Sends a message to a Toloker.
-
-        The sent message is added to a new message thread.
+        """Creates a message thread and sends the first thread message to Tolokers.
 
         Args:
-            compose: Message parameters.
+            compose: Parameters for creating the message thread.
 
         Returns:
-            MessageThread: New created thread.
+            MessageThread: The created message thread.
 
         Example:
-            If you want to thank Tolokers who have tried to complete your tasks, send them a nice message.
+            A message is sent to all Tolokers who have tried to complete your tasks.
+            The message is in english. Tolokers can't reply to your message.
 
-            >>> message_text = "Amazing job! We've just trained our first model with the data YOU prepared for us. Thank you!"
+            >>> message_text = "Amazing job! We've just trained our first model with the data you prepared for us. Thank you!"
             >>> toloka_client.compose_message_thread(
             >>>     recipients_select_type='ALL',
             >>>     topic={'EN': 'Thank you!'},
@@ -927,20 +1184,19 @@ class AsyncTolokaClient:
         recipients_ids: typing.Optional[typing.List[str]] = None,
         recipients_filter: typing.Optional[toloka.client.filter.FilterCondition] = None
     ) -> toloka.client.message_thread.MessageThread:
-        """Sends a message to a Toloker.
-
-        The sent message is added to a new message thread.
+        """Creates a message thread and sends the first thread message to Tolokers.
 
         Args:
-            compose: Message parameters.
+            compose: Parameters for creating the message thread.
 
         Returns:
-            MessageThread: New created thread.
+            MessageThread: The created message thread.
 
         Example:
-            If you want to thank Tolokers who have tried to complete your tasks, send them a nice message.
+            A message is sent to all Tolokers who have tried to complete your tasks.
+            The message is in english. Tolokers can't reply to your message.
 
-            >>> message_text = "Amazing job! We've just trained our first model with the data YOU prepared for us. Thank you!"
+            >>> message_text = "Amazing job! We've just trained our first model with the data you prepared for us. Thank you!"
             >>> toloka_client.compose_message_thread(
             >>>     recipients_select_type='ALL',
             >>>     topic={'EN': 'Thank you!'},
@@ -973,7 +1229,7 @@ class AsyncTolokaClient:
             MessageThreadSearchResult: Found message threads and a flag showing whether there are more matching threads.
 
         Example:
-            Find all message threads in the Inbox folder.
+            Finding all message threads in the `INBOX` folder.
 
             >>> toloka_client.find_message_threads(folder='INBOX')
             ...
@@ -1011,7 +1267,7 @@ class AsyncTolokaClient:
             MessageThreadSearchResult: Found message threads and a flag showing whether there are more matching threads.
 
         Example:
-            Find all message threads in the Inbox folder.
+            Finding all message threads in the `INBOX` folder.
 
             >>> toloka_client.find_message_threads(folder='INBOX')
             ...
@@ -1023,22 +1279,24 @@ class AsyncTolokaClient:
         message_thread_id: str,
         reply: toloka.client.message_thread.MessageThreadReply
     ) -> toloka.client.message_thread.MessageThread:
-        """Replies to a message in thread
+        """Sends a reply message in a thread.
 
         Args:
-            message_thread_id: In which thread to reply.
-            reply: Reply message.
+            message_thread_id: The ID of the thread.
+            reply: The reply message.
 
         Returns:
-            MessageThread: New created message.
+            MessageThread: The updated message thread.
 
         Example:
+            Sending a reply to all unread messages.
+
             >>> message_threads = toloka_client.get_message_threads(folder='UNREAD')
             >>> message_reply = {'EN': 'Thank you for your message! I will get back to you soon.'}
             >>> for thread in message_threads:
             >>>     toloka_client.reply_message_thread(
             >>>         message_thread_id=thread.id,
-            >>>         reply=toloka.message_thread.MessageThreadReply(text=message_reply)
+            >>>         reply=toloka.client.message_thread.MessageThreadReply(text=message_reply)
             >>>     )
             ...
         """
@@ -1112,14 +1370,14 @@ class AsyncTolokaClient:
         message_thread_id: str,
         folders: typing.Union[typing.List[typing.Union[toloka.client.message_thread.Folder, str]], toloka.client.message_thread.MessageThreadFolders]
     ) -> toloka.client.message_thread.MessageThread:
-        """Deletes a message chain from one or more folders ("unread", "important" etc.)
+        """Removes a message thread from folders.
 
         Args:
-            message_thread_id: ID of message chain.
-            folders:  List of folders, where from to remove chain.
+            message_thread_id: The ID of the message thread.
+            folders: A list of folders.
 
         Returns:
-            MessageThread: Full object by ID with updated folders.
+            MessageThread: The updated message thread.
 
         Example:
             >>> toloka_client.remove_message_thread_from_folders(message_thread_id='1', folders=['IMPORTANT'])
@@ -2607,8 +2865,12 @@ class AsyncTolokaClient:
     async def create_tasks(
         self,
         tasks: typing.List[toloka.client.task.Task],
-        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None
-    ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several tasks in Toloka.
 
         You can add together general and control tasks.
@@ -2623,9 +2885,15 @@ class AsyncTolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            chunk_size: The maximum number of tasks created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all tasks are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
 
         Returns:
-            batch_create_results.TaskBatchCreateResult: The result of the operation.
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2671,8 +2939,11 @@ class AsyncTolokaClient:
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several tasks in Toloka.
 
         You can add together general and control tasks.
@@ -2687,9 +2958,15 @@ class AsyncTolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            chunk_size: The maximum number of tasks created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all tasks are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
 
         Returns:
-            batch_create_results.TaskBatchCreateResult: The result of the operation.
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2791,6 +3068,96 @@ class AsyncTolokaClient:
         """
         ...
 
+    @typing.overload
+    def upload_tasks(
+        self,
+        tasks: typing.Iterable[toloka.client.task.Task],
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        batch_size: int = 10000,
+        ids_only: bool = False
+    ) -> toloka.util.async_utils.AsyncGenAdapter[typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult], None]:
+        """Creates tasks from an iterable of any length in batches.
+
+        Unlike [create_tasks](toloka.client.TolokaClient.create_tasks.md), the method does not need all tasks in
+        memory: tasks are taken from the iterable lazily, `batch_size` tasks at a time, and the result is yielded as
+        soon as a batch is created. Every batch is created by a separate operation with an `operation_id` derived from
+        the one in `parameters`.
+
+        Args:
+            tasks: An iterable of tasks to be created. It may be a generator.
+            parameters: Additional parameters of the request.
+            batch_size: The maximum number of tasks created by a single operation. Default: `10000`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
+
+        Yields:
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of creating the next batch. Indexes of
+                tasks in the `tasks` iterable are used as keys in the `items` and `validation_errors` dictionaries.
+                If `skip_invalid_items` is `True`, a batch without valid tasks gives a result with empty `items`.
+
+        Raises:
+            ValidationApiError: A batch contains invalid tasks and `skip_invalid_items` is not `True`.
+
+        Example:
+            >>> def read_tasks(path):
+            >>>     with open(path) as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id=existing_pool_id)
+            >>>
+            >>> for result in toloka_client.upload_tasks(read_tasks('dataset.txt'), allow_defaults=True, ids_only=True):
+            >>>     print(len(result.items))
+            ...
+        """
+        ...
+
+    @typing.overload
+    def upload_tasks(
+        self,
+        tasks: typing.Iterable[toloka.client.task.Task],
+        *,
+        operation_id: typing.Optional[uuid.UUID] = ...,
+        async_mode: typing.Optional[bool] = True,
+        allow_defaults: typing.Optional[bool] = None,
+        open_pool: typing.Optional[bool] = None,
+        skip_invalid_items: typing.Optional[bool] = None,
+        batch_size: int = 10000,
+        ids_only: bool = False
+    ) -> toloka.util.async_utils.AsyncGenAdapter[typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult], None]:
+        """Creates tasks from an iterable of any length in batches.
+
+        Unlike [create_tasks](toloka.client.TolokaClient.create_tasks.md), the method does not need all tasks in
+        memory: tasks are taken from the iterable lazily, `batch_size` tasks at a time, and the result is yielded as
+        soon as a batch is created. Every batch is created by a separate operation with an `operation_id` derived from
+        the one in `parameters`.
+
+        Args:
+            tasks: An iterable of tasks to be created. It may be a generator.
+            parameters: Additional parameters of the request.
+            batch_size: The maximum number of tasks created by a single operation. Default: `10000`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
+
+        Yields:
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of creating the next batch. Indexes of
+                tasks in the `tasks` iterable are used as keys in the `items` and `validation_errors` dictionaries.
+                If `skip_invalid_items` is `True`, a batch without valid tasks gives a result with empty `items`.
+
+        Raises:
+            ValidationApiError: A batch contains invalid tasks and `skip_invalid_items` is not `True`.
+
+        Example:
+            >>> def read_tasks(path):
+            >>>     with open(path) as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id=existing_pool_id)
+            >>>
+            >>> for result in toloka_client.upload_tasks(read_tasks('dataset.txt'), allow_defaults=True, ids_only=True):
+            >>>     print(len(result.items))
+            ...
+        """
+        ...
+
     @typing.overload
     async def find_tasks(
         self,
@@ -2881,7 +3248,9 @@ class AsyncTolokaClient:
     def get_tasks(
         self,
         request: toloka.client.search_requests.TaskSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.task.Task, None]:
         """Finds all tasks that match certain criteria.
 
@@ -2892,6 +3261,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned tasks limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Task: The next matching task.
@@ -2921,7 +3292,9 @@ class AsyncTolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.task.Task, None]:
         """Finds all tasks that match certain criteria.
 
@@ -2932,6 +3305,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned tasks limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Task: The next matching task.
@@ -2944,6 +3319,32 @@ class AsyncTolokaClient:
         """
         ...
 
+    async def get_tasks_by_ids(
+        self,
+        task_ids: typing.Iterable[str],
+        batch_size: typing.Optional[int] = None,
+        concurrency: int = 4
+    ) -> typing.Dict[str, toloka.client.task.Task]:
+        """Gets tasks with specified IDs.
+
+        IDs are sorted and grouped into ranges of close IDs. Tasks from every range are fetched with a single search
+        request or a few requests, so it is much faster than calling `get_task` for every ID.
+
+        Args:
+            task_ids: IDs of tasks.
+            batch_size: The maximum number of requested IDs in a range. It is also used as a limit of every search request. The maximum allowed batch_size is 100,000. Default: `None` (ranges contain up to 1,000 requested IDs).
+            concurrency: The number of ranges that are fetched concurrently. Default: `4`.
+
+        Returns:
+            Dict[str, Task]: Found tasks by their IDs. Tasks that are not found are missing.
+
+        Example:
+            >>> tasks = toloka_client.get_tasks_by_ids(task_ids)
+            >>> print(tasks[task_ids[0]].input_values)
+            ...
+        """
+        ...
+
     @typing.overload
     async def patch_task(
         self,
@@ -3117,8 +3518,12 @@ class AsyncTolokaClient:
     async def create_task_suites(
         self,
         task_suites: typing.List[toloka.client.task_suite.TaskSuite],
-        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None
-    ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
+        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several task suites in Toloka.
 
         Usually, you don't need to create a task suite manually, because Toloka can group tasks into suites automatically.
@@ -3135,9 +3540,15 @@ class AsyncTolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            chunk_size: The maximum number of task suites created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all task suites are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created task suites are returned. The IDs are taken from the operation log,
+                so created task suites are not requested. Default: `False`.
 
         Returns:
-            TaskSuiteBatchCreateResult: The result of the operation.
+            Union[TaskSuiteBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -3170,8 +3581,11 @@ class AsyncTolokaClient:
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several task suites in Toloka.
 
         Usually, you don't need to create a task suite manually, because Toloka can group tasks into suites automatically.
@@ -3188,9 +3602,15 @@ class AsyncTolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            chunk_size: The maximum number of task suites created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all task suites are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created task suites are returned. The IDs are taken from the operation log,
+                so created task suites are not requested. Default: `False`.
 
         Returns:
-            TaskSuiteBatchCreateResult: The result of the operation.
+            Union[TaskSuiteBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -3386,7 +3806,9 @@ class AsyncTolokaClient:
     def get_task_suites(
         self,
         request: toloka.client.search_requests.TaskSuiteSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.task_suite.TaskSuite, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3397,6 +3819,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned task suites limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3427,7 +3851,9 @@ class AsyncTolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.task_suite.TaskSuite, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3438,6 +3864,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned task suites limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3796,8 +4224,12 @@ class AsyncTolokaClient:
     async def create_user_bonuses(
         self,
         user_bonuses: typing.List[toloka.client.user_bonus.UserBonus],
-        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None
-    ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
+        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.UserBonusBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates rewards for Tolokers.
 
         Right now it's safer to use asynchronous version: "create_user_bonuses_async"
@@ -3806,10 +4238,16 @@ class AsyncTolokaClient:
         Args:
             user_bonuses: To whom, how much to pay and for what.
             parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of rewards created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all rewards are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created rewards are returned. The IDs are taken from the operation log,
+                so created rewards are not requested. Default: `False`.
 
         Returns:
-            UserBonusBatchCreateResult: Result of creating rewards. Contains `UserBonus` instances in `items` and
-                problems in `validation_errors`.
+            Union[UserBonusBatchCreateResult, IdsBatchCreateResult]: Result of creating rewards. Contains `UserBonus`
+                instances or their IDs in `items` and problems in `validation_errors`.
 
         Example:
             >>> import decimal
@@ -3853,8 +4291,11 @@ class AsyncTolokaClient:
         *,
         operation_id: typing.Optional[uuid.UUID] = ...,
         async_mode: typing.Optional[bool] = True,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.UserBonusBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates rewards for Tolokers.
 
         Right now it's safer to use asynchronous version: "create_user_bonuses_async"
@@ -3863,10 +4304,16 @@ class AsyncTolokaClient:
         Args:
             user_bonuses: To whom, how much to pay and for what.
             parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of rewards created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all rewards are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created rewards are returned. The IDs are taken from the operation log,
+                so created rewards are not requested. Default: `False`.
 
         Returns:
-            UserBonusBatchCreateResult: Result of creating rewards. Contains `UserBonus` instances in `items` and
-                problems in `validation_errors`.
+            Union[UserBonusBatchCreateResult, IdsBatchCreateResult]: Result of creating rewards. Contains `UserBonus`
+                instances or their IDs in `items` and problems in `validation_errors`.
 
         Example:
             >>> import decimal
@@ -4095,7 +4542,9 @@ class AsyncTolokaClient:
     def get_user_bonuses(
         self,
         request: toloka.client.search_requests.UserBonusSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.user_bonus.UserBonus, None]:
         """Finds all Tolokers' rewards that match certain rules and returns them in an iterable object
 
@@ -4106,6 +4555,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned Tolokers' rewards limit for each request. The maximum allowed batch_size is 300.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             UserBonus: The next matching Toloker's reward.
@@ -4130,7 +4581,9 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.user_bonus.UserBonus, None]:
         """Finds all Tolokers' rewards that match certain rules and returns them in an iterable object
 
@@ -4141,6 +4594,8 @@ class AsyncTolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned Tolokers' rewards limit for each request. The maximum allowed batch_size is 300.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             UserBonus: The next matching Toloker's reward.
@@ -4571,17 +5026,16 @@ class AsyncTolokaClient:
         ...
 
     async def upsert_webhook_subscriptions(self, subscriptions: typing.List[toloka.client.webhook_subscription.WebhookSubscription]) -> toloka.client.batch_create_results.WebhookSubscriptionBatchCreateResult:
-        """Creates (upsert) many webhook-subscriptions.
+        """Creates (upsert) webhook subscriptions.
 
         Args:
-            subscriptions: List of webhook-subscriptions, that will be created.
+            subscriptions: A list of webhook subscriptions to be created.
 
         Returns:
-            batch_create_results.WebhookSubscriptionBatchCreateResult: Result of subscriptions creation.
-                Contains created subscriptions in `items` and problems in "validation_errors".
+            batch_create_results.WebhookSubscriptionBatchCreateResult: The result of the operation.
 
         Raises:
-            ValidationApiError: If no subscriptions were created.
+            ValidationApiError: No subscriptions were created.
 
         Example:
             How to create several subscriptions.
@@ -4729,102 +5183,79 @@ class AsyncTolokaClient:
         ...
 
     @typing.overload
-    async def get_assignments_df(
+    async def export_assignments(
         self,
         pool_id: str,
-        parameters: toloka.client.assignment.GetAssignmentsTsvParameters
-    ) -> pandas.DataFrame:
-        """Downloads assignments as pandas.DataFrame.
+        path: str,
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        file_format: str = 'csv',
+        chunksize: int = 100000,
+        dtype: typing.Union[None, str, typing.Dict[str, str]] = None
+    ) -> None:
+        """Downloads assignments to a CSV or Parquet file chunk by chunk without loading all of them into memory.
 
         {% note warning %}
 
-        Requires toloka-kit[pandas] extras. Install it with the following command:
-
-        ```shell
-        pip install toloka-kit[pandas]
-        ```
+        Requires toloka-kit[pandas] extras. Writing Parquet files also requires the pyarrow package.
 
         {% endnote %}
 
         Experimental method.
-        Implements the same behavior as if you download results in web-interface and then read it by pandas.
 
         Args:
             pool_id: From which pool the results are loaded.
-            parameters: Filters for the results and the set of fields that will be in the dataframe.
-
-        Returns:
-            pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
-                * "INPUT" - Fields that were at the input in the task.
-                * "OUTPUT" - Fields that were received as a result of execution.
-                * "GOLDEN" - Fields with correct answers. Filled in only for golden tasks and training tasks.
-                * "HINT" - Hints for completing tasks. Filled in for training tasks.
-                * "ACCEPT" - Fields describing the deferred acceptance of tasks.
-                * "ASSIGNMENT" - fields describing additional information about the Assignment.
+            path: The path of the file to write.
+            parameters: Filters for the results and the set of fields that will be in the file.
+            file_format: `csv` or `parquet`. Default: `csv`.
+            chunksize: The number of rows that are processed at once. Default: `100000`.
+            dtype: Data types of columns. All Parquet row groups get the schema of the first chunk, so Parquet files
+                are written with string columns by default. Default: `None` — types are inferred for CSV files,
+                and all columns are strings for Parquet files.
 
         Example:
-            Get all assignments from the specified pool by `pool_id` to [pandas.DataFrame](https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html).
-            And apply the native pandas `rename` method to change columns' names.
-
-            >>> answers_df = toloka_client.get_assignments_df(pool_id='1')
-            >>> answers_df = answers_df.rename(columns={
-            >>>     'INPUT:image': 'task',
-            >>>     'OUTPUT:result': 'label',
-            >>>     'ASSIGNMENT:worker_id': 'annotator'
-            >>> })
+            >>> toloka_client.export_assignments(pool_id='1', path='assignments.parquet', file_format='parquet')
             ...
         """
         ...
 
     @typing.overload
-    async def get_assignments_df(
+    async def export_assignments(
         self,
         pool_id: str,
+        path: str,
         *,
         status: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Status]] = ...,
         start_time_from: typing.Optional[datetime.datetime] = None,
         start_time_to: typing.Optional[datetime.datetime] = None,
         exclude_banned: typing.Optional[bool] = None,
-        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...
-    ) -> pandas.DataFrame:
-        """Downloads assignments as pandas.DataFrame.
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        file_format: str = 'csv',
+        chunksize: int = 100000,
+        dtype: typing.Union[None, str, typing.Dict[str, str]] = None
+    ) -> None:
+        """Downloads assignments to a CSV or Parquet file chunk by chunk without loading all of them into memory.
 
         {% note warning %}
 
-        Requires toloka-kit[pandas] extras. Install it with the following command:
-
-        ```shell
-        pip install toloka-kit[pandas]
-        ```
+        Requires toloka-kit[pandas] extras. Writing Parquet files also requires the pyarrow package.
 
         {% endnote %}
 
         Experimental method.
-        Implements the same behavior as if you download results in web-interface and then read it by pandas.
 
         Args:
             pool_id: From which pool the results are loaded.
-            parameters: Filters for the results and the set of fields that will be in the dataframe.
-
-        Returns:
-            pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
-                * "INPUT" - Fields that were at the input in the task.
-                * "OUTPUT" - Fields that were received as a result of execution.
-                * "GOLDEN" - Fields with correct answers. Filled in only for golden tasks and training tasks.
-                * "HINT" - Hints for completing tasks. Filled in for training tasks.
-                * "ACCEPT" - Fields describing the deferred acceptance of tasks.
-                * "ASSIGNMENT" - fields describing additional information about the Assignment.
+            path: The path of the file to write.
+            parameters: Filters for the results and the set of fields that will be in the file.
+            file_format: `csv` or `parquet`. Default: `csv`.
+            chunksize: The number of rows that are processed at once. Default: `100000`.
+            dtype: Data types of columns. All Parquet row groups get the schema of the first chunk, so Parquet files
+                are written with string columns by default. Default: `None` — types are inferred for CSV files,
+                and all columns are strings for Parquet files.
 
         Example:
-            Get all assignments from the specified pool by `pool_id` to [pandas.DataFrame](https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html).
-            And apply the native pandas `rename` method to change columns' names.
-
-            >>> answers_df = toloka_client.get_assignments_df(pool_id='1')
-            >>> answers_df = answers_df.rename(columns={
-            >>>     'INPUT:image': 'task',
-            >>>     'OUTPUT:result': 'label',
-            >>>     'ASSIGNMENT:worker_id': 'annotator'
-            >>> })
+            >>> toloka_client.export_assignments(pool_id='1', path='assignments.parquet', file_format='parquet')
             ...
         """
         ...
@@ -450,10 +450,12 @@ class AutoQuality:
         pool_skills_copy = list(pool_skills)
         random.shuffle(pool_skills_copy)
         pool_skills_cycle = itertools.cycle(pool_skills_copy)
-        df = self.toloka_client.get_assignments_df(from_pool_id,
-                                                   field=[GetAssignmentsTsvParameters.Field.WORKER_ID],
-                                                   exclude_banned=True)
-        workers = df['ASSIGNMENT:worker_id'].unique()
+        chunks = self.toloka_client.get_assignments_df(from_pool_id,
+                                                       field=[GetAssignmentsTsvParameters.Field.WORKER_ID],
+                                                       exclude_banned=True,
+                                                       chunksize=100000,
+                                                       dtype=str)
+        workers = list(dict.fromkeys(worker_id for chunk in chunks for worker_id in chunk['ASSIGNMENT:worker_id']))
         for worker_id in workers:
             if worker_id not in self.worker_autoquality_pool_skills:
                 skill = next(pool_skills_cycle)
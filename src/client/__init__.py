@@ -17,6 +17,7 @@ __all__ = [
     'operations',
     'owner',
     'quality_control',
+    'record_batch',
     'requester',
     'search_requests',
     'search_results',
@@ -69,31 +70,33 @@ __all__ = [
     'AppBatchCreateRequest',
 ]
 
+import contextvars
 import datetime
 import functools
+import importlib.util
 import io
+import itertools
 import logging
+import os
 import threading
 import time
 
 import attr
 import httpx
-import simplejson
 from httpx import HTTPStatusError, RequestError
 from httpx._types import VerifyTypes
 from toloka.client.batch_create_results import FieldValidationError
 
-try:
-    import pandas as pd
-    PANDAS_INSTALLED = True
-except ImportError:
-    PANDAS_INSTALLED = False
+# pandas is slow to import, so it is imported only when DataFrames are read
+PANDAS_INSTALLED = importlib.util.find_spec('pandas') is not None
 
-from decimal import Decimal
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from enum import Enum, unique
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
-from typing import BinaryIO, Callable, ClassVar, Dict, Generator, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any, BinaryIO, Callable, ClassVar, Dict, Generator, Iterable, Iterator, List, Optional, Sequence, Tuple, Union,
+)
 from urllib3.util.retry import Retry
 
 from . import actions
@@ -114,6 +117,7 @@ from . import operation_log
 from . import operations
 from . import owner
 from . import quality_control
+from . import record_batch
 from . import requester
 from . import search_requests
 from . import search_results
@@ -129,7 +133,14 @@ from . import user_skill
 from . import webhook_subscription
 
 from ..__version__ import __version__
+from ._attachments import get_attachment_path, get_partial_path, is_already_downloaded
+from ._batching import derive_parameters, iterate_batches, shift_batch_create_result, split_into_chunks
 from ._converter import structure, unstructure
+from ._lazy import structure_search_result_lazily
+from ._pagination import (
+    iterate_search_results, iterate_shards_in_threads, make_shard_requests, plan_id_windows, prefetch_in_thread,
+)
+from ._tsv import IteratorReader, read_tsv, write_dataframes
 from .aggregation import AggregatedSolution
 from .analytics_request import AnalyticsRequest
 from .app import (
@@ -150,8 +161,14 @@ from .operation_log import OperationLogItem
 from .pool import Pool, PoolPatchRequest
 from .primitives.retry import TolokaRetry, SyncRetryingOverURLLibRetry, STATUSES_TO_RETRY
 from .primitives.base import autocast_to_enum
+from .primitives.bulk import BulkItemResult
+from .primitives.instrumentation import ClientHooks, get_response_size
 from .primitives.parameter import IdempotentOperationParameters
+from .primitives.json_codec import JsonCodec, SimplejsonCodec
+from .primitives.rate_limiter import RateLimiter
+from .primitives.response_cache import ResponseCache
 from .project import Project
+from .record_batch import RecordBatch
 from .training import Training
 from .requester import Requester
 from .skill import Skill
@@ -162,12 +179,25 @@ from .user_restriction import UserRestriction
 from .user_skill import SetUserSkillRequest, UserSkill
 from .user import User
 from ..util import identity
-from ..util._managing_headers import add_headers, form_additional_headers, top_level_method_var
+from ..util._managing_headers import add_headers, form_additional_headers, iterate_in_context, top_level_method_var
 from ..util._codegen import expand
+from ..util.async_utils import SyncGenWrapper
 from .webhook_subscription import WebhookSubscription
 
 logger = logging.getLogger(__name__)
 
+_POLLING_INTERVAL_MULTIPLIER = 1.5
+_MAX_SESSIONS_WITHOUT_CLEANUP = 128
+_MAX_OPERATIONS_SEARCH_LIMIT = 500
+# Batch status checks request at most this number of operation search pages, other operations are requested directly
+_MAX_OPERATIONS_POLL_PAGES = 2
+# Bulk getters fetch at most this number of requested ids with a single id range if batch size is not set
+_MAX_IDS_PER_WINDOW = 1000
+# Number of result pages that are fetched ahead of the consumer for each shard of a parallel search
+_SHARD_PREFETCH_PAGES = 4
+
+_TaskUploadResult = Union[batch_create_results.TaskBatchCreateResult, batch_create_results.IdsBatchCreateResult]
+
 
 class TolokaClient:
     """Class that implements interaction with [Toloka API](https://toloka.ai/en/docs/api/).
@@ -227,6 +257,33 @@ class TolokaClient:
             verify the identity of requested hosts. Either `True` (default CA bundle),
             a path to an SSL certificate file, an `ssl.SSLContext`, or `False`
             (which will disable verification)
+        rate_limiter: Client-side limiter of the request rate. Requests are delayed to stay within the limits, and
+            the limits are decreased when Toloka reports exceeded quotas. The same limiter may be shared by several clients.
+            Default value: `None`.
+        limits: Connection pool limits of HTTP sessions: the maximum number of connections, the maximum number of
+            keep-alive connections and the keep-alive expiry. Default value: `None` — default `httpx` limits are used.
+        http2: Whether HTTP/2 is used. It requires the `h2` package that is installed with `httpx[http2]`.
+            Default value: `False`.
+        share_session: Whether all threads share a single HTTP session with a common connection pool. Otherwise,
+            every thread has its own session. `AsyncTolokaClient` always uses a separate session for every event loop.
+            Default value: `False`.
+        cache: Cache of responses for single entities: pools, projects, skills and trainings. Write requests made through
+            the client invalidate cached entities. The same cache may be shared by several clients.
+            Default value: `None` — responses are not cached.
+        json_codec: Codec that encodes request bodies and decodes responses. Use `OrjsonCodec` to speed up large
+            requests and responses. Default value: `None` — `SimplejsonCodec` is used.
+        lazy_search_results: Whether items returned by `find_*` and `get_*` methods are structured lazily. Such items
+            keep raw response data and structure every attribute on the first access. It speeds up scans that read only
+            a few attributes of every item. Default value: `False`.
+        hooks: Hooks that are called around every HTTP request, retry and conversion of responses into Toloka objects.
+            Use `ClientStats` to collect request counts, latencies, transferred bytes, retries and structuring time
+            by client methods. Default value: `None`.
+        transport: Custom `httpx` transport for all requests, e.g. `toloka.testing.FakeTolokaBackend` for tests and
+            benchmarks without network access. `AsyncTolokaClient` requires a transport that supports asynchronous
+            requests. Default value: `None` — requests are sent over the network.
+
+    `TolokaClient` keeps HTTP connections open. Call the `close` method or use the client as a context manager
+    to release them.
 
     Example:
         How to create `TolokaClient` instance and make your first request to Toloka.
@@ -263,6 +320,15 @@ class TolokaClient:
     _platform_url: Optional[str]
     url: Optional[str]
     retryer_factory: Optional[Callable[[], Retry]]
+    rate_limiter: Optional[RateLimiter]
+    limits: Optional[httpx.Limits]
+    http2: bool
+    share_session: bool
+    cache: Optional[ResponseCache]
+    json_codec: JsonCodec
+    lazy_search_results: bool
+    hooks: Optional[ClientHooks]
+    transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None]
 
     def __init__(
         self,
@@ -275,6 +341,15 @@ class TolokaClient:
         retryer_factory: Optional[Callable[[], Retry]] = None,
         act_under_account_id: Optional[str] = None,
         verify: VerifyTypes = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        share_session: bool = False,
+        cache: Optional[ResponseCache] = None,
+        json_codec: Optional[JsonCodec] = None,
+        lazy_search_results: bool = False,
+        hooks: Optional[ClientHooks] = None,
+        transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None,
     ):
         if url is None and environment is None:
             raise ValueError('You must pass at least one parameter: url or environment.')
@@ -306,10 +381,21 @@ class TolokaClient:
 
         self.act_under_account_id = act_under_account_id
         self.verify = verify
+        self.rate_limiter = rate_limiter
+        self.limits = limits
+        self.http2 = http2
+        self.share_session = share_session
+        self.cache = cache
+        self.json_codec = json_codec or SimplejsonCodec()
+        self.lazy_search_results = lazy_search_results
+        self.hooks = hooks
+        self.transport = transport
+        self._sessions: Dict[Optional[int], httpx.Client] = {}
+        self._sessions_lock = threading.Lock()
 
         self.retrying = SyncRetryingOverURLLibRetry(
             base_url=str(self._session.base_url), retry=self.retryer_factory(), reraise=True,
-            exception_to_retry=self.EXCEPTIONS_TO_RETRY,
+            exception_to_retry=self.EXCEPTIONS_TO_RETRY, hooks=self.hooks, rate_limiter=self.rate_limiter,
         )
 
     @staticmethod
@@ -336,23 +422,121 @@ class TolokaClient:
             headers['X-Act-Under-Account-ID'] = self.act_under_account_id
         return headers
 
-    def _do_request_with_retries(self, method, path, **kwargs):
+    def _do_request_with_retries(self, method, path, stream=False, **kwargs):
         @self.retrying.wraps
         def wrapped(method, path, **kwargs):
-            response = self._session.request(method, path, **kwargs)
-            raise_on_api_error(response)
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve(path)
+                if delay:
+                    time.sleep(delay)
+            request = self._session.build_request(method, path, **kwargs)
+            if self.hooks is None:
+                response = self._session.send(request, stream=stream)
+            else:
+                response = self._send_with_hooks(request, stream)
+            if stream and response.is_error:
+                response.read()
+            self._raise_on_api_error(path, response)
             return response
 
         return wrapped(method, path, **kwargs)
 
+    def _send_with_hooks(self, request: httpx.Request, stream: bool) -> httpx.Response:
+        path = request.url.path
+        top_level_method = top_level_method_var.get(None)
+        self.hooks.on_request(
+            method=request.method, path=path, top_level_method=top_level_method,
+            bytes_out=int(request.headers.get('Content-Length', 0)),
+        )
+        response = None
+        start = time.perf_counter()
+        try:
+            response = self._session.send(request, stream=stream)
+        finally:
+            self.hooks.on_response(
+                method=request.method, path=path, top_level_method=top_level_method,
+                status_code=None if response is None else response.status_code,
+                latency=time.perf_counter() - start, bytes_in=get_response_size(response),
+            )
+        return response
+
+    def _raise_on_api_error(self, path, response):
+        try:
+            raise_on_api_error(response)
+        except TooManyRequestsApiError as exc:
+            if self.rate_limiter is not None:
+                interval = exc.payload.get('interval') if isinstance(exc.payload, dict) else None
+                self.rate_limiter.on_quota_exceeded(path, interval)
+            raise
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_sessions'], state['_sessions_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Closes HTTP sessions and releases all connections.
+
+        The client remains usable after closing: new sessions are opened on the next request.
+
+        Example:
+            >>> with toloka.client.TolokaClient(token, 'PRODUCTION') as toloka_client:
+            >>>     print(toloka_client.get_requester().balance)
+            ...
+        """
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    @property
+    def _session_parameters(self) -> dict:
+        parameters = {'headers': self._headers, 'base_url': self.url, 'verify': self.verify, 'http2': self.http2}
+        if self.limits is not None:
+            parameters['limits'] = self.limits
+        if self.transport is not None:
+            parameters['transport'] = self.transport
+        return parameters
+
     @property
     def _session(self):
-        return self._session_for_thread(threading.current_thread().ident)
+        return self._session_for_thread(None if self.share_session else threading.current_thread().ident)
+
+    def _session_for_thread(self, thread_id: Optional[int]) -> httpx.Client:
+        session = self._sessions.get(thread_id)
+        if session is None:
+            with self._sessions_lock:
+                session = self._sessions.get(thread_id)
+                if session is None:
+                    if len(self._sessions) >= _MAX_SESSIONS_WITHOUT_CLEANUP:
+                        self._close_sessions_of_finished_threads()
+                    session = self._sessions[thread_id] = httpx.Client(**self._session_parameters)
+        return session
+
+    def _close_session_of_current_thread(self):
+        if self.share_session:
+            return
+        with self._sessions_lock:
+            session = self._sessions.pop(threading.current_thread().ident, None)
+        if session is not None:
+            session.close()
 
-    @functools.lru_cache(maxsize=128)
-    def _session_for_thread(self, thread_id: int) -> httpx.Client:
-        client = httpx.Client(headers=self._headers, base_url=self.url, verify=self.verify)
-        return client
+    def _close_sessions_of_finished_threads(self):
+        alive_thread_ids = {thread.ident for thread in threading.enumerate()}
+        for thread_id in list(self._sessions):
+            if thread_id is not None and thread_id not in alive_thread_ids:
+                self._sessions.pop(thread_id).close()
 
     def _prepare_request(self, kwargs):
         prepared_kwargs = dict(**kwargs)
@@ -371,17 +555,30 @@ class TolokaClient:
         prepared_kwargs['headers'] = headers
         json_param = prepared_kwargs.pop('json', None)
         if json_param:
-            prepared_kwargs['content'] = simplejson.dumps(json_param)
+            prepared_kwargs['content'] = self.json_codec.dumps(json_param)
             headers['Content-Type'] = 'application/json'
         return prepared_kwargs
 
     def _raw_request(self, method, path, **kwargs):
-        kwargs = self._prepare_request(kwargs)
-        response = self._do_request_with_retries(method, f'/api{path}', **kwargs)
-        return response
+        if self.cache is None or method.upper() == 'GET':
+            return self._do_request_with_retries(method, f'/api{path}', **self._prepare_request(kwargs))
+        try:
+            return self._do_request_with_retries(method, f'/api{path}', **self._prepare_request(kwargs))
+        finally:
+            # Entities may change even if the write request failed, e.g. after a retried timeout
+            self.cache.invalidate_after_write(path, kwargs.get('params'), kwargs.get('json'))
 
     def _request(self, method, path, **kwargs):
-        return self._raw_request(method, path, **kwargs).json(parse_float=Decimal)
+        return self.json_codec.loads(self._raw_request(method, path, **kwargs).content)
+
+    def _get_entity(self, path, result_type):
+        if self.cache is None or not self.cache.is_cacheable('get', path):
+            return self._structure(self._request('get', path), result_type)
+        entity = self.cache.get(path)
+        if entity is None:
+            entity = self._structure(self._request('get', path), result_type)
+            self.cache.put(path, entity)
+        return entity
 
     def _search_request(self, method, path, request, sort, limit):
         params = unstructure(request) or {}
@@ -391,16 +588,58 @@ class TolokaClient:
             params['limit'] = limit
         return self._request(method, path, params=params)
 
-    def _find_all(self, find_function, request, sort_field: str = 'id', items_field: str = 'items', batch_size: Optional[int] = None):
-        result = find_function(request, sort=[sort_field], limit=batch_size)
-        items = getattr(result, items_field)
-        while result.has_more:
-            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
-            yield from items
+    def _structure(self, data, result_type, structure_func=structure):
+        if self.hooks is None:
+            return structure_func(data, result_type)
+        start = time.perf_counter()
+        try:
+            return structure_func(data, result_type)
+        finally:
+            self.hooks.on_structure(
+                top_level_method=top_level_method_var.get(None), result_type=result_type,
+                duration=time.perf_counter() - start,
+            )
+
+    def _structure_search_result(self, response, result_type):
+        if self.lazy_search_results:
+            return self._structure(response, result_type, structure_func=structure_search_result_lazily)
+        return self._structure(response, result_type)
+
+    def _find_all(
+        self, find_function, request, sort_field: str = 'id', items_field: str = 'items',
+        batch_size: Optional[int] = None, parallelism: Optional[int] = None, prefetch_pages: Optional[int] = None,
+    ):
+        # Pages are fetched in the context of the first step, so their requests keep the headers of the calling method
+        # wherever the items are consumed. The context is switched once per page, not once per item
+        ctx = contextvars.copy_context()
+        if parallelism and parallelism > 1:
             result = find_function(request, sort=[sort_field], limit=batch_size)
             items = getattr(result, items_field)
-
-        yield from items
+            if not result.has_more:
+                yield from items
+                return
+            # The last item is probed to split the remaining range into shards that are fetched concurrently
+            last_item = getattr(find_function(request, sort=[f'-{sort_field}'], limit=1), items_field)[-1]
+            shard_requests = make_shard_requests(
+                request, sort_field, getattr(items[-1], sort_field), getattr(last_item, sort_field), parallelism,
+            )
+            yield from items
+            results = iterate_shards_in_threads(
+                functools.partial(
+                    iterate_search_results, find_function, sort_field=sort_field, items_field=items_field,
+                    batch_size=batch_size,
+                ),
+                shard_requests,
+                max_workers=parallelism,
+                depth=prefetch_pages or _SHARD_PREFETCH_PAGES,
+                on_exit=self._close_session_of_current_thread,
+            )
+        else:
+            results = iterate_search_results(find_function, request, sort_field, items_field, batch_size)
+            if prefetch_pages:
+                results = prefetch_in_thread(results, prefetch_pages, on_exit=self._close_session_of_current_thread)
+        for result in iterate_in_context(ctx, results):
+            yield from getattr(result, items_field)
 
     def _async_create_objects_idempotent(
         self,
@@ -411,7 +650,7 @@ class TolokaClient:
     ):
         try:
             response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            insert_operation = structure(response, operation_type)
+            insert_operation = self._structure(response, operation_type)
         except IncorrectActionsApiError as exc:
             if exc.code != 'OPERATION_ALREADY_EXISTS':
                 raise
@@ -430,18 +669,32 @@ class TolokaClient:
         parameters: IdempotentOperationParameters,
         url: str,
         operation_type: operations.Operation,
-    ):
+        chunk_size: Optional[int] = None,
+        max_concurrent_operations: int = 1,
+    ) -> List[operations.Operation]:
         # Index objects to restore sequence in the future
         is_single = not isinstance(objects, list)
         if is_single:
-            objects._unexpected['__item_idx'] = '0'
+            objects._unexpected = {**objects._unexpected, '__item_idx': '0'}
         else:
             for item_idx, obj in enumerate(objects):
-                obj._unexpected['__item_idx'] = str(item_idx)
+                obj._unexpected = {**obj._unexpected, '__item_idx': str(item_idx)}
 
-        insert_operation = self._async_create_objects_idempotent(url, objects, parameters, operation_type)
-        insert_operation = self.wait_operation(insert_operation, datetime.timedelta(minutes=60))
-        return insert_operation
+        chunks = [(objects, parameters)] if is_single else split_into_chunks(objects, parameters, chunk_size)
+        if len(chunks) == 1:
+            insert_operation = self._async_create_objects_idempotent(url, objects, parameters, operation_type)
+            return [self.wait_operation(insert_operation, datetime.timedelta(minutes=60))]
+
+        def create_chunk(chunk, chunk_parameters):
+            insert_operation = self._async_create_objects_idempotent(url, chunk, chunk_parameters, operation_type)
+            return self.wait_operation(insert_operation, datetime.timedelta(minutes=60), disable_progress=True)
+
+        with ThreadPoolExecutor(max_workers=max_concurrent_operations) as executor:
+            operation_futures = [
+                executor.submit(contextvars.copy_context().run, create_chunk, chunk, chunk_parameters)
+                for chunk, chunk_parameters in chunks
+            ]
+            return [operation_future.result() for operation_future in operation_futures]
 
     def _sync_via_async_pool_related(
             self,
@@ -452,25 +705,35 @@ class TolokaClient:
             operation_type: operations.Operation,
             output_id_field: str,
             get_method: Callable,
+            chunk_size: Optional[int] = None,
+            max_concurrent_operations: int = 1,
+            ids_only: bool = False,
     ):
+        if ids_only:
+            return self._create_ids_via_async(
+                objects, parameters, url, operation_type, output_id_field, chunk_size, max_concurrent_operations,
+            )
         if not parameters.async_mode:
             response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
+            return self._structure(response, result_type)
         is_single = not isinstance(objects, list)
-        insert_operation = self._start_sync_via_async(objects, parameters, url, operation_type)
+        insert_operations = self._start_sync_via_async(
+            objects, parameters, url, operation_type, chunk_size, max_concurrent_operations,
+        )
 
         pools = {}
         validation_errors = {}
-        for log_item in self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
-            else:
-                continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
-                numerated_ids[log_item.output[output_id_field]] = index
-            else:
-                validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
+        for insert_operation in insert_operations:
+            for log_item in self.get_operation_log(insert_operation.id):
+                if '__item_idx' in log_item.input:
+                    index = log_item.input['__item_idx']
+                else:
+                    continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
+                if log_item.success:
+                    numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
+                    numerated_ids[log_item.output[output_id_field]] = index
+                else:
+                    validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
 
         # Like in sync methods Exception will raise
         # even if the skip_invalid_items=True but no objects are created
@@ -489,19 +752,74 @@ class TolokaClient:
             items = self._collect_from_pools(get_method, pools)
             return result_type(items=items, validation_errors=validation_errors)
 
+    def _create_ids_via_async(
+            self,
+            objects: List,
+            parameters: IdempotentOperationParameters,
+            url: str,
+            operation_type: operations.Operation,
+            output_id_field: str,
+            chunk_size: Optional[int] = None,
+            max_concurrent_operations: int = 1,
+    ) -> batch_create_results.IdsBatchCreateResult:
+        if not parameters.async_mode:
+            response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
+            response['items'] = {item_idx: item['id'] for item_idx, item in response['items'].items()}
+            return self._structure(response, batch_create_results.IdsBatchCreateResult)
+        insert_operations = self._start_sync_via_async(
+            objects, parameters, url, operation_type, chunk_size, max_concurrent_operations,
+        )
+
+        item_ids = {}
+        validation_errors = {}
+        for insert_operation in insert_operations:
+            for log_item in self.get_operation_log(insert_operation.id):
+                if '__item_idx' in log_item.input:
+                    index = log_item.input['__item_idx']
+                else:
+                    continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
+                if log_item.success:
+                    item_ids[index] = log_item.output[output_id_field]
+                else:
+                    validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
+
+        # Like in sync methods Exception will raise
+        # even if the skip_invalid_items=True but no objects are created
+        if validation_errors and not item_ids:
+            raise ValidationApiError(
+                code='VALIDATION_ERROR',
+                message='Validation failed',
+                payload=validation_errors,
+            )
+
+        return batch_create_results.IdsBatchCreateResult(items=item_ids, validation_errors=validation_errors)
+
     def _collect_from_pools(self, get_method, pools):
         items = {}
         for pool_id, numerated_ids in pools.items():
-            obj_it = get_method(
-                pool_id=pool_id,
-                id_gte=min(numerated_ids.keys()),
-                id_lte=max(numerated_ids.keys()),
-            )
-            for obj in obj_it:
-                if obj.id in numerated_ids:
-                    items[numerated_ids[obj.id]] = obj
+            for obj_id, obj in self._get_by_ids(get_method, numerated_ids, pool_id=pool_id).items():
+                items[numerated_ids[obj_id]] = obj
         return items
 
+    def _get_by_ids(
+        self, get_method, ids: Iterable[str], batch_size: Optional[int] = None, concurrency: int = 1, **filters,
+    ) -> Dict[str, Any]:
+        ids = set(ids)
+        batch_size = batch_size or _MAX_IDS_PER_WINDOW
+        windows = plan_id_windows(ids, max_ids_per_window=batch_size)
+
+        def fetch_window(window):
+            return (obj for obj in get_method(id_gte=window[0], id_lte=window[1], batch_size=batch_size, **filters) if obj.id in ids)
+
+        if concurrency > 1 and len(windows) > 1:
+            objects = iterate_shards_in_threads(
+                fetch_window, windows, max_workers=concurrency, depth=batch_size,
+                on_exit=self._close_session_of_current_thread,
+            )
+        else:
+            objects = itertools.chain.from_iterable(map(fetch_window, windows))
+        return {obj.id: obj for obj in objects}
+
     def _sync_via_async(
             self,
             objects: List,
@@ -511,24 +829,34 @@ class TolokaClient:
             operation_type: operations.Operation,
             output_id_field: str,
             get_method: Callable,
+            chunk_size: Optional[int] = None,
+            max_concurrent_operations: int = 1,
+            ids_only: bool = False,
     ):
+        if ids_only:
+            return self._create_ids_via_async(
+                objects, parameters, url, operation_type, output_id_field, chunk_size, max_concurrent_operations,
+            )
         if not parameters.async_mode:
             response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
+            return self._structure(response, result_type)
         is_single = not isinstance(objects, list)
-        insert_operation = self._start_sync_via_async(objects, parameters, url, operation_type)
+        insert_operations = self._start_sync_via_async(
+            objects, parameters, url, operation_type, chunk_size, max_concurrent_operations,
+        )
 
         item_id_to_idx = {}
         validation_errors = {}
-        for log_item in self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
-            else:
-                continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                item_id_to_idx[log_item.output[output_id_field]] = index
-            else:
-                validation_errors[index] = log_item.output
+        for insert_operation in insert_operations:
+            for log_item in self.get_operation_log(insert_operation.id):
+                if '__item_idx' in log_item.input:
+                    index = log_item.input['__item_idx']
+                else:
+                    continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
+                if log_item.success:
+                    item_id_to_idx[log_item.output[output_id_field]] = index
+                else:
+                    validation_errors[index] = log_item.output
 
         # Like as in sync methods Exception will raise
         # even if the skip_invalid_items=True but no objects are created
@@ -592,7 +920,7 @@ class TolokaClient:
         """
         data = unstructure(request)
         response = self._request('post', '/v1/aggregated-solutions/aggregate-by-pool', json=data)
-        return structure(response, operations.AggregatedSolutionOperation)
+        return self._structure(response, operations.AggregatedSolutionOperation)
 
     @expand('request')
     @add_headers('client')
@@ -624,7 +952,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/aggregated-solutions/aggregate-by-task', json=unstructure(request))
-        return structure(response, AggregatedSolution)
+        return self._structure(response, AggregatedSolution)
 
     @expand('request')
     @add_headers('client')
@@ -666,7 +994,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AggregatedSolutionSortItems)
         response = self._search_request('get', f'/v1/aggregated-solutions/{operation_id}', request, sort, limit)
-        return structure(response, search_results.AggregatedSolutionSearchResult)
+        return self._structure_search_result(response, search_results.AggregatedSolutionSearchResult)
 
     @expand('request')
     @add_headers('client')
@@ -762,7 +1090,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AssignmentSortItems)
         response = self._search_request('get', '/v1/assignments', request, sort, limit)
-        return structure(response, search_results.AssignmentSearchResult)
+        return self._structure_search_result(response, search_results.AssignmentSearchResult)
 
     @add_headers('client')
     def get_assignment(self, assignment_id: str) -> Assignment:
@@ -779,14 +1107,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/assignments/{assignment_id}')
-        return structure(response, Assignment)
+        return self._structure(response, Assignment)
 
     @expand('request')
     @add_headers('client')
     def get_assignments(
         self,
         request: search_requests.AssignmentSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        prefetch_pages: Optional[int] = None,
     ) -> Generator[Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -797,6 +1127,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned assignments limit for each request. The default batch_size  is 50. The maximum allowed batch_size  is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Assignment: The next matching assignment.
@@ -809,9 +1141,69 @@ class TolokaClient:
             >>> result_list = [assignment.id for assignment in assignments]
             ...
         """
-        generator = self._find_all(self.find_assignments, request, batch_size=batch_size)
+        generator = self._find_all(
+            self.find_assignments, request, batch_size=batch_size, parallelism=parallelism, prefetch_pages=prefetch_pages,
+        )
         yield from generator
 
+    @add_headers('client')
+    def get_assignments_by_ids(
+        self, assignment_ids: Iterable[str], batch_size: Optional[int] = None, concurrency: int = 4,
+    ) -> Dict[str, Assignment]:
+        """Gets assignments with specified IDs.
+
+        IDs are sorted and grouped into ranges of close IDs. Assignments from every range are fetched with a single
+        search request or a few requests, so it is much faster than calling `get_assignment` for every ID.
+
+        Args:
+            assignment_ids: IDs of assignments.
+            batch_size: The maximum number of requested IDs in a range. It is also used as a limit of every search request. The maximum allowed batch_size is 100,000. Default: `None` (ranges contain up to 1,000 requested IDs).
+            concurrency: The number of ranges that are fetched concurrently. Default: `4`.
+
+        Returns:
+            Dict[str, Assignment]: Found assignments by their IDs. Assignments that are not found are missing.
+
+        Example:
+            >>> assignments = toloka_client.get_assignments_by_ids(['00001092da--61ef030400c684132d0da0de', '00001092da--61ef030400c684132d0da0df'])
+            ...
+        """
+        return self._get_by_ids(self.get_assignments, assignment_ids, batch_size=batch_size, concurrency=concurrency)
+
+    @expand('request')
+    @add_headers('client')
+    def get_assignments_table(
+        self,
+        request: search_requests.AssignmentSearchRequest,
+        batch_size: Optional[int] = None,
+    ) -> Generator[RecordBatch, None, None]:
+        """Finds all assignments that match certain criteria and returns them in a columnar layout.
+
+        Every page of search results is converted to a `RecordBatch` straight from the API response, without creating
+        `Assignment` objects. Every task of an assignment makes a row. Columns are described in
+        [RecordBatch.from_assignments](toloka.client.record_batch.RecordBatch.from_assignments.md).
+
+        Args:
+            request: Search criteria.
+            batch_size: Returned assignments limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+
+        Yields:
+            RecordBatch: Assignments from the next page of search results.
+
+        Example:
+            >>> batches = toloka_client.get_assignments_table(pool_id='1', status='ACCEPTED', batch_size=100000)
+            >>> df = toloka.client.record_batch.RecordBatch.concat(batches).to_pandas()
+            ...
+        """
+        sort = structure(['id'], search_requests.AssignmentSortItems)
+        while True:
+            response = self._search_request('get', '/v1/assignments', request, sort, batch_size)
+            items = response['items']
+            if items:
+                yield RecordBatch.from_assignments(items)
+            if not response['has_more'] or not items:
+                return
+            request = attr.evolve(request, id_gt=items[-1]['id'])
+
     @expand('patch')
     @add_headers('client')
     def patch_assignment(self, assignment_id: str, patch: AssignmentPatch) -> Assignment:
@@ -831,7 +1223,7 @@ class TolokaClient:
             ...
         """
         response = self._request('patch', f'/v1/assignments/{assignment_id}', json=unstructure(patch))
-        return structure(response, Assignment)
+        return self._structure(response, Assignment)
 
     @add_headers('client')
     def reject_assignment(self, assignment_id: str, public_comment: str) -> Assignment:
@@ -881,7 +1273,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AttachmentSortItems)
         response = self._search_request('get', '/v1/attachments', request, sort, limit)
-        return structure(response, search_results.AttachmentSearchResult)
+        return self._structure_search_result(response, search_results.AttachmentSearchResult)
 
     @add_headers('client')
     def get_attachment(self, attachment_id: str) -> Attachment:
@@ -902,14 +1294,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/attachments/{attachment_id}')
-        return structure(response, Attachment)
+        return self._structure(response, Attachment)
 
     @expand('request')
     @add_headers('client')
     def get_attachments(
         self,
         request: search_requests.AttachmentSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        prefetch_pages: Optional[int] = None,
     ) -> Generator[Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -920,6 +1314,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned attachments limit for each request. The maximum allowed batch_size is 100.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Attachment: The next matching attachment.
@@ -930,7 +1326,9 @@ class TolokaClient:
             >>> results_list = list(toloka_client.get_attachments(pool_id='1'))
             ...
         """
-        generator = self._find_all(self.find_attachments, request, batch_size=batch_size)
+        generator = self._find_all(
+            self.find_attachments, request, batch_size=batch_size, parallelism=parallelism, prefetch_pages=prefetch_pages,
+        )
         yield from generator
 
     @add_headers('client')
@@ -948,8 +1346,86 @@ class TolokaClient:
             >>>     toloka_client.download_attachment(attachment_id='1', out=out_f)
             ...
         """
-        response = self._raw_request('get', f'/v1/attachments/{attachment_id}/download')
-        out.write(response.content)
+        response = self._raw_request('get', f'/v1/attachments/{attachment_id}/download', stream=True)
+        try:
+            for chunk in response.iter_bytes():
+                out.write(chunk)
+        finally:
+            response.close()
+
+    def _download_attachment_to_dir(self, attachment: Attachment, target_dir: str) -> str:
+        path = get_attachment_path(attachment, target_dir)
+        response = self._raw_request('get', f'/v1/attachments/{attachment.id}/download', stream=True)
+        try:
+            if is_already_downloaded(path, response):
+                return path
+            partial_path = get_partial_path(path)
+            with open(partial_path, 'wb') as out:
+                for chunk in response.iter_bytes():
+                    out.write(chunk)
+            os.replace(partial_path, path)
+        finally:
+            response.close()
+        return path
+
+    @expand('request')
+    @add_headers('client')
+    def download_attachments(
+        self,
+        request: search_requests.AttachmentSearchRequest,
+        *,
+        target_dir: str,
+        concurrency: int = 8,
+        disable_progress: bool = False,
+    ) -> List[str]:
+        """Downloads all attachments that match certain criteria to a directory.
+
+        Attachments are downloaded concurrently and streamed to files chunk by chunk. The list of attachments is
+        fetched page by page while files are downloaded, so memory usage doesn't depend on the number of attachments.
+        Files are named `<attachment ID>_<attachment name>`. Files that already exist and have the expected size are
+        not downloaded again, so an interrupted download can be resumed by calling the method again. Note that a
+        download request is still sent for every existing file to get its size, but its body is not read.
+
+        Args:
+            request: Search criteria.
+            target_dir: The directory to put files into. It is created if it doesn't exist.
+            concurrency: The maximum number of attachments that are downloaded simultaneously. Default: `8`.
+            disable_progress: Whether the progress bar is disabled. Default: `False`.
+
+        Returns:
+            List[str]: Paths of downloaded files.
+
+        Example:
+            >>> paths = toloka_client.download_attachments(pool_id='1', target_dir='attachments', concurrency=16)
+            ...
+        """
+        os.makedirs(target_dir, exist_ok=True)
+        download = functools.partial(self._download_attachment_to_dir, target_dir=target_dir)
+        paths = []
+        pending = {}
+
+        def collect_finished():
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for download_future in finished:
+                paths[pending.pop(download_future)] = download_future.result()
+                progress_bar.update(1)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                with logging_redirect_tqdm():
+                    with tqdm(unit='file', disable=disable_progress) as progress_bar:
+                        # Attachments are taken from the listing only when there is room for a new download
+                        for idx, attachment in enumerate(self.get_attachments(request)):
+                            if len(pending) >= concurrency:
+                                collect_finished()
+                            paths.append(None)
+                            pending[executor.submit(contextvars.copy_context().run, download, attachment)] = idx
+                        while pending:
+                            collect_finished()
+            finally:
+                for download_future in pending:
+                    download_future.cancel()
+        return paths
 
     # Message section
 
@@ -975,7 +1451,7 @@ class TolokaClient:
         if not isinstance(folders, MessageThreadFolders):
             folders = structure({'folders': folders}, MessageThreadFolders)
         response = self._request('post', f'/v1/message-threads/{message_thread_id}/add-to-folders', json=unstructure(folders))
-        return structure(response, MessageThread)
+        return self._structure(response, MessageThread)
 
     @expand('compose')
     @add_headers('client')
@@ -1002,7 +1478,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/message-threads/compose', json=unstructure(compose))
-        return structure(response, MessageThread)
+        return self._structure(response, MessageThread)
 
     @expand('request')
     @add_headers('client')
@@ -1031,7 +1507,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.MessageThreadSortItems)
         response = self._search_request('get', '/v1/message-threads', request, sort, limit)
-        return structure(response, search_results.MessageThreadSearchResult)
+        return self._structure_search_result(response, search_results.MessageThreadSearchResult)
 
     @add_headers('client')
     def reply_message_thread(self, message_thread_id: str, reply: MessageThreadReply) -> MessageThread:
@@ -1057,7 +1533,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', f'/v1/message-threads/{message_thread_id}/reply', json=unstructure(reply))
-        return structure(response, MessageThread)
+        return self._structure(response, MessageThread)
 
     @expand('request')
     @add_headers('client')
@@ -1108,7 +1584,7 @@ class TolokaClient:
         if not isinstance(folders, MessageThreadFolders):
             folders = structure({'folders': folders}, MessageThreadFolders)
         response = self._request('post', f'/v1/message-threads/{message_thread_id}/remove-from-folders', json=unstructure(folders))
-        return structure(response, MessageThread)
+        return self._structure(response, MessageThread)
 
     # Project section
 
@@ -1154,7 +1630,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', f'/v1/projects/{project_id}/archive')
-        return structure(response, operations.ProjectArchiveOperation)
+        return self._structure(response, operations.ProjectArchiveOperation)
 
     @add_headers('client')
     def create_project(self, project: Project) -> Project:
@@ -1187,7 +1663,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/projects', json=unstructure(project))
-        result = structure(response, Project)
+        result = self._structure(response, Project)
         logger.info(f'A new project with ID "{result.id}" has been created. Link to open in web interface: {self._platform_url}/requester/project/{result.id}')
         return result
 
@@ -1220,7 +1696,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.ProjectSortItems)
         response = self._search_request('get', '/v1/projects', request, sort, limit)
-        return structure(response, search_results.ProjectSearchResult)
+        return self._structure_search_result(response, search_results.ProjectSearchResult)
 
     @add_headers('client')
     def get_project(self, project_id: str) -> Project:
@@ -1236,8 +1712,7 @@ class TolokaClient:
             >>> toloka_client.get_project(project_id='1')
             ...
         """
-        response = self._request('get', f'/v1/projects/{project_id}')
-        return structure(response, Project)
+        return self._get_entity(f'/v1/projects/{project_id}', Project)
 
     @expand('request')
     @add_headers('client')
@@ -1290,7 +1765,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', f'/v1/projects/{project_id}', json=unstructure(project))
-        return structure(response, Project)
+        return self._structure(response, Project)
 
     @add_headers('client')
     def clone_project(self, project_id: str, reuse_controllers: bool = True) -> CloneResults:
@@ -1419,7 +1894,7 @@ class TolokaClient:
         # is pool already archived?
         if response.status_code == 204:
             return
-        return structure(response.json(), operations.PoolArchiveOperation)
+        return self._structure(response.json(), operations.PoolArchiveOperation)
 
     @add_headers('client')
     def close_pool(self, pool_id: str) -> Pool:
@@ -1467,7 +1942,7 @@ class TolokaClient:
         # is pool already closed?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.PoolCloseOperation)
+        return self._structure(response.json(), operations.PoolCloseOperation)
 
     @add_headers('client')
     def close_pool_for_update(self, pool_id: str) -> Pool:
@@ -1514,7 +1989,7 @@ class TolokaClient:
         # is pool already closed for update?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.PoolCloseOperation)
+        return self._structure(response.json(), operations.PoolCloseOperation)
 
     @add_headers('client')
     def clone_pool(self, pool_id: str) -> Pool:
@@ -1561,7 +2036,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', f'/v1/pools/{pool_id}/clone')
-        return structure(response, operations.PoolCloneOperation)
+        return self._structure(response, operations.PoolCloneOperation)
 
     @add_headers('client')
     def create_pool(self, pool: Pool) -> Pool:
@@ -1598,7 +2073,7 @@ class TolokaClient:
             raise ValueError('Training pools are not supported')
 
         response = self._request('post', '/v1/pools', json=unstructure(pool))
-        result = structure(response, Pool)
+        result = self._structure(response, Pool)
         logger.info(
             f'A new pool with ID "{result.id}" has been created. Link to open in web interface: '
             f'{self._platform_url}/requester/project/{result.project_id}/pool/{result.id}'
@@ -1644,7 +2119,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.PoolSortItems)
         response = self._search_request('get', '/v1/pools', request, sort, limit)
-        return structure(response, search_results.PoolSearchResult)
+        return self._structure_search_result(response, search_results.PoolSearchResult)
 
     @add_headers('client')
     def get_pool(self, pool_id: str) -> Pool:
@@ -1660,8 +2135,7 @@ class TolokaClient:
             >>> toloka_client.get_pool(pool_id='1')
             ...
         """
-        response = self._request('get', f'/v1/pools/{pool_id}')
-        return structure(response, Pool)
+        return self._get_entity(f'/v1/pools/{pool_id}', Pool)
 
     @expand('request')
     @add_headers('client')
@@ -1745,7 +2219,7 @@ class TolokaClient:
         # is pool already opened?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.PoolOpenOperation)
+        return self._structure(response.json(), operations.PoolOpenOperation)
 
     @expand('request')
     @add_headers('client')
@@ -1768,7 +2242,7 @@ class TolokaClient:
             ...
         """
         response = self._request('patch', f'/v1/pools/{pool_id}', json=unstructure(request))
-        return structure(response, Pool)
+        return self._structure(response, Pool)
 
     @add_headers('client')
     def update_pool(self, pool_id: str, pool: Pool) -> Pool:
@@ -1790,7 +2264,7 @@ class TolokaClient:
         if pool.type == Pool.Type.TRAINING:
             raise ValueError('Training pools are not supported')
         response = self._request('put', f'/v1/pools/{pool_id}', json=unstructure(pool))
-        return structure(response, Pool)
+        return self._structure(response, Pool)
 
     # Training section
 
@@ -1843,7 +2317,7 @@ class TolokaClient:
         # is training already archived?
         if response.status_code == 204:
             return
-        return structure(response.json(), operations.TrainingArchiveOperation)
+        return self._structure(response.json(), operations.TrainingArchiveOperation)
 
     @add_headers('client')
     def close_training(self, training_id: str) -> Training:
@@ -1890,7 +2364,7 @@ class TolokaClient:
         # is training already closed?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.TrainingCloseOperation)
+        return self._structure(response.json(), operations.TrainingCloseOperation)
 
     @add_headers('client')
     def clone_training(self, training_id: str) -> Training:
@@ -1937,7 +2411,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', f'/v1/trainings/{training_id}/clone')
-        return structure(response, operations.TrainingCloneOperation)
+        return self._structure(response, operations.TrainingCloneOperation)
 
     @add_headers('client')
     def create_training(self, training: Training) -> Training:
@@ -1970,7 +2444,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/trainings', json=unstructure(training))
-        result = structure(response, Training)
+        result = self._structure(response, Training)
         logger.info(
             f'A new training with ID "{result.id}" has been created. Link to open in web interface: '
             f'{self._platform_url}/requester/project/{result.project_id}/training/{result.id}'
@@ -2016,7 +2490,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.TrainingSortItems)
         response = self._search_request('get', '/v1/trainings', request, sort, limit)
-        return structure(response, search_results.TrainingSearchResult)
+        return self._structure_search_result(response, search_results.TrainingSearchResult)
 
     @add_headers('client')
     def get_training(self, training_id: str) -> Training:
@@ -2032,8 +2506,7 @@ class TolokaClient:
             >>> t = toloka_client.get_training(training_id='1')
             ...
         """
-        response = self._request('get', f'/v1/trainings/{training_id}')
-        return structure(response, Training)
+        return self._get_entity(f'/v1/trainings/{training_id}', Training)
 
     @expand('request')
     @add_headers('client')
@@ -2112,7 +2585,7 @@ class TolokaClient:
         # is training already opened?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.TrainingOpenOperation)
+        return self._structure(response.json(), operations.TrainingOpenOperation)
 
     @add_headers('client')
     def update_training(self, training_id: str, training: Training) -> Training:
@@ -2134,7 +2607,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', f'/v1/trainings/{training_id}', json=unstructure(training))
-        return structure(response, Training)
+        return self._structure(response, Training)
 
     # Skills section
 
@@ -2165,7 +2638,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/skills', json=unstructure(skill))
-        result = structure(response, Skill)
+        result = self._structure(response, Skill)
         logger.info(
             f'A new skill with ID "{result.id}" has been created. Link to open in web interface: '
             f'{self._platform_url}/requester/quality/skill/{result.id}'
@@ -2199,7 +2672,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.SkillSortItems)
         response = self._search_request('get', '/v1/skills', request, sort, limit)
-        return structure(response, search_results.SkillSearchResult)
+        return self._structure_search_result(response, search_results.SkillSearchResult)
 
     @add_headers('client')
     def get_skill(self, skill_id: str) -> Skill:
@@ -2215,8 +2688,7 @@ class TolokaClient:
             >>> toloka_client.get_skill(skill_id='1')
             ...
         """
-        response = self._request('get', f'/v1/skills/{skill_id}')
-        return structure(response, Skill)
+        return self._get_entity(f'/v1/skills/{skill_id}', Skill)
 
     @expand('request')
     @add_headers('client')
@@ -2267,7 +2739,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', f'/v1/skills/{skill_id}', json=unstructure(skill))
-        return structure(response, Skill)
+        return self._structure(response, Skill)
 
     # Statistics section
 
@@ -2296,7 +2768,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/staging/analytics-2', json=unstructure(stats))
-        return structure(response, operations.AnalyticsOperation)
+        return self._structure(response, operations.AnalyticsOperation)
 
     # Task section
 
@@ -2339,8 +2811,9 @@ class TolokaClient:
     @add_headers('client')
     def create_tasks(
         self,
-        tasks: List[Task], parameters: Optional[task.CreateTasksParameters] = None
-    ) -> batch_create_results.TaskBatchCreateResult:
+        tasks: List[Task], parameters: Optional[task.CreateTasksParameters] = None,
+        *, chunk_size: Optional[int] = None, max_concurrent_operations: int = 1, ids_only: bool = False,
+    ) -> Union[batch_create_results.TaskBatchCreateResult, batch_create_results.IdsBatchCreateResult]:
         """Creates several tasks in Toloka.
 
         You can add together general and control tasks.
@@ -2355,9 +2828,15 @@ class TolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            chunk_size: The maximum number of tasks created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all tasks are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
 
         Returns:
-            batch_create_results.TaskBatchCreateResult: The result of the operation.
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2400,6 +2879,9 @@ class TolokaClient:
             operation_type=operations.TasksCreateOperation,
             output_id_field='task_id',
             get_method=self.get_tasks,
+            chunk_size=chunk_size,
+            max_concurrent_operations=max_concurrent_operations,
+            ids_only=ids_only,
         )
 
     @expand('parameters')
@@ -2433,6 +2915,66 @@ class TolokaClient:
         parameters.async_mode = True
         return self._async_create_objects_idempotent('/v1/tasks', tasks, parameters, operations.TasksCreateOperation)
 
+    @expand('parameters')
+    @add_headers('client')
+    def upload_tasks(
+        self,
+        tasks: Iterable[Task], parameters: Optional[task.CreateTasksParameters] = None,
+        *, batch_size: int = 10000, ids_only: bool = False,
+    ) -> Generator[_TaskUploadResult, None, None]:
+        """Creates tasks from an iterable of any length in batches.
+
+        Unlike [create_tasks](toloka.client.TolokaClient.create_tasks.md), the method does not need all tasks in
+        memory: tasks are taken from the iterable lazily, `batch_size` tasks at a time, and the result is yielded as
+        soon as a batch is created. Every batch is created by a separate operation with an `operation_id` derived from
+        the one in `parameters`.
+
+        Args:
+            tasks: An iterable of tasks to be created. It may be a generator.
+            parameters: Additional parameters of the request.
+            batch_size: The maximum number of tasks created by a single operation. Default: `10000`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
+
+        Yields:
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of creating the next batch. Indexes of
+                tasks in the `tasks` iterable are used as keys in the `items` and `validation_errors` dictionaries.
+                If `skip_invalid_items` is `True`, a batch without valid tasks gives a result with empty `items`.
+
+        Raises:
+            ValidationApiError: A batch contains invalid tasks and `skip_invalid_items` is not `True`.
+
+        Example:
+            >>> def read_tasks(path):
+            >>>     with open(path) as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id=existing_pool_id)
+            >>>
+            >>> for result in toloka_client.upload_tasks(read_tasks('dataset.txt'), allow_defaults=True, ids_only=True):
+            >>>     print(len(result.items))
+            ...
+        """
+        result_type = batch_create_results.IdsBatchCreateResult if ids_only else batch_create_results.TaskBatchCreateResult
+        for batch_idx, batch in enumerate(iterate_batches(tasks, batch_size)):
+            try:
+                result = self._sync_via_async_pool_related(
+                    objects=batch,
+                    parameters=derive_parameters(parameters, batch_idx),
+                    url='/v1/tasks',
+                    result_type=batch_create_results.TaskBatchCreateResult,
+                    operation_type=operations.TasksCreateOperation,
+                    output_id_field='task_id',
+                    get_method=self.get_tasks,
+                    ids_only=ids_only,
+                )
+            except ValidationApiError as exc:
+                # A batch without valid tasks doesn't stop the upload if invalid tasks are skipped
+                if not parameters.skip_invalid_items:
+                    raise
+                validation_errors = structure(unstructure(exc.payload), Dict[str, Dict[str, FieldValidationError]])
+                result = result_type(items={}, validation_errors=validation_errors)
+            yield shift_batch_create_result(result, batch_idx * batch_size)
+
     @expand('request')
     @add_headers('client')
     def find_tasks(self, request: search_requests.TaskSearchRequest,
@@ -2460,7 +3002,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.TaskSortItems)
         response = self._search_request('get', '/v1/tasks', request, sort, limit)
-        return structure(response, search_results.TaskSearchResult)
+        return self._structure_search_result(response, search_results.TaskSearchResult)
 
     @add_headers('client')
     def get_task(self, task_id: str) -> Task:
@@ -2477,14 +3019,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/tasks/{task_id}')
-        return structure(response, Task)
+        return self._structure(response, Task)
 
     @expand('request')
     @add_headers('client')
     def get_tasks(
         self,
         request: search_requests.TaskSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        prefetch_pages: Optional[int] = None,
     ) -> Generator[Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -2495,6 +3039,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned tasks limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Task: The next matching task.
@@ -2505,9 +3051,35 @@ class TolokaClient:
             >>> results_list = list(toloka_client.get_tasks(pool_id='1'))
             ...
         """
-        generator = self._find_all(self.find_tasks, request, batch_size=batch_size)
+        generator = self._find_all(
+            self.find_tasks, request, batch_size=batch_size, parallelism=parallelism, prefetch_pages=prefetch_pages,
+        )
         yield from generator
 
+    @add_headers('client')
+    def get_tasks_by_ids(
+        self, task_ids: Iterable[str], batch_size: Optional[int] = None, concurrency: int = 4,
+    ) -> Dict[str, Task]:
+        """Gets tasks with specified IDs.
+
+        IDs are sorted and grouped into ranges of close IDs. Tasks from every range are fetched with a single search
+        request or a few requests, so it is much faster than calling `get_task` for every ID.
+
+        Args:
+            task_ids: IDs of tasks.
+            batch_size: The maximum number of requested IDs in a range. It is also used as a limit of every search request. The maximum allowed batch_size is 100,000. Default: `None` (ranges contain up to 1,000 requested IDs).
+            concurrency: The number of ranges that are fetched concurrently. Default: `4`.
+
+        Returns:
+            Dict[str, Task]: Found tasks by their IDs. Tasks that are not found are missing.
+
+        Example:
+            >>> tasks = toloka_client.get_tasks_by_ids(task_ids)
+            >>> print(tasks[task_ids[0]].input_values)
+            ...
+        """
+        return self._get_by_ids(self.get_tasks, task_ids, batch_size=batch_size, concurrency=concurrency)
+
     @expand('patch')
     @add_headers('client')
     def patch_task(self, task_id: str, patch: task.TaskPatch) -> Task:
@@ -2521,7 +3093,7 @@ class TolokaClient:
             Task: The task with updated fields.
         """
         response = self._request('patch', f'/v1/tasks/{task_id}', json=unstructure(patch))
-        return structure(response, Task)
+        return self._structure(response, Task)
 
     @expand('patch')
     @add_headers('client')
@@ -2548,7 +3120,7 @@ class TolokaClient:
             {% endnote %}
         """
         response = self._request('patch', f'/v1/tasks/{task_id}/set-overlap-or-min', json=unstructure(patch))
-        return structure(response, Task)
+        return self._structure(response, Task)
 
     # Task suites section
 
@@ -2597,8 +3169,9 @@ class TolokaClient:
     @add_headers('client')
     def create_task_suites(
         self,
-        task_suites: List[TaskSuite], parameters: Optional[task_suite.TaskSuitesCreateRequestParameters] = None
-    ) -> batch_create_results.TaskSuiteBatchCreateResult:
+        task_suites: List[TaskSuite], parameters: Optional[task_suite.TaskSuitesCreateRequestParameters] = None,
+        *, chunk_size: Optional[int] = None, max_concurrent_operations: int = 1, ids_only: bool = False,
+    ) -> Union[batch_create_results.TaskSuiteBatchCreateResult, batch_create_results.IdsBatchCreateResult]:
         """Creates several task suites in Toloka.
 
         Usually, you don't need to create a task suite manually, because Toloka can group tasks into suites automatically.
@@ -2615,9 +3188,15 @@ class TolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            chunk_size: The maximum number of task suites created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all task suites are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created task suites are returned. The IDs are taken from the operation log,
+                so created task suites are not requested. Default: `False`.
 
         Returns:
-            TaskSuiteBatchCreateResult: The result of the operation.
+            Union[TaskSuiteBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2647,6 +3226,9 @@ class TolokaClient:
             operation_type=operations.TaskSuiteCreateBatchOperation,
             output_id_field='task_suite_id',
             get_method=self.get_task_suites,
+            chunk_size=chunk_size,
+            max_concurrent_operations=max_concurrent_operations,
+            ids_only=ids_only,
         )
 
     @expand('parameters')
@@ -2720,7 +3302,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.TaskSuiteSortItems)
         response = self._search_request('get', '/v1/task-suites', request, sort, limit)
-        return structure(response, search_results.TaskSuiteSearchResult)
+        return self._structure_search_result(response, search_results.TaskSuiteSearchResult)
 
     @add_headers('client')
     def get_task_suite(self, task_suite_id: str) -> TaskSuite:
@@ -2737,14 +3319,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/task-suites/{task_suite_id}')
-        return structure(response, TaskSuite)
+        return self._structure(response, TaskSuite)
 
     @expand('request')
     @add_headers('client')
     def get_task_suites(
         self,
         request: search_requests.TaskSuiteSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        prefetch_pages: Optional[int] = None,
     ) -> Generator[TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -2755,6 +3339,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned task suites limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -2765,7 +3351,9 @@ class TolokaClient:
             >>> results_list = list(toloka_client.get_task_suites(pool_id='1'))
             ...
         """
-        generator = self._find_all(self.find_task_suites, request, batch_size=batch_size)
+        generator = self._find_all(
+            self.find_task_suites, request, batch_size=batch_size, parallelism=parallelism, prefetch_pages=prefetch_pages,
+        )
         yield from generator
 
     @expand('patch')
@@ -2789,7 +3377,7 @@ class TolokaClient:
         body = unstructure(patch)
         params = {'open_pool': body.pop('open_pool')} if 'open_pool' in body else None
         response = self._request('patch', f'/v1/task-suites/{task_suite_id}', json=body, params=params)
-        return structure(response, TaskSuite)
+        return self._structure(response, TaskSuite)
 
     @expand('patch')
     @add_headers('client')
@@ -2810,7 +3398,7 @@ class TolokaClient:
         body = unstructure(patch)
         params = {'open_pool': body.pop('open_pool')} if 'open_pool' in body else None
         response = self._request('patch', f'/v1/task-suites/{task_suite_id}/set-overlap-or-min', json=body, params=params)
-        return structure(response, TaskSuite)
+        return self._structure(response, TaskSuite)
 
     # Operations section
 
@@ -2832,7 +3420,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/operations/{operation_id}')
-        return structure(response, operations.Operation)
+        return self._structure(response, operations.Operation)
 
     @add_headers('client')
     def wait_operation(
@@ -2899,6 +3487,103 @@ class TolokaClient:
                     if datetime.datetime.now(datetime.timezone.utc) > wait_until_time:
                         raise TimeoutError
 
+    @add_headers('client')
+    def wait_operations(
+        self,
+        ops: List[operations.Operation],
+        timeout: datetime.timedelta = datetime.timedelta(minutes=10),
+        polling_interval: datetime.timedelta = datetime.timedelta(milliseconds=500),
+        max_polling_interval: datetime.timedelta = datetime.timedelta(seconds=30),
+        batch_status_checks: bool = False,
+    ) -> Generator[operations.Operation, None, None]:
+        """Waits for several operations to complete and yields them in the order of completion.
+
+        Statuses of all pending operations are checked together. The interval between checks starts at
+        `polling_interval` and grows exponentially up to `max_polling_interval` while no operation completes. It is
+        reset to `polling_interval` after a check that completes some operations.
+
+        Args:
+            ops: Operations to wait for.
+            timeout: How long to wait for all operations. Default: 10 minutes.
+            polling_interval: The initial interval between status checks. Default: 500 milliseconds.
+            max_polling_interval: The maximum interval between status checks. Default: 30 seconds.
+            batch_status_checks:
+                * `True` — Statuses of pending operations are requested with the
+                  [find_operations](toloka.client.TolokaClient.find_operations.md) method filtering operations by
+                  their type and submission time. Operations that are not found on the first few result pages are
+                  requested separately.
+                * `False` — The status of every pending operation is requested separately.
+
+                Default: `False`.
+
+        Raises:
+            TimeoutError: Raises it if the timeout has expired and some operations are still not completed.
+
+        Yields:
+            Operation: The next completed operation.
+
+        Example:
+            >>> analytics_ops = [
+            >>>     toloka_client.get_analytics([CompletionPercentagePoolAnalytics(subject_id=pool_id)])
+            >>>     for pool_id in pool_ids
+            >>> ]
+            >>> for op in toloka_client.wait_operations(analytics_ops, batch_status_checks=True):
+            >>>     print(op.details['value'][0]['result']['value'])
+            ...
+        """
+        pending = {}
+        for op in ops:
+            if op.is_completed():
+                yield op
+            else:
+                pending[op.id] = op
+
+        initial_polling_interval = polling_interval
+        wait_until_time = datetime.datetime.now(datetime.timezone.utc) + timeout
+        while pending:
+            time.sleep(polling_interval.total_seconds())
+            completed_count = 0
+            for op in self._poll_operations(pending, batch_status_checks):
+                if op.is_completed():
+                    del pending[op.id]
+                    completed_count += 1
+                    yield op
+            if not pending:
+                return
+            if datetime.datetime.now(datetime.timezone.utc) > wait_until_time:
+                raise TimeoutError
+            if completed_count:
+                polling_interval = initial_polling_interval
+            else:
+                polling_interval = min(polling_interval * _POLLING_INTERVAL_MULTIPLIER, max_polling_interval)
+
+    def _poll_operations(
+        self, pending: Dict[str, operations.Operation], batch_status_checks: bool,
+    ) -> List[operations.Operation]:
+        polled = {}
+        submitted = [op.submitted for op in pending.values() if op.submitted]
+        if batch_status_checks and len(pending) > 1 and len(submitted) == len(pending):
+            # Operation ids are random, so the search is narrowed by the type and the submission time instead
+            types = {op.type for op in pending.values()}
+            request = search_requests.OperationSearchRequest(
+                type=types.pop() if len(types) == 1 else None,
+                submitted_gte=min(submitted),
+                submitted_lte=max(submitted),
+            )
+            for _ in range(_MAX_OPERATIONS_POLL_PAGES):
+                result = self.find_operations(request, sort=['id'], limit=_MAX_OPERATIONS_SEARCH_LIMIT)
+                for op in result.items:
+                    if op.id in pending:
+                        polled[op.id] = op
+                if not result.has_more or not result.items or len(polled) == len(pending):
+                    break
+                request = attr.evolve(request, id_gt=result.items[-1].id)
+        # Operations that are not found within the pages limit are requested directly
+        for op_id in pending:
+            if op_id not in polled:
+                polled[op_id] = self.get_operation(op_id)
+        return list(polled.values())
+
     @expand('request')
     @add_headers('client')
     def find_operations(
@@ -2925,7 +3610,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.OperationSortItems)
         response = self._search_request('get', '/v1/operations', request, sort, limit)
-        return structure(response, search_results.OperationSearchResult)
+        return self._structure_search_result(response, search_results.OperationSearchResult)
 
     @expand('request')
     @add_headers('client')
@@ -2973,7 +3658,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/operations/{operation_id}/log')
-        return structure(response, List[OperationLogItem])
+        return self._structure(response, List[OperationLogItem])
 
     # User bonus
 
@@ -3029,8 +3714,9 @@ class TolokaClient:
     @add_headers('client')
     def create_user_bonuses(
         self,
-        user_bonuses: List[UserBonus], parameters: Optional[user_bonus.UserBonusesCreateRequestParameters] = None
-    ) -> batch_create_results.UserBonusBatchCreateResult:
+        user_bonuses: List[UserBonus], parameters: Optional[user_bonus.UserBonusesCreateRequestParameters] = None,
+        *, chunk_size: Optional[int] = None, max_concurrent_operations: int = 1, ids_only: bool = False,
+    ) -> Union[batch_create_results.UserBonusBatchCreateResult, batch_create_results.IdsBatchCreateResult]:
         """Creates rewards for Tolokers.
 
         Right now it's safer to use asynchronous version: "create_user_bonuses_async"
@@ -3039,10 +3725,16 @@ class TolokaClient:
         Args:
             user_bonuses: To whom, how much to pay and for what.
             parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of rewards created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all rewards are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created rewards are returned. The IDs are taken from the operation log,
+                so created rewards are not requested. Default: `False`.
 
         Returns:
-            UserBonusBatchCreateResult: Result of creating rewards. Contains `UserBonus` instances in `items` and
-                problems in `validation_errors`.
+            Union[UserBonusBatchCreateResult, IdsBatchCreateResult]: Result of creating rewards. Contains `UserBonus`
+                instances or their IDs in `items` and problems in `validation_errors`.
 
         Example:
             >>> import decimal
@@ -3085,6 +3777,9 @@ class TolokaClient:
             operation_type=operations.UserBonusCreateBatchOperation,
             output_id_field='user_bonus_id',
             get_method=self.get_user_bonuses,
+            chunk_size=chunk_size,
+            max_concurrent_operations=max_concurrent_operations,
+            ids_only=ids_only,
         )
 
     @expand('parameters')
@@ -3169,7 +3864,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserBonusSortItems)
         response = self._search_request('get', '/v1/user-bonuses', request, sort, limit)
-        return structure(response, search_results.UserBonusSearchResult)
+        return self._structure_search_result(response, search_results.UserBonusSearchResult)
 
     @add_headers('client')
     def get_user_bonus(self, user_bonus_id: str) -> UserBonus:
@@ -3186,14 +3881,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/user-bonuses/{user_bonus_id}')
-        return structure(response, UserBonus)
+        return self._structure(response, UserBonus)
 
     @expand('request')
     @add_headers('client')
     def get_user_bonuses(
         self,
         request: search_requests.UserBonusSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        prefetch_pages: Optional[int] = None,
     ) -> Generator[UserBonus, None, None]:
         """Finds all Tolokers' rewards that match certain rules and returns them in an iterable object
 
@@ -3204,6 +3901,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned Tolokers' rewards limit for each request. The maximum allowed batch_size is 300.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             UserBonus: The next matching Toloker's reward.
@@ -3212,7 +3911,9 @@ class TolokaClient:
             >>> bonuses = list(toloka_client.get_user_bonuses(created_lt='2021-06-01T00:00:00'))
             ...
         """
-        generator = self._find_all(self.find_user_bonuses, request, batch_size=batch_size)
+        generator = self._find_all(
+            self.find_user_bonuses, request, batch_size=batch_size, parallelism=parallelism, prefetch_pages=prefetch_pages,
+        )
         yield from generator
 
     # User restrictions
@@ -3244,7 +3945,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserRestrictionSortItems)
         response = self._search_request('get', '/v1/user-restrictions', request, sort, limit)
-        return structure(response, search_results.UserRestrictionSearchResult)
+        return self._structure_search_result(response, search_results.UserRestrictionSearchResult)
 
     @add_headers('client')
     def get_user_restriction(self, user_restriction_id: str) -> UserRestriction:
@@ -3261,7 +3962,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/user-restrictions/{user_restriction_id}')
-        return structure(response, UserRestriction)
+        return self._structure(response, UserRestriction)
 
     @expand('request')
     @add_headers('client')
@@ -3313,7 +4014,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', '/v1/user-restrictions', json=unstructure(user_restriction))
-        return structure(response, UserRestriction)
+        return self._structure(response, UserRestriction)
 
     @add_headers('client')
     def delete_user_restriction(self, user_restriction_id: str) -> None:
@@ -3353,7 +4054,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', '/v1/requester')
-        return structure(response, Requester)
+        return self._structure(response, Requester)
 
     # User skills
 
@@ -3384,7 +4085,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserSkillSortItems)
         response = self._search_request('get', '/v1/user-skills', request, sort, limit)
-        return structure(response, search_results.UserSkillSearchResult)
+        return self._structure_search_result(response, search_results.UserSkillSearchResult)
 
     @add_headers('client')
     def get_user_skill(self, user_skill_id: str) -> UserSkill:
@@ -3403,7 +4104,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/user-skills/{user_skill_id}')
-        return structure(response, UserSkill)
+        return self._structure(response, UserSkill)
 
     @expand('request')
     @add_headers('client')
@@ -3444,7 +4145,7 @@ class TolokaClient:
         """
 
         response = self._request('get', f'/v1/user-metadata/{user_id}')
-        return structure(response, User)
+        return self._structure(response, User)
 
     @expand('request')
     @add_headers('client')
@@ -3463,7 +4164,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', '/v1/user-skills', json=unstructure(request))
-        return structure(response, UserSkill)
+        return self._structure(response, UserSkill)
 
     @add_headers('client')
     def delete_user_skill(self, user_skill_id: str) -> None:
@@ -3515,7 +4216,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', '/v1/webhook-subscriptions', json=unstructure(subscriptions))
-        return structure(response, batch_create_results.WebhookSubscriptionBatchCreateResult)
+        return self._structure(response, batch_create_results.WebhookSubscriptionBatchCreateResult)
 
     @add_headers('client')
     def get_webhook_subscription(self, webhook_subscription_id: str) -> WebhookSubscription:
@@ -3528,7 +4229,7 @@ class TolokaClient:
             WebhookSubscription: The subscription.
         """
         response = self._request('get', f'/v1/webhook-subscriptions/{webhook_subscription_id}')
-        return structure(response, WebhookSubscription)
+        return self._structure(response, WebhookSubscription)
 
     @expand('request')
     @add_headers('client')
@@ -3551,7 +4252,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.WebhookSubscriptionSortItems)
         response = self._search_request('get', '/v1/webhook-subscriptions', request, sort, limit)
-        return structure(response, search_results.WebhookSubscriptionSearchResult)
+        return self._structure_search_result(response, search_results.WebhookSubscriptionSearchResult)
 
     @expand('request')
     @add_headers('client')
@@ -3585,12 +4286,88 @@ class TolokaClient:
         """
         self._raw_request('delete', f'/v1/webhook-subscriptions/{webhook_subscription_id}')
 
+    # Bulk section
+
+    @add_headers('client')
+    def bulk(
+        self,
+        method: Union[str, Callable],
+        kwargs_iterable: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = False,
+        return_exceptions: bool = False,
+        disable_progress: bool = False,
+    ) -> Generator[BulkItemResult, None, None]:
+        """Calls a client method many times with a bounded number of concurrent requests.
+
+        Calls are made by an `AsyncTolokaClient` in an internal event loop, so a single thread is enough for any
+        concurrency. At most `concurrency` calls are in flight, and arguments are taken from `kwargs_iterable` only when
+        there is room for a new call. To stay within request quotas, create the client with a `rate_limiter`: it paces
+        requests of all concurrent calls.
+
+        Args:
+            method: A client method or its name, for example `toloka_client.accept_assignment` or `'accept_assignment'`.
+            kwargs_iterable: Keyword arguments for every call. It may be a generator.
+            concurrency: The maximum number of concurrent calls. Default: `8`.
+            ordered:
+                * `True` — Results are yielded in the order of `kwargs_iterable`.
+                * `False` — Results are yielded as soon as calls are finished.
+
+                Default: `False`.
+            return_exceptions:
+                * `True` — Failed calls are yielded with the raised exception in the `error` attribute.
+                * `False` — The first failed call raises its exception and other calls are cancelled.
+
+                Default: `False`.
+            disable_progress: Whether the progress bar is disabled. Default: `False`.
+
+        Yields:
+            BulkItemResult: The result of every call with its index and arguments.
+
+        Example:
+            Accepting assignments and collecting errors.
+
+            >>> results = toloka_client.bulk(
+            >>>     'accept_assignment',
+            >>>     ({'assignment_id': assignment_id, 'public_comment': 'Well done!'} for assignment_id in assignment_ids),
+            >>>     concurrency=16,
+            >>>     return_exceptions=True,
+            >>> )
+            >>> errors = {item.kwargs['assignment_id']: item.error for item in results if item.error is not None}
+            ...
+        """
+        # The asynchronous client imports this module, so it is imported on the first call
+        from ..async_client import AsyncTolokaClient
+
+        method_name = method if isinstance(method, str) else method.__name__
+
+        async def iterate_results():
+            async_client = AsyncTolokaClient.from_sync_client(self)
+            try:
+                async for item in async_client.bulk(
+                    method_name, kwargs_iterable, concurrency=concurrency, ordered=ordered,
+                    return_exceptions=return_exceptions, disable_progress=disable_progress,
+                ):
+                    yield item
+            finally:
+                await async_client._close_sessions()
+
+        yield from SyncGenWrapper(iterate_results())
+
     # Experimental section
 
     if PANDAS_INSTALLED:
         @expand('parameters')
         @add_headers('client')
-        def get_assignments_df(self, pool_id: str, parameters: GetAssignmentsTsvParameters) -> pd.DataFrame:
+        def get_assignments_df(
+            self,
+            pool_id: str,
+            parameters: GetAssignmentsTsvParameters,
+            *,
+            chunksize: Optional[int] = None,
+            dtype: Union[None, str, Dict[str, str]] = None,
+        ) -> Union['pandas.DataFrame', Iterator['pandas.DataFrame']]:
             """Downloads assignments as pandas.DataFrame.
 
             {% note warning %}
@@ -3606,12 +4383,19 @@ class TolokaClient:
             Experimental method.
             Implements the same behavior as if you download results in web-interface and then read it by pandas.
 
+            The response is parsed while it is being downloaded. Set `chunksize` to process pools that do not fit in memory.
+
             Args:
                 pool_id: From which pool the results are loaded.
                 parameters: Filters for the results and the set of fields that will be in the dataframe.
+                chunksize: The number of rows in DataFrame chunks. If set, an iterator over chunks is returned instead
+                    of a single DataFrame. Default: `None`.
+                dtype: Data types of columns that are passed to `pandas.read_csv`. Explicit types save memory and
+                    keep types of columns the same in all chunks. Default: `None` — types are inferred.
 
             Returns:
-                pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
+                Union[pd.DataFrame, Iterator[pd.DataFrame]]: DataFrame with all results or an iterator over DataFrame chunks.
+                    Contains groups of fields with prefixes:
                     * "INPUT" - Fields that were at the input in the task.
                     * "OUTPUT" - Fields that were received as a result of execution.
                     * "GOLDEN" - Fields with correct answers. Filled in only for golden tasks and training tasks.
@@ -3630,15 +4414,66 @@ class TolokaClient:
                 >>>     'ASSIGNMENT:worker_id': 'annotator'
                 >>> })
                 ...
+
+                Count assignments by workers without loading all of them into memory.
+
+                >>> counts = collections.Counter()
+                >>> for chunk in toloka_client.get_assignments_df(pool_id='1', chunksize=100000):
+                >>>     counts.update(chunk['ASSIGNMENT:worker_id'])
+                ...
             """
             logger.warning('Experimental method')
             response = self._raw_request('get', f'/new/requester/pools/{pool_id}/assignments.tsv',
-                                         params=unstructure(parameters))
-            return pd.read_csv(io.StringIO(response.text), delimiter='\t')
+                                         params=unstructure(parameters), stream=True)
+            return read_tsv(io.BufferedReader(IteratorReader(response.iter_bytes())), chunksize, dtype, response.close)
+
+        @expand('parameters')
+        @add_headers('client')
+        def export_assignments(
+            self,
+            pool_id: str,
+            path: str,
+            parameters: GetAssignmentsTsvParameters,
+            *,
+            file_format: str = 'csv',
+            chunksize: int = 100000,
+            dtype: Union[None, str, Dict[str, str]] = None,
+        ) -> None:
+            """Downloads assignments to a CSV or Parquet file chunk by chunk without loading all of them into memory.
+
+            {% note warning %}
+
+            Requires toloka-kit[pandas] extras. Writing Parquet files also requires the pyarrow package.
+
+            {% endnote %}
+
+            Experimental method.
+
+            Args:
+                pool_id: From which pool the results are loaded.
+                path: The path of the file to write.
+                parameters: Filters for the results and the set of fields that will be in the file.
+                file_format: `csv` or `parquet`. Default: `csv`.
+                chunksize: The number of rows that are processed at once. Default: `100000`.
+                dtype: Data types of columns. All Parquet row groups get the schema of the first chunk, so Parquet files
+                    are written with string columns by default. Default: `None` — types are inferred for CSV files,
+                    and all columns are strings for Parquet files.
+
+            Example:
+                >>> toloka_client.export_assignments(pool_id='1', path='assignments.parquet', file_format='parquet')
+                ...
+            """
+            if dtype is None and file_format == 'parquet':
+                dtype = str
+            chunks = self.get_assignments_df(pool_id, parameters, chunksize=chunksize, dtype=dtype)
+            write_dataframes(chunks, path, file_format)
     else:
         def get_assignments_df(self, *args, **kwargs):
             raise NotImplementedError('Please install toloka-kit[pandas] extras.')
 
+        def export_assignments(self, *args, **kwargs):
+            raise NotImplementedError('Please install toloka-kit[pandas] extras.')
+
     # toloka apps
 
     @expand('request')
@@ -3678,7 +4513,7 @@ class TolokaClient:
 
         sort = None if sort is None else structure(sort, search_requests.AppProjectSortItems)
         response = self._search_request('get', '/app/v0/app-projects', request, sort, limit)
-        return structure(response, search_results.AppProjectSearchResult)
+        return self._structure_search_result(response, search_results.AppProjectSearchResult)
 
     @expand('request')
     @add_headers('client')
@@ -3767,7 +4602,7 @@ class TolokaClient:
             raise RuntimeError('this method supports only production environment')
 
         response = self._request('post', '/app/v0/app-projects', json=unstructure(app_project))
-        return structure(response, AppProject)
+        return self._structure(response, AppProject)
 
     @add_headers('client')
     def get_app_project(self, app_project_id: str) -> AppProject:
@@ -3789,7 +4624,7 @@ class TolokaClient:
             raise RuntimeError('this method supports only production environment')
 
         response = self._request('get', f'/app/v0/app-projects/{app_project_id}')
-        return structure(response, AppProject)
+        return self._structure(response, AppProject)
 
     @add_headers('client')
     def archive_app_project(self, app_project_id: str) -> AppProject:
@@ -3873,7 +4708,7 @@ class TolokaClient:
 
         sort = None if sort is None else structure(sort, search_requests.AppSortItems)
         response = self._search_request('get', '/app/v0/apps', request, sort, limit)
-        return structure(response, search_results.AppSearchResult)
+        return self._structure_search_result(response, search_results.AppSearchResult)
 
     @expand('request')
     @add_headers('client')
@@ -3930,7 +4765,7 @@ class TolokaClient:
             raise RuntimeError('this method supports only production environment')
 
         response = self._request('get', f'/app/v0/apps/{app_id}', params={'lang': lang})
-        return structure(response, App)
+        return self._structure(response, App)
 
     @expand('request')
     @add_headers('client')
@@ -3973,7 +4808,7 @@ class TolokaClient:
 
         sort = None if sort is None else structure(sort, search_requests.AppItemSortItems)
         response = self._search_request('get', f'/app/v0/app-projects/{app_project_id}/items', request, sort, limit)
-        return structure(response, search_results.AppItemSearchResult)
+        return self._structure_search_result(response, search_results.AppItemSearchResult)
 
     @expand('request')
     @add_headers('client')
@@ -4041,7 +4876,7 @@ class TolokaClient:
             raise RuntimeError('this method supports only production environment')
 
         response = self._request('post', f'/app/v0/app-projects/{app_project_id}/items', json=unstructure(app_item))
-        return structure(response, AppItem)
+        return self._structure(response, AppItem)
 
     @expand('request')
     @add_headers('client')
@@ -4092,7 +4927,7 @@ class TolokaClient:
             raise RuntimeError('this method supports only production environment')
 
         response = self._request('get', f'/app/v0/app-projects/{app_project_id}/items/{app_item_id}')
-        return structure(response, AppItem)
+        return self._structure(response, AppItem)
 
     @expand('request')
     @add_headers('client')
@@ -4121,7 +4956,7 @@ class TolokaClient:
 
         sort = None if sort is None else structure(sort, search_requests.AppBatchSortItems)
         response = self._search_request('get', f'/app/v0/app-projects/{app_project_id}/batches', request, sort, limit)
-        return structure(response, search_results.AppBatchSearchResult)
+        return self._structure_search_result(response, search_results.AppBatchSearchResult)
 
     @expand('request')
     @add_headers('client')
@@ -4187,7 +5022,7 @@ class TolokaClient:
             raise RuntimeError('this method supports only production environment')
 
         response = self._request('post', f'/app/v0/app-projects/{app_project_id}/batches', json=unstructure(request))
-        return structure(response, AppBatch)
+        return self._structure(response, AppBatch)
 
     @add_headers('client')
     def get_app_batch(self, app_project_id: str, batch_id: str) -> AppBatch:
@@ -4210,7 +5045,7 @@ class TolokaClient:
             raise RuntimeError('this method supports only production environment')
 
         response = self._request('get', f'/app/v0/app-projects/{app_project_id}/batches/{batch_id}')
-        return structure(response, AppBatch)
+        return self._structure(response, AppBatch)
 
     @expand('patch')
     @add_headers('client')
@@ -4240,7 +5075,7 @@ class TolokaClient:
         response = self._request(
             'patch', f'/app/v0/app-projects/{app_project_id}/batches/{batch_id}', json=unstructure(patch)
         )
-        return structure(response, AppBatch)
+        return self._structure(response, AppBatch)
 
     @add_headers('client')
     def start_app_batch(self, app_project_id: str, batch_id: str):
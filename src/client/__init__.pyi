@@ -17,6 +17,7 @@ __all__ = [
     'operations',
     'owner',
     'quality_control',
+    'record_batch',
     'requester',
     'search_requests',
     'search_results',
@@ -69,7 +70,7 @@ __all__ = [
 import datetime
 import decimal
 import enum
-import pandas
+import httpx
 import ssl
 import toloka.client.aggregation
 import toloka.client.analytics_request
@@ -84,7 +85,13 @@ import toloka.client.operation_log
 import toloka.client.operations
 import toloka.client.owner
 import toloka.client.pool
+import toloka.client.primitives.bulk
+import toloka.client.primitives.instrumentation
+import toloka.client.primitives.json_codec
+import toloka.client.primitives.rate_limiter
+import toloka.client.primitives.response_cache
 import toloka.client.project
+import toloka.client.record_batch
 import toloka.client.requester
 import toloka.client.search_requests
 import toloka.client.search_results
@@ -120,6 +127,7 @@ from toloka.client import (
     operations,
     owner,
     quality_control,
+    record_batch,
     requester,
     search_requests,
     search_results,
@@ -236,6 +244,33 @@ class TolokaClient:
             verify the identity of requested hosts. Either `True` (default CA bundle),
             a path to an SSL certificate file, an `ssl.SSLContext`, or `False`
             (which will disable verification)
+        rate_limiter: Client-side limiter of the request rate. Requests are delayed to stay within the limits, and
+            the limits are decreased when Toloka reports exceeded quotas. The same limiter may be shared by several clients.
+            Default value: `None`.
+        limits: Connection pool limits of HTTP sessions: the maximum number of connections, the maximum number of
+            keep-alive connections and the keep-alive expiry. Default value: `None` — default `httpx` limits are used.
+        http2: Whether HTTP/2 is used. It requires the `h2` package that is installed with `httpx[http2]`.
+            Default value: `False`.
+        share_session: Whether all threads share a single HTTP session with a common connection pool. Otherwise,
+            every thread has its own session. `AsyncTolokaClient` always uses a separate session for every event loop.
+            Default value: `False`.
+        cache: Cache of responses for single entities: pools, projects, skills and trainings. Write requests made through
+            the client invalidate cached entities. The same cache may be shared by several clients.
+            Default value: `None` — responses are not cached.
+        json_codec: Codec that encodes request bodies and decodes responses. Use `OrjsonCodec` to speed up large
+            requests and responses. Default value: `None` — `SimplejsonCodec` is used.
+        lazy_search_results: Whether items returned by `find_*` and `get_*` methods are structured lazily. Such items
+            keep raw response data and structure every attribute on the first access. It speeds up scans that read only
+            a few attributes of every item. Default value: `False`.
+        hooks: Hooks that are called around every HTTP request, retry and conversion of responses into Toloka objects.
+            Use `ClientStats` to collect request counts, latencies, transferred bytes, retries and structuring time
+            by client methods. Default value: `None`.
+        transport: Custom `httpx` transport for all requests, e.g. `toloka.testing.FakeTolokaBackend` for tests and
+            benchmarks without network access. `AsyncTolokaClient` requires a transport that supports asynchronous
+            requests. Default value: `None` — requests are sent over the network.
+
+    `TolokaClient` keeps HTTP connections open. Call the `close` method or use the client as a context manager
+    to release them.
 
     Example:
         How to create `TolokaClient` instance and make your first request to Toloka.
@@ -252,9 +287,6 @@ class TolokaClient:
     """
 
     class Environment(enum.Enum):
-        """An enumeration.
-        """
-
         SANDBOX = 'https://sandbox.toloka.dev'
         PRODUCTION = 'https://toloka.dev'
 
@@ -268,9 +300,36 @@ class TolokaClient:
         retry_quotas: typing.Union[typing.List[str], str, None] = 'MIN',
         retryer_factory: typing.Optional[typing.Callable[[], urllib3.util.retry.Retry]] = None,
         act_under_account_id: typing.Optional[str] = None,
-        verify: typing.Union[str, bool, ssl.SSLContext] = True
+        verify: typing.Union[str, bool, ssl.SSLContext] = True,
+        rate_limiter: typing.Optional[toloka.client.primitives.rate_limiter.RateLimiter] = None,
+        limits: typing.Optional[httpx.Limits] = None,
+        http2: bool = False,
+        share_session: bool = False,
+        cache: typing.Optional[toloka.client.primitives.response_cache.ResponseCache] = None,
+        json_codec: typing.Optional[toloka.client.primitives.json_codec.JsonCodec] = None,
+        lazy_search_results: bool = False,
+        hooks: typing.Optional[toloka.client.primitives.instrumentation.ClientHooks] = None,
+        transport: typing.Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None
     ): ...
 
+    def __setstate__(self, state): ...
+
+    def __enter__(self): ...
+
+    def __exit__(self, *exc_info): ...
+
+    def close(self) -> None:
+        """Closes HTTP sessions and releases all connections.
+
+        The client remains usable after closing: new sessions are opened on the next request.
+
+        Example:
+            >>> with toloka.client.TolokaClient(token, 'PRODUCTION') as toloka_client:
+            >>>     print(toloka_client.get_requester().balance)
+            ...
+        """
+        ...
+
     @typing.overload
     def aggregate_solutions_by_pool(self, request: toloka.client.aggregation.PoolAggregatedSolutionRequest) -> toloka.client.operations.AggregatedSolutionOperation:
         """Starts aggregation of responses in all completed tasks in a pool.
@@ -722,7 +781,9 @@ class TolokaClient:
     def get_assignments(
         self,
         request: toloka.client.search_requests.AssignmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -733,6 +794,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned assignments limit for each request. The default batch_size  is 50. The maximum allowed batch_size  is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Assignment: The next matching assignment.
@@ -783,7 +846,9 @@ class TolokaClient:
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -794,6 +859,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned assignments limit for each request. The default batch_size  is 50. The maximum allowed batch_size  is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Assignment: The next matching assignment.
@@ -808,6 +875,115 @@ class TolokaClient:
         """
         ...
 
+    def get_assignments_by_ids(
+        self,
+        assignment_ids: typing.Iterable[str],
+        batch_size: typing.Optional[int] = None,
+        concurrency: int = 4
+    ) -> typing.Dict[str, toloka.client.assignment.Assignment]:
+        """Gets assignments with specified IDs.
+
+        IDs are sorted and grouped into ranges of close IDs. Assignments from every range are fetched with a single
+        search request or a few requests, so it is much faster than calling `get_assignment` for every ID.
+
+        Args:
+            assignment_ids: IDs of assignments.
+            batch_size: The maximum number of requested IDs in a range. It is also used as a limit of every search request. The maximum allowed batch_size is 100,000. Default: `None` (ranges contain up to 1,000 requested IDs).
+            concurrency: The number of ranges that are fetched concurrently. Default: `4`.
+
+        Returns:
+            Dict[str, Assignment]: Found assignments by their IDs. Assignments that are not found are missing.
+
+        Example:
+            >>> assignments = toloka_client.get_assignments_by_ids(['00001092da--61ef030400c684132d0da0de', '00001092da--61ef030400c684132d0da0df'])
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_table(
+        self,
+        request: toloka.client.search_requests.AssignmentSearchRequest,
+        batch_size: typing.Optional[int] = None
+    ) -> typing.Generator[toloka.client.record_batch.RecordBatch, None, None]:
+        """Finds all assignments that match certain criteria and returns them in a columnar layout.
+
+        Every page of search results is converted to a `RecordBatch` straight from the API response, without creating
+        `Assignment` objects. Every task of an assignment makes a row. Columns are described in
+        [RecordBatch.from_assignments](toloka.client.record_batch.RecordBatch.from_assignments.md).
+
+        Args:
+            request: Search criteria.
+            batch_size: Returned assignments limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+
+        Yields:
+            RecordBatch: Assignments from the next page of search results.
+
+        Example:
+            >>> batches = toloka_client.get_assignments_table(pool_id='1', status='ACCEPTED', batch_size=100000)
+            >>> df = toloka.client.record_batch.RecordBatch.concat(batches).to_pandas()
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_table(
+        self,
+        status: typing.Union[str, toloka.client.assignment.Assignment.Status, typing.List[typing.Union[str, toloka.client.assignment.Assignment.Status]]] = None,
+        task_id: typing.Optional[str] = None,
+        task_suite_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        user_id: typing.Optional[str] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        submitted_lt: typing.Optional[datetime.datetime] = None,
+        submitted_lte: typing.Optional[datetime.datetime] = None,
+        submitted_gt: typing.Optional[datetime.datetime] = None,
+        submitted_gte: typing.Optional[datetime.datetime] = None,
+        accepted_lt: typing.Optional[datetime.datetime] = None,
+        accepted_lte: typing.Optional[datetime.datetime] = None,
+        accepted_gt: typing.Optional[datetime.datetime] = None,
+        accepted_gte: typing.Optional[datetime.datetime] = None,
+        rejected_lt: typing.Optional[datetime.datetime] = None,
+        rejected_lte: typing.Optional[datetime.datetime] = None,
+        rejected_gt: typing.Optional[datetime.datetime] = None,
+        rejected_gte: typing.Optional[datetime.datetime] = None,
+        skipped_lt: typing.Optional[datetime.datetime] = None,
+        skipped_lte: typing.Optional[datetime.datetime] = None,
+        skipped_gt: typing.Optional[datetime.datetime] = None,
+        skipped_gte: typing.Optional[datetime.datetime] = None,
+        expired_lt: typing.Optional[datetime.datetime] = None,
+        expired_lte: typing.Optional[datetime.datetime] = None,
+        expired_gt: typing.Optional[datetime.datetime] = None,
+        expired_gte: typing.Optional[datetime.datetime] = None,
+        batch_size: typing.Optional[int] = None
+    ) -> typing.Generator[toloka.client.record_batch.RecordBatch, None, None]:
+        """Finds all assignments that match certain criteria and returns them in a columnar layout.
+
+        Every page of search results is converted to a `RecordBatch` straight from the API response, without creating
+        `Assignment` objects. Every task of an assignment makes a row. Columns are described in
+        [RecordBatch.from_assignments](toloka.client.record_batch.RecordBatch.from_assignments.md).
+
+        Args:
+            request: Search criteria.
+            batch_size: Returned assignments limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+
+        Yields:
+            RecordBatch: Assignments from the next page of search results.
+
+        Example:
+            >>> batches = toloka_client.get_assignments_table(pool_id='1', status='ACCEPTED', batch_size=100000)
+            >>> df = toloka.client.record_batch.RecordBatch.concat(batches).to_pandas()
+            ...
+        """
+        ...
+
     @typing.overload
     def patch_assignment(
         self,
@@ -975,7 +1151,9 @@ class TolokaClient:
     def get_attachments(
         self,
         request: toloka.client.search_requests.AttachmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -986,6 +1164,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned attachments limit for each request. The maximum allowed batch_size is 100.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Attachment: The next matching attachment.
@@ -1016,7 +1196,9 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -1027,6 +1209,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned attachments limit for each request. The maximum allowed batch_size is 100.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Attachment: The next matching attachment.
@@ -1059,19 +1243,97 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def download_attachments(
+        self,
+        request: toloka.client.search_requests.AttachmentSearchRequest,
+        *,
+        target_dir: str,
+        concurrency: int = 8,
+        disable_progress: bool = False
+    ) -> typing.List[str]:
+        """Downloads all attachments that match certain criteria to a directory.
+
+        Attachments are downloaded concurrently and streamed to files chunk by chunk. The list of attachments is
+        fetched page by page while files are downloaded, so memory usage doesn't depend on the number of attachments.
+        Files are named `<attachment ID>_<attachment name>`. Files that already exist and have the expected size are
+        not downloaded again, so an interrupted download can be resumed by calling the method again. Note that a
+        download request is still sent for every existing file to get its size, but its body is not read.
+
+        Args:
+            request: Search criteria.
+            target_dir: The directory to put files into. It is created if it doesn't exist.
+            concurrency: The maximum number of attachments that are downloaded simultaneously. Default: `8`.
+            disable_progress: Whether the progress bar is disabled. Default: `False`.
+
+        Returns:
+            List[str]: Paths of downloaded files.
+
+        Example:
+            >>> paths = toloka_client.download_attachments(pool_id='1', target_dir='attachments', concurrency=16)
+            ...
+        """
+        ...
+
+    @typing.overload
+    def download_attachments(
+        self,
+        name: typing.Optional[str] = None,
+        type: typing.Optional[toloka.client.attachment.Attachment.Type] = None,
+        user_id: typing.Optional[str] = None,
+        assignment_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        owner_id: typing.Optional[str] = None,
+        owner_company_id: typing.Optional[str] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        target_dir: str,
+        concurrency: int = 8,
+        disable_progress: bool = False
+    ) -> typing.List[str]:
+        """Downloads all attachments that match certain criteria to a directory.
+
+        Attachments are downloaded concurrently and streamed to files chunk by chunk. The list of attachments is
+        fetched page by page while files are downloaded, so memory usage doesn't depend on the number of attachments.
+        Files are named `<attachment ID>_<attachment name>`. Files that already exist and have the expected size are
+        not downloaded again, so an interrupted download can be resumed by calling the method again. Note that a
+        download request is still sent for every existing file to get its size, but its body is not read.
+
+        Args:
+            request: Search criteria.
+            target_dir: The directory to put files into. It is created if it doesn't exist.
+            concurrency: The maximum number of attachments that are downloaded simultaneously. Default: `8`.
+            disable_progress: Whether the progress bar is disabled. Default: `False`.
+
+        Returns:
+            List[str]: Paths of downloaded files.
+
+        Example:
+            >>> paths = toloka_client.download_attachments(pool_id='1', target_dir='attachments', concurrency=16)
+            ...
+        """
+        ...
+
     def add_message_thread_to_folders(
         self,
         message_thread_id: str,
         folders: typing.Union[typing.List[typing.Union[toloka.client.message_thread.Folder, str]], toloka.client.message_thread.MessageThreadFolders]
     ) -> toloka.client.message_thread.MessageThread:
-        """Adds a message chain to one or more folders ("unread", "important" etc.)
+        """Adds a message thread to folders.
 
         Args:
-            message_thread_id: ID of message chain.
-            folders: List of folders, where to move chain.
+            message_thread_id: The ID of the message thread.
+            folders: A list of folders where to add the thread.
 
         Returns:
-            MessageThread: Full object by ID with updated folders.
+            MessageThread: The updated message thread.
 
         Example:
             >>> toloka_client.add_message_thread_to_folders(message_thread_id='1', folders=['IMPORTANT'])
@@ -1081,20 +1343,19 @@ class TolokaClient:
 
     @typing.overload
     def compose_message_thread(self, compose: toloka.client.message_thread.MessageThreadCompose) -> toloka.client.message_thread.MessageThread:
-        """Sends a message to a Toloker.
-
-        The sent message is added to a new message thread.
+        """Creates a message thread and sends the first thread message to Tolokers.
 
         Args:
-            compose: Message parameters.
+            compose: Parameters for creating the message thread.
 
         Returns:
-            MessageThread: New created thread.
+            MessageThread: The created message thread.
 
         Example:
-            If you want to thank Tolokers who have tried to complete your tasks, send them a nice message.
+            A message is sent to all Tolokers who have tried to complete your tasks.
+            The message is in english. Tolokers can't reply to your message.
 
-            >>> message_text = "Amazing job! We've just trained our first model with the data YOU prepared for us. Thank you!"
+            >>> message_text = "Amazing job! We've just trained our first model with the data you prepared for us. Thank you!"
             >>> toloka_client.compose_message_thread(
             >>>     recipients_select_type='ALL',
             >>>     topic={'EN': 'Thank you!'},
@@ -1116,20 +1377,19 @@ class TolokaClient:
         recipients_ids: typing.Optional[typing.List[str]] = None,
         recipients_filter: typing.Optional[toloka.client.filter.FilterCondition] = None
     ) -> toloka.client.message_thread.MessageThread:
-        """Sends a message to a Toloker.
-
-        The sent message is added to a new message thread.
+        """Creates a message thread and sends the first thread message to Tolokers.
 
         Args:
-            compose: Message parameters.
+            compose: Parameters for creating the message thread.
 
         Returns:
-            MessageThread: New created thread.
+            MessageThread: The created message thread.
 
         Example:
-            If you want to thank Tolokers who have tried to complete your tasks, send them a nice message.
+            A message is sent to all Tolokers who have tried to complete your tasks.
+            The message is in english. Tolokers can't reply to your message.
 
-            >>> message_text = "Amazing job! We've just trained our first model with the data YOU prepared for us. Thank you!"
+            >>> message_text = "Amazing job! We've just trained our first model with the data you prepared for us. Thank you!"
             >>> toloka_client.compose_message_thread(
             >>>     recipients_select_type='ALL',
             >>>     topic={'EN': 'Thank you!'},
@@ -1162,7 +1422,7 @@ class TolokaClient:
             MessageThreadSearchResult: Found message threads and a flag showing whether there are more matching threads.
 
         Example:
-            Find all message threads in the Inbox folder.
+            Finding all message threads in the `INBOX` folder.
 
             >>> toloka_client.find_message_threads(folder='INBOX')
             ...
@@ -1200,7 +1460,7 @@ class TolokaClient:
             MessageThreadSearchResult: Found message threads and a flag showing whether there are more matching threads.
 
         Example:
-            Find all message threads in the Inbox folder.
+            Finding all message threads in the `INBOX` folder.
 
             >>> toloka_client.find_message_threads(folder='INBOX')
             ...
@@ -1212,22 +1472,24 @@ class TolokaClient:
         message_thread_id: str,
         reply: toloka.client.message_thread.MessageThreadReply
     ) -> toloka.client.message_thread.MessageThread:
-        """Replies to a message in thread
+        """Sends a reply message in a thread.
 
         Args:
-            message_thread_id: In which thread to reply.
-            reply: Reply message.
+            message_thread_id: The ID of the thread.
+            reply: The reply message.
 
         Returns:
-            MessageThread: New created message.
+            MessageThread: The updated message thread.
 
         Example:
+            Sending a reply to all unread messages.
+
             >>> message_threads = toloka_client.get_message_threads(folder='UNREAD')
             >>> message_reply = {'EN': 'Thank you for your message! I will get back to you soon.'}
             >>> for thread in message_threads:
             >>>     toloka_client.reply_message_thread(
             >>>         message_thread_id=thread.id,
-            >>>         reply=toloka.message_thread.MessageThreadReply(text=message_reply)
+            >>>         reply=toloka.client.message_thread.MessageThreadReply(text=message_reply)
             >>>     )
             ...
         """
@@ -1301,14 +1563,14 @@ class TolokaClient:
         message_thread_id: str,
         folders: typing.Union[typing.List[typing.Union[toloka.client.message_thread.Folder, str]], toloka.client.message_thread.MessageThreadFolders]
     ) -> toloka.client.message_thread.MessageThread:
-        """Deletes a message chain from one or more folders ("unread", "important" etc.)
+        """Removes a message thread from folders.
 
         Args:
-            message_thread_id: ID of message chain.
-            folders:  List of folders, where from to remove chain.
+            message_thread_id: The ID of the message thread.
+            folders: A list of folders.
 
         Returns:
-            MessageThread: Full object by ID with updated folders.
+            MessageThread: The updated message thread.
 
         Example:
             >>> toloka_client.remove_message_thread_from_folders(message_thread_id='1', folders=['IMPORTANT'])
@@ -2796,8 +3058,12 @@ class TolokaClient:
     def create_tasks(
         self,
         tasks: typing.List[toloka.client.task.Task],
-        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None
-    ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several tasks in Toloka.
 
         You can add together general and control tasks.
@@ -2812,9 +3078,15 @@ class TolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            chunk_size: The maximum number of tasks created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all tasks are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
 
         Returns:
-            batch_create_results.TaskBatchCreateResult: The result of the operation.
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2860,8 +3132,11 @@ class TolokaClient:
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several tasks in Toloka.
 
         You can add together general and control tasks.
@@ -2876,9 +3151,15 @@ class TolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            chunk_size: The maximum number of tasks created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all tasks are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
 
         Returns:
-            batch_create_results.TaskBatchCreateResult: The result of the operation.
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2980,6 +3261,96 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def upload_tasks(
+        self,
+        tasks: typing.Iterable[toloka.client.task.Task],
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        batch_size: int = 10000,
+        ids_only: bool = False
+    ) -> typing.Generator[typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult], None, None]:
+        """Creates tasks from an iterable of any length in batches.
+
+        Unlike [create_tasks](toloka.client.TolokaClient.create_tasks.md), the method does not need all tasks in
+        memory: tasks are taken from the iterable lazily, `batch_size` tasks at a time, and the result is yielded as
+        soon as a batch is created. Every batch is created by a separate operation with an `operation_id` derived from
+        the one in `parameters`.
+
+        Args:
+            tasks: An iterable of tasks to be created. It may be a generator.
+            parameters: Additional parameters of the request.
+            batch_size: The maximum number of tasks created by a single operation. Default: `10000`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
+
+        Yields:
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of creating the next batch. Indexes of
+                tasks in the `tasks` iterable are used as keys in the `items` and `validation_errors` dictionaries.
+                If `skip_invalid_items` is `True`, a batch without valid tasks gives a result with empty `items`.
+
+        Raises:
+            ValidationApiError: A batch contains invalid tasks and `skip_invalid_items` is not `True`.
+
+        Example:
+            >>> def read_tasks(path):
+            >>>     with open(path) as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id=existing_pool_id)
+            >>>
+            >>> for result in toloka_client.upload_tasks(read_tasks('dataset.txt'), allow_defaults=True, ids_only=True):
+            >>>     print(len(result.items))
+            ...
+        """
+        ...
+
+    @typing.overload
+    def upload_tasks(
+        self,
+        tasks: typing.Iterable[toloka.client.task.Task],
+        *,
+        operation_id: typing.Optional[uuid.UUID] = ...,
+        async_mode: typing.Optional[bool] = True,
+        allow_defaults: typing.Optional[bool] = None,
+        open_pool: typing.Optional[bool] = None,
+        skip_invalid_items: typing.Optional[bool] = None,
+        batch_size: int = 10000,
+        ids_only: bool = False
+    ) -> typing.Generator[typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult], None, None]:
+        """Creates tasks from an iterable of any length in batches.
+
+        Unlike [create_tasks](toloka.client.TolokaClient.create_tasks.md), the method does not need all tasks in
+        memory: tasks are taken from the iterable lazily, `batch_size` tasks at a time, and the result is yielded as
+        soon as a batch is created. Every batch is created by a separate operation with an `operation_id` derived from
+        the one in `parameters`.
+
+        Args:
+            tasks: An iterable of tasks to be created. It may be a generator.
+            parameters: Additional parameters of the request.
+            batch_size: The maximum number of tasks created by a single operation. Default: `10000`.
+            ids_only: If `True`, only IDs of created tasks are returned. The IDs are taken from the operation log,
+                so created tasks are not requested. Default: `False`.
+
+        Yields:
+            Union[TaskBatchCreateResult, IdsBatchCreateResult]: The result of creating the next batch. Indexes of
+                tasks in the `tasks` iterable are used as keys in the `items` and `validation_errors` dictionaries.
+                If `skip_invalid_items` is `True`, a batch without valid tasks gives a result with empty `items`.
+
+        Raises:
+            ValidationApiError: A batch contains invalid tasks and `skip_invalid_items` is not `True`.
+
+        Example:
+            >>> def read_tasks(path):
+            >>>     with open(path) as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id=existing_pool_id)
+            >>>
+            >>> for result in toloka_client.upload_tasks(read_tasks('dataset.txt'), allow_defaults=True, ids_only=True):
+            >>>     print(len(result.items))
+            ...
+        """
+        ...
+
     @typing.overload
     def find_tasks(
         self,
@@ -3070,7 +3441,9 @@ class TolokaClient:
     def get_tasks(
         self,
         request: toloka.client.search_requests.TaskSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.task.Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -3081,6 +3454,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned tasks limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Task: The next matching task.
@@ -3110,7 +3485,9 @@ class TolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.task.Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -3121,6 +3498,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned tasks limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             Task: The next matching task.
@@ -3133,6 +3512,32 @@ class TolokaClient:
         """
         ...
 
+    def get_tasks_by_ids(
+        self,
+        task_ids: typing.Iterable[str],
+        batch_size: typing.Optional[int] = None,
+        concurrency: int = 4
+    ) -> typing.Dict[str, toloka.client.task.Task]:
+        """Gets tasks with specified IDs.
+
+        IDs are sorted and grouped into ranges of close IDs. Tasks from every range are fetched with a single search
+        request or a few requests, so it is much faster than calling `get_task` for every ID.
+
+        Args:
+            task_ids: IDs of tasks.
+            batch_size: The maximum number of requested IDs in a range. It is also used as a limit of every search request. The maximum allowed batch_size is 100,000. Default: `None` (ranges contain up to 1,000 requested IDs).
+            concurrency: The number of ranges that are fetched concurrently. Default: `4`.
+
+        Returns:
+            Dict[str, Task]: Found tasks by their IDs. Tasks that are not found are missing.
+
+        Example:
+            >>> tasks = toloka_client.get_tasks_by_ids(task_ids)
+            >>> print(tasks[task_ids[0]].input_values)
+            ...
+        """
+        ...
+
     @typing.overload
     def patch_task(
         self,
@@ -3306,8 +3711,12 @@ class TolokaClient:
     def create_task_suites(
         self,
         task_suites: typing.List[toloka.client.task_suite.TaskSuite],
-        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None
-    ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
+        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several task suites in Toloka.
 
         Usually, you don't need to create a task suite manually, because Toloka can group tasks into suites automatically.
@@ -3324,9 +3733,15 @@ class TolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            chunk_size: The maximum number of task suites created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all task suites are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created task suites are returned. The IDs are taken from the operation log,
+                so created task suites are not requested. Default: `False`.
 
         Returns:
-            TaskSuiteBatchCreateResult: The result of the operation.
+            Union[TaskSuiteBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -3359,8 +3774,11 @@ class TolokaClient:
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several task suites in Toloka.
 
         Usually, you don't need to create a task suite manually, because Toloka can group tasks into suites automatically.
@@ -3377,9 +3795,15 @@ class TolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            chunk_size: The maximum number of task suites created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all task suites are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created task suites are returned. The IDs are taken from the operation log,
+                so created task suites are not requested. Default: `False`.
 
         Returns:
-            TaskSuiteBatchCreateResult: The result of the operation.
+            Union[TaskSuiteBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -3575,7 +3999,9 @@ class TolokaClient:
     def get_task_suites(
         self,
         request: toloka.client.search_requests.TaskSuiteSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3586,6 +4012,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned task suites limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3616,7 +4044,9 @@ class TolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3627,6 +4057,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned task suites limit for each request. The default batch_size is 50. The maximum allowed batch_size is 100,000.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3790,6 +4222,51 @@ class TolokaClient:
         """
         ...
 
+    def wait_operations(
+        self,
+        ops: typing.List[toloka.client.operations.Operation],
+        timeout: datetime.timedelta = ...,
+        polling_interval: datetime.timedelta = ...,
+        max_polling_interval: datetime.timedelta = ...,
+        batch_status_checks: bool = False
+    ) -> typing.Generator[toloka.client.operations.Operation, None, None]:
+        """Waits for several operations to complete and yields them in the order of completion.
+
+        Statuses of all pending operations are checked together. The interval between checks starts at
+        `polling_interval` and grows exponentially up to `max_polling_interval` while no operation completes. It is
+        reset to `polling_interval` after a check that completes some operations.
+
+        Args:
+            ops: Operations to wait for.
+            timeout: How long to wait for all operations. Default: 10 minutes.
+            polling_interval: The initial interval between status checks. Default: 500 milliseconds.
+            max_polling_interval: The maximum interval between status checks. Default: 30 seconds.
+            batch_status_checks:
+                * `True` — Statuses of pending operations are requested with the
+                  [find_operations](toloka.client.TolokaClient.find_operations.md) method filtering operations by
+                  their type and submission time. Operations that are not found on the first few result pages are
+                  requested separately.
+                * `False` — The status of every pending operation is requested separately.
+
+                Default: `False`.
+
+        Raises:
+            TimeoutError: Raises it if the timeout has expired and some operations are still not completed.
+
+        Yields:
+            Operation: The next completed operation.
+
+        Example:
+            >>> analytics_ops = [
+            >>>     toloka_client.get_analytics([CompletionPercentagePoolAnalytics(subject_id=pool_id)])
+            >>>     for pool_id in pool_ids
+            >>> ]
+            >>> for op in toloka_client.wait_operations(analytics_ops, batch_status_checks=True):
+            >>>     print(op.details['value'][0]['result']['value'])
+            ...
+        """
+        ...
+
     @typing.overload
     def find_operations(
         self,
@@ -4025,8 +4502,12 @@ class TolokaClient:
     def create_user_bonuses(
         self,
         user_bonuses: typing.List[toloka.client.user_bonus.UserBonus],
-        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None
-    ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
+        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.UserBonusBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates rewards for Tolokers.
 
         Right now it's safer to use asynchronous version: "create_user_bonuses_async"
@@ -4035,10 +4516,16 @@ class TolokaClient:
         Args:
             user_bonuses: To whom, how much to pay and for what.
             parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of rewards created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all rewards are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created rewards are returned. The IDs are taken from the operation log,
+                so created rewards are not requested. Default: `False`.
 
         Returns:
-            UserBonusBatchCreateResult: Result of creating rewards. Contains `UserBonus` instances in `items` and
-                problems in `validation_errors`.
+            Union[UserBonusBatchCreateResult, IdsBatchCreateResult]: Result of creating rewards. Contains `UserBonus`
+                instances or their IDs in `items` and problems in `validation_errors`.
 
         Example:
             >>> import decimal
@@ -4082,8 +4569,11 @@ class TolokaClient:
         *,
         operation_id: typing.Optional[uuid.UUID] = ...,
         async_mode: typing.Optional[bool] = True,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_operations: int = 1,
+        ids_only: bool = False
+    ) -> typing.Union[toloka.client.batch_create_results.UserBonusBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates rewards for Tolokers.
 
         Right now it's safer to use asynchronous version: "create_user_bonuses_async"
@@ -4092,10 +4582,16 @@ class TolokaClient:
         Args:
             user_bonuses: To whom, how much to pay and for what.
             parameters: Parameters for UserBonus creation controlling.
+            chunk_size: The maximum number of rewards created by a single operation. Larger lists are split into chunks
+                that are created by separate operations. Used only if `async_mode` is `True`.
+                Default: `None` — all rewards are created by a single operation.
+            max_concurrent_operations: The maximum number of chunk operations that run at the same time. Default: `1`.
+            ids_only: If `True`, only IDs of created rewards are returned. The IDs are taken from the operation log,
+                so created rewards are not requested. Default: `False`.
 
         Returns:
-            UserBonusBatchCreateResult: Result of creating rewards. Contains `UserBonus` instances in `items` and
-                problems in `validation_errors`.
+            Union[UserBonusBatchCreateResult, IdsBatchCreateResult]: Result of creating rewards. Contains `UserBonus`
+                instances or their IDs in `items` and problems in `validation_errors`.
 
         Example:
             >>> import decimal
@@ -4324,7 +4820,9 @@ class TolokaClient:
     def get_user_bonuses(
         self,
         request: toloka.client.search_requests.UserBonusSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
         """Finds all Tolokers' rewards that match certain rules and returns them in an iterable object
 
@@ -4335,6 +4833,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned Tolokers' rewards limit for each request. The maximum allowed batch_size is 300.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             UserBonus: The next matching Toloker's reward.
@@ -4359,7 +4859,9 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        prefetch_pages: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
         """Finds all Tolokers' rewards that match certain rules and returns them in an iterable object
 
@@ -4370,6 +4872,8 @@ class TolokaClient:
         Args:
             request: Search criteria.
             batch_size: Returned Tolokers' rewards limit for each request. The maximum allowed batch_size is 300.
+            parallelism: The number of ID ranges that are fetched concurrently. Items are yielded in the same order as in sequential mode. Default: `None` (items are fetched sequentially).
+            prefetch_pages: The maximum number of pages that are fetched in the background while you process already received items. If `parallelism` is set, it is the maximum number of pages fetched ahead for every ID range. Default: `None` (pages are fetched on demand, or up to 4 pages ahead for every ID range if `parallelism` is set).
 
         Yields:
             UserBonus: The next matching Toloker's reward.
@@ -4800,17 +5304,16 @@ class TolokaClient:
         ...
 
     def upsert_webhook_subscriptions(self, subscriptions: typing.List[toloka.client.webhook_subscription.WebhookSubscription]) -> toloka.client.batch_create_results.WebhookSubscriptionBatchCreateResult:
-        """Creates (upsert) many webhook-subscriptions.
+        """Creates (upsert) webhook subscriptions.
 
         Args:
-            subscriptions: List of webhook-subscriptions, that will be created.
+            subscriptions: A list of webhook subscriptions to be created.
 
         Returns:
-            batch_create_results.WebhookSubscriptionBatchCreateResult: Result of subscriptions creation.
-                Contains created subscriptions in `items` and problems in "validation_errors".
+            batch_create_results.WebhookSubscriptionBatchCreateResult: The result of the operation.
 
         Raises:
-            ValidationApiError: If no subscriptions were created.
+            ValidationApiError: No subscriptions were created.
 
         Example:
             How to create several subscriptions.
@@ -4957,12 +5460,65 @@ class TolokaClient:
         """
         ...
 
+    def bulk(
+        self,
+        method: typing.Union[str, typing.Callable],
+        kwargs_iterable: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = False,
+        return_exceptions: bool = False,
+        disable_progress: bool = False
+    ) -> typing.Generator[toloka.client.primitives.bulk.BulkItemResult, None, None]:
+        """Calls a client method many times with a bounded number of concurrent requests.
+
+        Calls are made by an `AsyncTolokaClient` in an internal event loop, so a single thread is enough for any
+        concurrency. At most `concurrency` calls are in flight, and arguments are taken from `kwargs_iterable` only when
+        there is room for a new call. To stay within request quotas, create the client with a `rate_limiter`: it paces
+        requests of all concurrent calls.
+
+        Args:
+            method: A client method or its name, for example `toloka_client.accept_assignment` or `'accept_assignment'`.
+            kwargs_iterable: Keyword arguments for every call. It may be a generator.
+            concurrency: The maximum number of concurrent calls. Default: `8`.
+            ordered:
+                * `True` — Results are yielded in the order of `kwargs_iterable`.
+                * `False` — Results are yielded as soon as calls are finished.
+
+                Default: `False`.
+            return_exceptions:
+                * `True` — Failed calls are yielded with the raised exception in the `error` attribute.
+                * `False` — The first failed call raises its exception and other calls are cancelled.
+
+                Default: `False`.
+            disable_progress: Whether the progress bar is disabled. Default: `False`.
+
+        Yields:
+            BulkItemResult: The result of every call with its index and arguments.
+
+        Example:
+            Accepting assignments and collecting errors.
+
+            >>> results = toloka_client.bulk(
+            >>>     'accept_assignment',
+            >>>     ({'assignment_id': assignment_id, 'public_comment': 'Well done!'} for assignment_id in assignment_ids),
+            >>>     concurrency=16,
+            >>>     return_exceptions=True,
+            >>> )
+            >>> errors = {item.kwargs['assignment_id']: item.error for item in results if item.error is not None}
+            ...
+        """
+        ...
+
     @typing.overload
     def get_assignments_df(
         self,
         pool_id: str,
-        parameters: toloka.client.assignment.GetAssignmentsTsvParameters
-    ) -> pandas.DataFrame:
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        chunksize: typing.Optional[int] = None,
+        dtype: typing.Union[None, str, typing.Dict[str, str]] = None
+    ) -> typing.Union['pandas.DataFrame', typing.Iterator['pandas.DataFrame']]:
         """Downloads assignments as pandas.DataFrame.
 
         {% note warning %}
@@ -4978,12 +5534,19 @@ class TolokaClient:
         Experimental method.
         Implements the same behavior as if you download results in web-interface and then read it by pandas.
 
+        The response is parsed while it is being downloaded. Set `chunksize` to process pools that do not fit in memory.
+
         Args:
             pool_id: From which pool the results are loaded.
             parameters: Filters for the results and the set of fields that will be in the dataframe.
+            chunksize: The number of rows in DataFrame chunks. If set, an iterator over chunks is returned instead
+                of a single DataFrame. Default: `None`.
+            dtype: Data types of columns that are passed to `pandas.read_csv`. Explicit types save memory and
+                keep types of columns the same in all chunks. Default: `None` — types are inferred.
 
         Returns:
-            pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
+            Union[pd.DataFrame, Iterator[pd.DataFrame]]: DataFrame with all results or an iterator over DataFrame chunks.
+                Contains groups of fields with prefixes:
                 * "INPUT" - Fields that were at the input in the task.
                 * "OUTPUT" - Fields that were received as a result of execution.
                 * "GOLDEN" - Fields with correct answers. Filled in only for golden tasks and training tasks.
@@ -5002,6 +5565,13 @@ class TolokaClient:
             >>>     'ASSIGNMENT:worker_id': 'annotator'
             >>> })
             ...
+
+            Count assignments by workers without loading all of them into memory.
+
+            >>> counts = collections.Counter()
+            >>> for chunk in toloka_client.get_assignments_df(pool_id='1', chunksize=100000):
+            >>>     counts.update(chunk['ASSIGNMENT:worker_id'])
+            ...
         """
         ...
 
@@ -5014,8 +5584,10 @@ class TolokaClient:
         start_time_from: typing.Optional[datetime.datetime] = None,
         start_time_to: typing.Optional[datetime.datetime] = None,
         exclude_banned: typing.Optional[bool] = None,
-        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...
-    ) -> pandas.DataFrame:
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        chunksize: typing.Optional[int] = None,
+        dtype: typing.Union[None, str, typing.Dict[str, str]] = None
+    ) -> typing.Union['pandas.DataFrame', typing.Iterator['pandas.DataFrame']]:
         """Downloads assignments as pandas.DataFrame.
 
         {% note warning %}
@@ -5031,12 +5603,19 @@ class TolokaClient:
         Experimental method.
         Implements the same behavior as if you download results in web-interface and then read it by pandas.
 
+        The response is parsed while it is being downloaded. Set `chunksize` to process pools that do not fit in memory.
+
         Args:
             pool_id: From which pool the results are loaded.
             parameters: Filters for the results and the set of fields that will be in the dataframe.
+            chunksize: The number of rows in DataFrame chunks. If set, an iterator over chunks is returned instead
+                of a single DataFrame. Default: `None`.
+            dtype: Data types of columns that are passed to `pandas.read_csv`. Explicit types save memory and
+                keep types of columns the same in all chunks. Default: `None` — types are inferred.
 
         Returns:
-            pd.DataFrame: DataFrame with all results. Contains groups of fields with prefixes:
+            Union[pd.DataFrame, Iterator[pd.DataFrame]]: DataFrame with all results or an iterator over DataFrame chunks.
+                Contains groups of fields with prefixes:
                 * "INPUT" - Fields that were at the input in the task.
                 * "OUTPUT" - Fields that were received as a result of execution.
                 * "GOLDEN" - Fields with correct answers. Filled in only for golden tasks and training tasks.
@@ -5055,6 +5634,91 @@ class TolokaClient:
             >>>     'ASSIGNMENT:worker_id': 'annotator'
             >>> })
             ...
+
+            Count assignments by workers without loading all of them into memory.
+
+            >>> counts = collections.Counter()
+            >>> for chunk in toloka_client.get_assignments_df(pool_id='1', chunksize=100000):
+            >>>     counts.update(chunk['ASSIGNMENT:worker_id'])
+            ...
+        """
+        ...
+
+    @typing.overload
+    def export_assignments(
+        self,
+        pool_id: str,
+        path: str,
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        file_format: str = 'csv',
+        chunksize: int = 100000,
+        dtype: typing.Union[None, str, typing.Dict[str, str]] = None
+    ) -> None:
+        """Downloads assignments to a CSV or Parquet file chunk by chunk without loading all of them into memory.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] extras. Writing Parquet files also requires the pyarrow package.
+
+        {% endnote %}
+
+        Experimental method.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            path: The path of the file to write.
+            parameters: Filters for the results and the set of fields that will be in the file.
+            file_format: `csv` or `parquet`. Default: `csv`.
+            chunksize: The number of rows that are processed at once. Default: `100000`.
+            dtype: Data types of columns. All Parquet row groups get the schema of the first chunk, so Parquet files
+                are written with string columns by default. Default: `None` — types are inferred for CSV files,
+                and all columns are strings for Parquet files.
+
+        Example:
+            >>> toloka_client.export_assignments(pool_id='1', path='assignments.parquet', file_format='parquet')
+            ...
+        """
+        ...
+
+    @typing.overload
+    def export_assignments(
+        self,
+        pool_id: str,
+        path: str,
+        *,
+        status: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Status]] = ...,
+        start_time_from: typing.Optional[datetime.datetime] = None,
+        start_time_to: typing.Optional[datetime.datetime] = None,
+        exclude_banned: typing.Optional[bool] = None,
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        file_format: str = 'csv',
+        chunksize: int = 100000,
+        dtype: typing.Union[None, str, typing.Dict[str, str]] = None
+    ) -> None:
+        """Downloads assignments to a CSV or Parquet file chunk by chunk without loading all of them into memory.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] extras. Writing Parquet files also requires the pyarrow package.
+
+        {% endnote %}
+
+        Experimental method.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            path: The path of the file to write.
+            parameters: Filters for the results and the set of fields that will be in the file.
+            file_format: `csv` or `parquet`. Default: `csv`.
+            chunksize: The number of rows that are processed at once. Default: `100000`.
+            dtype: Data types of columns. All Parquet row groups get the schema of the first chunk, so Parquet files
+                are written with string columns by default. Default: `None` — types are inferred for CSV files,
+                and all columns are strings for Parquet files.
+
+        Example:
+            >>> toloka_client.export_assignments(pool_id='1', path='assignments.parquet', file_format='parquet')
+            ...
         """
         ...
 
@@ -6095,3 +6759,12 @@ class TolokaClient:
     _platform_url: typing.Optional[str]
     url: typing.Optional[str]
     retryer_factory: typing.Optional[typing.Callable[[], urllib3.util.retry.Retry]]
+    rate_limiter: typing.Optional[toloka.client.primitives.rate_limiter.RateLimiter]
+    limits: typing.Optional[httpx.Limits]
+    http2: bool
+    share_session: bool
+    cache: typing.Optional[toloka.client.primitives.response_cache.ResponseCache]
+    json_codec: toloka.client.primitives.json_codec.JsonCodec
+    lazy_search_results: bool
+    hooks: typing.Optional[toloka.client.primitives.instrumentation.ClientHooks]
+    transport: typing.Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None]
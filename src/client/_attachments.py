@@ -0,0 +1,23 @@
+__all__: list = []
+import os
+
+import httpx
+
+from .attachment import Attachment
+
+
+def get_attachment_path(attachment: Attachment, target_dir: str) -> str:
+    """Returns a unique path for the attachment in the directory. File names are prefixed with attachment IDs."""
+    name = os.path.basename(attachment.name or '')
+    return os.path.join(target_dir, f'{attachment.id}_{name}' if name else attachment.id)
+
+
+def is_already_downloaded(path: str, response: httpx.Response) -> bool:
+    """Checks whether the file exists and has the size of the response body."""
+    content_length = response.headers.get('Content-Length')
+    return content_length is not None and os.path.isfile(path) and os.path.getsize(path) == int(content_length)
+
+
+def get_partial_path(path: str) -> str:
+    """Returns a path for the file that is being downloaded, so incomplete files never have the final name."""
+    return f'{path}.part'
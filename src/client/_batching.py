@@ -0,0 +1,56 @@
+__all__: list = []
+import itertools
+import uuid
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+import attr
+
+from .primitives.parameter import IdempotentOperationParameters
+
+T = TypeVar('T')
+
+
+def derive_parameters(parameters: IdempotentOperationParameters, chunk_idx: int) -> IdempotentOperationParameters:
+    """Returns parameters for a chunk of objects with an `operation_id` derived from the original one."""
+    return attr.evolve(parameters, operation_id=uuid.uuid5(uuid.UUID(str(parameters.operation_id)), str(chunk_idx)))
+
+
+def iterate_batches(objects: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    """Lazily groups objects from any iterable into lists of at most `batch_size` objects."""
+    iterator = iter(objects)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def split_into_chunks(
+    objects: Sequence, parameters: IdempotentOperationParameters, chunk_size: Optional[int] = None,
+) -> List[Tuple[Sequence, IdempotentOperationParameters]]:
+    """Splits objects for batch creation into chunks that are created by separate operations.
+
+    Every chunk gets its own `operation_id` derived from the original one, so repeating the call with the same
+    parameters and the same `chunk_size` is idempotent for every chunk.
+
+    Returns:
+        List[Tuple[Sequence, IdempotentOperationParameters]]: Pairs of objects chunk and request parameters for it.
+    """
+    if not chunk_size or len(objects) <= chunk_size:
+        return [(objects, parameters)]
+
+    return [
+        (objects[start:start + chunk_size], derive_parameters(parameters, chunk_idx))
+        for chunk_idx, start in enumerate(range(0, len(objects), chunk_size))
+    ]
+
+
+def shift_batch_create_result(result, offset: int):
+    """Returns a batch creation result with item indexes shifted by `offset`."""
+    if not offset:
+        return result
+
+    def shift(items):
+        return {str(int(item_idx) + offset): item for item_idx, item in items.items()} if items is not None else None
+
+    return type(result)(items=shift(result.items), validation_errors=shift(result.validation_errors))
@@ -4,18 +4,100 @@ from decimal import Decimal
 import typing
 import re
 import uuid
-import pkg_resources
 from typing import List, Union
 
 import cattr
 from ..util._extendable_enum import ExtendableStrEnum
 
-_CATTRS_VERSION = tuple(map(int, pkg_resources.get_distribution('cattrs').version.split('.')))
+try:
+    from importlib.metadata import version as _get_distribution_version
+except ImportError:  # Python 3.7. Importing pkg_resources is slow, so it is used only when there is no other way
+    import pkg_resources
+
+    def _get_distribution_version(distribution_name: str) -> str:
+        return pkg_resources.get_distribution(distribution_name).version
+
+_CATTRS_VERSION = tuple(map(int, _get_distribution_version('cattrs').split('.')))
 
 if _CATTRS_VERSION < (22, 2, 0):
-    converter = cattr.Converter()
+    _BaseConverter = cattr.Converter
 else:
-    converter = cattr.converters.BaseConverter()
+    _BaseConverter = cattr.converters.BaseConverter
+
+# Caches of functions that call structure hooks directly, such as generated structure functions of Toloka objects
+_STRUCTURE_CACHES: List[dict] = []
+# Caches of functions that call unstructure hooks directly or skip them, such as generated unstructure functions
+_UNSTRUCTURE_CACHES: List[dict] = []
+
+
+def register_structure_cache(cache: dict) -> dict:
+    """Registers a cache that is cleared every time a structure hook is registered."""
+    _STRUCTURE_CACHES.append(cache)
+    return cache
+
+
+def register_unstructure_cache(cache: dict) -> dict:
+    """Registers a cache that is cleared every time an unstructure hook is registered."""
+    _UNSTRUCTURE_CACHES.append(cache)
+    return cache
+
+
+def _clear_caches(caches: List[dict]) -> None:
+    for cache in caches:
+        cache.clear()
+
+
+class _Converter(_BaseConverter):
+    """A converter that clears registered caches when structure or unstructure hooks change."""
+
+    def register_structure_hook(self, cl, func=None):
+        if func is None:
+            # Used as a decorator in newer versions of cattrs
+            def decorator(func):
+                self.register_structure_hook(cl, func)
+                return func
+            return decorator
+        super().register_structure_hook(cl, func)
+        _clear_caches(_STRUCTURE_CACHES)
+
+    def register_structure_hook_func(self, predicate, func):
+        super().register_structure_hook_func(predicate, func)
+        _clear_caches(_STRUCTURE_CACHES)
+
+    def register_structure_hook_factory(self, predicate, factory):
+        super().register_structure_hook_factory(predicate, factory)
+        _clear_caches(_STRUCTURE_CACHES)
+
+    def register_unstructure_hook(self, cls, func=None):
+        if func is None:
+            # Used as a decorator in newer versions of cattrs
+            def decorator(func):
+                self.register_unstructure_hook(cls, func)
+                return func
+            return decorator
+        super().register_unstructure_hook(cls, func)
+        _clear_caches(_UNSTRUCTURE_CACHES)
+
+    def register_unstructure_hook_func(self, predicate, func):
+        super().register_unstructure_hook_func(predicate, func)
+        _clear_caches(_UNSTRUCTURE_CACHES)
+
+    def register_unstructure_hook_factory(self, predicate, factory):
+        super().register_unstructure_hook_factory(predicate, factory)
+        _clear_caches(_UNSTRUCTURE_CACHES)
+
+
+converter = _Converter()
+
+
+def get_structure_hook(type_: typing.Any) -> typing.Callable[[typing.Any, typing.Any], typing.Any]:
+    """Returns the hook that structures data into the type. The hook is called as `hook(data, type_)`.
+
+    Callers that keep the hook must register their cache with `register_structure_cache`.
+    """
+    if hasattr(converter, 'get_structure_hook'):
+        return converter.get_structure_hook(type_)
+    return converter._structure_func.dispatch(type_)
 
 converter.register_structure_hook_func(
     lambda type_: hasattr(type_, 'structure'),
@@ -72,7 +154,8 @@ converter.register_unstructure_hook(datetime.datetime, lambda data: datetime_to_
 
 converter.register_structure_hook(
     Decimal,
-    lambda data, type_: Decimal(data)  # type: ignore
+    # Floats are converted through their shortest representation, so 0.1 becomes Decimal('0.1')
+    lambda data, type_: Decimal(repr(data)) if isinstance(data, float) else Decimal(data)  # type: ignore
 )
 
 # We need to redefine structure/unstructure hook for ExtendableStrEnum because hasattr(type_, 'structure') works
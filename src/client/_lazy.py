@@ -0,0 +1,177 @@
+__all__: list = []
+import sys
+from typing import Any, ClassVar, Dict, Tuple, Type
+
+import attr
+
+from ._converter import converter, get_structure_hook, register_structure_cache
+from .primitives.base import BaseTolokaObject, _get_mapped_type, _is_interned_field
+from ..util import identity
+from ..util._codegen import ORIGIN_KEY
+from ..util._typing import generate_type_var_mapping, get_args, get_origin, is_optional_of
+
+# Lazy subclasses are created once for every structured class and created again after new structure hooks are
+# registered, as their fields keep the hooks of field types. Parametrized generic classes get their own subclasses
+_LAZY_CLASSES: Dict[type, type] = register_structure_cache({})
+
+
+class _LazyField:
+
+    def __init__(self, field: attr.Attribute, type_var_mapping: Dict[str, type]):
+        self.key = field.metadata.get(ORIGIN_KEY, field.name)
+        self.default = field.default
+        self.converter = field.converter
+        field_type = None if field.type is None else _get_mapped_type(field.type, type_var_mapping)
+        # Optional types are unwrapped to skip union dispatch for every value
+        optional_type = None if field_type is None else is_optional_of(field_type)
+        self.is_optional = optional_type is not None
+        self.type = optional_type or field_type
+        self.structure_hook = None if self.type is None else get_structure_hook(self.type)
+        self.is_interned = _is_interned_field(field, self.type)
+
+    def structure(self, obj, raw: dict) -> Any:
+        if self.key not in raw:
+            if isinstance(self.default, attr.Factory):
+                return self.default.factory(obj) if self.default.takes_self else self.default.factory()
+            return self.default
+        value = raw[self.key]
+        if self.type is not None and not (self.is_optional and value is None):
+            value = self.structure_hook(value, self.type)
+            if self.is_interned:
+                value = sys.intern(value)
+        if self.converter is not None:
+            value = self.converter(value)
+        return value
+
+
+class _LazyTolokaObjectMixin:
+    """Mixin for lazy subclasses of Toloka objects.
+
+    A lazy object keeps the raw data and structures every field on the first access. Structured values are memoized
+    in the instance dict, so subsequent accesses and assignments work as for usual objects.
+    """
+
+    _lazy_base: ClassVar[type]
+    _lazy_fields: ClassVar[Dict[str, _LazyField]]
+    _known_keys: ClassVar[frozenset]
+
+    def __getattr__(self, item):
+        if item == '_raw':
+            raise AttributeError(item)
+        raw = self._raw
+        if item == '_unexpected':
+            value = {key: value for key, value in raw.items() if key not in self._known_keys}
+        elif item in self._lazy_fields:
+            value = self._lazy_fields[item].structure(self, raw)
+        else:
+            try:
+                return self._unexpected[item]
+            except KeyError as exc:
+                raise AttributeError(str(item)) from exc
+        # Bypass on_setattr hooks since the value is already converted
+        self.__dict__[item] = value
+        return value
+
+    def unstructure(self):
+        # Unexpected fields are kept in the raw data until the first access
+        self._unexpected
+        return super().unstructure()
+
+    def _materialize(self) -> BaseTolokaObject:
+        """Returns a usual object with all fields structured."""
+        obj = object.__new__(self._lazy_base)
+        obj.__dict__.update((field.name, getattr(self, field.name)) for field in attr.fields(self._lazy_base))
+        return obj
+
+    def __reduce_ex__(self, protocol):
+        # Copies and unpickled objects are usual objects
+        return identity, (self._materialize(),)
+
+    def __eq__(self, other):
+        if not isinstance(other, self._lazy_base):
+            return NotImplemented
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in attr.fields(self._lazy_base))
+
+    __hash__ = None
+
+
+def _get_lazy_class(generic_cls: type) -> type:
+    lazy_cls = _LAZY_CLASSES.get(generic_cls)
+    if lazy_cls is None:
+        # Field types are resolved the same way as by the eager structure functions
+        cls, type_var_mapping = generate_type_var_mapping(generic_cls)
+        fields = [field for field in attr.fields(cls) if field.name != '_unexpected']
+        namespace = {
+            '_lazy_base': cls,
+            '_lazy_fields': {field.name: _LazyField(field, type_var_mapping) for field in fields},
+            '_known_keys': frozenset(field.metadata.get(ORIGIN_KEY, field.name) for field in fields),
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__doc__': cls.__doc__,
+        }
+        if cls._variant_registry is not None:
+            # Otherwise the subclass would be considered as an incomplete variant type
+            namespace[cls._variant_registry.field] = getattr(cls, cls._variant_registry.field)
+        # Skip the metaclass so attrs doesn't regenerate the class: all attrs methods are inherited
+        lazy_cls = type.__new__(type(cls), cls.__name__, (_LazyTolokaObjectMixin, cls), namespace)
+        lazy_cls = _LAZY_CLASSES.setdefault(generic_cls, lazy_cls)
+    return lazy_cls
+
+
+def _resolve_variant(cls: type, data: dict) -> Tuple[type, dict]:
+    while cls.is_variant_incomplete():
+        registry = cls._variant_registry
+        if registry.field not in data:
+            break
+        try:
+            spec_value = registry.enum(data[registry.field])
+        except ValueError:
+            break
+        if spec_value not in registry.registered_classes:
+            break
+        cls = registry[spec_value]
+        data = {key: value for key, value in data.items() if key != registry.field}
+    return cls, data
+
+
+def _has_custom_structure(cls: type) -> bool:
+    return cls.structure.__func__ is not BaseTolokaObject.structure.__func__
+
+
+def structure_lazily(data: Any, cls: Type[BaseTolokaObject]) -> BaseTolokaObject:
+    """Structures data into an object that structures its fields on the first access.
+
+    Classes with custom structuring logic and variants that can't be resolved are structured eagerly.
+    """
+    if not isinstance(data, dict):
+        return converter.structure(data, cls)
+    cls, data = _resolve_variant(cls, data)
+    if cls.is_variant_incomplete() or _has_custom_structure(cls):
+        return converter.structure(data, cls)
+    obj = object.__new__(_get_lazy_class(cls))
+    obj.__dict__['_raw'] = data
+    return obj
+
+
+def _is_toloka_object_type(type_: Any) -> bool:
+    cls = get_origin(type_) or type_
+    return isinstance(cls, type) and issubclass(cls, BaseTolokaObject)
+
+
+def structure_search_result_lazily(data: dict, result_type: type) -> BaseTolokaObject:
+    """Structures a search result with lazily structured items."""
+    data = dict(data)
+    lazy_items = {}
+    result_cls, type_var_mapping = generate_type_var_mapping(result_type)
+    for field in attr.fields(result_cls):
+        field_type = _get_mapped_type(field.type, type_var_mapping)
+        field_type = is_optional_of(field_type) or field_type
+        item_types = get_args(field_type)
+        if get_origin(field_type) is list and item_types and _is_toloka_object_type(item_types[0]):
+            items = data.pop(field.metadata.get(ORIGIN_KEY, field.name), None)
+            if items is not None:
+                lazy_items[field.name] = [structure_lazily(item, item_types[0]) for item in items]
+    result = converter.structure(data, result_type)
+    for name, items in lazy_items.items():
+        setattr(result, name, items)
+    return result
@@ -0,0 +1,328 @@
+__all__: list = []
+import asyncio
+import collections
+import contextvars
+import itertools
+import queue
+import statistics
+import string
+import threading
+from typing import Any, AsyncIterator, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import attr
+
+T = TypeVar('T')
+
+# Characters that are always considered as possible id characters when splitting an id range. Toloka ids are
+# hexadecimal strings possibly separated by dashes, so these characters give a reasonable resolution even when the
+# bounding ids themselves contain only a few distinct characters.
+_DEFAULT_ID_ALPHABET = frozenset('-' + string.digits + 'abcdef')
+
+
+def _make_string_numbering(values: Iterable[str]) -> Tuple[List[str], int, Callable[[str], int]]:
+    """Returns the alphabet, the length and a function that maps strings to numbers preserving their order.
+
+    Strings are treated as numbers written in the alphabet consisting of their characters and padded to the length
+    of the longest string.
+    """
+    values = list(values)
+    alphabet = sorted(_DEFAULT_ID_ALPHABET.union(*values))
+    base = len(alphabet)
+    char_to_digit = {char: digit for digit, char in enumerate(alphabet)}
+    length = max(map(len, values))
+
+    def to_number(value: str) -> int:
+        number = 0
+        for char in value.ljust(length, alphabet[0]):
+            number = number * base + char_to_digit[char]
+        return number
+
+    return alphabet, length, to_number
+
+
+def split_string_range(lower: str, upper: str, parts: int) -> List[str]:
+    """Splits the lexicographic range between two strings into approximately equal parts.
+
+    Strings are treated as numbers written in the alphabet consisting of their characters, so the split is even for
+    uniformly distributed ids.
+
+    Args:
+        lower: Lower bound of the range.
+        upper: Upper bound of the range.
+        parts: Desired number of parts.
+
+    Returns:
+        List[str]: Sorted unique boundaries lying strictly between `lower` and `upper`. The list contains at most
+            `parts - 1` elements and may be empty if the range is too narrow.
+    """
+    if parts < 2 or lower >= upper:
+        return []
+
+    alphabet, length, to_number = _make_string_numbering([lower, upper])
+    base = len(alphabet)
+
+    def to_string(number: int) -> str:
+        chars = []
+        for _ in range(length):
+            number, digit = divmod(number, base)
+            chars.append(alphabet[digit])
+        return ''.join(reversed(chars))
+
+    lower_number, upper_number = to_number(lower), to_number(upper)
+    boundaries = []
+    for part in range(1, parts):
+        boundary = to_string(lower_number + (upper_number - lower_number) * part // parts)
+        if lower < boundary < upper and (not boundaries or boundaries[-1] < boundary):
+            boundaries.append(boundary)
+    return boundaries
+
+
+def plan_id_windows(ids: Iterable[str], max_ids_per_window: int, max_gap_ratio: float = 8.0) -> List[Tuple[str, str]]:
+    """Groups ids into closed ranges that can be fetched with `id_gte` and `id_lte` search conditions.
+
+    Every range contains at most `max_ids_per_window` of the ids. A range is also closed before a gap between
+    neighbouring ids that is `max_gap_ratio` times wider than the median gap, so sparse ids don't make ranges cover
+    many items that were not requested.
+
+    Returns:
+        List[Tuple[str, str]]: Sorted non-overlapping ranges as (first id, last id) pairs.
+    """
+    ids = sorted(set(ids))
+    if not ids:
+        return []
+    _, _, to_number = _make_string_numbering(ids)
+    numbers = [to_number(item_id) for item_id in ids]
+    gaps = [upper - lower for lower, upper in zip(numbers, numbers[1:])]
+    max_gap = statistics.median(gaps) * max_gap_ratio if gaps else 0
+
+    windows = []
+    first_idx = 0
+    for idx, gap in enumerate(gaps, start=1):
+        if idx - first_idx >= max_ids_per_window or gap > max_gap:
+            windows.append((ids[first_idx], ids[idx - 1]))
+            first_idx = idx
+    windows.append((ids[first_idx], ids[-1]))
+    return windows
+
+
+def make_shard_requests(request, sort_field: str, lower: str, upper: str, parallelism: int) -> List:
+    """Splits search request for items with `sort_field` greater than `lower` into consecutive non-overlapping shards.
+
+    The last shard is left unbounded from above so items created after the boundaries were probed are not lost.
+    """
+    boundaries = split_string_range(lower, upper, parallelism)
+    shards = []
+    previous_condition = {f'{sort_field}_gt': lower}
+    for boundary in boundaries:
+        shards.append(attr.evolve(request, **previous_condition, **{f'{sort_field}_lt': boundary}))
+        previous_condition = {f'{sort_field}_gte': boundary}
+    shards.append(attr.evolve(request, **previous_condition))
+    return shards
+
+
+def iterate_search_results(
+    find_function: Callable, request, sort_field: str = 'id', items_field: str = 'items', batch_size: Optional[int] = None,
+) -> Iterator[Any]:
+    """Yields consecutive search results pages for the request iterating over `sort_field` values."""
+    while True:
+        result = find_function(request, sort=[sort_field], limit=batch_size)
+        yield result
+        items = getattr(result, items_field)
+        if not result.has_more or not items:
+            return
+        request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
+
+
+async def aiterate_search_results(
+    find_function: Callable, request, sort_field: str = 'id', items_field: str = 'items', batch_size: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """Asynchronous version of `iterate_search_results`."""
+    while True:
+        result = await find_function(request, sort=[sort_field], limit=batch_size)
+        yield result
+        items = getattr(result, items_field)
+        if not result.has_more or not items:
+            return
+        request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
+
+
+_END_OF_ITERATION = object()
+
+
+class _PrefetchingThread:
+    """Iterates over the iterator in a background daemon thread keeping at most `depth` values ahead of the consumer.
+
+    The thread is started immediately and runs in a copy of the current context. It stops after the value being fetched
+    once `stop` is called. The iterator is closed and `on_exit` is called in the background thread itself.
+    """
+
+    def __init__(self, iterator: Iterator[T], depth: int, on_exit: Optional[Callable[[], None]] = None):
+        self._iterator = iterator
+        self._on_exit = on_exit
+        self._buffer: queue.Queue = queue.Queue(maxsize=depth)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=contextvars.copy_context().run, args=(self._produce,), daemon=True)
+        self._thread.start()
+
+    def _put(self, value, exception=None) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._buffer.put((value, exception), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(self):
+        exception = None
+        try:
+            for value in self._iterator:
+                if not self._put(value):
+                    return
+        except Exception as exc:
+            exception = exc
+        finally:
+            if hasattr(self._iterator, 'close'):
+                self._iterator.close()
+            if self._on_exit is not None:
+                self._on_exit()
+        self._put(_END_OF_ITERATION, exception)
+
+    def __iter__(self) -> Iterator[T]:
+        while True:
+            value, exception = self._buffer.get()
+            if exception is not None:
+                raise exception
+            if value is _END_OF_ITERATION:
+                return
+            yield value
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+def prefetch_in_thread(iterator: Iterator[T], depth: int, on_exit: Optional[Callable[[], None]] = None) -> Iterator[T]:
+    """Iterates over the iterator in a background thread while the consumer processes already fetched values.
+
+    At most `depth` values are kept ahead of the consumer. The background thread runs in a copy of the current
+    context. Exceptions raised by the iterator are re-raised in the consumer thread. `on_exit` is called in the
+    background thread when it finishes.
+    """
+    prefetcher = _PrefetchingThread(iterator, depth, on_exit)
+    try:
+        yield from prefetcher
+    finally:
+        prefetcher.stop()
+
+
+def iterate_shards_in_threads(
+    iterate_shard: Callable[[Any], Iterator[T]],
+    shard_requests: List,
+    max_workers: Optional[int] = None,
+    depth: int = 4,
+    on_exit: Optional[Callable[[], None]] = None,
+) -> Iterator[T]:
+    """Fetches shards concurrently in background threads and yields their values shard by shard.
+
+    At most `max_workers` shards are fetched at the same time, and every shard is kept at most `depth` values ahead of
+    the consumer, so memory usage doesn't depend on the shard sizes. Threads are stopped when the consumer stops.
+    See `prefetch_in_thread` for details.
+    """
+    max_workers = max_workers or len(shard_requests)
+    shard_requests = iter(shard_requests)
+    running: Deque[_PrefetchingThread] = collections.deque()
+
+    def start_shards(count: int):
+        running.extend(
+            _PrefetchingThread(iterate_shard(shard_request), depth, on_exit)
+            for shard_request in itertools.islice(shard_requests, count)
+        )
+
+    start_shards(max_workers)
+    try:
+        while running:
+            # The shard is removed only after it is exhausted, so it is stopped on early exit
+            yield from running[0]
+            running.popleft()
+            start_shards(1)
+    finally:
+        for prefetcher in running:
+            prefetcher.stop()
+
+
+async def aprefetch_in_task(iterator: AsyncIterator[T], depth: int) -> AsyncIterator[T]:
+    """Asynchronous version of `prefetch_in_thread`: the iterator is driven by a separate task."""
+    prefetcher = _PrefetchingTask(iterator, depth)
+    try:
+        async for value in prefetcher:
+            yield value
+    finally:
+        prefetcher.stop()
+
+
+class _PrefetchingTask:
+    """Asynchronous version of `_PrefetchingThread`: the iterator is driven by a task that is cancelled by `stop`.
+
+    The iterator is closed by the task when it finishes or is cancelled.
+    """
+
+    def __init__(self, iterator: AsyncIterator[T], depth: int):
+        self._iterator = iterator
+        self._buffer: asyncio.Queue = asyncio.Queue(maxsize=depth)
+        self._producer = asyncio.ensure_future(self._produce())
+
+    async def _produce(self):
+        try:
+            try:
+                async for value in self._iterator:
+                    await self._buffer.put((value, None))
+            finally:
+                # Runs finally blocks of the iterator when the task is cancelled, instead of leaving them to the GC
+                if hasattr(self._iterator, 'aclose'):
+                    await self._iterator.aclose()
+        except Exception as exc:
+            await self._buffer.put((_END_OF_ITERATION, exc))
+        else:
+            await self._buffer.put((_END_OF_ITERATION, None))
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        while True:
+            value, exception = await self._buffer.get()
+            if exception is not None:
+                raise exception
+            if value is _END_OF_ITERATION:
+                return
+            yield value
+
+    def stop(self) -> None:
+        self._producer.cancel()
+
+
+async def aiterate_shards_in_tasks(
+    aiterate_shard: Callable[[Any], AsyncIterator[T]],
+    shard_requests: List,
+    max_workers: Optional[int] = None,
+    depth: int = 4,
+) -> AsyncIterator[T]:
+    """Asynchronous version of `iterate_shards_in_threads`: every shard is fetched by a separate task."""
+    max_workers = max_workers or len(shard_requests)
+    shard_requests = iter(shard_requests)
+    running: Deque[_PrefetchingTask] = collections.deque()
+
+    def start_shards(count: int):
+        running.extend(
+            _PrefetchingTask(aiterate_shard(shard_request), depth)
+            for shard_request in itertools.islice(shard_requests, count)
+        )
+
+    start_shards(max_workers)
+    try:
+        while running:
+            # The shard is removed only after it is exhausted, so it is stopped on early exit
+            async for value in running[0]:
+                yield value
+            running.popleft()
+            start_shards(1)
+    finally:
+        for prefetcher in running:
+            prefetcher.stop()
@@ -0,0 +1,92 @@
+__all__: list = []
+import io
+from typing import TYPE_CHECKING, BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class IteratorReader(io.RawIOBase):
+    """A readable binary file over an iterator of byte chunks, e.g. a streamed response body."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            self._buffer = next(self._chunks, None)
+            if self._buffer is None:
+                self._buffer = b''
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def read_tsv(
+    file: BinaryIO, chunksize: Optional[int], dtype: Union[None, str, Dict], close: Callable[[], None],
+) -> Union['pd.DataFrame', Iterator['pd.DataFrame']]:
+    """Reads a TSV file into a DataFrame or into an iterator of DataFrame chunks if `chunksize` is set.
+
+    `close` is called when the file is read completely or the iterator is closed.
+    """
+    import pandas as pd
+
+    if chunksize is None:
+        try:
+            return pd.read_csv(file, delimiter='\t', dtype=dtype)
+        finally:
+            close()
+    return _iterate_tsv_chunks(file, chunksize, dtype, close)
+
+
+def _iterate_tsv_chunks(
+    file: BinaryIO, chunksize: int, dtype: Union[None, str, Dict], close: Callable[[], None],
+) -> Iterator['pd.DataFrame']:
+    import pandas as pd
+
+    try:
+        reader = pd.read_csv(file, delimiter='\t', dtype=dtype, chunksize=chunksize)
+        try:
+            yield from reader
+        finally:
+            reader.close()
+    finally:
+        close()
+
+
+def write_dataframes(dataframes: Iterable['pd.DataFrame'], path: str, file_format: str) -> None:
+    """Writes DataFrame chunks one by one to a single CSV or Parquet file."""
+    if file_format == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            for idx, df in enumerate(dataframes):
+                df.to_csv(file, index=False, header=idx == 0)
+    elif file_format == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise NotImplementedError('Please install pyarrow to write Parquet files.') from exc
+
+        writer = None
+        try:
+            for df in dataframes:
+                if writer is None:
+                    # All chunks are written with the schema of the first one. Columns that are empty in the first
+                    # chunk have the null type there, so they are written as strings to fit values of later chunks.
+                    schema = pa.Table.from_pandas(df, preserve_index=False).schema
+                    for idx, field in enumerate(schema):
+                        if pa.types.is_null(field.type):
+                            schema = schema.set(idx, field.with_type(pa.string()))
+                    writer = pq.ParquetWriter(path, schema)
+                writer.write_table(pa.Table.from_pandas(df, schema=writer.schema, preserve_index=False))
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        raise ValueError(f'Unsupported file format: {file_format}. Use "csv" or "parquet".')
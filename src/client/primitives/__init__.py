@@ -1,13 +1,23 @@
 __all__ = [
     'base',
+    'bulk',
     'infinite_overlap',
+    'instrumentation',
+    'json_codec',
     'operators',
     'parameter',
+    'rate_limiter',
+    'response_cache',
     'retry',
 ]
 
 from . import base
+from . import bulk
 from . import infinite_overlap
+from . import instrumentation
+from . import json_codec
 from . import operators
 from . import parameter
+from . import rate_limiter
+from . import response_cache
 from . import retry
@@ -1,14 +1,24 @@
 __all__ = [
     'base',
+    'bulk',
     'infinite_overlap',
+    'instrumentation',
+    'json_codec',
     'operators',
     'parameter',
+    'rate_limiter',
+    'response_cache',
     'retry',
 ]
 from toloka.client.primitives import (
     base,
+    bulk,
     infinite_overlap,
+    instrumentation,
+    json_codec,
     operators,
     parameter,
+    rate_limiter,
+    response_cache,
     retry,
 )
@@ -9,24 +9,26 @@ __all__ = [
 
 import inspect
 import logging
+import sys
 import typing
+from inspect import Signature, Parameter
 from copy import copy
 from enum import Enum
 from functools import update_wrapper, partial
-from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union, Tuple
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, TypeVar, Union, Tuple
 
 import attr
 import simplejson as json
 
 
 from ...util._extendable_enum import ExtendableStrEnumMetaclass
-from .._converter import converter
+from .._converter import converter, get_structure_hook, register_structure_cache, register_unstructure_cache
 from ..exceptions import SpecClassIdentificationError
 from ...util._codegen import (
     attribute, expand, fix_attrs_converters, REQUIRED_KEY, ORIGIN_KEY, AUTOCAST_KEY,
-    universal_decorator,
+    universal_decorator, _compile_function, _get_signature_invocation_string, _replace_defaults_with_references,
 )
-from ...util._typing import generate_type_var_mapping
+from ...util._typing import generate_type_var_mapping, is_optional_of
 
 E = TypeVar('E', bound=Enum)
 
@@ -149,11 +151,12 @@ class BaseTolokaObjectMetaclass(type):
         transformed_fields = []
 
         for field in fields:
-            # Make all attributes optional unless explicitly configured otherwise
+            # Make all attributes optional unless explicitly configured otherwise. Attributes that are not set in
+            # __init__ and have no default stay unset
             if not field.metadata.get(REQUIRED_KEY):
                 field = field.evolve(
                     type=Optional[field.type] if field.type else field.type,
-                    default=None if field.default is attr.NOTHING else field.default,
+                    default=None if field.default is attr.NOTHING and field.init else field.default,
                 )
 
             if field.metadata.get(AUTOCAST_KEY):
@@ -183,7 +186,8 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     """
 
     _variant_registry: ClassVar[Optional[VariantRegistry]] = None
-    _unexpected: Dict[str, Any] = attribute(factory=dict, init=False)
+    # Objects without unexpected fields don't allocate a dict until `_unexpected` is accessed
+    _unexpected: Dict[str, Any] = attribute(init=False)
 
     def __new__(cls, *args, **kwargs):
         """Overriding new for our check to be executed before auto-generated __init__"""
@@ -226,10 +230,13 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     # Unexpected fields access
 
     def __getattr__(self, item):
+        # get _unexpected pickle-friendly
+        instance_dict = super().__getattribute__('__dict__')
+        if item == '_unexpected':
+            _unexpected = instance_dict['_unexpected'] = {}
+            return _unexpected
         try:
-            # get _unexpected pickle-friendly
-            _unexpected = super().__getattribute__('_unexpected')
-            return _unexpected[item]
+            return instance_dict['_unexpected'][item]
         except KeyError as exc:
             raise AttributeError(str(item)) from exc
 
@@ -268,63 +275,18 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     # Conversions related functions
 
     def unstructure(self) -> Optional[dict]:
-        data = dict(self._unexpected)
         obj_class = type(self)
-
-        for field in attr.fields(obj_class):
-            if field.name == '_unexpected':
-                continue
-
-            value = converter.unstructure(getattr(self, field.name))
-            if field.metadata.get(REQUIRED_KEY) or value is not None:
-                key = field.metadata.get(ORIGIN_KEY, field.name)
-                data[key] = value
-
-        data.update(converter.unstructure(self.get_variant_specs()))
-        assert '_unexpected' not in data
-        return data or None
+        unstructure_func = _UNSTRUCTURE_FUNCS.get(obj_class)
+        if unstructure_func is None:
+            unstructure_func = _UNSTRUCTURE_FUNCS[obj_class] = _make_unstructure_func(obj_class)
+        return unstructure_func(self)
 
     @classmethod
     def structure(cls, data: Any):
-
-        cls, type_var_mapping = generate_type_var_mapping(cls)
-
-        # If a class is an incomplete variant type we structure it into
-        # one of its subclasses
-        if cls.is_variant_incomplete():
-            # TODO: Optimize copying
-            data = dict(data)  # Do not modify input data
-            spec_field = cls._variant_registry.field
-            data_field = data.pop(spec_field)
-            try:
-                spec_value = cls._variant_registry.enum(data_field)
-
-                if spec_value in cls._variant_registry.registered_classes:
-                    spec_class = cls._variant_registry[spec_value]
-                else:
-                    spec_class = cls._variant_registry.generate_subtype(cls, spec_value)
-            except Exception:
-                raise SpecClassIdentificationError(spec_field=spec_field,
-                                                   spec_enum=cls._variant_registry.enum.__name__)
-            return spec_class.structure(data)
-
-        data = copy(data)
-        kwargs = {}
-
-        for field in attr.fields(cls):
-            key = field.metadata.get(ORIGIN_KEY, field.name)
-            if key not in data:
-                continue
-
-            value = data.pop(key)
-            if field.type is not None:
-                target_type = _get_mapped_type(field.type, type_var_mapping)
-                value = converter.structure(value, target_type)
-
-            kwargs[field.name] = value
-        obj = cls(**kwargs)
-        obj._unexpected = data
-        return obj
+        structure_func = _STRUCTURE_FUNCS.get(cls)
+        if structure_func is None:
+            structure_func = _STRUCTURE_FUNCS[cls] = _make_structure_func(cls)
+        return structure_func(data)
 
     def to_json(self, pretty: bool = False) -> str:
         basic_config = {
@@ -341,6 +303,129 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
         return cls.structure(json.loads(json_str, use_decimal=True))
 
 
+# Structure and unstructure functions are generated for every class on the first use. Keys of _STRUCTURE_FUNCS may be
+# parametrized generic classes. Structure functions call the hooks of field types directly, and unstructure functions
+# skip hooks of primitive types, so they are generated again after new hooks are registered.
+_STRUCTURE_FUNCS: Dict[Any, Callable[[Any], Any]] = register_structure_cache({})
+_UNSTRUCTURE_FUNCS: Dict[type, Callable[[Any], Optional[dict]]] = register_unstructure_cache({})
+
+# Types that are unstructured as is
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool))
+
+
+def _make_variant_structure_func(cls) -> Callable[[Any], Any]:
+
+    def structure_variant(data):
+        data = dict(data)  # Do not modify input data
+        spec_field = cls._variant_registry.field
+        data_field = data.pop(spec_field)
+        try:
+            spec_value = cls._variant_registry.enum(data_field)
+
+            if spec_value in cls._variant_registry.registered_classes:
+                spec_class = cls._variant_registry[spec_value]
+            else:
+                spec_class = cls._variant_registry.generate_subtype(cls, spec_value)
+        except Exception:
+            raise SpecClassIdentificationError(spec_field=spec_field,
+                                               spec_enum=cls._variant_registry.enum.__name__)
+        return spec_class.structure(data)
+
+    return structure_variant
+
+
+def _make_structure_func(cls) -> Callable[[Any], Any]:
+    """Generates a function that structures data into an instance of the class.
+
+    Keys that don't correspond to any field are stored in the `_unexpected` attribute. If the class is an incomplete
+    variant type, data is structured into one of its registered subclasses. String IDs of other objects, such as
+    `pool_id` or `user_id`, are interned as they repeat in many objects.
+    """
+
+    cls, type_var_mapping = generate_type_var_mapping(cls)
+    if cls.is_variant_incomplete():
+        return _make_variant_structure_func(cls)
+
+    globs = {'cls': cls, 'copy': copy, 'intern': sys.intern}
+    lines = ['data = copy(data)', 'kwargs = {}']
+    for idx, field in enumerate(attr.fields(cls)):
+        if field.name == '_unexpected':
+            continue
+        key = field.metadata.get(ORIGIN_KEY, field.name)
+        lines.append(f'if {key!r} in data:')
+        if field.type is None:
+            lines.append(f'    kwargs[{field.name!r}] = data.pop({key!r})')
+            continue
+
+        target_type = _get_mapped_type(field.type, type_var_mapping)
+        optional_type = is_optional_of(target_type)
+        globs[f'type_{idx}'] = target_type if optional_type is None else optional_type
+        globs[f'structure_{idx}'] = get_structure_hook(globs[f'type_{idx}'])
+        lines.append(f'    value = data.pop({key!r})')
+        structured_value = f'structure_{idx}(value, type_{idx})'
+        if _is_interned_field(field, globs[f'type_{idx}']):
+            structured_value = f'intern({structured_value})'
+        if optional_type is None:
+            lines.append(f'    kwargs[{field.name!r}] = {structured_value}')
+        else:
+            lines.append(f'    kwargs[{field.name!r}] = None if value is None else {structured_value}')
+    # Fields are popped from the copy, so it is copied again to release the memory of the popped items
+    lines.extend(['obj = cls(**kwargs)', 'if data:', '    obj._unexpected = dict(data)', 'return obj'])
+
+    return _compile_function(
+        f'structure_{cls.__name__}',
+        Signature(parameters=[Parameter(name='data', kind=Parameter.POSITIONAL_OR_KEYWORD)]),
+        '\n'.join(lines),
+        globs=globs,
+    )
+
+
+def _is_interned_field(field: attr.Attribute, field_type: Any) -> bool:
+    """Checks whether values of the field are interned when structured."""
+    return field_type is str and field.name.endswith('_id')
+
+
+def _make_unstructure_func(cls) -> Callable[[Any], Optional[dict]]:
+    """Generates a function that unstructures an instance of the class into a dict.
+
+    Values of `_unexpected` are included as is. Optional fields with `None` values are skipped.
+    """
+
+    globs = {
+        'unstructure': converter.unstructure,
+        'PRIMITIVE_TYPES': _PRIMITIVE_TYPES,
+        'variant_specs': converter.unstructure(cls.get_variant_specs()),
+    }
+    lines = ["data = dict(self.__dict__.get('_unexpected', ()))"]
+    for field in attr.fields(cls):
+        if field.name == '_unexpected':
+            continue
+        key = field.metadata.get(ORIGIN_KEY, field.name)
+        lines.append(f'value = self.{field.name}')
+        if field.metadata.get(REQUIRED_KEY):
+            lines.append(f'data[{key!r}] = value if value.__class__ in PRIMITIVE_TYPES else unstructure(value)')
+        else:
+            lines.extend([
+                'if value is not None:',
+                '    if value.__class__ not in PRIMITIVE_TYPES:',
+                '        value = unstructure(value)',
+                '    if value is not None:',
+                f'        data[{key!r}] = value',
+            ])
+    lines.extend([
+        'data.update(variant_specs)',
+        "assert '_unexpected' not in data",
+        'return data or None',
+    ])
+
+    return _compile_function(
+        f'unstructure_{cls.__name__}',
+        Signature(parameters=[Parameter(name='self', kind=Parameter.POSITIONAL_OR_KEYWORD)]),
+        '\n'.join(lines),
+        globs=globs,
+    )
+
+
 def _get_mapped_type(t, mapping):
     if isinstance(t, typing.TypeVar):
         return mapping.get(t.__name__, t)
@@ -392,17 +477,36 @@ def autocast_to_enum(func: typing.Callable) -> typing.Callable:
 
     signature = signature.replace(parameters=new_params)
 
-    def wrapper(*args, **kwargs):
-        bound_arguments = signature.bind(*args, **kwargs)
-        new_args = {}
-        for (argument_name, argument_value), casting_type, parameter in zip(
-                bound_arguments.arguments.items(),
-                casting_types,
-                signature.parameters.values()
-        ):
-            new_args[argument_name] = converter.structure(argument_value, casting_type)
-        return func(**new_args)
-
+    # The wrapper is generated with the same parameters as the function, so arguments are bound by the interpreter.
+    # Only arguments that may contain enums are cast, and casting is skipped for omitted arguments and enum members.
+    globs = {'func': func, 'structure': converter.structure}
+    lines = []
+    for idx, (param, casting_type) in enumerate(zip(signature.parameters.values(), casting_types)):
+        if casting_type is Any:
+            continue
+        if param.kind == Parameter.VAR_POSITIONAL:
+            casting_type = Tuple[casting_type, ...]
+        elif param.kind == Parameter.VAR_KEYWORD:
+            casting_type = Dict[str, casting_type]
+        globs[f'type_{idx}'] = casting_type
+        conditions = []
+        if param.default is not Parameter.empty:
+            conditions.append(f'{param.name} is not default_{idx}')
+        if inspect.isclass(casting_type):
+            conditions.append(f'not isinstance({param.name}, type_{idx})')
+        casting_line = f'{param.name} = structure({param.name}, type_{idx})'
+        if conditions:
+            lines.extend([f'if {" and ".join(conditions)}:', f'    {casting_line}'])
+        else:
+            lines.append(casting_line)
+    lines.append(f'return func{_get_signature_invocation_string(signature)}')
+
+    wrapper = _compile_function(
+        func.__name__,
+        _replace_defaults_with_references(signature, globs),
+        '\n'.join(lines),
+        globs=globs,
+    )
     update_wrapper(wrapper, func)
     wrapper.__signature__ = signature
     wrapper.__casting_types = casting_types
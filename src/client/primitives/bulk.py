@@ -0,0 +1,86 @@
+__all__ = [
+    'BulkItemResult',
+]
+
+import asyncio
+import collections
+import itertools
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import attr
+
+
+@attr.s(auto_attribs=True)
+class BulkItemResult:
+    """The result of a single call made by the `bulk` method of `TolokaClient` or `AsyncTolokaClient`.
+
+    Attributes:
+        index: The position of the call arguments in the iterable passed to `bulk`.
+        kwargs: Keyword arguments of the call.
+        result: The value returned by the call. `None` if the call failed.
+        error: The exception raised by the call. `None` if the call succeeded.
+    """
+
+    index: int
+    kwargs: Dict[str, Any]
+    result: Any = None
+    error: Optional[Exception] = None
+
+
+async def iterate_bulk_results(
+    method: Callable[..., Awaitable],
+    kwargs_iterable: Iterable[Dict[str, Any]],
+    concurrency: int,
+    ordered: bool,
+    return_exceptions: bool,
+) -> AsyncGenerator[BulkItemResult, None]:
+    """Calls the method with every item of `kwargs_iterable` keeping at most `concurrency` calls in flight.
+
+    Arguments are taken from the iterable only when there is room for a new call, so the iterable may be a lazy
+    generator of any length. If results are `ordered`, finished calls that wait for earlier ones count towards the limit
+    too. If `return_exceptions` is `False`, the first failed call raises its exception and other calls are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError(f'concurrency must be positive, got {concurrency}')
+
+    async def call(index: int, kwargs: Dict[str, Any]) -> BulkItemResult:
+        try:
+            return BulkItemResult(index=index, kwargs=kwargs, result=await method(**kwargs))
+        except asyncio.CancelledError:
+            # CancelledError is a subclass of Exception in python 3.7
+            raise
+        except Exception as exc:
+            return BulkItemResult(index=index, kwargs=kwargs, error=exc)
+
+    numbered_kwargs = enumerate(kwargs_iterable)
+
+    def start_calls(count: int) -> List[asyncio.Future]:
+        return [asyncio.ensure_future(call(index, kwargs)) for index, kwargs in itertools.islice(numbered_kwargs, count)]
+
+    def check(item: BulkItemResult) -> BulkItemResult:
+        if item.error is not None and not return_exceptions:
+            raise item.error
+        return item
+
+    if ordered:
+        pending = collections.deque(start_calls(concurrency))
+    else:
+        pending = set(start_calls(concurrency))
+    try:
+        while pending:
+            if ordered:
+                # The call is removed from the window only after it is finished, so it is cancelled on early exit
+                item = await pending[0]
+                pending.popleft()
+                pending.extend(start_calls(1))
+                yield check(item)
+            else:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.update(start_calls(len(done)))
+                for item in sorted((task.result() for task in done), key=lambda item: item.index):
+                    yield check(item)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
@@ -0,0 +1,31 @@
+__all__ = [
+    'BulkItemResult',
+]
+import typing
+
+
+class BulkItemResult:
+    """The result of a single call made by the `bulk` method of `TolokaClient` or `AsyncTolokaClient`.
+
+    Attributes:
+        index: The position of the call arguments in the iterable passed to `bulk`.
+        kwargs: Keyword arguments of the call.
+        result: The value returned by the call. `None` if the call failed.
+        error: The exception raised by the call. `None` if the call succeeded.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        kwargs: typing.Dict[str, typing.Any],
+        result: typing.Any = None,
+        error: typing.Optional[Exception] = None
+    ) -> None:
+        """Method generated by attrs for class BulkItemResult.
+        """
+        ...
+
+    index: int
+    kwargs: typing.Dict[str, typing.Any]
+    result: typing.Any
+    error: typing.Optional[Exception]
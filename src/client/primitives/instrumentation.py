@@ -0,0 +1,187 @@
+__all__ = [
+    'ClientHooks',
+    'ClientStats',
+    'MethodStats',
+]
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import attr
+import httpx
+
+# Upper bounds of latency histogram buckets in seconds. The last bucket contains all longer requests.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+
+class ClientHooks:
+    """Base class for hooks that are called by `TolokaClient` and `AsyncTolokaClient` around HTTP requests.
+
+    Override the methods you need and pass an instance to the client with the `hooks` parameter. All hooks receive
+    the name of the client method that was called by your code, the same as in the `X-Top-Level-Method` header.
+    Hooks are called synchronously, so they must be fast and thread-safe.
+
+    Example:
+        >>> class LoggingHooks(toloka.client.primitives.instrumentation.ClientHooks):
+        >>>     def on_response(self, method, path, top_level_method, status_code, latency, bytes_in):
+        >>>         print(f'{top_level_method}: {method} {path} -> {status_code} in {latency:.3f}s')
+        >>>
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', hooks=LoggingHooks())
+        ...
+    """
+
+    def on_request(self, method: str, path: str, top_level_method: Optional[str], bytes_out: int) -> None:
+        """Called before every HTTP request, including retries.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            top_level_method: Name of the client method that made the request.
+            bytes_out: Size of the request body.
+        """
+
+    def on_response(
+        self, method: str, path: str, top_level_method: Optional[str], status_code: Optional[int], latency: float,
+        bytes_in: int,
+    ) -> None:
+        """Called after every HTTP request, including failed ones and retries.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            top_level_method: Name of the client method that made the request.
+            status_code: Response status code or `None` if no response was received.
+            latency: Seconds spent on the request. Streamed response bodies are not included.
+            bytes_in: Size of the response body. For streamed responses, the `Content-Length` header value is used.
+        """
+
+    def on_retry(self, method: str, path: str, top_level_method: Optional[str], attempt: int, backoff: float) -> None:
+        """Called before the client sleeps between attempts of a request.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            top_level_method: Name of the client method that made the request.
+            attempt: Number of the failed attempt starting from 1.
+            backoff: Seconds the client sleeps before the next attempt.
+        """
+
+    def on_structure(self, top_level_method: Optional[str], result_type: type, duration: float) -> None:
+        """Called after a response is converted into Toloka objects.
+
+        Args:
+            top_level_method: Name of the client method that made the request.
+            result_type: Class of the resulting object.
+            duration: Seconds spent on the conversion.
+        """
+
+
+@attr.s(auto_attribs=True)
+class MethodStats:
+    """Statistics of requests made by a single client method.
+
+    Attributes:
+        requests: Number of HTTP requests including retries.
+        errors: Number of requests that failed or received a response with an error status code.
+        retries: Number of retries.
+        bytes_in: Total size of response bodies.
+        bytes_out: Total size of request bodies.
+        network_time: Seconds spent on HTTP requests.
+        backoff_time: Seconds spent sleeping between retries.
+        structuring_time: Seconds spent on converting responses into Toloka objects.
+        latency_histogram: Numbers of requests by latency buckets. Bucket `i` counts requests that took no more than
+            `LATENCY_BUCKETS[i]` seconds and more than `LATENCY_BUCKETS[i - 1]` seconds.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    network_time: float = 0.0
+    backoff_time: float = 0.0
+    structuring_time: float = 0.0
+    latency_histogram: List[int] = attr.ib(factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+
+class ClientStats(ClientHooks):
+    """Hooks that collect statistics of requests by client methods.
+
+    Statistics are grouped by the client method that was called by your code, e.g. all requests made while iterating
+    over `get_assignments` are counted for `get_assignments`. The collector is thread-safe and may be shared by several
+    clients.
+
+    Example:
+        >>> stats = toloka.client.primitives.instrumentation.ClientStats()
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', hooks=stats)
+        >>> assignments = list(toloka_client.get_assignments(pool_id='1'))
+        >>> method_stats = stats.snapshot()['get_assignments']
+        >>> print(method_stats.requests, method_stats.network_time, method_stats.structuring_time)
+        ...
+    """
+
+    def __init__(self):
+        self._stats: Dict[Optional[str], MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'_stats': self.snapshot()}
+
+    def __setstate__(self, state):
+        self._stats = state['_stats']
+        self._lock = threading.Lock()
+
+    def _get_stats(self, top_level_method: Optional[str]) -> MethodStats:
+        stats = self._stats.get(top_level_method)
+        if stats is None:
+            stats = self._stats.setdefault(top_level_method, MethodStats())
+        return stats
+
+    def on_request(self, method: str, path: str, top_level_method: Optional[str], bytes_out: int) -> None:
+        with self._lock:
+            stats = self._get_stats(top_level_method)
+            stats.requests += 1
+            stats.bytes_out += bytes_out
+
+    def on_response(
+        self, method: str, path: str, top_level_method: Optional[str], status_code: Optional[int], latency: float,
+        bytes_in: int,
+    ) -> None:
+        bucket = next(idx for idx, upper_bound in enumerate(LATENCY_BUCKETS) if latency <= upper_bound)
+        with self._lock:
+            stats = self._get_stats(top_level_method)
+            if status_code is None or status_code >= 400:
+                stats.errors += 1
+            stats.bytes_in += bytes_in
+            stats.network_time += latency
+            stats.latency_histogram[bucket] += 1
+
+    def on_retry(self, method: str, path: str, top_level_method: Optional[str], attempt: int, backoff: float) -> None:
+        with self._lock:
+            stats = self._get_stats(top_level_method)
+            stats.retries += 1
+            stats.backoff_time += backoff
+
+    def on_structure(self, top_level_method: Optional[str], result_type: type, duration: float) -> None:
+        with self._lock:
+            self._get_stats(top_level_method).structuring_time += duration
+
+    def snapshot(self) -> Dict[Optional[str], MethodStats]:
+        """Returns a copy of the collected statistics by client method names."""
+        with self._lock:
+            return {
+                name: attr.evolve(stats, latency_histogram=list(stats.latency_histogram))
+                for name, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Drops the collected statistics."""
+        with self._lock:
+            self._stats = {}
+
+
+def get_response_size(response: Optional[httpx.Response]) -> int:
+    """Returns the number of received body bytes or the declared body size for streamed responses that are not read."""
+    if response is None:
+        return 0
+    return response.num_bytes_downloaded or int(response.headers.get('Content-Length', 0))
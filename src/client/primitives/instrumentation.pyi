@@ -0,0 +1,203 @@
+__all__ = [
+    'ClientHooks',
+    'ClientStats',
+    'MethodStats',
+]
+import typing
+
+
+class ClientHooks:
+    """Base class for hooks that are called by `TolokaClient` and `AsyncTolokaClient` around HTTP requests.
+
+    Override the methods you need and pass an instance to the client with the `hooks` parameter. All hooks receive
+    the name of the client method that was called by your code, the same as in the `X-Top-Level-Method` header.
+    Hooks are called synchronously, so they must be fast and thread-safe.
+
+    Example:
+        >>> class LoggingHooks(toloka.client.primitives.instrumentation.ClientHooks):
+        >>>     def on_response(self, method, path, top_level_method, status_code, latency, bytes_in):
+        >>>         print(f'{top_level_method}: {method} {path} -> {status_code} in {latency:.3f}s')
+        >>>
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', hooks=LoggingHooks())
+        ...
+    """
+
+    def on_request(
+        self,
+        method: str,
+        path: str,
+        top_level_method: typing.Optional[str],
+        bytes_out: int
+    ) -> None:
+        """Called before every HTTP request, including retries.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            top_level_method: Name of the client method that made the request.
+            bytes_out: Size of the request body.
+        """
+        ...
+
+    def on_response(
+        self,
+        method: str,
+        path: str,
+        top_level_method: typing.Optional[str],
+        status_code: typing.Optional[int],
+        latency: float,
+        bytes_in: int
+    ) -> None:
+        """Called after every HTTP request, including failed ones and retries.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            top_level_method: Name of the client method that made the request.
+            status_code: Response status code or `None` if no response was received.
+            latency: Seconds spent on the request. Streamed response bodies are not included.
+            bytes_in: Size of the response body. For streamed responses, the `Content-Length` header value is used.
+        """
+        ...
+
+    def on_retry(
+        self,
+        method: str,
+        path: str,
+        top_level_method: typing.Optional[str],
+        attempt: int,
+        backoff: float
+    ) -> None:
+        """Called before the client sleeps between attempts of a request.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            top_level_method: Name of the client method that made the request.
+            attempt: Number of the failed attempt starting from 1.
+            backoff: Seconds the client sleeps before the next attempt.
+        """
+        ...
+
+    def on_structure(
+        self,
+        top_level_method: typing.Optional[str],
+        result_type: type,
+        duration: float
+    ) -> None:
+        """Called after a response is converted into Toloka objects.
+
+        Args:
+            top_level_method: Name of the client method that made the request.
+            result_type: Class of the resulting object.
+            duration: Seconds spent on the conversion.
+        """
+        ...
+
+
+class MethodStats:
+    """Statistics of requests made by a single client method.
+
+    Attributes:
+        requests: Number of HTTP requests including retries.
+        errors: Number of requests that failed or received a response with an error status code.
+        retries: Number of retries.
+        bytes_in: Total size of response bodies.
+        bytes_out: Total size of request bodies.
+        network_time: Seconds spent on HTTP requests.
+        backoff_time: Seconds spent sleeping between retries.
+        structuring_time: Seconds spent on converting responses into Toloka objects.
+        latency_histogram: Numbers of requests by latency buckets. Bucket `i` counts requests that took no more than
+            `LATENCY_BUCKETS[i]` seconds and more than `LATENCY_BUCKETS[i - 1]` seconds.
+    """
+
+    def __init__(
+        self,
+        requests: int = 0,
+        errors: int = 0,
+        retries: int = 0,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        network_time: float = 0.0,
+        backoff_time: float = 0.0,
+        structuring_time: float = 0.0,
+        latency_histogram: typing.List[int] = ...
+    ) -> None:
+        """Method generated by attrs for class MethodStats.
+        """
+        ...
+
+    requests: int
+    errors: int
+    retries: int
+    bytes_in: int
+    bytes_out: int
+    network_time: float
+    backoff_time: float
+    structuring_time: float
+    latency_histogram: typing.List[int]
+
+
+class ClientStats(ClientHooks):
+    """Hooks that collect statistics of requests by client methods.
+
+    Statistics are grouped by the client method that was called by your code, e.g. all requests made while iterating
+    over `get_assignments` are counted for `get_assignments`. The collector is thread-safe and may be shared by several
+    clients.
+
+    Example:
+        >>> stats = toloka.client.primitives.instrumentation.ClientStats()
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', hooks=stats)
+        >>> assignments = list(toloka_client.get_assignments(pool_id='1'))
+        >>> method_stats = stats.snapshot()['get_assignments']
+        >>> print(method_stats.requests, method_stats.network_time, method_stats.structuring_time)
+        ...
+    """
+
+    def __init__(self): ...
+
+    def __setstate__(self, state): ...
+
+    def on_request(
+        self,
+        method: str,
+        path: str,
+        top_level_method: typing.Optional[str],
+        bytes_out: int
+    ) -> None: ...
+
+    def on_response(
+        self,
+        method: str,
+        path: str,
+        top_level_method: typing.Optional[str],
+        status_code: typing.Optional[int],
+        latency: float,
+        bytes_in: int
+    ) -> None: ...
+
+    def on_retry(
+        self,
+        method: str,
+        path: str,
+        top_level_method: typing.Optional[str],
+        attempt: int,
+        backoff: float
+    ) -> None: ...
+
+    def on_structure(
+        self,
+        top_level_method: typing.Optional[str],
+        result_type: type,
+        duration: float
+    ) -> None: ...
+
+    def snapshot(self) -> typing.Dict[typing.Optional[str], MethodStats]:
+        """Returns a copy of the collected statistics by client method names.
+        """
+        ...
+
+    def reset(self) -> None:
+        """Drops the collected statistics.
+        """
+        ...
@@ -0,0 +1,71 @@
+__all__ = [
+    'JsonCodec',
+    'SimplejsonCodec',
+    'OrjsonCodec',
+]
+
+from decimal import Decimal
+from typing import Any
+
+import simplejson
+
+try:
+    import orjson
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
+
+
+class JsonCodec:
+    """Encodes request bodies and decodes response bodies of Toloka API requests.
+
+    Subclass it to use another JSON library with `TolokaClient`.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes an unstructured object into a request body."""
+        raise NotImplementedError
+
+    def loads(self, content: bytes) -> Any:
+        """Decodes a response body."""
+        raise NotImplementedError
+
+
+class SimplejsonCodec(JsonCodec):
+    """The default codec based on `simplejson`.
+
+    All floating point numbers are decoded as `Decimal`, so no precision is lost in untyped values either.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        return simplejson.dumps(obj).encode('utf-8')
+
+    def loads(self, content: bytes) -> Any:
+        return simplejson.loads(content, parse_float=Decimal)
+
+
+class OrjsonCodec(JsonCodec):
+    """A fast codec based on `orjson`. It requires the `orjson` package: `pip install toloka-kit[orjson]`.
+
+    Floating point numbers are decoded as `float`. Decimal attributes of Toloka objects, e.g. `Assignment.reward`,
+    `Requester.balance` or `UserBonus.amount`, are still structured as exact `Decimal` values. Floating point numbers
+    in untyped values, e.g. in task inputs or in analytics results, stay `float`.
+
+    `Decimal` values are encoded as JSON numbers with the shortest `float` representation.
+    """
+
+    def __init__(self):
+        if not ORJSON_INSTALLED:
+            raise ImportError('OrjsonCodec requires the orjson package. Install it with: pip install toloka-kit[orjson]')
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, Decimal):
+            return float(obj)
+        raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=self._default)
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
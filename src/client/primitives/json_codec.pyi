@@ -0,0 +1,51 @@
+__all__ = [
+    'JsonCodec',
+    'SimplejsonCodec',
+    'OrjsonCodec',
+]
+import typing
+
+
+class JsonCodec:
+    """Encodes request bodies and decodes response bodies of Toloka API requests.
+
+    Subclass it to use another JSON library with `TolokaClient`.
+    """
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        """Encodes an unstructured object into a request body.
+        """
+        ...
+
+    def loads(self, content: bytes) -> typing.Any:
+        """Decodes a response body.
+        """
+        ...
+
+
+class SimplejsonCodec(JsonCodec):
+    """The default codec based on `simplejson`.
+
+    All floating point numbers are decoded as `Decimal`, so no precision is lost in untyped values either.
+    """
+
+    def dumps(self, obj: typing.Any) -> bytes: ...
+
+    def loads(self, content: bytes) -> typing.Any: ...
+
+
+class OrjsonCodec(JsonCodec):
+    """A fast codec based on `orjson`. It requires the `orjson` package: `pip install toloka-kit[orjson]`.
+
+    Floating point numbers are decoded as `float`. Decimal attributes of Toloka objects, e.g. `Assignment.reward`,
+    `Requester.balance` or `UserBonus.amount`, are still structured as exact `Decimal` values. Floating point numbers
+    in untyped values, e.g. in task inputs or in analytics results, stay `float`.
+
+    `Decimal` values are encoded as JSON numbers with the shortest `float` representation.
+    """
+
+    def __init__(self): ...
+
+    def dumps(self, obj: typing.Any) -> bytes: ...
+
+    def loads(self, content: bytes) -> typing.Any: ...
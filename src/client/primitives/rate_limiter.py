@@ -0,0 +1,147 @@
+__all__ = [
+    'RateLimiter',
+]
+
+import collections
+import re
+import threading
+import time
+from typing import Deque, Dict, Optional
+
+from .retry import TolokaRetry
+
+# Path segments that precede the resource name in Toloka API paths, e.g. "/api/v1/tasks" or "/api/app/v0/apps"
+_NON_RESOURCE_SEGMENT_REGEX = re.compile(r'^(api|app|new|requester|staging|v\d+)?$')
+
+
+class _TokenBucket:
+
+    def __init__(self, rate: Optional[float], now: float):
+        self.configured_rate = rate
+        self.rate = rate
+        self.tokens = self.capacity
+        self.updated_at = now
+        self.slowed_down_at: Optional[float] = None
+        self.slowed_down_until = 0.0
+        self.request_times: Deque[float] = collections.deque(maxlen=1000)
+
+    @property
+    def capacity(self) -> float:
+        return max(self.rate, 1.0) if self.rate else 0.0
+
+    def reserve(self, now: float) -> float:
+        self.request_times.append(now)
+        if self.rate != self.configured_rate and now >= self.slowed_down_until:
+            self.rate = self.configured_rate
+        if not self.rate:
+            return 0.0
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def slow_down(self, now: float, quota_period: float, decrease_factor: float, min_rate: float):
+        # Reports that arrive before a request could be sent at the decreased rate are caused by requests that were
+        # sent before the decrease, e.g. by several clients at once, so they don't decrease the rate again
+        if self.slowed_down_at is not None and self.rate and now - self.slowed_down_at < 1 / self.rate:
+            return
+        if self.rate:
+            current_rate = self.rate
+        else:
+            recent_request_times = [t for t in self.request_times if t > now - quota_period]
+            elapsed = now - recent_request_times[0] if recent_request_times else 0.0
+            current_rate = len(recent_request_times) / max(elapsed, 1.0)
+        self.rate = max(current_rate * decrease_factor, min_rate)
+        self.tokens = min(self.tokens, 0.0)
+        self.updated_at = now
+        self.slowed_down_at = now
+        self.slowed_down_until = now + quota_period
+
+
+class RateLimiter:
+    """Limits the rate of requests to Toloka API on the client side.
+
+    Requests are grouped into endpoint families by the resource name in the request path: `tasks`, `assignments`,
+    `operations` and so on. Every family has its own token bucket. When there is no token for a request, the request is
+    delayed until a token is available, so requests are paced evenly instead of being rejected by Toloka.
+
+    When Toloka responds with the `429 Too Many Requests` status code, the rate of the endpoint family is decreased for
+    the quota interval from the response. Families without a configured rate are limited to a share of the rate
+    observed before the quota was exceeded. Such requests are retried without a backoff: the retries take tokens at
+    the decreased rate, so clients that exceeded a quota at once don't retry all together.
+
+    The limiter is thread-safe. A single instance may be shared by several `TolokaClient` and `AsyncTolokaClient`
+    instances, threads and event loops.
+
+    Args:
+        requests_per_second: The default rate for all endpoint families. `None` means that requests are not limited
+            until a quota is exceeded. Default: `None`.
+        endpoint_limits: Rates for specific endpoint families, for example `{'tasks': 100, 'assignments': 50}`.
+        decrease_factor: A multiplier that is applied to the rate of an endpoint family when its quota is exceeded.
+            Default: `0.5`.
+        min_requests_per_second: The rate limit never drops below this value. Default: `0.1`.
+
+    Example:
+        >>> rate_limiter = toloka.client.primitives.rate_limiter.RateLimiter(endpoint_limits={'tasks': 50})
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', rate_limiter=rate_limiter)
+        ...
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        endpoint_limits: Optional[Dict[str, float]] = None,
+        decrease_factor: float = 0.5,
+        min_requests_per_second: float = 0.1,
+    ):
+        self.requests_per_second = requests_per_second
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self.decrease_factor = decrease_factor
+        self.min_requests_per_second = min_requests_per_second
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_endpoint_family(path: str) -> str:
+        """Returns the name of the endpoint family for the request path."""
+        for segment in path.split('?', 1)[0].split('/'):
+            if not _NON_RESOURCE_SEGMENT_REGEX.match(segment):
+                return segment
+        return ''
+
+    def _get_bucket(self, endpoint_family: str, now: float) -> _TokenBucket:
+        bucket = self._buckets.get(endpoint_family)
+        if bucket is None:
+            rate = self.endpoint_limits.get(endpoint_family, self.requests_per_second)
+            bucket = self._buckets[endpoint_family] = _TokenBucket(rate, now)
+        return bucket
+
+    def reserve(self, path: str) -> float:
+        """Takes a token for a request and returns the number of seconds to wait before sending the request."""
+        now = time.monotonic()
+        with self._lock:
+            return self._get_bucket(self.get_endpoint_family(path), now).reserve(now)
+
+    def on_quota_exceeded(self, path: str, interval: Optional[str] = None):
+        """Decreases the rate of the endpoint family after Toloka reported an exceeded quota.
+
+        Args:
+            path: The request path.
+            interval: The quota interval from the response payload: `MIN`, `HOUR` or `DAY`. Default: `MIN`.
+        """
+        quota_period = TolokaRetry.seconds_to_wait.get(interval, TolokaRetry.seconds_to_wait[TolokaRetry.Unit.MIN])
+        now = time.monotonic()
+        with self._lock:
+            self._get_bucket(self.get_endpoint_family(path), now).slow_down(
+                now, quota_period, self.decrease_factor, self.min_requests_per_second,
+            )
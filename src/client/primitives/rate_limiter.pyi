@@ -0,0 +1,68 @@
+__all__ = [
+    'RateLimiter',
+]
+import typing
+
+
+class RateLimiter:
+    """Limits the rate of requests to Toloka API on the client side.
+
+    Requests are grouped into endpoint families by the resource name in the request path: `tasks`, `assignments`,
+    `operations` and so on. Every family has its own token bucket. When there is no token for a request, the request is
+    delayed until a token is available, so requests are paced evenly instead of being rejected by Toloka.
+
+    When Toloka responds with the `429 Too Many Requests` status code, the rate of the endpoint family is decreased for
+    the quota interval from the response. Families without a configured rate are limited to a share of the rate
+    observed before the quota was exceeded. Such requests are retried without a backoff: the retries take tokens at
+    the decreased rate, so clients that exceeded a quota at once don't retry all together.
+
+    The limiter is thread-safe. A single instance may be shared by several `TolokaClient` and `AsyncTolokaClient`
+    instances, threads and event loops.
+
+    Args:
+        requests_per_second: The default rate for all endpoint families. `None` means that requests are not limited
+            until a quota is exceeded. Default: `None`.
+        endpoint_limits: Rates for specific endpoint families, for example `{'tasks': 100, 'assignments': 50}`.
+        decrease_factor: A multiplier that is applied to the rate of an endpoint family when its quota is exceeded.
+            Default: `0.5`.
+        min_requests_per_second: The rate limit never drops below this value. Default: `0.1`.
+
+    Example:
+        >>> rate_limiter = toloka.client.primitives.rate_limiter.RateLimiter(endpoint_limits={'tasks': 50})
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', rate_limiter=rate_limiter)
+        ...
+    """
+
+    def __init__(
+        self,
+        requests_per_second: typing.Optional[float] = None,
+        endpoint_limits: typing.Optional[typing.Dict[str, float]] = None,
+        decrease_factor: float = 0.5,
+        min_requests_per_second: float = 0.1
+    ): ...
+
+    def __setstate__(self, state): ...
+
+    @staticmethod
+    def get_endpoint_family(path: str) -> str:
+        """Returns the name of the endpoint family for the request path.
+        """
+        ...
+
+    def reserve(self, path: str) -> float:
+        """Takes a token for a request and returns the number of seconds to wait before sending the request.
+        """
+        ...
+
+    def on_quota_exceeded(
+        self,
+        path: str,
+        interval: typing.Optional[str] = None
+    ):
+        """Decreases the rate of the endpoint family after Toloka reported an exceeded quota.
+
+        Args:
+            path: The request path.
+            interval: The quota interval from the response payload: `MIN`, `HOUR` or `DAY`. Default: `MIN`.
+        """
+        ...
@@ -0,0 +1,170 @@
+__all__ = [
+    'ResponseCache',
+]
+
+import collections
+import copy
+import datetime
+import decimal
+import enum
+import re
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, OrderedDict, Tuple
+
+from .base import BaseTolokaObject
+
+# Paths of single entities, e.g. "/v1/pools/123". Writes to nested paths, e.g. "/v1/pools/123/open", change the entity.
+_ENTITY_PATH_REGEX = re.compile(r'^/v1/(?P<family>[\w-]+)/(?P<entity_id>[^/?]+)(?P<nested>/[^?]*)?$')
+
+# Families of objects that belong to a pool and are created or patched with the `open_pool` parameter
+_POOL_ITEMS_FAMILIES = frozenset(('tasks', 'task-suites'))
+_POOL_ITEMS_PATHS = frozenset(f'/v1/{family}' for family in _POOL_ITEMS_FAMILIES)
+
+_IMMUTABLE_TYPES = frozenset((
+    type(None), str, int, float, bool, decimal.Decimal, datetime.datetime, datetime.date, datetime.timedelta, uuid.UUID,
+))
+
+
+def _copy_entity(value: Any) -> Any:
+    """Deep copies a structured entity sharing immutable values. It is several times faster than `copy.deepcopy`."""
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES or isinstance(value, enum.Enum):
+        return value
+    if isinstance(value, BaseTolokaObject):
+        entity_copy = object.__new__(value_type)
+        entity_copy.__dict__.update({name: _copy_entity(item) for name, item in value.__dict__.items()})
+        return entity_copy
+    if value_type is list:
+        return [_copy_entity(item) for item in value]
+    if value_type is dict:
+        return {key: _copy_entity(item) for key, item in value.items()}
+    return copy.deepcopy(value)
+
+
+class ResponseCache:
+    """Caches entities returned by requests for single entities, such as `get_pool` or `get_project`, for a limited time.
+
+    The cache is opt-in: pass it to `TolokaClient` or `AsyncTolokaClient` with the `cache` parameter. Only entities
+    listed in `ttl` are cached. Entities are cached structured, and every hit returns a copy, so changing a returned
+    entity doesn't change the cache. Any write request to an entity (`update_pool`, `patch_pool`, `open_pool` and so on)
+    made through a client with this cache invalidates the cached entity. Creating tasks or task suites with
+    `open_pool` invalidates their pools, and patching a task suite with `open_pool` invalidates all cached pools.
+
+    Note that entities may change on the Toloka side without any requests from the client, e.g. a pool is closed when
+    all tasks are completed. A cached entity may be outdated for at most its `ttl`.
+
+    The cache is thread-safe and may be shared by several clients that use the same account.
+
+    Args:
+        ttl: How many seconds entities are cached for every entity type. Entity types are named as in the API paths:
+            `pools`, `projects`, `skills` and `trainings`. Other entities, such as operations or tasks, are never
+            cached.
+            Default: 60 seconds for pools and trainings, 300 seconds for projects and skills.
+        max_size: The maximum number of cached entities. Least recently used entities are evicted first.
+            Default: `1000`.
+
+    Attributes:
+        hits: The number of requests served from the cache.
+        misses: The number of cacheable requests that were sent to Toloka.
+
+    Example:
+        >>> cache = toloka.client.primitives.response_cache.ResponseCache(ttl={'pools': 30, 'projects': 600})
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', cache=cache)
+        >>> pool = toloka_client.get_pool(pool_id)
+        >>> pool = toloka_client.get_pool(pool_id)  # no request is sent
+        >>> print(cache.stats)
+        ...
+    """
+
+    DEFAULT_TTL = {'pools': 60.0, 'trainings': 60.0, 'projects': 300.0, 'skills': 300.0}
+    # Entities of other types, such as operations or tasks, change on the Toloka side too often to be cached
+    CACHEABLE_FAMILIES = frozenset(('pools', 'projects', 'skills', 'trainings'))
+
+    def __init__(self, ttl: Optional[Dict[str, float]] = None, max_size: int = 1000):
+        self.ttl = dict(self.DEFAULT_TTL if ttl is None else ttl)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entities: OrderedDict[Tuple[str, str], Tuple[float, Any]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'ttl': self.ttl, 'max_size': self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Numbers of hits, misses and currently cached entities."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entities)}
+
+    def _get_key(self, path: str) -> Optional[Tuple[str, str]]:
+        match = _ENTITY_PATH_REGEX.match(path)
+        if match is None or match['family'] not in self.ttl:
+            return None
+        return match['family'], match['entity_id']
+
+    def is_cacheable(self, method: str, path: str, params=None) -> bool:
+        """Checks whether the entity returned by the request may be cached."""
+        match = _ENTITY_PATH_REGEX.match(path)
+        return (
+            method.upper() == 'GET' and not params and match is not None
+            and match['family'] in self.ttl and match['family'] in self.CACHEABLE_FAMILIES and not match['nested']
+        )
+
+    def get(self, path: str) -> Optional[Any]:
+        """Returns a copy of the cached entity for the entity path if it hasn't expired yet."""
+        key = self._get_key(path)
+        with self._lock:
+            expires_at, entity = self._entities.get(key, (None, None))
+            if entity is not None and expires_at > time.monotonic():
+                self._entities.move_to_end(key)
+                self.hits += 1
+            else:
+                self._entities.pop(key, None)
+                self.misses += 1
+                return None
+        return _copy_entity(entity)
+
+    def put(self, path: str, entity: Any):
+        """Caches a copy of the entity for the entity path."""
+        key = self._get_key(path)
+        entity = _copy_entity(entity)
+        with self._lock:
+            self._entities[key] = (time.monotonic() + self.ttl[key[0]], entity)
+            self._entities.move_to_end(key)
+            while len(self._entities) > self.max_size:
+                self._entities.popitem(last=False)
+
+    def invalidate(self, path: str):
+        """Removes the cached entity that is changed by a request to the path."""
+        key = self._get_key(path)
+        if key is not None:
+            with self._lock:
+                self._entities.pop(key, None)
+
+    def invalidate_after_write(self, path: str, params: Optional[dict] = None, json: Any = None):
+        """Removes cached entities that may be changed by a write request with the parameters and the JSON body."""
+        self.invalidate(path)
+        if not params or params.get('open_pool') not in (True, 'true'):
+            return
+        if path in _POOL_ITEMS_PATHS:
+            objects = json if isinstance(json, list) else [json]
+            for pool_id in {obj.get('pool_id') for obj in objects if isinstance(obj, dict)}:
+                if pool_id:
+                    self.invalidate(f'/v1/pools/{pool_id}')
+            return
+        match = _ENTITY_PATH_REGEX.match(path)
+        if match is not None and match['family'] in _POOL_ITEMS_FAMILIES:
+            # Patches of a single task or task suite don't tell its pool, so all cached pools are removed
+            with self._lock:
+                for key in [key for key in self._entities if key[0] == 'pools']:
+                    del self._entities[key]
+
+    def clear(self):
+        """Removes all cached entities."""
+        with self._lock:
+            self._entities.clear()
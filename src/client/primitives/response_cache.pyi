@@ -0,0 +1,92 @@
+__all__ = [
+    'ResponseCache',
+]
+import typing
+
+
+class ResponseCache:
+    """Caches entities returned by requests for single entities, such as `get_pool` or `get_project`, for a limited time.
+
+    The cache is opt-in: pass it to `TolokaClient` or `AsyncTolokaClient` with the `cache` parameter. Only entities
+    listed in `ttl` are cached. Entities are cached structured, and every hit returns a copy, so changing a returned
+    entity doesn't change the cache. Any write request to an entity (`update_pool`, `patch_pool`, `open_pool` and so on)
+    made through a client with this cache invalidates the cached entity. Creating tasks or task suites with
+    `open_pool` invalidates their pools, and patching a task suite with `open_pool` invalidates all cached pools.
+
+    Note that entities may change on the Toloka side without any requests from the client, e.g. a pool is closed when
+    all tasks are completed. A cached entity may be outdated for at most its `ttl`.
+
+    The cache is thread-safe and may be shared by several clients that use the same account.
+
+    Args:
+        ttl: How many seconds entities are cached for every entity type. Entity types are named as in the API paths:
+            `pools`, `projects`, `skills` and `trainings`. Other entities, such as operations or tasks, are never
+            cached.
+            Default: 60 seconds for pools and trainings, 300 seconds for projects and skills.
+        max_size: The maximum number of cached entities. Least recently used entities are evicted first.
+            Default: `1000`.
+
+    Attributes:
+        hits: The number of requests served from the cache.
+        misses: The number of cacheable requests that were sent to Toloka.
+
+    Example:
+        >>> cache = toloka.client.primitives.response_cache.ResponseCache(ttl={'pools': 30, 'projects': 600})
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', cache=cache)
+        >>> pool = toloka_client.get_pool(pool_id)
+        >>> pool = toloka_client.get_pool(pool_id)  # no request is sent
+        >>> print(cache.stats)
+        ...
+    """
+
+    def __init__(
+        self,
+        ttl: typing.Optional[typing.Dict[str, float]] = None,
+        max_size: int = 1000
+    ): ...
+
+    def __setstate__(self, state): ...
+
+    def is_cacheable(
+        self,
+        method: str,
+        path: str,
+        params=None
+    ) -> bool:
+        """Checks whether the entity returned by the request may be cached.
+        """
+        ...
+
+    def get(self, path: str) -> typing.Optional[typing.Any]:
+        """Returns a copy of the cached entity for the entity path if it hasn't expired yet.
+        """
+        ...
+
+    def put(
+        self,
+        path: str,
+        entity: typing.Any
+    ):
+        """Caches a copy of the entity for the entity path.
+        """
+        ...
+
+    def invalidate(self, path: str):
+        """Removes the cached entity that is changed by a request to the path.
+        """
+        ...
+
+    def invalidate_after_write(
+        self,
+        path: str,
+        params: typing.Optional[dict] = None,
+        json: typing.Any = None
+    ):
+        """Removes cached entities that may be changed by a write request with the parameters and the JSON body.
+        """
+        ...
+
+    def clear(self):
+        """Removes all cached entities.
+        """
+        ...
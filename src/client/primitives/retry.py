@@ -7,7 +7,7 @@ import logging
 import socket
 from functools import wraps
 from inspect import signature
-from typing import Callable, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Type, Union
 
 import httpx
 import urllib3
@@ -20,6 +20,13 @@ from urllib3.connectionpool import ConnectionPool
 from urllib3.response import HTTPResponse  # type: ignore
 from urllib3.util.retry import Retry  # type: ignore
 
+from .instrumentation import ClientHooks
+from ..exceptions import TooManyRequestsApiError
+from ...util._managing_headers import top_level_method_var
+
+if TYPE_CHECKING:
+    from .rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 STATUSES_TO_RETRY = {408, 429, 500, 503, 504}
@@ -168,29 +175,40 @@ class RetryingOverURLLibRetry(BaseRetrying):
 
     Wrapped function should make a single request using HTTPX library and either return httpx.Response or raise an
     exception.
+
+    When a rate limiter is passed, requests that exceeded a quota are retried without a backoff: the wrapped function
+    is expected to take a token from the limiter before every attempt, so the limiter paces the retries.
     """
 
-    def __init__(self, base_url: str, retry: Retry, exception_to_retry: Tuple[Type[Exception], ...], **kwargs):
+    def __init__(
+        self, base_url: str, retry: Retry, exception_to_retry: Tuple[Type[Exception], ...],
+        hooks: Optional[ClientHooks] = None, rate_limiter: Optional['RateLimiter'] = None, **kwargs,
+    ):
         self.base_url = base_url
         self.urllib_retry = retry
         self.exception_to_retry = exception_to_retry
+        self.hooks = hooks
+        self.rate_limiter = rate_limiter
 
         super().__init__(
             stop=self._get_stop_callback(),
             wait=self._get_wait_callback(),
             after=self._get_after_callback(),
             retry=self._get_retry_callback(),
+            before_sleep=self._get_before_sleep_callback(),
             **kwargs,
         )
 
     def __getstate__(self):
         return {
-            'base_url': self.base_url, 'urllib_retry': self.urllib_retry, 'exception_to_retry': self.exception_to_retry
+            'base_url': self.base_url, 'urllib_retry': self.urllib_retry, 'exception_to_retry': self.exception_to_retry,
+            'hooks': self.hooks, 'rate_limiter': self.rate_limiter,
         }
 
     def __setstate__(self, state):
         self.__init__(
-            base_url=state['base_url'], retry=state['urllib_retry'], exception_to_retry=state['exception_to_retry']
+            base_url=state['base_url'], retry=state['urllib_retry'], exception_to_retry=state['exception_to_retry'],
+            hooks=state.get('hooks'), rate_limiter=state.get('rate_limiter'),
         )
 
     def _patch_with_urllib_retry(self, func: Callable):
@@ -245,11 +263,17 @@ class RetryingOverURLLibRetry(BaseRetrying):
 
             @self._patch_with_urllib_retry
             def __call__(self, retry_state):
+                if outer_self.rate_limiter is not None and retry_state.outcome.failed and isinstance(
+                    retry_state.outcome.exception(), TooManyRequestsApiError
+                ):
+                    # The limiter has already decreased the rate, and its reservation delays the next attempt. Clients
+                    # sharing the limiter are spread over the decreased rate instead of backing off all at once
+                    return 0.0
                 response = outer_self._get_urllib_response(retry_state)
                 if response and retry_state.urllib_retry.respect_retry_after_header:
                     retry_after = retry_state.urllib_retry.get_retry_after(response)
                     if retry_after:
-                        return retry_state
+                        return retry_after
                 return retry_state.urllib_retry.get_backoff_time()
 
         return GetBackoffTime()
@@ -299,6 +323,22 @@ class RetryingOverURLLibRetry(BaseRetrying):
 
         return increment
 
+    def _get_before_sleep_callback(self):
+
+        def notify_hooks(retry_state: RetryCallState):
+            if self.hooks is None:
+                return
+            bound_args = signature(retry_state.fn).bind(*retry_state.args, **retry_state.kwargs)
+            self.hooks.on_retry(
+                method=bound_args.arguments['method'],
+                path=bound_args.arguments['path'],
+                top_level_method=top_level_method_var.get(None),
+                attempt=retry_state.attempt_number,
+                backoff=retry_state.next_action.sleep,
+            )
+
+        return notify_hooks
+
 
 class SyncRetryingOverURLLibRetry(RetryingOverURLLibRetry, Retrying):
     pass
@@ -6,6 +6,8 @@ __all__ = [
 ]
 import abc
 import tenacity
+import toloka.client.primitives.instrumentation
+import toloka.client.primitives.rate_limiter
 import typing
 import urllib3.response
 import urllib3.util.retry
@@ -53,6 +55,9 @@ class RetryingOverURLLibRetry(tenacity.BaseRetrying, metaclass=abc.ABCMeta):
 
     Wrapped function should make a single request using HTTPX library and either return httpx.Response or raise an
     exception.
+
+    When a rate limiter is passed, requests that exceeded a quota are retried without a backoff: the wrapped function
+    is expected to take a token from the limiter before every attempt, so the limiter paces the retries.
     """
 
     def __init__(
@@ -60,6 +65,8 @@ class RetryingOverURLLibRetry(tenacity.BaseRetrying, metaclass=abc.ABCMeta):
         base_url: str,
         retry: urllib3.util.retry.Retry,
         exception_to_retry: typing.Tuple[typing.Type[Exception], ...],
+        hooks: typing.Optional[toloka.client.primitives.instrumentation.ClientHooks] = None,
+        rate_limiter: typing.Optional[toloka.client.primitives.rate_limiter.RateLimiter] = None,
         **kwargs
     ): ...
 
@@ -0,0 +1,127 @@
+__all__ = [
+    'RecordBatch',
+]
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+# pandas and pyarrow are slow to import, so they are imported only on conversion
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+def _is_scalar(value: Any) -> bool:
+    return not isinstance(value, (dict, list))
+
+
+class _ColumnsBuilder:
+
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {}
+        self.num_rows = 0
+
+    def append_row(self, row: Dict[str, Any]) -> None:
+        for name, value in row.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = [None] * self.num_rows
+            column.append(value)
+        self.num_rows += 1
+        if len(row) < len(self.columns):
+            for column in self.columns.values():
+                if len(column) < self.num_rows:
+                    column.append(None)
+
+
+class RecordBatch:
+    """A batch of search results in a columnar layout.
+
+    Values are taken from API responses as is, without creating Toloka objects, so a batch is much cheaper than
+    the list of corresponding objects.
+
+    Args:
+        columns: Column values by column names. All columns must have the same length.
+
+    Example:
+        >>> batches = toloka_client.get_assignments_table(pool_id='1', status='ACCEPTED')
+        >>> df = pandas.concat(batch.to_pandas() for batch in batches)
+        ...
+    """
+
+    def __init__(self, columns: Optional[Dict[str, List[Any]]] = None):
+        self.columns = columns or {}
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError('All columns must have the same length')
+
+    @classmethod
+    def from_assignments(cls, assignments: Iterable[dict]) -> 'RecordBatch':
+        """Builds a batch from raw assignments as they are returned by the API.
+
+        Every task of an assignment makes a row with columns prefixed like in `get_assignments_df`:
+            * "ASSIGNMENT" - Scalar fields of the assignment, e.g. "ASSIGNMENT:id" or "ASSIGNMENT:user_id".
+            * "TASK" - Scalar fields of the task, e.g. "TASK:id".
+            * "INPUT" - Input values of the task.
+            * "OUTPUT" - Output values of the corresponding solution.
+
+        Nested fields that are not listed above are skipped. An assignment without tasks makes a single row.
+        """
+        builder = _ColumnsBuilder()
+        for assignment in assignments:
+            assignment_row = {
+                f'ASSIGNMENT:{name}': value for name, value in assignment.items() if _is_scalar(value)
+            }
+            tasks = assignment.get('tasks') or [{}]
+            solutions = assignment.get('solutions') or []
+            for idx, task in enumerate(tasks):
+                row = dict(assignment_row)
+                row.update((f'TASK:{name}', value) for name, value in task.items() if _is_scalar(value))
+                row.update((f'INPUT:{name}', value) for name, value in (task.get('input_values') or {}).items())
+                if idx < len(solutions):
+                    output_values = solutions[idx].get('output_values') or {}
+                    row.update((f'OUTPUT:{name}', value) for name, value in output_values.items())
+                builder.append_row(row)
+        return cls(builder.columns)
+
+    @classmethod
+    def concat(cls, batches: Iterable['RecordBatch']) -> 'RecordBatch':
+        """Concatenates batches. Columns missing in some batches are filled with `None`."""
+        builder = _ColumnsBuilder()
+        for batch in batches:
+            num_rows = builder.num_rows
+            for name, column in batch.columns.items():
+                builder.columns.setdefault(name, [None] * num_rows).extend(column)
+            builder.num_rows += batch.num_rows
+            for column in builder.columns.values():
+                if len(column) < builder.num_rows:
+                    column.extend([None] * (builder.num_rows - len(column)))
+        return cls(builder.columns)
+
+    @property
+    def num_rows(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+    def to_pandas(self) -> 'pd.DataFrame':
+        """Converts the batch to `pandas.DataFrame`. Requires toloka-kit[pandas] extras."""
+        try:
+            import pandas as pd
+        except ImportError as exc:
+            raise NotImplementedError('Please install toloka-kit[pandas] extras.') from exc
+        return pd.DataFrame(self.columns, columns=self.column_names)
+
+    def to_arrow(self) -> 'pa.RecordBatch':
+        """Converts the batch to `pyarrow.RecordBatch`. Requires the pyarrow package."""
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise NotImplementedError('Please install pyarrow.') from exc
+        return pa.RecordBatch.from_pydict(self.columns)
@@ -0,0 +1,56 @@
+__all__ = [
+    'RecordBatch',
+]
+import typing
+
+
+class RecordBatch:
+    """A batch of search results in a columnar layout.
+
+    Values are taken from API responses as is, without creating Toloka objects, so a batch is much cheaper than
+    the list of corresponding objects.
+
+    Args:
+        columns: Column values by column names. All columns must have the same length.
+
+    Example:
+        >>> batches = toloka_client.get_assignments_table(pool_id='1', status='ACCEPTED')
+        >>> df = pandas.concat(batch.to_pandas() for batch in batches)
+        ...
+    """
+
+    def __init__(self, columns: typing.Optional[typing.Dict[str, typing.List[typing.Any]]] = None): ...
+
+    @classmethod
+    def from_assignments(cls, assignments: typing.Iterable[dict]) -> 'RecordBatch':
+        """Builds a batch from raw assignments as they are returned by the API.
+
+        Every task of an assignment makes a row with columns prefixed like in `get_assignments_df`:
+            * "ASSIGNMENT" - Scalar fields of the assignment, e.g. "ASSIGNMENT:id" or "ASSIGNMENT:user_id".
+            * "TASK" - Scalar fields of the task, e.g. "TASK:id".
+            * "INPUT" - Input values of the task.
+            * "OUTPUT" - Output values of the corresponding solution.
+
+        Nested fields that are not listed above are skipped. An assignment without tasks makes a single row.
+        """
+        ...
+
+    @classmethod
+    def concat(cls, batches: typing.Iterable['RecordBatch']) -> 'RecordBatch':
+        """Concatenates batches. Columns missing in some batches are filled with `None`.
+        """
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, name: str) -> typing.List[typing.Any]: ...
+
+    def to_pandas(self) -> 'pd.DataFrame':
+        """Converts the batch to `pandas.DataFrame`. Requires toloka-kit[pandas] extras.
+        """
+        ...
+
+    def to_arrow(self) -> 'pa.RecordBatch':
+        """Converts the batch to `pyarrow.RecordBatch`. Requires the pyarrow package.
+        """
+        ...
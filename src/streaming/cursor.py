@@ -32,6 +32,7 @@ from ..client import (
     search_results,
     structure,
 )
+from ..client._pagination import aprefetch_in_task, prefetch_in_thread
 from ..client.search_requests import BaseSearchRequest
 from ..util._codegen import fix_attrs_converters
 from .event import AssignmentEvent, BaseEvent, MessageThreadEvent, TaskEvent, UserBonusEvent, UserRestrictionEvent, UserSkillEvent
@@ -50,35 +51,53 @@ DATETIME_MIN = datetime.fromtimestamp(0)
 
 @attr.s
 class _ByIdCursor:
-    """Iterate by id only."""
+    """Iterate by id only.
+
+    If `prefetch_pages` is set, up to this number of pages is fetched in the background while already fetched items
+    are being processed.
+    """
     fetcher: Callable[[BaseSearchRequest], ResponseObjectType] = attr.ib()
     request: BaseSearchRequest = attr.ib()
+    prefetch_pages: Optional[int] = attr.ib(default=None)
 
-    def __iter__(self) -> Iterator[Any]:
+    def _iter_responses(self) -> Iterator[ResponseObjectType]:
         while True:
             response = self.fetcher(self.request, sort='id')  # Diff between sync and async.
-            if response.items:
-                for item in response.items:
-                    yield item
-                self.request = attr.evolve(self.request, id_gt=item.id)
-            if not response.has_more:
+            yield response
+            if not response.items or not response.has_more:
                 return
+            self.request = attr.evolve(self.request, id_gt=response.items[-1].id)
 
-    async def __aiter__(self) -> AsyncIterator[Any]:
+    async def _aiter_responses(self) -> AsyncIterator[ResponseObjectType]:
         while True:
             response = await ensure_async(self.fetcher)(self.request, sort='id')  # Diff between sync and async.
-            if response.items:
-                for item in response.items:
-                    yield item
-                self.request = attr.evolve(self.request, id_gt=item.id)
-            if not response.has_more:
+            yield response
+            if not response.items or not response.has_more:
                 return
+            self.request = attr.evolve(self.request, id_gt=response.items[-1].id)
+
+    def __iter__(self) -> Iterator[Any]:
+        responses = self._iter_responses()  # Diff between sync and async.
+        if self.prefetch_pages:
+            responses = prefetch_in_thread(responses, self.prefetch_pages)  # Diff between sync and async.
+        for response in responses:  # Diff between sync and async.
+            for item in response.items or []:
+                yield item
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        responses = self._aiter_responses()  # Diff between sync and async.
+        if self.prefetch_pages:
+            responses = aprefetch_in_task(responses, self.prefetch_pages)  # Diff between sync and async.
+        async for response in responses:  # Diff between sync and async.
+            for item in response.items or []:
+                yield item
 
 
 @attr.s
 class BaseCursor:
     toloka_client: TolokaClientSyncOrAsyncType = attr.ib()
     _request: BaseSearchRequest = attr.ib()
+    prefetch_pages: Optional[int] = attr.ib(default=None, kw_only=True)
     _prev_response: Optional[ResponseObjectType] = attr.ib(default=None, init=False)
     _seen_ids: Set[str] = attr.ib(factory=set, init=False)
 
@@ -174,7 +193,7 @@ class BaseCursor:
 
                 if self._get_time(response.items[0]) == max_time:
                     fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
-                    for item in _ByIdCursor(fetcher, fixed_time_request):  # Diff between sync and async.
+                    for item in _ByIdCursor(fetcher, fixed_time_request, self.prefetch_pages):  # Diff between sync and async.
                         if item.id not in self._seen_ids:
                             self._seen_ids.add(item.id)
                             yield self._construct_event(item)
@@ -203,7 +222,7 @@ class BaseCursor:
 
                 if self._get_time(response.items[0]) == max_time:
                     fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
-                    async for item in _ByIdCursor(fetcher, fixed_time_request):  # Diff between sync and async.
+                    async for item in _ByIdCursor(fetcher, fixed_time_request, self.prefetch_pages):  # Diff between sync and async.
                         if item.id not in self._seen_ids:
                             self._seen_ids.add(item.id)
                             yield self._construct_event(item)
@@ -225,6 +244,8 @@ class AssignmentCursor(BaseCursor):
         toloka_client: TolokaClient object that is being used to search assignments.
         request: Base request to search assignments by.
         event_type: Assignments event's type to search.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over assignment acceptances events.
@@ -270,6 +291,8 @@ class TaskCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search tasks.
         request: Base request to search tasks by.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over tasks.
@@ -304,6 +327,8 @@ class UserBonusCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search `UserBonus` instances.
         request: Base request to search `UserBonus` instances by.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over `UserBonus` instances.
@@ -339,6 +364,8 @@ class UserSkillCursor(BaseCursor):
         toloka_client: TolokaClient object that is being used to search skills.
         request: Base request to search skills by.
         event_type: Skill event type to search.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over skills acceptances events.
@@ -376,6 +403,8 @@ class UserRestrictionCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search Toloker restrictions.
         request: Base request to search Toloker restrictions.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over Toloker restrictions in a project.
@@ -410,6 +439,8 @@ class MessageThreadCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search messages.
         request: Base request to search messages.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over all messages.
@@ -83,7 +83,9 @@ class BaseCursor:
     def __init__(
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
-        request: toloka.client.search_requests.BaseSearchRequest
+        request: toloka.client.search_requests.BaseSearchRequest,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class BaseCursor.
         """
@@ -91,6 +93,7 @@ class BaseCursor:
 
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.BaseSearchRequest
+    prefetch_pages: typing.Optional[int]
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
 
@@ -102,6 +105,8 @@ class AssignmentCursor(BaseCursor):
         toloka_client: TolokaClient object that is being used to search assignments.
         request: Base request to search assignments by.
         event_type: Assignments event's type to search.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over assignment acceptances events.
@@ -118,7 +123,9 @@ class AssignmentCursor(BaseCursor):
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         event_type: typing.Any,
-        request: toloka.client.search_requests.AssignmentSearchRequest = ...
+        request: toloka.client.search_requests.AssignmentSearchRequest = ...,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class AssignmentCursor.
         """
@@ -161,7 +168,9 @@ class AssignmentCursor(BaseCursor):
         expired_lt: typing.Optional[datetime.datetime] = None,
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
-        expired_gte: typing.Optional[datetime.datetime] = None
+        expired_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class AssignmentCursor.
         """
@@ -169,6 +178,7 @@ class AssignmentCursor(BaseCursor):
 
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.AssignmentSearchRequest
+    prefetch_pages: typing.Optional[int]
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
     _event_type: toloka.streaming.event.AssignmentEvent.Type
@@ -180,6 +190,8 @@ class TaskCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search tasks.
         request: Base request to search tasks by.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over tasks.
@@ -195,7 +207,9 @@ class TaskCursor(BaseCursor):
     def __init__(
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
-        request: toloka.client.search_requests.TaskSearchRequest = ...
+        request: toloka.client.search_requests.TaskSearchRequest = ...,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class TaskCursor.
         """
@@ -218,7 +232,9 @@ class TaskCursor(BaseCursor):
         overlap_lt: typing.Optional[int] = None,
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
-        overlap_gte: typing.Optional[int] = None
+        overlap_gte: typing.Optional[int] = None,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class TaskCursor.
         """
@@ -226,6 +242,7 @@ class TaskCursor(BaseCursor):
 
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.TaskSearchRequest
+    prefetch_pages: typing.Optional[int]
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
 
@@ -236,6 +253,8 @@ class UserBonusCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search `UserBonus` instances.
         request: Base request to search `UserBonus` instances by.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over `UserBonus` instances.
@@ -251,7 +270,9 @@ class UserBonusCursor(BaseCursor):
     def __init__(
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
-        request: toloka.client.search_requests.UserBonusSearchRequest = ...
+        request: toloka.client.search_requests.UserBonusSearchRequest = ...,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class UserBonusCursor.
         """
@@ -271,7 +292,9 @@ class UserBonusCursor(BaseCursor):
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class UserBonusCursor.
         """
@@ -279,6 +302,7 @@ class UserBonusCursor(BaseCursor):
 
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.UserBonusSearchRequest
+    prefetch_pages: typing.Optional[int]
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
 
@@ -290,6 +314,8 @@ class UserSkillCursor(BaseCursor):
         toloka_client: TolokaClient object that is being used to search skills.
         request: Base request to search skills by.
         event_type: Skill event type to search.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over skills acceptances events.
@@ -306,7 +332,9 @@ class UserSkillCursor(BaseCursor):
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         event_type: typing.Any,
-        request: toloka.client.search_requests.UserSkillSearchRequest = ...
+        request: toloka.client.search_requests.UserSkillSearchRequest = ...,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class UserSkillCursor.
         """
@@ -330,7 +358,9 @@ class UserSkillCursor(BaseCursor):
         modified_lt: typing.Optional[datetime.datetime] = None,
         modified_lte: typing.Optional[datetime.datetime] = None,
         modified_gt: typing.Optional[datetime.datetime] = None,
-        modified_gte: typing.Optional[datetime.datetime] = None
+        modified_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class UserSkillCursor.
         """
@@ -338,6 +368,7 @@ class UserSkillCursor(BaseCursor):
 
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.UserSkillSearchRequest
+    prefetch_pages: typing.Optional[int]
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
     _event_type: toloka.streaming.event.UserSkillEvent.Type
@@ -349,6 +380,8 @@ class UserRestrictionCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search Toloker restrictions.
         request: Base request to search Toloker restrictions.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over Toloker restrictions in a project.
@@ -364,7 +397,9 @@ class UserRestrictionCursor(BaseCursor):
     def __init__(
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
-        request: toloka.client.search_requests.UserRestrictionSearchRequest = ...
+        request: toloka.client.search_requests.UserRestrictionSearchRequest = ...,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class UserRestrictionCursor.
         """
@@ -385,7 +420,9 @@ class UserRestrictionCursor(BaseCursor):
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class UserRestrictionCursor.
         """
@@ -393,6 +430,7 @@ class UserRestrictionCursor(BaseCursor):
 
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.UserRestrictionSearchRequest
+    prefetch_pages: typing.Optional[int]
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
 
@@ -403,6 +441,8 @@ class MessageThreadCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search messages.
         request: Base request to search messages.
+        prefetch_pages: The number of pages fetched in the background while iterating over objects with the same
+            time. Default: `None`, pages are fetched on demand.
 
     Examples:
         Iterate over all messages.
@@ -418,7 +458,9 @@ class MessageThreadCursor(BaseCursor):
     def __init__(
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
-        request: toloka.client.search_requests.MessageThreadSearchRequest = ...
+        request: toloka.client.search_requests.MessageThreadSearchRequest = ...,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class MessageThreadCursor.
         """
@@ -437,7 +479,9 @@ class MessageThreadCursor(BaseCursor):
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class MessageThreadCursor.
         """
@@ -445,5 +489,6 @@ class MessageThreadCursor(BaseCursor):
 
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.MessageThreadSearchRequest
+    prefetch_pages: typing.Optional[int]
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
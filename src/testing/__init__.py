@@ -0,0 +1,8 @@
+__all__ = [
+    'FakeTolokaBackend',
+    'fake_backend',
+]
+
+from . import fake_backend
+
+from .fake_backend import FakeTolokaBackend
@@ -0,0 +1,6 @@
+__all__ = [
+    'FakeTolokaBackend',
+    'fake_backend',
+]
+from toloka.testing import fake_backend
+from toloka.testing.fake_backend import FakeTolokaBackend
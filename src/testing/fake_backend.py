@@ -0,0 +1,512 @@
+__all__ = [
+    'FakeTolokaBackend',
+]
+
+import asyncio
+import datetime
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+# Search parameters that are not conditions on item fields
+_SEARCH_SERVICE_PARAMS = frozenset(('sort', 'limit'))
+_INTERVAL_SUFFIXES = ('_gte', '_lte', '_gt', '_lt')
+_FINISHED_ASSIGNMENT_STATUSES = ('SUBMITTED', 'ACCEPTED', 'REJECTED')
+
+
+def _now() -> str:
+    return datetime.datetime.utcnow().isoformat(timespec='milliseconds')
+
+
+def _is_true(value: Optional[str]) -> bool:
+    return value is not None and value.lower() == 'true'
+
+
+def _error(status_code: int, code: str, message: str, payload: Any = None) -> httpx.Response:
+    content = {'code': code, 'message': message}
+    if payload is not None:
+        content['payload'] = payload
+    return httpx.Response(status_code=status_code, json=content)
+
+
+def _not_found(family: str, item_id: str) -> httpx.Response:
+    return _error(404, 'DOES_NOT_EXIST', f'Object {family}/{item_id} does not exist')
+
+
+def _parse_datetime(value: str) -> Optional[datetime.datetime]:
+    # Stored and requested datetimes may differ in precision, e.g. "...:00.387" and "...:00.387000"
+    if len(value) < 19 or value[10] != 'T':
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _matches_interval(item_value: Any, suffix: str, value: str) -> bool:
+    if item_value is None:
+        return False
+    if isinstance(item_value, (int, float)) and not isinstance(item_value, bool):
+        value = float(value)
+    elif not isinstance(item_value, str):
+        item_value = str(item_value)
+    else:
+        item_datetime, value_datetime = _parse_datetime(item_value), _parse_datetime(value)
+        if item_datetime is not None and value_datetime is not None:
+            item_value, value = item_datetime, value_datetime
+    if suffix == '_gte':
+        return item_value >= value
+    if suffix == '_lte':
+        return item_value <= value
+    if suffix == '_gt':
+        return item_value > value
+    return item_value < value
+
+
+def _matches_exact(item_value: Any, values: List[str]) -> bool:
+    if isinstance(item_value, bool):
+        item_value = 'true' if item_value else 'false'
+    return item_value is not None and str(item_value) in values
+
+
+class FakeTolokaBackend(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """In-memory imitation of the Toloka API for load testing and benchmarks without network access.
+
+    The backend is an `httpx` transport: pass it to `TolokaClient` or `AsyncTolokaClient` with the `transport`
+    parameter. It implements the main endpoints of projects, pools, tasks, assignments, operations, operation logs,
+    rewards and analytics. Operations are completed immediately. The backend doesn't check tokens and validates only
+    references to pools.
+
+    Assignments are not created by the backend on its own. Call `generate_assignments` to imitate Tolokers' work.
+
+    The backend is thread-safe and may be used by several clients at once.
+
+    Args:
+        latency: Seconds every request takes, or a function that returns the latency for a request. Use it to
+            imitate network delays. Default: `0`.
+        quota: The maximum number of requests in `quota_interval`. Requests that exceed the quota get the 429 response
+            with the `Retry-After` header. Default: `None` — requests are not limited.
+        quota_interval: Length of the quota interval in seconds. Default: `60`.
+        balance: Requester's balance. Default: `1000`.
+        seed: Seed of the random generator used by `generate_assignments`. Default: `None`.
+
+    Attributes:
+        storage: Stored objects in the API format by ID for every entity type: `projects`, `pools`, `tasks`,
+            `assignments`, `operations` and `user-bonuses`.
+        operation_logs: Logs of operations by operation IDs.
+        request_count: The number of handled requests including rejected by the quota.
+
+    Example:
+        >>> backend = toloka.testing.FakeTolokaBackend(latency=0.05)
+        >>> toloka_client = toloka.client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+        >>> project = toloka_client.create_project(project)
+        >>> pool = toloka_client.create_pool(pool)
+        >>> toloka_client.create_tasks(tasks, allow_defaults=True)
+        >>> backend.generate_assignments(pool.id, solution=lambda task: {'result': 'OK'})
+        >>> assignments = list(toloka_client.get_assignments(pool_id=pool.id, status='SUBMITTED'))
+        ...
+    """
+
+    FAMILIES = ('projects', 'pools', 'tasks', 'assignments', 'operations', 'user-bonuses')
+
+    # Method, path pattern and name of the handler for every endpoint
+    _ROUTES: List[Tuple[str, re.Pattern, str]] = [
+        (method, re.compile(f'^/api{pattern}$'), handler_name)
+        for method, pattern, handler_name in (
+            ('GET', '/v1/requester', '_get_requester'),
+            ('GET', '/v1/(?P<family>projects|pools|tasks|assignments|operations|user-bonuses)', '_search'),
+            ('GET', '/v1/(?P<family>projects|pools|tasks|assignments|operations|user-bonuses)/(?P<item_id>[^/]+)', '_get'),
+            ('POST', '/v1/projects', '_create_project'),
+            ('PUT', '/v1/(?P<family>projects|pools)/(?P<item_id>[^/]+)', '_replace'),
+            ('POST', '/v1/projects/(?P<item_id>[^/]+)/archive', '_archive_project'),
+            ('POST', '/v1/pools', '_create_pool'),
+            ('PATCH', '/v1/(?P<family>pools|tasks)/(?P<item_id>[^/]+)', '_patch'),
+            ('POST', '/v1/pools/(?P<item_id>[^/]+)/(?P<action>open|close|close-for-update|archive)', '_change_pool_status'),
+            ('POST', '/v1/(?P<family>tasks|user-bonuses)', '_create_objects'),
+            ('PATCH', '/v1/assignments/(?P<item_id>[^/]+)', '_patch_assignment'),
+            ('GET', '/v1/operations/(?P<item_id>[^/]+)/log', '_get_operation_log'),
+            ('POST', '/staging/analytics-2', '_get_analytics'),
+        )
+    ]
+
+    def __init__(
+        self,
+        latency: Union[float, Callable[[httpx.Request], float]] = 0.0,
+        quota: Optional[int] = None,
+        quota_interval: float = 60.0,
+        balance: float = 1000.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.quota = quota
+        self.quota_interval = quota_interval
+        self.balance = balance
+        self.storage: Dict[str, Dict[str, dict]] = {family: {} for family in self.FAMILIES}
+        self.operation_logs: Dict[str, List[dict]] = {}
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._quota_window_start = time.monotonic()
+        self._quota_used = 0
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    # Transport interface
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        latency = self._get_latency(request)
+        if latency:
+            time.sleep(latency)
+        return self._handle(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        latency = self._get_latency(request)
+        if latency:
+            await asyncio.sleep(latency)
+        return self._handle(request)
+
+    def _get_latency(self, request: httpx.Request) -> float:
+        return self.latency(request) if callable(self.latency) else self.latency
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.request_count += 1
+            retry_after = self._consume_quota()
+            if retry_after is not None:
+                response = _error(429, 'TOO_MANY_REQUESTS', 'Too many requests', payload={'interval': 'MIN'})
+                response.headers['Retry-After'] = str(math.ceil(retry_after))
+            else:
+                response = self._route(request)
+        response.request = request
+        return response
+
+    def _consume_quota(self) -> Optional[float]:
+        if self.quota is None:
+            return None
+        now = time.monotonic()
+        if now - self._quota_window_start >= self.quota_interval:
+            self._quota_window_start = now
+            self._quota_used = 0
+        if self._quota_used >= self.quota:
+            return self._quota_window_start + self.quota_interval - now
+        self._quota_used += 1
+        return None
+
+    def _route(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        for method, pattern, handler_name in self._ROUTES:
+            match = pattern.match(path)
+            if match and method == request.method:
+                body = json.loads(request.content) if request.content else None
+                return getattr(self, handler_name)(request.url.params, body, **match.groupdict())
+        return _error(404, 'NOT_FOUND', f'Unknown endpoint: {request.method} {path}')
+
+    # Helpers
+
+    def _next_id(self) -> str:
+        return f'{next(self._ids):024x}'
+
+    def _store(self, family: str, item: dict, **fields) -> dict:
+        item = {key: value for key, value in item.items() if key != '__item_idx'}
+        item.update(id=self._next_id(), created=_now(), **fields)
+        self.storage[family][item['id']] = item
+        return item
+
+    def _add_operation(self, operation_type: str, parameters: dict, details: Optional[dict] = None,
+                       operation_id: Optional[str] = None, log: Optional[List[dict]] = None) -> dict:
+        now = _now()
+        operation = {
+            'id': operation_id or self._next_id(), 'type': operation_type, 'status': 'SUCCESS', 'submitted': now,
+            'started': now, 'finished': now, 'progress': 100, 'parameters': parameters,
+        }
+        if details is not None:
+            operation['details'] = details
+        self.storage['operations'][operation['id']] = operation
+        self.operation_logs[operation['id']] = log or []
+        return operation
+
+    # Handlers
+
+    def _get_requester(self, params, body) -> httpx.Response:
+        return httpx.Response(200, json={
+            'id': 'fake-requester', 'balance': self.balance, 'public_name': {'EN': 'Fake requester'},
+        })
+
+    def _search(self, params: httpx.QueryParams, body, family: str) -> httpx.Response:
+        items = list(self.storage[family].values())
+        for param, value in params.multi_items():
+            if param in _SEARCH_SERVICE_PARAMS:
+                continue
+            suffix = next((suffix for suffix in _INTERVAL_SUFFIXES if param.endswith(suffix)), None)
+            if suffix is not None:
+                field = param[:-len(suffix)]
+                items = [item for item in items if _matches_interval(item.get(field), suffix, value)]
+            else:
+                values = value.split(',')
+                items = [item for item in items if _matches_exact(item.get(param), values)]
+
+        sort_fields = [field for value in params.get_list('sort') for field in value.split(',') if field]
+        for field in reversed(sort_fields or ['id']):
+            key = field.lstrip('-')
+            items.sort(key=lambda item: (item.get(key) is not None, item.get(key) or ''), reverse=field[0] == '-')
+
+        limit = int(params.get('limit', 50))
+        return httpx.Response(200, json={'items': items[:limit], 'has_more': len(items) > limit})
+
+    def _get(self, params, body, family: str, item_id: str) -> httpx.Response:
+        item = self.storage[family].get(item_id)
+        if item is None:
+            return _not_found(family, item_id)
+        return httpx.Response(200, json=item)
+
+    def _replace(self, params, body: dict, family: str, item_id: str) -> httpx.Response:
+        item = self.storage[family].get(item_id)
+        if item is None:
+            return _not_found(family, item_id)
+        readonly_fields = {key: item[key] for key in ('id', 'created', 'status') if key in item}
+        item = self.storage[family][item_id] = {**body, **readonly_fields}
+        return httpx.Response(200, json=item)
+
+    def _patch(self, params, body: dict, family: str, item_id: str) -> httpx.Response:
+        item = self.storage[family].get(item_id)
+        if item is None:
+            return _not_found(family, item_id)
+        item.update(body)
+        return httpx.Response(200, json=item)
+
+    def _create_project(self, params, body: dict) -> httpx.Response:
+        return httpx.Response(201, json=self._store('projects', body, status='ACTIVE'))
+
+    def _archive_project(self, params, body, item_id: str) -> httpx.Response:
+        project = self.storage['projects'].get(item_id)
+        if project is None:
+            return _not_found('projects', item_id)
+        project['status'] = 'ARCHIVED'
+        return httpx.Response(202, json=self._add_operation('PROJECT.ARCHIVE', {'project_id': item_id}))
+
+    def _create_pool(self, params, body: dict) -> httpx.Response:
+        if body.get('project_id') not in self.storage['projects']:
+            return _error(400, 'VALIDATION_ERROR', 'Validation failed', payload={
+                'project_id': {'code': 'DOES_NOT_EXIST', 'message': 'Project does not exist'},
+            })
+        return httpx.Response(201, json=self._store('pools', body, status='CLOSED'))
+
+    def _change_pool_status(self, params, body, item_id: str, action: str) -> httpx.Response:
+        pool = self.storage['pools'].get(item_id)
+        if pool is None:
+            return _not_found('pools', item_id)
+        status, operation_type = {
+            'open': ('OPEN', 'POOL.OPEN'),
+            'close': ('CLOSED', 'POOL.CLOSE'),
+            'close-for-update': ('CLOSED', 'POOL.CLOSE'),
+            'archive': ('ARCHIVED', 'POOL.ARCHIVE'),
+        }[action]
+        if pool['status'] == status:
+            return httpx.Response(204)
+        pool['status'] = status
+        if status == 'OPEN':
+            pool['last_started'] = _now()
+        return httpx.Response(202, json=self._add_operation(operation_type, {'pool_id': item_id}))
+
+    def _validate_object(self, family: str, obj: dict) -> Optional[dict]:
+        if family == 'tasks' and obj.get('pool_id') not in self.storage['pools']:
+            return {'pool_id': {'code': 'DOES_NOT_EXIST', 'message': 'Pool does not exist'}}
+        return None
+
+    def _create_object(self, family: str, obj: dict, allow_defaults: bool) -> dict:
+        if family == 'tasks':
+            pool = self.storage['pools'][obj['pool_id']]
+            overlap = obj.get('overlap')
+            if overlap is None and allow_defaults:
+                overlap = (pool.get('defaults') or {}).get('default_overlap_for_new_tasks')
+            return self._store(family, obj, overlap=overlap or 1, remaining_overlap=overlap or 1)
+        return self._store(family, obj)
+
+    def _create_objects(self, params: httpx.QueryParams, body: Union[dict, List[dict]], family: str) -> httpx.Response:
+        operation_id = params.get('operation_id')
+        if operation_id is not None and operation_id in self.storage['operations']:
+            return _error(409, 'OPERATION_ALREADY_EXISTS', f'Operation {operation_id} already exists')
+
+        is_single = isinstance(body, dict)
+        objects = [body] if is_single else body
+        validation_errors = {str(idx): self._validate_object(family, obj) for idx, obj in enumerate(objects)}
+        validation_errors = {idx: errors for idx, errors in validation_errors.items() if errors is not None}
+        skip_invalid_items = _is_true(params.get('skip_invalid_items'))
+        if validation_errors and (is_single or not skip_invalid_items):
+            return _error(400, 'VALIDATION_ERROR', 'Validation failed', payload=(
+                validation_errors['0'] if is_single else validation_errors
+            ))
+
+        allow_defaults = _is_true(params.get('allow_defaults'))
+        created = {
+            str(idx): self._create_object(family, obj, allow_defaults)
+            for idx, obj in enumerate(objects) if str(idx) not in validation_errors
+        }
+        if _is_true(params.get('open_pool')):
+            for pool_id in {obj['pool_id'] for obj in created.values() if 'pool_id' in obj}:
+                self.storage['pools'][pool_id]['status'] = 'OPEN'
+
+        if not _is_true(params.get('async_mode')):
+            if is_single:
+                return httpx.Response(201, json=created['0'])
+            return httpx.Response(201, json={'items': created, 'validation_errors': validation_errors})
+
+        output_id_field = {'tasks': 'task_id', 'user-bonuses': 'user_bonus_id'}[family]
+        log = []
+        for idx, obj in enumerate(objects):
+            item_input = {**obj, '__item_idx': obj.get('__item_idx', str(idx))}
+            if str(idx) in created:
+                log.append({
+                    'type': f'{family.upper()}_CREATE', 'success': True, 'input': item_input,
+                    'output': {output_id_field: created[str(idx)]['id']},
+                })
+            else:
+                log.append({
+                    'type': f'{family.upper()}_CREATE', 'success': False, 'input': item_input,
+                    'output': validation_errors[str(idx)],
+                })
+        operation_type = {'tasks': 'TASK.BATCH_CREATE', 'user-bonuses': 'USER_BONUS.BATCH_CREATE'}[family]
+        details = {
+            'total_count': len(objects), 'valid_count': len(created), 'not_valid_count': len(validation_errors),
+            'success_count': len(created), 'failed_count': 0,
+        }
+        parameters = {'skip_invalid_items': skip_invalid_items}
+        if family == 'tasks':
+            parameters.update(allow_defaults=allow_defaults, open_pool=_is_true(params.get('open_pool')))
+        operation = self._add_operation(operation_type, parameters, details, operation_id=operation_id, log=log)
+        return httpx.Response(202, json=operation)
+
+    def _patch_assignment(self, params, body: dict, item_id: str) -> httpx.Response:
+        assignment = self.storage['assignments'].get(item_id)
+        if assignment is None:
+            return _not_found('assignments', item_id)
+        status = body.get('status')
+        if assignment['status'] != 'SUBMITTED' or status not in ('ACCEPTED', 'REJECTED'):
+            return _error(409, 'INAPPROPRIATE_STATUS', f'Can not change status {assignment["status"]} to {status}')
+        assignment.update(status=status, public_comment=body.get('public_comment'))
+        assignment[status.lower()] = _now()
+        return httpx.Response(200, json=assignment)
+
+    def _get_operation_log(self, params, body, item_id: str) -> httpx.Response:
+        if item_id not in self.operation_logs:
+            return _not_found('operations', item_id)
+        return httpx.Response(200, json=self.operation_logs[item_id])
+
+    def _compute_pool_analytics(self, name: str, pool_id: str) -> Any:
+        assignments = [item for item in self.storage['assignments'].values() if item['pool_id'] == pool_id]
+        tasks = [item for item in self.storage['tasks'].values() if item['pool_id'] == pool_id]
+        assignment_counts = {
+            'submitted_assignments_count': 'SUBMITTED',
+            'approved_assignments_count': 'ACCEPTED',
+            'rejected_assignments_count': 'REJECTED',
+            'skipped_assignments_count': 'SKIPPED',
+            'expired_assignments_count': 'EXPIRED',
+        }
+        if name in assignment_counts:
+            return sum(1 for assignment in assignments if assignment['status'] == assignment_counts[name])
+        if name == 'real_tasks_count':
+            return sum(1 for task in tasks if not task.get('known_solutions'))
+        if name == 'completion_percentage':
+            total_overlap = sum(task.get('overlap') or 1 for task in tasks)
+            completed = sum(
+                len(assignment.get('tasks') or []) for assignment in assignments
+                if assignment['status'] in _FINISHED_ASSIGNMENT_STATUSES
+            )
+            return {'value': 100 * min(completed, total_overlap) // total_overlap if total_overlap else 0}
+        return None
+
+    def _get_analytics(self, params, body: List[dict]) -> httpx.Response:
+        finished = _now()
+        results = [
+            {
+                'request': request,
+                'result': self._compute_pool_analytics(request['name'], request['subject_id'])
+                if request.get('subject') == 'POOL' else None,
+                'finished': finished,
+            }
+            for request in body
+        ]
+        return httpx.Response(202, json=self._add_operation('ANALYTICS', {'value': body}, {'value': results}))
+
+    # Traffic generation
+
+    def generate_assignments(
+        self,
+        pool_id: str,
+        count: Optional[int] = None,
+        status: str = 'SUBMITTED',
+        tasks_per_assignment: int = 1,
+        solution: Optional[Callable[[dict], dict]] = None,
+        users_count: int = 100,
+    ) -> List[dict]:
+        """Creates assignments for tasks of a pool as if Tolokers completed them.
+
+        Tasks are assigned in a round robin manner, so every task gets an assignment before any task gets a second one.
+
+        Args:
+            pool_id: ID of the pool.
+            count: The number of assignments. Default: `None` — every task gets a single assignment.
+            status: Status of the assignments. Default: `SUBMITTED`.
+            tasks_per_assignment: The number of tasks in every assignment. Default: `1`.
+            solution: A function that returns output values for a task. Default: `None` — output values are empty.
+            users_count: The number of Tolokers whose IDs are randomly assigned to assignments. Default: `100`.
+
+        Returns:
+            List[dict]: Created assignments in the API format.
+        """
+        with self._lock:
+            pool = self.storage['pools'].get(pool_id)
+            if pool is None:
+                raise ValueError(f'Pool {pool_id} does not exist')
+            tasks = [task for task in self.storage['tasks'].values() if task['pool_id'] == pool_id]
+            if not tasks:
+                raise ValueError(f'Pool {pool_id} has no tasks')
+            if count is None:
+                count = math.ceil(len(tasks) / tasks_per_assignment)
+
+            task_iterator = itertools.cycle(tasks)
+            assignments = []
+            for _ in range(count):
+                assignment_tasks = [next(task_iterator) for _ in range(tasks_per_assignment)]
+                now = _now()
+                assignment = {
+                    'id': self._next_id(),
+                    'task_suite_id': self._next_id(),
+                    'pool_id': pool_id,
+                    'user_id': f'user-{self._random.randrange(users_count)}',
+                    'status': status,
+                    'reward': pool.get('reward_per_assignment', 0),
+                    'tasks': [
+                        {key: task[key] for key in ('id', 'pool_id', 'input_values', 'overlap') if key in task}
+                        for task in assignment_tasks
+                    ],
+                    'automerged': False,
+                    'created': now,
+                }
+                if status in _FINISHED_ASSIGNMENT_STATUSES:
+                    assignment['submitted'] = now
+                    assignment['solutions'] = [
+                        {'output_values': solution(task) if solution is not None else {}} for task in assignment_tasks
+                    ]
+                if status in ('ACCEPTED', 'REJECTED'):
+                    assignment[status.lower()] = now
+                self.storage['assignments'][assignment['id']] = assignment
+                assignments.append(assignment)
+            return assignments
@@ -0,0 +1,88 @@
+__all__ = [
+    'FakeTolokaBackend',
+]
+import httpx
+import re
+import typing
+
+
+class FakeTolokaBackend(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """In-memory imitation of the Toloka API for load testing and benchmarks without network access.
+
+    The backend is an `httpx` transport: pass it to `TolokaClient` or `AsyncTolokaClient` with the `transport`
+    parameter. It implements the main endpoints of projects, pools, tasks, assignments, operations, operation logs,
+    rewards and analytics. Operations are completed immediately. The backend doesn't check tokens and validates only
+    references to pools.
+
+    Assignments are not created by the backend on its own. Call `generate_assignments` to imitate Tolokers' work.
+
+    The backend is thread-safe and may be used by several clients at once.
+
+    Args:
+        latency: Seconds every request takes, or a function that returns the latency for a request. Use it to
+            imitate network delays. Default: `0`.
+        quota: The maximum number of requests in `quota_interval`. Requests that exceed the quota get the 429 response
+            with the `Retry-After` header. Default: `None` — requests are not limited.
+        quota_interval: Length of the quota interval in seconds. Default: `60`.
+        balance: Requester's balance. Default: `1000`.
+        seed: Seed of the random generator used by `generate_assignments`. Default: `None`.
+
+    Attributes:
+        storage: Stored objects in the API format by ID for every entity type: `projects`, `pools`, `tasks`,
+            `assignments`, `operations` and `user-bonuses`.
+        operation_logs: Logs of operations by operation IDs.
+        request_count: The number of handled requests including rejected by the quota.
+
+    Example:
+        >>> backend = toloka.testing.FakeTolokaBackend(latency=0.05)
+        >>> toloka_client = toloka.client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+        >>> project = toloka_client.create_project(project)
+        >>> pool = toloka_client.create_pool(pool)
+        >>> toloka_client.create_tasks(tasks, allow_defaults=True)
+        >>> backend.generate_assignments(pool.id, solution=lambda task: {'result': 'OK'})
+        >>> assignments = list(toloka_client.get_assignments(pool_id=pool.id, status='SUBMITTED'))
+        ...
+    """
+
+    def __init__(
+        self,
+        latency: typing.Union[float, typing.Callable[[httpx.Request], float]] = 0.0,
+        quota: typing.Optional[int] = None,
+        quota_interval: float = 60.0,
+        balance: float = 1000.0,
+        seed: typing.Optional[int] = None
+    ): ...
+
+    def __setstate__(self, state): ...
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response: ...
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response: ...
+
+    def generate_assignments(
+        self,
+        pool_id: str,
+        count: typing.Optional[int] = None,
+        status: str = 'SUBMITTED',
+        tasks_per_assignment: int = 1,
+        solution: typing.Optional[typing.Callable[[dict], dict]] = None,
+        users_count: int = 100
+    ) -> typing.List[dict]:
+        """Creates assignments for tasks of a pool as if Tolokers completed them.
+
+        Tasks are assigned in a round robin manner, so every task gets an assignment before any task gets a second one.
+
+        Args:
+            pool_id: ID of the pool.
+            count: The number of assignments. Default: `None` — every task gets a single assignment.
+            status: Status of the assignments. Default: `SUBMITTED`.
+            tasks_per_assignment: The number of tasks in every assignment. Default: `1`.
+            solution: A function that returns output values for a task. Default: `None` — output values are empty.
+            users_count: The number of Tolokers whose IDs are randomly assigned to assignments. Default: `100`.
+
+        Returns:
+            List[dict]: Created assignments in the API format.
+        """
+        ...
+
+    _ROUTES: typing.List[typing.Tuple[str, re.Pattern, str]]
@@ -8,7 +8,7 @@ import functools
 import inspect
 import linecache
 import uuid
-from inspect import isclass, signature, Signature, Parameter, BoundArguments
+from inspect import isclass, signature, Signature, Parameter
 from textwrap import dedent, indent
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
@@ -126,10 +126,45 @@ def _get_annotations_from_signature(sig: Signature) -> dict:
     return annotations
 
 
-def _try_bind_arguments(sig: Signature, args: List, kwargs: Dict) -> Tuple[Optional[BoundArguments], Optional[TypeError]]:
-    """Checks if arguments are suitable for provided signature. Return bindings and exception."""
+class _Reference:
+    """An object with the given repr. Used to refer to global names in the source code of generated functions."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+def _replace_defaults_with_references(sig: Signature, globs: Dict[str, Any]) -> Signature:
+    """Returns a signature where default values are replaced with references to them added to `globs`
+
+    Such a signature can be used to compile a function with any default values, not only with ones having an
+    evaluable repr.
+    """
+    new_params = []
+    for idx, param in enumerate(sig.parameters.values()):
+        if param.default is not Parameter.empty:
+            globs[f'default_{idx}'] = param.default
+            param = param.replace(default=_Reference(f'default_{idx}'))
+        new_params.append(param)
+    return sig.replace(parameters=new_params)
+
+
+def _compile_binding_function(func_name: str, sig: Signature, result: str = 'None') -> Callable:
+    """Generates a function that raises TypeError if arguments don't fit the signature and evaluates `result` otherwise.
+
+    Calling the generated function is much faster than `Signature.bind` as arguments are bound by the interpreter.
+    """
+    globs = {}
+    sig = _replace_defaults_with_references(sig, globs).replace(return_annotation=Signature.empty)
+    return _compile_function(func_name, sig, f'return {result}', globs=globs)
+
+
+def _try_bind_arguments(binding_func: Callable, args: Tuple, kwargs: Dict) -> Tuple[Any, Optional[TypeError]]:
+    """Checks if arguments are suitable for the binding function. Returns its result and exception."""
     try:
-        return sig.bind(*args, **kwargs), None
+        return binding_func(*args, **kwargs), None
     except TypeError as err:
         return None, err
 
@@ -248,26 +283,20 @@ def expand_func_by_argument(func: Callable, arg_name: str, arg_type: Optional[Ty
             return func{_get_signature_invocation_string(func_sig)}
         ''')
 
+    globs = {arg_type.__name__: arg_type, 'func': func}
     expanded_func = _compile_function(
         f'{func.__name__}_expanded_by_{arg_name}',
-        func_sig.replace(parameters=new_params),
+        _replace_defaults_with_references(func_sig.replace(parameters=new_params), globs),
         function_body,
         inspect.iscoroutinefunction(func),
-        {arg_type.__name__: arg_type, 'func': func, 'NOTHING': attr.NOTHING}
+        globs,
     )
     expanded_func.__doc__ = func.__doc__
     return expanded_func
 
 
-def _check_arg_type_compatibility(func_sig: Signature, arg_name: str, arg_type: Optional[Type], bound: BoundArguments) -> Tuple[bool, Optional[str]]:
-    arg_param: Parameter = func_sig.parameters[arg_name]
-    if arg_type is None:
-        arg_type = is_optional_of(arg_param.annotation) or arg_param.annotation
-    bound.apply_defaults()
-    arg_candidate: Any = bound.arguments[arg_name]  # incoming argument
-    if isinstance(arg_candidate, arg_type):
-        return True, None
-    return False, f'Argument "{arg_candidate}" has type "{type(arg_candidate)}" that is not a subclass of "{arg_type}"'
+def _get_arg_type_compatibility_problem(arg_type: Type, arg_candidate: Any) -> str:
+    return f'Argument "{arg_candidate}" has type "{type(arg_candidate)}" that is not a subclass of "{arg_type}"'
 
 
 @universal_decorator(has_parameters=True)
@@ -289,20 +318,23 @@ def expand(arg_name: str, arg_type: Optional[Type] = None, check_type: bool = Tr
         func_sig: Signature = get_signature(func)
         expanded_func: Callable = expand_func_by_argument(func, arg_name, arg_type)
         expanded_func_sig: Signature = get_signature(expanded_func)
+        arg_param: Parameter = func_sig.parameters[arg_name]
+        checked_type = arg_type or is_optional_of(arg_param.annotation) or arg_param.annotation
+
+        # Arguments are bound by generated functions at every call, so signatures are processed only once here
+        bind_arg = _compile_binding_function(func.__name__, func_sig, arg_name)
+        bind_expanded_args = _compile_binding_function(expanded_func.__name__, expanded_func_sig)
 
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            bound, func_problem = _try_bind_arguments(func_sig, args, kwargs)
-            if bound is not None:
-                if check_type and arg_name not in kwargs:
-                    fit, func_problem = _check_arg_type_compatibility(func_sig, arg_name, arg_type, bound)
-                    if fit:
-                        return func(*args, **kwargs)
-                else:
+            arg_candidate, func_problem = _try_bind_arguments(bind_arg, args, kwargs)
+            if func_problem is None:
+                if not check_type or arg_name in kwargs or isinstance(arg_candidate, checked_type):
                     return func(*args, **kwargs)
+                func_problem = _get_arg_type_compatibility_problem(checked_type, arg_candidate)
 
-            bound, expand_func_problem = _try_bind_arguments(expanded_func_sig, args, kwargs)
-            if bound is None:
+            _, expand_func_problem = _try_bind_arguments(bind_expanded_args, args, kwargs)
+            if expand_func_problem is not None:
                 raise TypeError(
                     f'Arguments does not fit standart or expanded version.\nStandart version on problem: {func_problem}\nExpand version on problem: {expand_func_problem}')
             return expanded_func(*args, **kwargs)
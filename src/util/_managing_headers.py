@@ -1,7 +1,9 @@
 __all__ = [
     'add_headers',
     'async_add_headers',
+    'aiterate_in_context',
     'form_additional_headers',
+    'iterate_in_context',
     'set_variable',
     'top_level_method_var',
 ]
@@ -9,16 +11,21 @@ __all__ = [
 import asyncio
 import contextvars
 import inspect
+import types
 from contextvars import ContextVar, copy_context
 import functools
-from contextlib import ExitStack, contextmanager
-from typing import Dict
+from contextlib import contextmanager
+from typing import AsyncIterator, Dict, Iterator, TypeVar
 from ._codegen import universal_decorator
 
 caller_context_var: ContextVar = ContextVar('caller_context')
 top_level_method_var: ContextVar = ContextVar('top_level_method')
 low_level_method_var: ContextVar = ContextVar('low_level_method')
 
+_NOT_SET = object()
+
+T = TypeVar('T')
+
 
 @contextmanager
 def set_variable(var, value):
@@ -30,22 +37,6 @@ def set_variable(var, value):
             var.reset(token)
 
 
-class LocalContext:
-    def __init__(self, ctx: contextvars.Context = None):
-        if ctx is None:
-            ctx = copy_context()
-        self._cached_vars = dict(ctx.items())
-        self.exit_stack = ExitStack()
-
-    def __enter__(self):
-        self.exit_stack.__enter__()
-        for var, value in self._cached_vars.items():
-            self.exit_stack.enter_context(set_variable(var, value))
-
-    def __exit__(self, *args, **kwargs):
-        self.exit_stack.__exit__(*args, **kwargs)
-
-
 @universal_decorator(has_parameters=True)
 def add_headers(client: str):
     """
@@ -62,15 +53,17 @@ def add_headers(client: str):
 
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            ctx = copy_context()
-            with ExitStack() as stack:
-                stack.enter_context(set_variable(low_level_method_var, func.__name__))
-                if caller_context_var not in ctx:
-                    stack.enter_context(set_variable(caller_context_var, client))
-                if top_level_method_var not in ctx:
-                    stack.enter_context(set_variable(top_level_method_var, func.__name__))
-
+            # Variables are set directly as the wrapper runs on every call of a client method
+            tokens = [low_level_method_var.set(func.__name__)]
+            if caller_context_var.get(_NOT_SET) is _NOT_SET:
+                tokens.append(caller_context_var.set(client))
+            if top_level_method_var.get(_NOT_SET) is _NOT_SET:
+                tokens.append(top_level_method_var.set(func.__name__))
+            try:
                 return run_in_current_context(func, *args, **kwargs)
+            finally:
+                for token in reversed(tokens):
+                    token.var.reset(token)
 
         return wrapped
 
@@ -91,10 +84,48 @@ def form_additional_headers(ctx: contextvars.Context = None) -> Dict[str, str]:
     }
 
 
+@types.coroutine
+def _await_in_context(ctx: contextvars.Context, awaitable):
+    """Awaits the awaitable running each of its steps in the context."""
+    iterator = awaitable.__await__()
+    step, value = iterator.send, None
+    while True:
+        try:
+            signal = ctx.run(step, value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value = yield signal
+            step = iterator.send
+        except BaseException as exc:
+            step, value = iterator.throw, exc
+
+
+def iterate_in_context(ctx: contextvars.Context, iterator: Iterator[T]) -> Iterator[T]:
+    """Iterates over the iterator getting each of its values in the context."""
+    while True:
+        try:
+            value = ctx.run(next, iterator)
+        except StopIteration:
+            return
+        yield value
+
+
+async def aiterate_in_context(ctx: contextvars.Context, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+    """Iterates over the async iterator getting each of its values in the context."""
+    while True:
+        try:
+            value = await _await_in_context(ctx, iterator.__anext__())
+        except StopAsyncIteration:
+            return
+        yield value
+
+
 def run_in_current_context(func, *args, **kwargs):
     """Runs the function using context state from the moment of calling run_in_current_context function.
 
     Unlike Context.run supports generators, async generators and functions that return an awaitable (e.g. coroutines).
+    Generators are advanced in a context captured once, so switching to it costs the same for any number of variables.
     """
 
     result = func(*args, **kwargs)
@@ -102,26 +133,29 @@ def run_in_current_context(func, *args, **kwargs):
         # capture context by running inside task
         loop = asyncio.get_event_loop()
         return loop.create_task(result)
-    elif inspect.isgenerator(result) or inspect.isasyncgen(result):
-        local_vars = LocalContext()
-        if inspect.isgenerator(result):
-            def gen():
-                while True:
-                    try:
-                        with local_vars:
-                            item = result.__next__()
-                        yield item
-                    except StopIteration:
-                        return
-        else:
-            async def gen():
-                while True:
-                    try:
-                        with local_vars:
-                            item = await result.__anext__()
-                        yield item
-                    except StopAsyncIteration:
-                        return
+    elif inspect.isgenerator(result):
+        ctx = copy_context()
+
+        def gen():
+            while True:
+                try:
+                    item = ctx.run(result.__next__)
+                except StopIteration:
+                    return
+                yield item
+
+        return gen()
+    elif inspect.isasyncgen(result):
+        ctx = copy_context()
+
+        async def gen():
+            while True:
+                try:
+                    item = await _await_in_context(ctx, result.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+
         return gen()
     else:
         return result
@@ -1,7 +1,9 @@
 __all__ = [
     'add_headers',
     'async_add_headers',
+    'aiterate_in_context',
     'form_additional_headers',
+    'iterate_in_context',
     'set_variable',
     'top_level_method_var',
 ]
@@ -11,6 +13,8 @@ import typing
 
 top_level_method_var: contextvars.ContextVar
 
+T = typing.TypeVar('T')
+
 def set_variable(var, value): ...
 
 
@@ -29,3 +33,15 @@ def add_headers(client: str):
 async_add_headers = add_headers
 
 def form_additional_headers(ctx: contextvars.Context = None) -> typing.Dict[str, str]: ...
+
+
+def iterate_in_context(ctx: contextvars.Context, iterator: typing.Iterator[T]) -> typing.Iterator[T]:
+    """Iterates over the iterator getting each of its values in the context.
+    """
+    ...
+
+
+def aiterate_in_context(ctx: contextvars.Context, iterator: typing.AsyncIterator[T]) -> typing.AsyncIterator[T]:
+    """Iterates over the async iterator getting each of its values in the context.
+    """
+    ...
@@ -8,6 +8,8 @@ __all__ = [
     'AsyncGenAdapter',
     'generate_async_methods_from',
     'isasyncgenadapterfunction',
+    'LazyGeneratedMethod',
+    'materialize_generated_methods',
 ]
 
 import asyncio
@@ -19,6 +21,7 @@ import logging
 import pickle
 import re
 import sys
+import threading
 import time
 from concurrent import futures
 from io import StringIO
@@ -228,6 +231,8 @@ def generate_async_methods_from(cls):
     the naming collision (decorated class already has the method that would have been created by the decorator)
     the new method is not generated. This allows you to custom implement asynchronous versions of non-trivial methods
     while automatically generating boilerplate code.
+
+    Methods are generated on the first access, see `LazyGeneratedMethod`.
     """
 
     def _substitute_for_loop(match):
@@ -305,23 +310,62 @@ def generate_async_methods_from(cls):
 
             return function
 
+        def _generate_method(member_name, member):
+            function = _compile_function(member_name, _generate_async_version_source(member))
+            if inspect.isasyncgenfunction(function):
+                function = async_gen_adapter(function)
+            return function
+
         for member_name, member in cls.__dict__.items():
             if (
                 inspect.isfunction(member)
                 and not hasattr(target_cls, member_name)
                 and not isinstance(member_name, property)
+                # special methods (e.g. context manager protocol) have different asynchronous counterparts
+                and not (member_name.startswith('__') and member_name.endswith('__'))
             ):
-                source = _generate_async_version_source(member)
-
-                function = _compile_function(member_name, source)
-                if inspect.isasyncgenfunction(function):
-                    function = async_gen_adapter(function)
-                setattr(target_cls, member_name, function)
+                setattr(
+                    target_cls, member_name,
+                    LazyGeneratedMethod(target_cls, member_name, functools.partial(_generate_method, member_name, member)),
+                )
         return target_cls
 
     return wrapper
 
 
+class LazyGeneratedMethod:
+    """Descriptor that generates a method on the first access and replaces itself with it in the owner class.
+
+    Generating asynchronous versions of all methods at import time is slow, and most programs use only a few of them.
+    """
+
+    def __init__(self, owner: type, name: str, generate: Callable[[], Callable]):
+        self._owner = owner
+        self._name = name
+        self._generate = generate
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner=None):
+        return self.materialize().__get__(instance, owner)
+
+    def materialize(self) -> Callable:
+        """Generates the method if it was not generated yet and returns it."""
+        with self._lock:
+            function = self._owner.__dict__[self._name]
+            if function is self:
+                function = self._generate()
+                setattr(self._owner, self._name, function)
+        return function
+
+
+def materialize_generated_methods(cls: type) -> type:
+    """Generates all methods of the class that are generated lazily."""
+    for member in list(cls.__dict__.values()):
+        if isinstance(member, LazyGeneratedMethod):
+            member.materialize()
+    return cls
+
+
 def async_gen_adapter(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -347,11 +391,18 @@ class SyncGenWrapper:
             # Creating new loop inside thread each time is impossible since it will be destroyed on thread exit and
             # generator will be closed.
             with futures.ThreadPoolExecutor(max_workers=1) as executor:
-                while True:
-                    res = executor.submit(loop.run_until_complete, self.gen.__anext__())
-                    yield res.result()
-        except StopAsyncIteration:
-            return
+                try:
+                    while True:
+                        # Every step runs in the context of the caller, e.g. with headers of the calling method
+                        res = executor.submit(contextvars.copy_context().run, loop.run_until_complete, self.gen.__anext__())
+                        yield res.result()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    # Finalizes the generator and generators it iterates over if the iteration is stopped early, so
+                    # they can cancel their tasks
+                    executor.submit(loop.run_until_complete, self.gen.aclose()).result()
+                    executor.submit(loop.run_until_complete, loop.shutdown_asyncgens()).result()
         finally:
             loop.close()
 
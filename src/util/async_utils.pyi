@@ -8,6 +8,8 @@ __all__ = [
     'AsyncGenAdapter',
     'generate_async_methods_from',
     'isasyncgenadapterfunction',
+    'LazyGeneratedMethod',
+    'materialize_generated_methods',
 ]
 import asyncio
 import asyncio.events
@@ -132,6 +134,39 @@ def generate_async_methods_from(cls):
     the naming collision (decorated class already has the method that would have been created by the decorator)
     the new method is not generated. This allows you to custom implement asynchronous versions of non-trivial methods
     while automatically generating boilerplate code.
+
+    Methods are generated on the first access, see `LazyGeneratedMethod`.
+    """
+    ...
+
+
+class LazyGeneratedMethod:
+    """Descriptor that generates a method on the first access and replaces itself with it in the owner class.
+
+    Generating asynchronous versions of all methods at import time is slow, and most programs use only a few of them.
+    """
+
+    def __init__(
+        self,
+        owner: type,
+        name: str,
+        generate: typing.Callable[[], typing.Callable]
+    ): ...
+
+    def __get__(
+        self,
+        instance,
+        owner=None
+    ): ...
+
+    def materialize(self) -> typing.Callable:
+        """Generates the method if it was not generated yet and returns it.
+        """
+        ...
+
+
+def materialize_generated_methods(cls: type) -> type:
+    """Generates all methods of the class that are generated lazily.
     """
     ...
 
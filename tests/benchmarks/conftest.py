@@ -0,0 +1,115 @@
+"""Benchmarks of client hot paths.
+
+Benchmarks are skipped unless pytest is run with `--benchmark`. Results are compared with `baseline.json`, and a
+benchmark fails if its result, a time or a memory size, is more than `--benchmark-tolerance` times the baseline. After
+an intended change of performance, or to measure on another machine, update the baseline with:
+
+    pytest tests/benchmarks --benchmark --benchmark-save
+"""
+import asyncio
+import inspect
+import json
+import os
+import time
+from typing import Callable, Dict, Optional
+
+import pytest
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCHMARKS_DIR, 'baseline.json')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmark'):
+        return
+    skip_benchmark = pytest.mark.skip(reason='benchmarks run only with --benchmark')
+    for item in items:
+        if str(item.fspath).startswith(BENCHMARKS_DIR + os.sep):
+            item.add_marker(skip_benchmark)
+
+
+def _load_baseline() -> Dict[str, float]:
+    if not os.path.isfile(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as file:
+        return json.load(file)
+
+
+class Benchmark:
+    """Measures the best time of a single call and compares it with the committed baseline.
+
+    The best of several rounds is used as it is the least affected by other processes on the machine.
+    """
+
+    def __init__(self, name: str, baseline: Optional[float], tolerance: float):
+        self.name = name
+        self.baseline = baseline
+        self.tolerance = tolerance
+        self.result: Optional[float] = None
+
+    def __call__(self, func: Callable, *args, rounds: int = 5, number: int = 1, **kwargs) -> float:
+        """Calls `func` `number` times in each of `rounds` rounds. Coroutine functions are awaited in a single loop."""
+        if inspect.iscoroutinefunction(func):
+            async def measure():
+                timings = []
+                for _ in range(rounds):
+                    start = time.perf_counter()
+                    for _ in range(number):
+                        await func(*args, **kwargs)
+                    timings.append((time.perf_counter() - start) / number)
+                return timings
+
+            loop = asyncio.new_event_loop()
+            try:
+                timings = loop.run_until_complete(measure())
+            finally:
+                loop.close()
+        else:
+            timings = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                for _ in range(number):
+                    func(*args, **kwargs)
+                timings.append((time.perf_counter() - start) / number)
+        return self.record(min(timings))
+
+    def record(self, value: float) -> float:
+        """Records a value measured by the benchmark itself, such as a timing or a memory size. Less is better."""
+        self.result = value
+        return value
+
+    def check(self) -> None:
+        if self.result is None:
+            pytest.fail(f'Benchmark {self.name} did not record any result')
+        if self.baseline is None:
+            pytest.fail(f'Benchmark {self.name} has no baseline. Run benchmarks with --benchmark-save')
+        if self.result > self.baseline * self.tolerance:
+            pytest.fail(
+                f'Benchmark {self.name} measured {self.result:.6g}, '
+                f'more than {self.tolerance} times the baseline {self.baseline:.6g}'
+            )
+
+
+@pytest.fixture(scope='session')
+def benchmark_results():
+    results = {}
+    yield results
+    if results:
+        baseline = _load_baseline()
+        baseline.update(results)
+        with open(BASELINE_PATH, 'w') as file:
+            json.dump(dict(sorted(baseline.items())), file, indent=4)
+            file.write('\n')
+
+
+@pytest.fixture
+def benchmark(request, benchmark_results):
+    config = request.config
+    name = request.node.name
+    bench = Benchmark(name, _load_baseline().get(name), config.getoption('--benchmark-tolerance'))
+    yield bench
+    if config.getoption('--benchmark-save'):
+        if bench.result is not None:
+            benchmark_results[name] = bench.result
+    else:
+        bench.check()
@@ -0,0 +1,92 @@
+import datetime
+
+import pytest
+import toloka.client as client
+from toloka.async_client import AsyncTolokaClient
+from toloka.streaming.cursor import AssignmentCursor
+from toloka.testing import FakeTolokaBackend
+
+TASKS_COUNT = 2000
+
+
+@pytest.fixture(scope='module')
+def backend_with_pool():
+    backend = FakeTolokaBackend(seed=0)
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+    project = toloka_client.create_project(
+        client.Project(
+            public_name='Cats vs dogs',
+            public_description='Choose an animal',
+            task_spec=client.project.task_spec.TaskSpec(
+                input_spec={'image': client.project.field_spec.UrlSpec()},
+                output_spec={'result': client.project.field_spec.StringSpec()},
+            ),
+        )
+    )
+    pool = toloka_client.create_pool(
+        client.Pool(
+            project_id=project.id,
+            private_name='Pool',
+            may_contain_adult_content=False,
+            will_expire=datetime.datetime(2030, 1, 1),
+            reward_per_assignment=0.01,
+            assignment_max_duration_seconds=600,
+            defaults=client.Pool.Defaults(default_overlap_for_new_tasks=1),
+        )
+    )
+    toloka_client.create_tasks(
+        [
+            client.Task(pool_id=pool.id, input_values={'image': f'https://example.com/{i}.png'})
+            for i in range(TASKS_COUNT)
+        ],
+        allow_defaults=True,
+    )
+    backend.generate_assignments(pool.id, solution=lambda task: {'result': 'cat'})
+    return backend, pool.id
+
+
+def test_find_all(benchmark, backend_with_pool):
+    backend, pool_id = backend_with_pool
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+
+    def get_all_tasks():
+        assert len(list(toloka_client.get_tasks(pool_id=pool_id, batch_size=100))) == TASKS_COUNT
+
+    benchmark(get_all_tasks, rounds=3)
+
+
+def test_cursor_iter(benchmark, backend_with_pool):
+    backend, pool_id = backend_with_pool
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+
+    def iterate_cursor():
+        cursor = AssignmentCursor(pool_id=pool_id, event_type='SUBMITTED', toloka_client=toloka_client)
+        assert len(list(cursor)) == TASKS_COUNT
+
+    benchmark(iterate_cursor, rounds=3)
+
+
+def test_cursor_aiter(benchmark, backend_with_pool):
+    backend, pool_id = backend_with_pool
+    toloka_client = AsyncTolokaClient('fake-token', 'SANDBOX', transport=backend)
+
+    async def iterate_cursor():
+        cursor = AssignmentCursor(pool_id=pool_id, event_type='SUBMITTED', toloka_client=toloka_client)
+        assert len([event async for event in cursor]) == TASKS_COUNT
+
+    benchmark(iterate_cursor, rounds=3)
+
+
+def test_cursor_try_fetch_all(benchmark, backend_with_pool):
+    backend, pool_id = backend_with_pool
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+    cursor = AssignmentCursor(pool_id=pool_id, event_type='SUBMITTED', toloka_client=toloka_client)
+    with cursor.try_fetch_all() as events:
+        assert len(events) == TASKS_COUNT
+
+    def fetch_nothing_new():
+        # Only the cost of the cursor state snapshot and a single request, as all events are already seen
+        with cursor.try_fetch_all() as events:
+            assert not events
+
+    benchmark(fetch_nothing_new, rounds=5, number=20)
@@ -0,0 +1,124 @@
+import contextvars
+from typing import List
+
+import pytest
+from toloka.client.message_thread import Folder
+from toloka.client.primitives.base import autocast_to_enum
+from toloka.client.task import TaskOverlapPatch
+from toloka.util._codegen import expand
+from toloka.util._managing_headers import add_headers, aiterate_in_context, iterate_in_context
+
+CALLS_COUNT = 10000
+
+
+@expand('patch')
+def patch_task_overlap_or_min(task_id: str, patch: TaskOverlapPatch):
+    return patch
+
+
+@add_headers('client')
+def get_items(count):
+    yield from range(count)
+
+
+@add_headers('client')
+async def get_items_async(count):
+    for item in range(count):
+        yield item
+
+
+def iterate_pages(count, page_size):
+    for start in range(0, count, page_size):
+        yield range(start, min(start + page_size, count))
+
+
+async def aiterate_pages(count, page_size):
+    for start in range(0, count, page_size):
+        yield range(start, min(start + page_size, count))
+
+
+@add_headers('client')
+def get_pages(count, page_size=100):
+    # Pages are taken in the captured context as in `_find_all`
+    for page in iterate_in_context(contextvars.copy_context(), iterate_pages(count, page_size)):
+        yield from page
+
+
+@add_headers('client')
+async def get_pages_async(count, page_size=100):
+    async for page in aiterate_in_context(contextvars.copy_context(), aiterate_pages(count, page_size)):
+        for item in page:
+            yield item
+
+
+@autocast_to_enum
+def add_message_thread_to_folders(message_thread_id: str, folders: List[Folder], folder: Folder = None):
+    return folders
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        pytest.param({'patch': TaskOverlapPatch(overlap=3)}, id='object'),
+        pytest.param({'overlap': 3}, id='expanded'),
+    ]
+)
+def test_expand_call(benchmark, kwargs):
+
+    def call():
+        for _ in range(CALLS_COUNT):
+            patch_task_overlap_or_min('task-1', **kwargs)
+
+    benchmark(call)
+
+
+@pytest.mark.parametrize(
+    'args',
+    [
+        pytest.param(([Folder.INBOX], Folder.UNREAD), id='enum'),
+        pytest.param((['INBOX'], 'UNREAD'), id='str'),
+    ]
+)
+def test_autocast_to_enum_call(benchmark, args):
+
+    def call():
+        for _ in range(CALLS_COUNT):
+            add_message_thread_to_folders('thread-1', *args)
+
+    benchmark(call)
+
+
+def test_add_headers_generator(benchmark):
+
+    def iterate():
+        for _ in get_items(CALLS_COUNT):
+            pass
+
+    benchmark(iterate)
+
+
+def test_add_headers_async_generator(benchmark):
+
+    async def iterate():
+        async for _ in get_items_async(CALLS_COUNT):
+            pass
+
+    benchmark(iterate)
+
+
+def test_add_headers_paginated_generator(benchmark):
+
+    def iterate():
+        for _ in get_pages(CALLS_COUNT):
+            pass
+
+    benchmark(iterate)
+
+
+def test_add_headers_paginated_async_generator(benchmark):
+
+    async def iterate():
+        async for _ in get_pages_async(CALLS_COUNT):
+            pass
+
+    benchmark(iterate)
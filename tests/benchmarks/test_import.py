@@ -0,0 +1,18 @@
+import subprocess
+import sys
+
+IMPORT_SCRIPT = '''
+import time
+start = time.perf_counter()
+import toloka.client
+print(time.perf_counter() - start)
+'''
+
+
+def test_import_toloka_client(benchmark):
+    # Every import is measured in a new interpreter, as modules are cached after the first import
+    timings = [
+        float(subprocess.run([sys.executable, '-c', IMPORT_SCRIPT], check=True, capture_output=True).stdout)
+        for _ in range(3)
+    ]
+    benchmark.record(min(timings))
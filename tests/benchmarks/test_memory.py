@@ -0,0 +1,50 @@
+import gc
+import json
+import tracemalloc
+
+import toloka.client as client
+
+OBJECTS_COUNT = 5000
+
+ASSIGNMENT = {
+    'id': '00001e1d8a--5ebcfcb39ba4b26fee1fef03',
+    'task_suite_id': '00001e1d8a--5ebcfcb39ba4b26fee1fef02',
+    'pool_id': '21',
+    'user_id': 'a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4',
+    'status': 'SUBMITTED',
+    'reward': 0.01,
+    'mixed': False,
+    'automerged': False,
+    'created': '2020-01-01T00:00:00',
+    'submitted': '2020-01-01T00:05:00',
+    'tasks': [
+        {'id': f'00001e1d8a--5ebcfcb39ba4b26fee1fef0{idx}', 'pool_id': '21', 'input_values': {'image': f'{idx}.png'}}
+        for idx in range(3)
+    ],
+    'solutions': [{'output_values': {'result': 'cat'}} for _ in range(3)],
+}
+
+
+def measure_bytes_per_object(data, cls):
+    # Every object is structured from its own parsed copy of the data, as it happens with API responses
+    payload = json.dumps([data] * OBJECTS_COUNT)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        raw = json.loads(payload)
+        objects = [client.structure(item, cls) for item in raw]
+        del raw
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == OBJECTS_COUNT
+    return size / OBJECTS_COUNT
+
+
+def test_memory_structure_assignment(benchmark):
+    benchmark.record(measure_bytes_per_object(ASSIGNMENT, client.Assignment))
+
+
+def test_memory_structure_task(benchmark):
+    benchmark.record(measure_bytes_per_object(ASSIGNMENT['tasks'][0], client.Task))
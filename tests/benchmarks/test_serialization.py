@@ -0,0 +1,133 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+import toloka.client as client
+from toloka.client.project.template_builder import (
+    GroupFieldOption,
+    ImageViewV1,
+    InputData,
+    ListViewV1,
+    OutputData,
+    RadioGroupFieldV1,
+    RequiredConditionV1,
+    TemplateBuilder,
+    TextViewV1,
+)
+from toloka.client.project.view_spec import TemplateBuilderViewSpec, ViewSpec
+
+
+def make_pool():
+    return client.Pool(
+        id='21',
+        project_id='10',
+        private_name='Benchmark pool',
+        may_contain_adult_content=False,
+        will_expire=datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc),
+        reward_per_assignment=0.01,
+        assignment_max_duration_seconds=600,
+        auto_accept_solutions=True,
+        defaults=client.Pool.Defaults(default_overlap_for_new_tasks=3),
+        filter=(
+            (client.filter.Languages.in_('EN') | client.filter.Languages.in_('FR'))
+            & (client.filter.ClientType == 'BROWSER')
+        ),
+        quality_control=client.quality_control.QualityControl(
+            configs=[
+                client.quality_control.QualityControl.QualityControlConfig(
+                    rules=[
+                        client.quality_control.QualityControl.QualityControlConfig.RuleConfig(
+                            action=client.actions.RestrictionV2(
+                                scope='PROJECT',
+                                duration=10,
+                                duration_unit='DAYS',
+                                private_comment='Fast responses',
+                            ),
+                            conditions=[client.conditions.FastSubmittedCount > 3],
+                        ),
+                    ],
+                    collector_config=client.collectors.AssignmentSubmitTime(history_size=5, fast_submit_threshold_seconds=7),
+                ),
+            ],
+        ),
+        mixer_config=client.pool.MixerConfig(real_tasks_count=10, golden_tasks_count=0, training_tasks_count=0),
+        created=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        status=client.Pool.Status.OPEN,
+    )
+
+
+def make_assignment(tasks_count=10):
+    return client.Assignment(
+        id='00001e1d8a--5ebcfcb39ba4b26fee1fef03',
+        task_suite_id='00001e1d8a--5ebcfcb39ba4b26fee1fef02',
+        pool_id='21',
+        user_id='user-1',
+        status=client.Assignment.SUBMITTED,
+        reward=Decimal('0.01'),
+        tasks=[
+            client.Task(
+                id=f'task-{i}', pool_id='21', input_values={'image': f'https://example.com/{i}.png', 'text': 'x' * 100}
+            )
+            for i in range(tasks_count)
+        ],
+        solutions=[client.solution.Solution(output_values={'result': 'cat'}) for _ in range(tasks_count)],
+        mixed=False,
+        automerged=False,
+        created=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        submitted=datetime.datetime(2020, 1, 1, 0, 5, tzinfo=datetime.timezone.utc),
+    )
+
+
+def make_task():
+    return client.Task(
+        id='task-1',
+        pool_id='21',
+        input_values={'image': 'https://example.com/1.png', 'text': 'x' * 100},
+        known_solutions=[client.task.BaseTask.KnownSolution(output_values={'result': 'cat'}, correctness_weight=1)],
+        overlap=3,
+        infinite_overlap=False,
+        created=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+
+
+def make_view_spec():
+    return TemplateBuilderViewSpec(
+        config=TemplateBuilder(
+            view=ListViewV1(
+                [
+                    ImageViewV1(InputData('image'), rotatable=True),
+                    RadioGroupFieldV1(
+                        OutputData('result'),
+                        [GroupFieldOption('cat', 'Cat'), GroupFieldOption('dog', 'Dog')],
+                        validation=RequiredConditionV1(),
+                    ),
+                    *(TextViewV1(InputData('text'), label=f'Label {i}') for i in range(20)),
+                ]
+            ),
+        ),
+    )
+
+
+# Objects are structured with the types that the client uses for API responses
+OBJECTS = {
+    'pool': (make_pool, client.Pool),
+    'assignment': (make_assignment, client.Assignment),
+    'task': (make_task, client.Task),
+    'view_spec': (make_view_spec, ViewSpec),
+}
+
+
+@pytest.mark.parametrize('object_name', OBJECTS)
+def test_structure(benchmark, object_name):
+    make_object, cl = OBJECTS[object_name]
+    obj = make_object()
+    data = client.unstructure(obj)
+    assert client.unstructure(client.structure(data, cl)) == data
+    benchmark(client.structure, data, cl, rounds=5, number=200)
+
+
+@pytest.mark.parametrize('object_name', OBJECTS)
+def test_unstructure(benchmark, object_name):
+    make_object, _ = OBJECTS[object_name]
+    obj = make_object()
+    benchmark(client.unstructure, obj, rounds=5, number=200)
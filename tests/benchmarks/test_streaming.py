@@ -0,0 +1,52 @@
+import datetime
+
+import attr
+import pytest
+from toloka.streaming.observer import BaseObserver
+from toloka.streaming.pipeline import IterationMode, Pipeline
+from toloka.streaming.storage import JSONLocalStorage
+
+ITERATIONS_COUNT = 20
+
+
+@attr.s
+class NoopObserver(BaseObserver):
+    calls_count: int = attr.ib(default=0)
+
+    async def __call__(self) -> None:
+        self.calls_count += 1
+
+    async def should_resume(self) -> bool:
+        return True
+
+
+@pytest.mark.parametrize('observers_count', [1, 10, 100])
+def test_pipeline_run_manually(benchmark, observers_count):
+
+    async def run_iterations():
+        pipeline = Pipeline(period=datetime.timedelta(0), iteration_mode=IterationMode.ALL_COMPLETED)
+        observers = [pipeline.register(NoopObserver(name=str(idx))) for idx in range(observers_count)]
+        iterations = pipeline.run_manually()
+        for _ in range(ITERATIONS_COUNT):
+            await iterations.__anext__()
+        await iterations.aclose()
+        assert all(observer.calls_count == ITERATIONS_COUNT for observer in observers)
+
+    benchmark(run_iterations, rounds=5)
+
+
+@pytest.fixture
+def observers_by_key():
+    return {f'observer-{idx}': NoopObserver(name=str(idx), calls_count=idx) for idx in range(50)}
+
+
+def test_json_local_storage_save(benchmark, tmp_path, observers_by_key):
+    storage = JSONLocalStorage(str(tmp_path))
+    benchmark(storage.save, 'pipeline', observers_by_key, rounds=5, number=5)
+
+
+def test_json_local_storage_load(benchmark, tmp_path, observers_by_key):
+    storage = JSONLocalStorage(str(tmp_path))
+    storage.save('pipeline', observers_by_key)
+    assert storage.load('pipeline', list(observers_by_key)) == observers_by_key
+    benchmark(storage.load, 'pipeline', list(observers_by_key), rounds=5, number=5)
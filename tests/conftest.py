@@ -53,11 +53,11 @@ class SyncOverAsyncTolokaClient:
             setattr(self.async_client, key, value)
 
     def __getstate__(self):
-        return self.async_client.__dict__
+        return self.async_client.__getstate__()
 
     def __setstate__(self, state):
         self.async_client = AsyncTolokaClient.__new__(AsyncTolokaClient)
-        self.async_client.__dict__ = state
+        self.async_client.__setstate__(state)
 
 
 @pytest.fixture
@@ -127,3 +127,16 @@ def no_uuid_random():
     rd = random.Random()
     rd.seed(0)
     uuid.uuid4 = lambda: uuid.UUID(int=rd.getrandbits(128))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmark', 'benchmarks of client hot paths')
+    group.addoption('--benchmark', action='store_true', help='Run benchmarks from tests/benchmarks.')
+    group.addoption(
+        '--benchmark-save', action='store_true',
+        help='Save benchmark results as the new baseline instead of comparing with it.',
+    )
+    group.addoption(
+        '--benchmark-tolerance', type=float, default=2.0,
+        help='Fail a benchmark if it is slower than the baseline by more than this factor. Default: 2.0.',
+    )
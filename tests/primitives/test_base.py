@@ -1,8 +1,10 @@
 import pytest
+import copy
 import pickle
 import inspect
 from toloka.client import structure, unstructure
 from toloka.util._codegen import attribute
+from toloka.client.primitives import base as base_module
 from toloka.client.primitives.base import BaseTolokaObject, autocast_to_enum
 from ..utils.test_extendable_enum import test_enum, test_extendable_enum  # noqa: F401
 from typing import Optional, List, Union, Tuple, Dict, TypeVar, Generic
@@ -62,6 +64,36 @@ def test_generic_base_inherited_object():
     assert unstructure(structured_with_simple_field) == unstructured_data_with_simple_field
 
 
+def test_generic_objects_are_structured_lazily_with_mapped_types():
+    from toloka.client._lazy import structure_lazily, structure_search_result_lazily
+
+    T = TypeVar('T')
+
+    class Point(BaseTolokaObject):
+        x: int
+
+    class Box(Generic[T], BaseTolokaObject):
+        content: T
+        contents: List[T]
+
+    class SearchResult(Generic[T], BaseTolokaObject):
+        items: List[T]
+        has_more: bool
+
+    box = structure_lazily({'content': {'x': 1}, 'contents': [{'x': 2}]}, Box[Point])
+    assert box == structure({'content': {'x': 1}, 'contents': [{'x': 2}]}, Box[Point])
+    assert box.content == Point(x=1)
+    assert box.contents == [Point(x=2)]
+
+    result = structure_search_result_lazily(
+        {'items': [{'content': {'x': 3}, 'contents': []}], 'has_more': False},
+        SearchResult[Box[Point]],
+    )
+    assert isinstance(result.items[0], Box)
+    assert result.items[0].content == Point(x=3)
+    assert result.has_more is False
+
+
 @pytest.fixture
 def non_attr_class():
     class NonAttrClass:
@@ -283,3 +315,107 @@ def test_extendable_enum_union_autocast(test_extendable_enum, non_attr_class):
     assert func(['a', 'b', 'field_2']) == [test_extendable_enum.A, test_extendable_enum.B, test_extendable_enum.field_2]
     non_attr_class_instance = non_attr_class(1)
     assert func(non_attr_class_instance) == non_attr_class_instance
+
+
+def test_structure_functions_are_generated_once():
+
+    class Point(BaseTolokaObject):
+        x: int
+        y_coordinate: int = attribute(origin='y', required=True)
+        label: str
+
+    data = {'x': '1', 'y': 2, 'label': None, 'color': 'red'}
+    point = structure(data, Point)
+    assert (point.x, point.y_coordinate, point.label, point.color) == (1, 2, None, 'red')
+    assert data == {'x': '1', 'y': 2, 'label': None, 'color': 'red'}
+    assert unstructure(point) == {'x': 1, 'y': 2, 'color': 'red'}
+    assert unstructure(Point(y_coordinate=None)) == {'y': None}
+
+    structure_func = base_module._STRUCTURE_FUNCS[Point]
+    unstructure_func = base_module._UNSTRUCTURE_FUNCS[Point]
+    structure({'x': 3, 'y': 4}, Point)
+    unstructure(point)
+    assert base_module._STRUCTURE_FUNCS[Point] is structure_func
+    assert base_module._UNSTRUCTURE_FUNCS[Point] is unstructure_func
+
+
+def test_structure_functions_use_hooks_registered_later():
+    from toloka.client._converter import converter
+    from toloka.client._lazy import structure_lazily
+
+    class Coordinate:
+        def __init__(self, value):
+            self.value = value
+
+    class Point(BaseTolokaObject):
+        x: Coordinate
+
+    converter.register_structure_hook(Coordinate, lambda data, type_: type_(data))
+    assert structure({'x': 1}, Point).x.value == 1
+    assert structure_lazily({'x': 1}, Point).x.value == 1
+
+    converter.register_structure_hook(Coordinate, lambda data, type_: type_(data * 10))
+    assert structure({'x': 1}, Point).x.value == 10
+    assert structure_lazily({'x': 1}, Point).x.value == 10
+
+
+def test_unstructure_functions_use_hooks_registered_later():
+    from enum import Enum
+
+    from toloka.client._converter import converter
+
+    class Kind(Enum):
+        CIRCLE = 'CIRCLE'
+
+    class Shape(BaseTolokaObject, spec_enum=Kind, spec_field='kind'):
+        pass
+
+    class Circle(Shape, spec_value=Kind.CIRCLE):
+        radius: int
+
+    assert unstructure(Circle(radius=1)) == {'kind': 'CIRCLE', 'radius': 1}
+
+    converter.register_unstructure_hook(Kind, lambda kind: kind.value.lower())
+    assert unstructure(Circle(radius=1)) == {'kind': 'circle', 'radius': 1}
+
+
+def test_objects_without_unexpected_fields_allocate_dict_on_access():
+
+    class Worker(BaseTolokaObject):
+        user_id: str
+        name: str
+
+    first = structure({'user_id': ''.join(['user', '-1']), 'name': ''.join(['Jo', 'hn'])}, Worker)
+    second = structure({'user_id': ''.join(['user', '-1']), 'name': ''.join(['Jo', 'hn'])}, Worker)
+    assert '_unexpected' not in first.__dict__
+    assert unstructure(first) == {'user_id': 'user-1', 'name': 'John'}
+    assert copy.deepcopy(first) == first
+    assert pickle.loads(pickle.dumps(BaseTolokaObject())) == BaseTolokaObject()
+    with pytest.raises(AttributeError):
+        first.color
+
+    assert first.user_id is second.user_id
+    assert first.name is not second.name
+
+    first._unexpected['color'] = 'red'
+    assert first.color == 'red'
+    assert second._unexpected == {}
+    assert first._unexpected is not second._unexpected is not Worker()._unexpected
+    assert unstructure(first) == {'user_id': 'user-1', 'name': 'John', 'color': 'red'}
+    assert copy.copy(first).color == 'red'
+    assert first != second
+
+    with_unexpected = structure({'user_id': 'user-1', 'color': 'red'}, Worker)
+    with_unexpected._unexpected['size'] = 'large'
+    assert unstructure(with_unexpected) == {'user_id': 'user-1', 'color': 'red', 'size': 'large'}
+
+
+def test_autocast_to_enum_decorator_with_omitted_arguments(test_enum):  # noqa: F811
+
+    @autocast_to_enum
+    def func(count: int = 0, arg: test_enum = None, *args: test_enum, **kwargs: str):
+        return count, arg, args, kwargs
+
+    assert func() == (0, None, (), {})
+    assert func(arg='a') == (0, test_enum.A, (), {})
+    assert func(1, 'a', 'b', key='value') == (1, test_enum.A, (test_enum.B,), {'key': 'value'})
@@ -0,0 +1,87 @@
+import pickle
+
+import httpx
+import pytest
+from toloka.async_client import AsyncTolokaClient
+from toloka.client import Requester, Skill, TolokaClient, unstructure
+from toloka.client.primitives.instrumentation import LATENCY_BUCKETS, ClientHooks, ClientStats, MethodStats
+from urllib3 import Retry
+
+REQUESTER = {'id': '566ec2b0ff0deeaae5f9d500', 'balance': 120.3, 'public_name': {'EN': 'John Smith'}}
+
+
+def test_client_stats_aggregates_by_top_level_method():
+    stats = ClientStats()
+    stats.on_request('GET', '/api/v1/pools/1', 'get_pool', 0)
+    stats.on_response('GET', '/api/v1/pools/1', 'get_pool', 500, 0.07, 10)
+    stats.on_retry('GET', '/api/v1/pools/1', 'get_pool', 1, 0.5)
+    stats.on_request('GET', '/api/v1/pools/1', 'get_pool', 0)
+    stats.on_response('GET', '/api/v1/pools/1', 'get_pool', 200, 3.0, 100)
+    stats.on_structure('get_pool', dict, 0.25)
+    stats.on_request('POST', '/api/v1/pools', 'create_pool', 50)
+    stats.on_response('POST', '/api/v1/pools', 'create_pool', None, 0.01, 0)
+
+    expected_histogram = [0] * len(LATENCY_BUCKETS)
+    expected_histogram[1] = expected_histogram[6] = 1
+    assert stats.snapshot() == {
+        'get_pool': MethodStats(
+            requests=2, errors=1, retries=1, bytes_in=110, network_time=3.07, backoff_time=0.5, structuring_time=0.25,
+            latency_histogram=expected_histogram,
+        ),
+        'create_pool': MethodStats(
+            requests=1, errors=1, bytes_out=50, network_time=0.01, latency_histogram=[1] + [0] * 8,
+        ),
+    }
+    assert pickle.loads(pickle.dumps(stats)).snapshot() == stats.snapshot()
+    stats.reset()
+    assert stats.snapshot() == {}
+
+
+@pytest.mark.parametrize('client_class', [TolokaClient, AsyncTolokaClient])
+@pytest.mark.asyncio
+async def test_client_calls_hooks(respx_mock, toloka_url, client_class):
+    stats = ClientStats()
+    toloka_client = client_class(
+        'fake-token', 'SANDBOX', hooks=stats, retry_quotas=None,
+        retryer_factory=lambda: Retry(total=3, status_forcelist={500}, backoff_factor=0.01),
+    )
+    respx_mock.get(f'{toloka_url}/requester').mock(
+        side_effect=[
+            httpx.Response(status_code=500, json={'code': 'INTERNAL_ERROR'}),
+            httpx.Response(status_code=500, json={'code': 'INTERNAL_ERROR'}),
+            httpx.Response(status_code=200, json=REQUESTER),
+        ]
+    )
+
+    requester = toloka_client.get_requester()
+    if isinstance(toloka_client, AsyncTolokaClient):
+        requester = await requester
+    assert isinstance(requester, Requester)
+
+    method_stats = stats.snapshot()['get_requester']
+    assert method_stats.requests == 3
+    assert method_stats.errors == 2
+    assert method_stats.retries == 2
+    assert method_stats.backoff_time == pytest.approx(0.02)
+    assert method_stats.bytes_in > len(b'{"code":"INTERNAL_ERROR"}') * 2
+    assert sum(method_stats.latency_histogram) == 3
+    assert method_stats.network_time > 0
+    assert method_stats.structuring_time > 0
+
+
+def test_hooks_receive_request_size(respx_mock, toloka_url):
+    calls = []
+
+    class RecordingHooks(ClientHooks):
+        def on_request(self, method, path, top_level_method, bytes_out):
+            calls.append((method, path, top_level_method, bytes_out))
+
+    toloka_client = TolokaClient('fake-token', 'SANDBOX', hooks=RecordingHooks())
+    skill = Skill(name='Area selection of road signs')
+    respx_mock.post(f'{toloka_url}/skills').mock(
+        httpx.Response(status_code=201, json={**unstructure(skill), 'id': '1'})
+    )
+    toloka_client.create_skill(skill)
+
+    request_size = len(toloka_client.json_codec.dumps(unstructure(skill)))
+    assert calls == [('POST', '/api/v1/skills', 'create_skill', request_size)]
@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+import httpx
+import pytest
+import simplejson
+from toloka.async_client import AsyncTolokaClient
+from toloka.client import TolokaClient, UserBonus, structure, unstructure
+from toloka.client.primitives.json_codec import OrjsonCodec, SimplejsonCodec
+
+pytest.importorskip('orjson')
+
+CODECS = [SimplejsonCodec(), OrjsonCodec()]
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_codec_roundtrip(codec):
+    obj = {'name': 'Имя', 'amount': Decimal('0.05'), 'items': [1, None, True, {'nested': 'value'}]}
+    content = codec.dumps(obj)
+    assert isinstance(content, bytes)
+    assert simplejson.loads(content, parse_float=Decimal) == obj
+
+
+def test_simplejson_codec_decodes_floats_as_decimals():
+    assert SimplejsonCodec().loads(b'{"value": 0.1}') == {'value': Decimal('0.1')}
+
+
+def test_orjson_codec_keeps_decimal_attributes_exact():
+    data = OrjsonCodec().loads(b'{"user_id": "1", "amount": 0.1, "public_title": {"EN": "Bonus"}}')
+    assert data['amount'] == 0.1
+    user_bonus = structure(data, UserBonus)
+    assert user_bonus.amount == Decimal('0.1')
+    assert OrjsonCodec().dumps(unstructure(user_bonus)) == b'{"user_id":"1","amount":0.1,"public_title":{"EN":"Bonus"}}'
+
+
+@pytest.mark.parametrize('client_class', [TolokaClient, AsyncTolokaClient])
+@pytest.mark.asyncio
+async def test_client_uses_codec(respx_mock, toloka_url, client_class):
+    toloka_client = client_class('fake-token', 'SANDBOX', json_codec=OrjsonCodec())
+    respx_mock.get(f'{toloka_url}/requester').mock(
+        httpx.Response(content=b'{"id": "566ec2b0ff0deeaae5f9d500", "balance": 120.3}', status_code=200)
+    )
+    requester = toloka_client.get_requester()
+    if isinstance(toloka_client, AsyncTolokaClient):
+        requester = await requester
+    assert requester.balance == Decimal('120.3')
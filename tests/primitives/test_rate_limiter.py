@@ -0,0 +1,136 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Lock, get_ident
+
+import httpx
+import pytest
+from toloka.async_client import AsyncTolokaClient
+from toloka.client import TolokaClient
+from toloka.client.exceptions import TooManyRequestsApiError
+from toloka.client.primitives import rate_limiter as rate_limiter_module
+from toloka.client.primitives.rate_limiter import RateLimiter
+from urllib3 import Retry
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    class FakeTime:
+        now = 1000.0
+
+        def monotonic(self):
+            return self.now
+
+    fake_time = FakeTime()
+    monkeypatch.setattr(rate_limiter_module.time, 'monotonic', fake_time.monotonic)
+    return fake_time
+
+
+@pytest.mark.parametrize(
+    'path, endpoint_family',
+    [
+        ('/api/v1/tasks', 'tasks'),
+        ('/api/v1/tasks/123?force=true', 'tasks'),
+        ('/api/v1/user-bonuses', 'user-bonuses'),
+        ('/api/staging/analytics-2', 'analytics-2'),
+        ('/api/app/v0/app-projects/1/archive', 'app-projects'),
+        ('/api/new/requester/pools/1/assignments.tsv', 'pools'),
+    ]
+)
+def test_get_endpoint_family(path, endpoint_family):
+    assert RateLimiter.get_endpoint_family(path) == endpoint_family
+
+
+def test_reserve_paces_requests(fake_time):
+    rate_limiter = RateLimiter(requests_per_second=2, endpoint_limits={'tasks': 4})
+
+    assert [rate_limiter.reserve('/api/v1/pools') for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    assert [rate_limiter.reserve('/api/v1/tasks') for _ in range(6)] == [0.0] * 4 + [0.25, 0.5]
+
+    fake_time.now += 1
+    assert rate_limiter.reserve('/api/v1/pools') == 0.5
+
+
+def test_unlimited_endpoint_family(fake_time):
+    rate_limiter = RateLimiter(endpoint_limits={'tasks': 1})
+    assert [rate_limiter.reserve('/api/v1/pools') for _ in range(100)] == [0.0] * 100
+
+
+def test_on_quota_exceeded_decreases_rate_for_quota_interval(fake_time):
+    rate_limiter = RateLimiter(requests_per_second=10)
+    rate_limiter.on_quota_exceeded('/api/v1/tasks', 'MIN')
+
+    assert [rate_limiter.reserve('/api/v1/tasks') for _ in range(3)] == [0.2, 0.4, 0.6]
+    # Other endpoint families are not affected
+    assert rate_limiter.reserve('/api/v1/pools') == 0.0
+
+    fake_time.now += 60
+    assert rate_limiter.reserve('/api/v1/tasks') == 0.0
+
+
+def test_on_quota_exceeded_limits_unlimited_endpoint_family(fake_time):
+    rate_limiter = RateLimiter()
+    for _ in range(40):
+        rate_limiter.reserve('/api/v1/tasks')
+        fake_time.now += 0.05
+    # 20 requests per second were observed
+    rate_limiter.on_quota_exceeded('/api/v1/tasks', 'MIN')
+
+    assert [rate_limiter.reserve('/api/v1/tasks') for _ in range(2)] == pytest.approx([0.1, 0.2])
+
+
+@pytest.mark.parametrize('client_class', [TolokaClient, AsyncTolokaClient])
+@pytest.mark.asyncio
+async def test_client_reports_exceeded_quota(respx_mock, toloka_url, client_class):
+    rate_limiter = RateLimiter()
+    toloka_client = client_class('fake-token', 'SANDBOX', retries=0, retry_quotas=None, rate_limiter=rate_limiter)
+
+    respx_mock.get(f'{toloka_url}/projects/10').mock(httpx.Response(
+        json={'code': 'TOO_MANY_REQUESTS', 'message': 'Too many requests', 'payload': {'interval': 'MIN'}},
+        status_code=429,
+    ))
+    with pytest.raises(TooManyRequestsApiError):
+        if isinstance(toloka_client, AsyncTolokaClient):
+            await toloka_client.get_project('10')
+        else:
+            toloka_client.get_project('10')
+
+    # A single request was observed, so the rate is limited to a half of request per second
+    assert rate_limiter.reserve('/api/v1/projects/10') == pytest.approx(2.0, abs=0.1)
+
+
+def test_clients_exceeding_quota_at_once_retry_at_decreased_rate(respx_mock, toloka_url, fake_time, monkeypatch):
+    threads_count = 4
+    rate_limiter = RateLimiter(requests_per_second=10)
+    clients = [
+        TolokaClient(
+            'fake-token', 'SANDBOX', rate_limiter=rate_limiter,
+            retryer_factory=lambda: Retry(total=3, status_forcelist={429}, backoff_factor=100),
+        )
+        for _ in range(threads_count)
+    ]
+
+    sleeps = []
+    monkeypatch.setattr(rate_limiter_module.time, 'sleep', sleeps.append)
+
+    barrier = Barrier(threads_count)
+    threads_with_exceeded_quota = set()
+    lock = Lock()
+
+    def respond(request):
+        with lock:
+            is_first_request = get_ident() not in threads_with_exceeded_quota
+            threads_with_exceeded_quota.add(get_ident())
+        if is_first_request:
+            barrier.wait(timeout=10)
+            return httpx.Response(
+                json={'code': 'TOO_MANY_REQUESTS', 'message': 'Too many requests', 'payload': {'interval': 'MIN'}},
+                status_code=429,
+            )
+        return httpx.Response(json={'id': '10', 'public_name': 'Project'}, status_code=200)
+
+    respx_mock.get(f'{toloka_url}/projects/10').mock(side_effect=respond)
+    with ThreadPoolExecutor(threads_count) as executor:
+        projects = list(executor.map(lambda client: client.get_project('10'), clients))
+
+    assert [project.id for project in projects] == ['10'] * threads_count
+    # The rate is halved once, and retries are not backed off but spread over the decreased rate
+    assert sorted(sleep for sleep in sleeps if sleep) == pytest.approx([0.2, 0.4, 0.6, 0.8])
@@ -0,0 +1,191 @@
+import pickle
+
+import httpx
+import pytest
+from toloka.async_client import AsyncTolokaClient
+from toloka.client import Pool, Skill, Task, TaskSuite, TolokaClient
+from toloka.client.operations import Operation
+from toloka.client.primitives import response_cache as response_cache_module
+from toloka.client.primitives.response_cache import ResponseCache
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    class FakeTime:
+        now = 1000.0
+
+        def monotonic(self):
+            return self.now
+
+    fake_time = FakeTime()
+    monkeypatch.setattr(response_cache_module.time, 'monotonic', fake_time.monotonic)
+    return fake_time
+
+
+@pytest.mark.parametrize(
+    'method, path, params, is_cacheable',
+    [
+        ('get', '/v1/pools/1', None, True),
+        ('GET', '/v1/skills/21', {}, True),
+        ('get', '/v1/pools', None, False),
+        ('get', '/v1/pools/1', {'limit': 1}, False),
+        ('get', '/v1/pools/1/attachments', None, False),
+        ('get', '/v1/tasks/1', None, False),
+        ('patch', '/v1/pools/1', None, False),
+    ]
+)
+def test_is_cacheable(method, path, params, is_cacheable):
+    assert ResponseCache().is_cacheable(method, path, params) == is_cacheable
+
+
+def test_operations_are_never_cached():
+    cache = ResponseCache(ttl={'pools': 60, 'operations': 60})
+    assert not cache.is_cacheable('get', '/v1/operations/1')
+
+
+def test_cache_expires_after_ttl(fake_time):
+    cache = ResponseCache(ttl={'pools': 10})
+    pool = Pool(id='1', private_name='Pool')
+
+    assert cache.get('/v1/pools/1') is None
+    cache.put('/v1/pools/1', pool)
+    fake_time.now += 9
+    assert cache.get('/v1/pools/1') == pool
+    fake_time.now += 1
+    assert cache.get('/v1/pools/1') is None
+    assert cache.stats == {'hits': 1, 'misses': 2, 'size': 0}
+
+
+def test_cache_returns_copies():
+    cache = ResponseCache()
+    pool = Pool(id='1', private_name='Pool', defaults=Pool.Defaults(default_overlap_for_new_tasks=1))
+    cache.put('/v1/pools/1', pool)
+    pool.defaults.default_overlap_for_new_tasks = 2
+
+    cached_pool = cache.get('/v1/pools/1')
+    assert cached_pool.defaults.default_overlap_for_new_tasks == 1
+    cached_pool.defaults.default_overlap_for_new_tasks = 3
+    cached_pool.private_name = 'Changed'
+    assert cache.get('/v1/pools/1') == Pool(
+        id='1', private_name='Pool', defaults=Pool.Defaults(default_overlap_for_new_tasks=1),
+    )
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_size=2)
+    for pool_id in ('1', '2'):
+        cache.put(f'/v1/pools/{pool_id}', Pool(id=pool_id))
+    cache.get('/v1/pools/1')
+    cache.put('/v1/pools/3', Pool(id='3'))
+
+    assert cache.get('/v1/pools/2') is None
+    assert cache.get('/v1/pools/1') is not None
+    assert cache.get('/v1/pools/3') is not None
+
+
+def test_nested_path_invalidates_entity():
+    cache = ResponseCache()
+    cache.put('/v1/pools/1', Pool(id='1'))
+    cache.invalidate('/v1/pools/1/open')
+    assert cache.get('/v1/pools/1') is None
+
+
+@pytest.mark.parametrize(
+    'path, params, json, invalidated_pool_ids',
+    [
+        ('/v1/tasks', {'open_pool': True}, [{'pool_id': '1'}, {'pool_id': '2'}], {'1', '2'}),
+        ('/v1/task-suites', {'open_pool': True, 'async_mode': False}, {'pool_id': '2'}, {'2'}),
+        ('/v1/tasks', {'open_pool': False}, [{'pool_id': '1'}], set()),
+        ('/v1/tasks', None, [{'pool_id': '1'}], set()),
+        ('/v1/user-bonuses', {'open_pool': True}, [{'pool_id': '1'}], set()),
+        ('/v1/task-suites/suite-1', {'open_pool': True}, {'overlap': 2}, {'1', '2', '3'}),
+        ('/v1/task-suites/suite-1/set-overlap-or-min', {'open_pool': 'true'}, {'overlap': 2}, {'1', '2', '3'}),
+        ('/v1/task-suites/suite-1', None, {'overlap': 2}, set()),
+    ]
+)
+def test_write_with_open_pool_invalidates_pools(path, params, json, invalidated_pool_ids):
+    cache = ResponseCache()
+    for pool_id in ('1', '2', '3'):
+        cache.put(f'/v1/pools/{pool_id}', Pool(id=pool_id))
+    cache.invalidate_after_write(path, params, json)
+    assert {pool_id for pool_id in ('1', '2', '3') if cache.get(f'/v1/pools/{pool_id}') is None} == invalidated_pool_ids
+
+
+def test_cache_pickling():
+    cache = ResponseCache(ttl={'pools': 1}, max_size=10)
+    cache.put('/v1/pools/1', Pool(id='1'))
+    unpickled = pickle.loads(pickle.dumps(cache))
+    assert (unpickled.ttl, unpickled.max_size, unpickled.stats) == ({'pools': 1}, 10, {'hits': 0, 'misses': 0, 'size': 0})
+
+
+@pytest.mark.parametrize('client_class', [TolokaClient, AsyncTolokaClient])
+@pytest.mark.asyncio
+async def test_client_caches_entities_until_write(respx_mock, toloka_url, client_class):
+    cache = ResponseCache()
+    toloka_client = client_class('fake-token', 'SANDBOX', cache=cache)
+    skill_sample = {'id': '21', 'name': 'Skill name'}
+
+    get_route = respx_mock.get(f'{toloka_url}/skills/21').mock(httpx.Response(json=skill_sample, status_code=200))
+    update_route = respx_mock.put(f'{toloka_url}/skills/21').mock(httpx.Response(json=skill_sample, status_code=200))
+
+    async def call(method, *args):
+        result = getattr(toloka_client, method)(*args)
+        return await result if isinstance(toloka_client, AsyncTolokaClient) else result
+
+    for _ in range(3):
+        assert (await call('get_skill', '21')) == Skill(id='21', name='Skill name')
+    assert get_route.call_count == 1
+
+    await call('update_skill', '21', Skill(name='Skill name'))
+    await call('get_skill', '21')
+    assert (get_route.call_count, update_route.call_count) == (2, 1)
+    assert cache.stats == {'hits': 2, 'misses': 2, 'size': 1}
+
+
+def test_client_invalidates_pool_opened_by_created_tasks(respx_mock, toloka_url):
+    cache = ResponseCache()
+    toloka_client = TolokaClient('fake-token', 'SANDBOX', cache=cache)
+    pool_map = {'id': '21', 'private_name': 'Pool', 'status': 'CLOSED'}
+    task_map = {'id': 'task-1', 'pool_id': '21', 'input_values': {'image': 'https://example.com/1.png'}}
+
+    get_route = respx_mock.get(f'{toloka_url}/pools/21').mock(side_effect=lambda request: httpx.Response(
+        json=pool_map, status_code=200,
+    ))
+    respx_mock.post(f'{toloka_url}/tasks').mock(httpx.Response(json=task_map, status_code=201))
+
+    assert toloka_client.get_pool('21').status == Pool.Status.CLOSED
+    pool_map['status'] = 'OPEN'
+    toloka_client.create_task(Task.structure(task_map), open_pool=True, async_mode=False)
+    assert toloka_client.get_pool('21').status == Pool.Status.OPEN
+    assert get_route.call_count == 2
+
+
+def test_client_invalidates_pools_opened_by_patched_task_suite(respx_mock, toloka_url):
+    cache = ResponseCache()
+    toloka_client = TolokaClient('fake-token', 'SANDBOX', cache=cache)
+    pool_map = {'id': '21', 'private_name': 'Pool', 'status': 'CLOSED'}
+    task_suite_map = {'id': 'suite-1', 'pool_id': '21', 'overlap': 2}
+
+    get_route = respx_mock.get(f'{toloka_url}/pools/21').mock(side_effect=lambda request: httpx.Response(
+        json=pool_map, status_code=200,
+    ))
+    respx_mock.patch(f'{toloka_url}/task-suites/suite-1').mock(httpx.Response(json=task_suite_map, status_code=200))
+
+    assert toloka_client.get_pool('21').status == Pool.Status.CLOSED
+    pool_map['status'] = 'OPEN'
+    assert toloka_client.patch_task_suite('suite-1', overlap=2, open_pool=True) == TaskSuite.structure(task_suite_map)
+    assert toloka_client.get_pool('21').status == Pool.Status.OPEN
+    assert get_route.call_count == 2
+
+
+def test_client_doesnt_cache_operations(respx_mock, toloka_url):
+    toloka_client = TolokaClient('fake-token', 'SANDBOX', cache=ResponseCache(ttl={'operations': 60}))
+    operation_map = {'id': 'op-1', 'type': 'POOL.OPEN', 'status': 'RUNNING', 'submitted': '2020-12-13T23:32:01'}
+
+    route = respx_mock.get(f'{toloka_url}/operations/op-1').mock(side_effect=lambda request: httpx.Response(
+        json=operation_map, status_code=200,
+    ))
+    assert toloka_client.get_operation('op-1').status == Operation.Status.RUNNING
+    operation_map['status'] = 'SUCCESS'
+    assert toloka_client.get_operation('op-1').status == Operation.Status.SUCCESS
+    assert route.call_count == 2
@@ -0,0 +1,24 @@
+import httpx
+from toloka.client.primitives.retry import SyncRetryingOverURLLibRetry
+from urllib3 import Retry
+
+
+def test_retrying_sleeps_for_retry_after_delay():
+    sleeps = []
+    responses = iter([
+        httpx.Response(
+            status_code=429, headers={'Retry-After': '7'}, request=httpx.Request('GET', 'https://toloka.dev/pools'),
+        ),
+        httpx.Response(status_code=200, request=httpx.Request('GET', 'https://toloka.dev/pools')),
+    ])
+    retrying = SyncRetryingOverURLLibRetry(
+        base_url='https://toloka.dev', retry=Retry(total=3, backoff_factor=100), reraise=True,
+        exception_to_retry=(httpx.HTTPError,), sleep=sleeps.append,
+    )
+
+    @retrying.wraps
+    def request(method, path):
+        return next(responses)
+
+    assert request('GET', '/pools').status_code == 200
+    assert sleeps == [7]
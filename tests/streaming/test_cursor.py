@@ -2,6 +2,7 @@ import asyncio
 import inspect
 import itertools
 import pickle
+import threading
 import pytest
 
 from toloka.client import TolokaClient, unstructure
@@ -270,7 +271,11 @@ def test_user_skill_cursor(respx_mock, toloka_url, toloka_client, chunk_size, ev
     [
         (
             _ByIdCursor,
-            {'await ensure_async(self.fetcher)': 'self.fetcher'}
+            {
+                'self._aiter_responses()': 'self._iter_responses()',
+                'aprefetch_in_task': 'prefetch_in_thread',
+                'async for response': 'for response',
+            }
         ),
         (
             BaseCursor,
@@ -291,3 +296,69 @@ def test_exact_iter_and_aiter_code(object_class, async_to_sync_differencies):
         aiter_code = aiter_code.replace(async_version, sync_version)
 
     assert iter_code.split('\n') == aiter_code.split('\n')
+
+
+def test_exact_by_id_cursor_responses_code():
+    def get_func_body(func):
+        return '\n'.join(inspect.getsource(func).rstrip().split('\n')[1:])
+
+    iter_code = get_func_body(_ByIdCursor._iter_responses)
+    aiter_code = get_func_body(_ByIdCursor._aiter_responses)
+    aiter_code = aiter_code.replace('await ensure_async(self.fetcher)', 'self.fetcher')
+
+    assert iter_code.split('\n') == aiter_code.split('\n')
+
+
+@pytest.mark.parametrize('prefetch_pages', [None, 1, 3])
+def test_by_id_cursor_prefetch(sync_toloka_client, mocked_backend_for_user_bonus, user_bonus_existing, prefetch_pages):
+    mocked_backend_for_user_bonus.storage.extend(user_bonus_existing)
+    request = UserBonusCursor(toloka_client=sync_toloka_client)._request
+    cursor = _ByIdCursor(sync_toloka_client.find_user_bonuses, request, prefetch_pages=prefetch_pages)
+    assert sorted(user_bonus_existing, key=lambda item: item['id']) == unstructure(list(cursor))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('prefetch_pages', [None, 1, 3])
+async def test_by_id_cursor_prefetch_async(
+    async_toloka_client, mocked_backend_for_user_bonus, user_bonus_existing, prefetch_pages,
+):
+    mocked_backend_for_user_bonus.storage.extend(user_bonus_existing)
+    request = UserBonusCursor(toloka_client=async_toloka_client)._request
+    cursor = _ByIdCursor(async_toloka_client.find_user_bonuses, request, prefetch_pages=prefetch_pages)
+    assert sorted(user_bonus_existing, key=lambda item: item['id']) == unstructure([item async for item in cursor])
+
+
+@pytest.mark.parametrize('prefetch_pages', [None, 2])
+def test_assignment_cursor_prefetch(respx_mock, toloka_url, sync_toloka_client, monkeypatch, prefetch_pages):
+    backend_data = [
+        {'pool_id': '100', 'id': item_id, 'submitted': '2020-01-01T01:01:01'} for item_id in 'ABCDEFG'
+    ] + [{'pool_id': '100', 'id': 'H', 'submitted': '2020-01-01T01:01:02'}]
+    backend = BackendSearchMock(backend_data)
+    request_threads = set()
+
+    def find_assignments(request):
+        request_threads.add(threading.get_ident())
+        return backend(request)
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=find_assignments)
+    monkeypatch.setattr(AssignmentCursor, 'BATCH_SIZE', 2)
+
+    cursor = AssignmentCursor(
+        pool_id='100', event_type='SUBMITTED', toloka_client=sync_toloka_client, prefetch_pages=prefetch_pages,
+    )
+    assert cursor.prefetch_pages == prefetch_pages
+    assert [item['id'] for item in backend_data] == [event.assignment.id for event in cursor]
+    # Pages of assignments submitted at the same time are fetched in a background thread if prefetch is enabled
+    assert len(request_threads) == (2 if prefetch_pages else 1)
+
+
+@pytest.mark.asyncio
+async def test_assignment_cursor_prefetch_async(respx_mock, toloka_url, async_toloka_client, monkeypatch):
+    backend_data = [
+        {'pool_id': '100', 'id': item_id, 'submitted': '2020-01-01T01:01:01'} for item_id in 'ABCDEFG'
+    ] + [{'pool_id': '100', 'id': 'H', 'submitted': '2020-01-01T01:01:02'}]
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=BackendSearchMock(backend_data))
+    monkeypatch.setattr(AssignmentCursor, 'BATCH_SIZE', 2)
+
+    cursor = AssignmentCursor(pool_id='100', event_type='SUBMITTED', toloka_client=async_toloka_client, prefetch_pages=2)
+    assert [item['id'] for item in backend_data] == [event.assignment.id async for event in cursor]
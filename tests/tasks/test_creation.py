@@ -7,7 +7,7 @@ import simplejson
 import toloka.client as client
 from httpx import QueryParams
 from toloka.client import Task
-from toloka.client.batch_create_results import TaskBatchCreateResult
+from toloka.client.batch_create_results import IdsBatchCreateResult, TaskBatchCreateResult
 from toloka.client.exceptions import FailedOperation, IncorrectActionsApiError
 from toloka.client.operations import Operation, TasksCreateOperation
 
@@ -429,6 +429,131 @@ def test_create_tasks_sync_through_async_retry_failed_operation(
     )
 
 
+@pytest.mark.parametrize('ids_only', [False, True])
+def test_create_tasks_sync_through_async_in_chunks(
+    respx_mock, toloka_client, toloka_url, tasks_map, operation_success_map, create_tasks_log,
+    created_tasks_21_map, created_tasks_22_map, task_create_result_map, ids_only,
+):
+    chunks = {}
+
+    def create_tasks(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'create_tasks',
+            'X-Low-Level-Method': 'create_tasks',
+        }
+        check_headers(request, expected_headers)
+
+        operation_id = request.url.params['operation_id']
+        chunks[operation_id] = [task['__item_idx'] for task in simplejson.loads(request.content)]
+        return httpx.Response(json={**operation_success_map, 'id': operation_id}, status_code=201)
+
+    def get_operation_log(request):
+        operation_id = request.url.path.split('/')[-2]
+        return httpx.Response(
+            json=[log_item for log_item in create_tasks_log if log_item['input'].get('__item_idx') in chunks[operation_id]],
+            status_code=200,
+        )
+
+    def return_tasks_by_pool(request):
+        res_map = [created_tasks_21_map] if request.url.params['pool_id'] == '21' else [created_tasks_22_map]
+        return httpx.Response(json={'items': res_map, 'has_more': False}, status_code=200)
+
+    respx_mock.post(f'{toloka_url}/tasks').mock(side_effect=create_tasks)
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(side_effect=get_operation_log)
+    find_tasks_route = respx_mock.get(f'{toloka_url}/tasks').mock(side_effect=return_tasks_by_pool)
+
+    result = toloka_client.create_tasks(
+        [client.structure(task, client.task.Task) for task in tasks_map],
+        operation_id=UUID('281073ea-ab34-416e-a028-47421ff1b166'),
+        skip_invalid_items=True,
+        allow_defaults=True,
+        chunk_size=2,
+        max_concurrent_operations=2,
+        ids_only=ids_only,
+    )
+    assert sorted(chunks.values()) == [['0', '1'], ['2']]
+    assert '281073ea-ab34-416e-a028-47421ff1b166' not in chunks
+    expected_result = TaskBatchCreateResult.structure(task_create_result_map)
+    if ids_only:
+        assert not find_tasks_route.called
+        assert result == IdsBatchCreateResult(
+            items={item_idx: task.id for item_idx, task in expected_result.items.items()},
+            validation_errors=expected_result.validation_errors,
+        )
+    else:
+        assert result == expected_result
+
+
+@pytest.mark.parametrize('ids_only', [False, True])
+@pytest.mark.parametrize('tasks_order', [[0, 2, 1], [0, 1, 2]])
+def test_upload_tasks(
+    respx_mock, toloka_client, toloka_url, tasks_map, operation_success_map, create_tasks_log,
+    created_tasks_21_map, created_tasks_22_map, task_create_result_map, ids_only, tasks_order,
+):
+    # With the second order the second batch contains only an invalid task
+    tasks_map = [tasks_map[idx] for idx in tasks_order]
+    create_tasks_log = [create_tasks_log[idx] for idx in tasks_order]
+    operation_logs = {}
+    uploaded_tasks_count = 0
+
+    def create_tasks(request):
+        nonlocal uploaded_tasks_count
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'upload_tasks',
+            'X-Low-Level-Method': 'upload_tasks',
+        }
+        check_headers(request, expected_headers)
+
+        operation_id = request.url.params['operation_id']
+        batch = simplejson.loads(request.content)
+        operation_logs[operation_id] = [
+            {**log_item, 'input': {**log_item['input'], '__item_idx': task['__item_idx']}}
+            for task, log_item in zip(batch, create_tasks_log[uploaded_tasks_count:])
+        ]
+        uploaded_tasks_count += len(batch)
+        return httpx.Response(json={**operation_success_map, 'id': operation_id}, status_code=201)
+
+    def get_operation_log(request):
+        return httpx.Response(json=operation_logs[request.url.path.split('/')[-2]], status_code=200)
+
+    def return_tasks_by_pool(request):
+        res_map = [created_tasks_21_map] if request.url.params['pool_id'] == '21' else [created_tasks_22_map]
+        return httpx.Response(json={'items': res_map, 'has_more': False}, status_code=200)
+
+    respx_mock.post(f'{toloka_url}/tasks').mock(side_effect=create_tasks)
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(side_effect=get_operation_log)
+    find_tasks_route = respx_mock.get(f'{toloka_url}/tasks').mock(side_effect=return_tasks_by_pool)
+
+    results = list(toloka_client.upload_tasks(
+        (client.structure(task, client.task.Task) for task in tasks_map),
+        operation_id=UUID('281073ea-ab34-416e-a028-47421ff1b166'),
+        skip_invalid_items=True,
+        batch_size=2,
+        ids_only=ids_only,
+    ))
+    assert len(results) == 2
+    assert len(operation_logs) == 2
+    assert '281073ea-ab34-416e-a028-47421ff1b166' not in operation_logs
+    expected_validation_errors = TaskBatchCreateResult.structure(task_create_result_map).validation_errors['2']
+    invalid_task_idx = str(tasks_order.index(2))
+    assert results[0].validation_errors == ({'1': expected_validation_errors} if invalid_task_idx == '1' else {})
+    assert results[1].validation_errors == ({'2': expected_validation_errors} if invalid_task_idx == '2' else {})
+    expected_items = [{'0': created_tasks_21_map}, {'2': created_tasks_22_map}]
+    if invalid_task_idx == '2':
+        expected_items = [{'0': created_tasks_21_map, '1': created_tasks_22_map}, {}]
+    if ids_only:
+        assert not find_tasks_route.called
+        assert [result.items for result in results] == [
+            {idx: task_map['id'] for idx, task_map in items.items()} for items in expected_items
+        ]
+    else:
+        assert [result.items for result in results] == [
+            {idx: Task.structure(task_map) for idx, task_map in items.items()} for items in expected_items
+        ]
+
+
 @pytest.fixture
 def create_tasks_operation_map():
     return {
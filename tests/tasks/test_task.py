@@ -1,13 +1,16 @@
 import datetime
+import threading
 from operator import itemgetter
 from uuid import uuid4
 import simplejson as json
 
 import httpx
+import pytest
 import simplejson
 import toloka.client as client
 from httpx import QueryParams
 
+from ..testutils.backend_mock import BackendSearchMock
 from ..testutils.util_functions import check_headers
 
 
@@ -114,6 +117,175 @@ def test_get_tasks(respx_mock, toloka_client, toloka_url, task_map_with_readonly
     assert tasks == client.unstructure(list(result))
 
 
+def test_get_tasks_parallel(respx_mock, toloka_client, toloka_url, task_map_with_readonly):
+    tasks = [dict(task_map_with_readonly, id=uuid4().hex) for _ in range(50)]
+    tasks.sort(key=itemgetter('id'))
+    backend = BackendSearchMock(tasks, limit=3)
+
+    def get_tasks(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_tasks',
+            'X-Low-Level-Method': 'find_tasks',
+        }
+        check_headers(request, expected_headers)
+        return backend(request)
+
+    respx_mock.get(f'{toloka_url}/tasks').mock(side_effect=get_tasks)
+
+    result = toloka_client.get_tasks(pool_id='21', parallelism=4)
+    assert tasks == client.unstructure(list(result))
+    # first page, probing of the last item and at least one request per shard
+    assert len(backend.responses) > 1 + 1 + 4
+    if isinstance(toloka_client, client.TolokaClient) and not toloka_client.share_session:
+        # Sessions of the shard threads are closed when the threads finish
+        assert set(toloka_client._sessions) == {threading.get_ident()}
+
+
+@pytest.mark.parametrize('prefetch_pages', [1, 4])
+def test_get_tasks_prefetch(respx_mock, toloka_client, toloka_url, task_map_with_readonly, prefetch_pages):
+    tasks = [dict(task_map_with_readonly, id=str(uuid4())) for _ in range(50)]
+    tasks.sort(key=itemgetter('id'))
+    backend = BackendSearchMock(tasks, limit=3)
+
+    def get_tasks(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_tasks',
+            'X-Low-Level-Method': 'find_tasks',
+        }
+        check_headers(request, expected_headers)
+        return backend(request)
+
+    respx_mock.get(f'{toloka_url}/tasks').mock(side_effect=get_tasks)
+
+    result = toloka_client.get_tasks(pool_id='21', prefetch_pages=prefetch_pages)
+    assert tasks == client.unstructure(list(result))
+
+
+def test_plan_id_windows():
+    from toloka.client._pagination import plan_id_windows
+
+    dense_ids = [f'{idx:04x}' for idx in range(0x100, 0x110)]
+    assert plan_id_windows(dense_ids + ['ff00'], max_ids_per_window=10) == [
+        ('0100', '0109'), ('010a', '010f'), ('ff00', 'ff00'),
+    ]
+    assert plan_id_windows([], max_ids_per_window=10) == []
+
+
+def test_iterate_shards_in_threads_streams_shards():
+    import time
+
+    from toloka.client._pagination import iterate_shards_in_threads
+
+    produced = {shard: 0 for shard in range(3)}
+    exited = []
+
+    def iterate_shard(shard):
+        for value in range(1000):
+            produced[shard] += 1
+            yield shard, value
+
+    def on_exit():
+        exited.append(threading.current_thread().ident)
+
+    values = iterate_shards_in_threads(iterate_shard, list(range(3)), depth=2, on_exit=on_exit)
+    assert [next(values) for _ in range(3)] == [(0, 0), (0, 1), (0, 2)]
+    time.sleep(0.1)
+    # Only a bounded number of values is fetched ahead of the consumer
+    assert all(count <= 3 + 2 + 1 for count in produced.values())
+
+    values.close()
+    time.sleep(0.3)
+    assert all(count <= 3 + 2 + 1 for count in produced.values())
+    assert len(set(exited)) == 3
+
+    assert list(iterate_shards_in_threads(iterate_shard, list(range(3)), max_workers=2)) == [
+        (shard, value) for shard in range(3) for value in range(1000)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aiterate_shards_in_tasks_streams_shards():
+    import asyncio
+
+    from toloka.client._pagination import aiterate_shards_in_tasks
+
+    produced = {shard: 0 for shard in range(3)}
+
+    async def aiterate_shard(shard):
+        for value in range(1000):
+            produced[shard] += 1
+            yield shard, value
+
+    values = aiterate_shards_in_tasks(aiterate_shard, list(range(3)), depth=2)
+    assert [await values.__anext__() for _ in range(3)] == [(0, 0), (0, 1), (0, 2)]
+    await asyncio.sleep(0.01)
+    assert all(count <= 3 + 2 + 1 for count in produced.values())
+    await values.aclose()
+
+    assert [value async for value in aiterate_shards_in_tasks(aiterate_shard, list(range(3)))] == [
+        (shard, value) for shard in range(3) for value in range(1000)
+    ]
+
+    produced = {shard: 0 for shard in range(3)}
+    values = aiterate_shards_in_tasks(aiterate_shard, list(range(3)), max_workers=2, depth=2)
+    assert await values.__anext__() == (0, 0)
+    await asyncio.sleep(0.01)
+    # The next shard is started only after one of the running shards is exhausted
+    assert produced[1] > 0 and produced[2] == 0
+    assert [value async for value in values] == [(0, value) for value in range(1, 1000)] + [
+        (shard, value) for shard in range(1, 3) for value in range(1000)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aprefetch_in_task_closes_iterator():
+    import asyncio
+
+    from toloka.client._pagination import aprefetch_in_task
+
+    closed = []
+
+    async def aiterate():
+        try:
+            for value in range(1000):
+                yield value
+        finally:
+            closed.append(True)
+
+    values = aprefetch_in_task(aiterate(), depth=2)
+    assert [await values.__anext__() for _ in range(3)] == [0, 1, 2]
+    await values.aclose()
+    await asyncio.sleep(0)
+    assert closed == [True]
+
+
+def test_get_tasks_by_ids(respx_mock, toloka_client, toloka_url, task_map_with_readonly):
+    tasks = [dict(task_map_with_readonly, id=uuid4().hex) for _ in range(50)]
+    tasks.sort(key=itemgetter('id'))
+    backend = BackendSearchMock(tasks)
+
+    def get_tasks(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_tasks_by_ids',
+            'X-Low-Level-Method': 'find_tasks',
+        }
+        check_headers(request, expected_headers)
+        return backend(request)
+
+    respx_mock.get(f'{toloka_url}/tasks').mock(side_effect=get_tasks)
+
+    requested_tasks = tasks[:5] + tasks[20:23] + tasks[-1:]
+    result = toloka_client.get_tasks_by_ids(
+        [task['id'] for task in requested_tasks] + ['ffffffffffffffffffffffffffffffff'], batch_size=4,
+    )
+    assert result.keys() == {task['id'] for task in requested_tasks}
+    assert client.unstructure(list(result.values())) == requested_tasks
+    assert len(backend.responses) >= 3
+
+
 def test_get_task(respx_mock, toloka_client, toloka_url, task_map_with_readonly):
 
     def get_task(request):
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from operator import itemgetter
 from urllib.parse import urlparse, parse_qs
 from decimal import Decimal
+import pickle
 
 import httpx
 import pytest
@@ -158,6 +159,90 @@ def test_get_assignments(respx_mock, toloka_client, toloka_url, assignment_map):
     assert assignments == client.unstructure(list(result))
 
 
+def test_get_assignments_by_ids(respx_mock, toloka_client, toloka_url, assignment_map):
+    assignments = [dict(assignment_map, id=f'{i:024x}') for i in range(0, 100, 3)]
+
+    def get_assignments(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_assignments_by_ids',
+            'X-Low-Level-Method': 'find_assignments',
+        }
+        check_headers(request, expected_headers)
+
+        params = request.url.params
+        id_gte, id_lte = params['id_gte'], params['id_lte']
+        assert QueryParams(sort='id', limit='1000', id_gte=id_gte, id_lte=id_lte) == params
+        items = [assignment for assignment in assignments if id_gte <= assignment['id'] <= id_lte]
+        return httpx.Response(text=simplejson.dumps({'items': items, 'has_more': False}), status_code=200)
+
+    route = respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    assignment_ids = [f'{i:024x}' for i in (3, 6, 9, 11, 12, 99)]
+    result = toloka_client.get_assignments_by_ids(assignment_ids)
+    assert sorted(result) == [f'{i:024x}' for i in (3, 6, 9, 12, 99)]
+    assert all(isinstance(assignment, client.Assignment) for assignment in result.values())
+    # the last id is far from others so it is fetched with a separate request
+    assert route.call_count == 2
+
+
+def test_get_assignments_table(respx_mock, toloka_client, toloka_url, assignment_map):
+    assignments = [dict(assignment_map, id=f'assignment-i{i}d') for i in range(5)]
+    assignments[-1].update(tasks=[], solutions=[])
+
+    def get_assignments(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_assignments_table',
+            'X-Low-Level-Method': 'get_assignments_table',
+        }
+        check_headers(request, expected_headers)
+
+        params = request.url.params
+        id_gt = params.get('id_gt', None)
+        assert QueryParams(pool_id='21', sort='id', limit='2') == params.remove('id_gt')
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:2]
+        return httpx.Response(
+            text=simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}),
+            status_code=200,
+        )
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    batches = list(toloka_client.get_assignments_table(pool_id='21', batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+
+    table = client.record_batch.RecordBatch.concat(batches)
+    assert table['ASSIGNMENT:id'] == [assignment['id'] for assignment in assignments]
+    assert table['ASSIGNMENT:reward'] == [Decimal('0.05')] * 5
+    assert table['TASK:origin_task_id'] == ['42'] * 4 + [None]
+    assert table['INPUT:image'] == ['http://images.com/1.png'] * 4 + [None]
+    assert table['OUTPUT:color'] == ['white'] * 4 + [None]
+    assert 'ASSIGNMENT:owner' not in table.column_names
+
+    df = table.to_pandas()
+    assert df.shape == (5, len(table.column_names))
+    assert list(df['OUTPUT:comment'][:4]) == ['So белый'] * 4
+
+
+def test_find_assignments_lazily(respx_mock, toloka_client, toloka_url, assignment_map):
+    toloka_client.lazy_search_results = True
+    respx_mock.get(f'{toloka_url}/assignments').mock(
+        httpx.Response(text=simplejson.dumps({'items': [assignment_map], 'has_more': False}), status_code=200)
+    )
+
+    result = toloka_client.find_assignments(pool_id='21')
+    assignment = result.items[0]
+    assert isinstance(assignment, client.assignment.Assignment)
+    assert assignment.status == client.assignment.Assignment.ACCEPTED
+    assert 'tasks' not in vars(assignment)
+
+    expected = client.structure(assignment_map, client.assignment.Assignment)
+    assert assignment == expected
+    assert assignment_map == client.unstructure(assignment)
+    assert pickle.loads(pickle.dumps(assignment)) == expected
+
+
 def test_assignment_from_json(assignment_map):
     assignment = client.structure(assignment_map, client.assignment.Assignment)
     assignment_json = simplejson.dumps(assignment_map, use_decimal=True, ensure_ascii=True)
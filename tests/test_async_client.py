@@ -0,0 +1,68 @@
+import inspect
+import json
+import subprocess
+import sys
+
+import pytest
+from toloka.async_client import AsyncTolokaClient
+from toloka.client import TolokaClient
+from toloka.util.async_utils import LazyGeneratedMethod, isasyncgenadapterfunction, materialize_generated_methods
+
+# Methods with explicit asynchronous implementations that intentionally accept other parameters
+METHODS_WITH_DIFFERENT_PARAMETERS = {'wait_operation'}
+
+SYNC_METHODS = [
+    name for name, member in vars(TolokaClient).items()
+    if inspect.isfunction(member) and not (name.startswith('__') and name.endswith('__'))
+]
+
+
+@pytest.mark.parametrize('name', SYNC_METHODS)
+def test_async_client_is_equivalent_to_sync_client(name):
+    materialize_generated_methods(AsyncTolokaClient)
+    sync_method = getattr(TolokaClient, name)
+    async_method = getattr(AsyncTolokaClient, name)
+
+    if inspect.isgeneratorfunction(sync_method):
+        assert isasyncgenadapterfunction(async_method) or inspect.isasyncgenfunction(async_method)
+    else:
+        assert inspect.iscoroutinefunction(async_method)
+
+    if name not in METHODS_WITH_DIFFERENT_PARAMETERS:
+        assert inspect.signature(async_method).parameters == inspect.signature(sync_method).parameters
+        expanded_signature = getattr(sync_method, '_expanded_func_sig', None)
+        if expanded_signature is not None:
+            assert async_method._expanded_func_sig.parameters == expanded_signature.parameters
+
+
+def test_async_methods_are_generated_on_first_access():
+    # A new interpreter is used as other tests have already generated the methods
+    script = (
+        'import json, toloka.async_client\n'
+        'from toloka.util.async_utils import LazyGeneratedMethod\n'
+        'cls = toloka.async_client.AsyncTolokaClient\n'
+        'lazy = lambda: sorted(name for name, member in vars(cls).items() if isinstance(member, LazyGeneratedMethod))\n'
+        'before = lazy()\n'
+        'cls.get_pool, cls.get_pools\n'
+        'print(json.dumps([before, lazy()]))\n'
+    )
+    before, after = json.loads(subprocess.run([sys.executable, '-c', script], check=True, capture_output=True).stdout)
+    assert {'get_pool', 'get_pools', 'create_pool'} <= set(before)
+    assert set(before) - set(after) == {'get_pool', 'get_pools'}
+
+
+def test_lazy_generated_method_is_generated_once():
+    calls = []
+
+    class Dummy:
+        pass
+
+    def generate():
+        calls.append(1)
+        return lambda self: 'value'
+
+    Dummy.method = LazyGeneratedMethod(Dummy, 'method', generate)
+    assert Dummy().method() == 'value'
+    assert Dummy().method() == 'value'
+    assert not isinstance(vars(Dummy)['method'], LazyGeneratedMethod)
+    assert len(calls) == 1
@@ -214,3 +214,79 @@ sandy hole with nothing in it to sit down on or to eat: it was a hobbit-hole, an
 
     with open(tmp_file_path, 'r') as in_f:
         assert content == in_f.read()
+
+
+def test_download_attachments(respx_mock, toloka_client, toloka_url, assignment_attachment_map, tmp_path):
+    attachments = [
+        dict(assignment_attachment_map, id=f'attachment-{i}', name=f'../file-{i}.txt') for i in range(5)
+    ]
+    contents = {attachment['id']: f'content of {attachment["id"]}'.encode() for attachment in attachments}
+
+    def find_attachments(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'download_attachments',
+            'X-Low-Level-Method': 'find_attachments',
+        }
+        check_headers(request, expected_headers)
+        assert request.url.params['pool_id'] == 'pool-1'
+        return httpx.Response(json={'items': attachments, 'has_more': False}, status_code=200)
+
+    def download(request, attachment_id):
+        return httpx.Response(content=contents[attachment_id], status_code=200)
+
+    respx_mock.get(f'{toloka_url}/attachments').mock(side_effect=find_attachments)
+    respx_mock.get(url__regex=rf'{toloka_url}/attachments/(?P<attachment_id>[\w-]+)/download').mock(side_effect=download)
+
+    # A file of the expected size is considered downloaded, an incomplete one is downloaded again
+    (tmp_path / 'attachment-0_file-0.txt').write_bytes(b'x' * len(contents['attachment-0']))
+    (tmp_path / 'attachment-1_file-1.txt').write_bytes(b'x')
+
+    paths = toloka_client.download_attachments(
+        pool_id='pool-1', target_dir=str(tmp_path), concurrency=2, disable_progress=True,
+    )
+
+    assert paths == [str(tmp_path / f'attachment-{i}_file-{i}.txt') for i in range(5)]
+    assert (tmp_path / 'attachment-0_file-0.txt').read_bytes() == b'x' * len(contents['attachment-0'])
+    for i in range(1, 5):
+        assert (tmp_path / f'attachment-{i}_file-{i}.txt').read_bytes() == contents[f'attachment-{i}']
+    assert sorted(file.name for file in tmp_path.iterdir()) == [f'attachment-{i}_file-{i}.txt' for i in range(5)]
+
+
+def test_download_attachments_takes_attachments_as_downloads_finish(
+    respx_mock, toloka_client, toloka_url, assignment_attachment_map, tmp_path,
+):
+    import threading
+    import time
+
+    from .testutils.backend_mock import BackendSearchMock
+
+    attachments = [dict(assignment_attachment_map, id=f'attachment-{i:02}') for i in range(10)]
+    backend = BackendSearchMock(attachments, limit=2)
+    events = []
+    in_flight = []
+    lock = threading.Lock()
+
+    def find_attachments(request):
+        events.append('page')
+        return backend(request)
+
+    def download(request, attachment_id):
+        with lock:
+            in_flight.append(attachment_id)
+            events.append(('in_flight', len(in_flight)))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(attachment_id)
+            events.append('done')
+        return httpx.Response(content=attachment_id.encode(), status_code=200)
+
+    respx_mock.get(f'{toloka_url}/attachments').mock(side_effect=find_attachments)
+    respx_mock.get(url__regex=rf'{toloka_url}/attachments/(?P<attachment_id>[\w-]+)/download').mock(side_effect=download)
+
+    paths = toloka_client.download_attachments(target_dir=str(tmp_path), concurrency=2, disable_progress=True)
+
+    assert paths == [str(tmp_path / f'attachment-{i:02}_ExampleAttachment.txt') for i in range(10)]
+    assert max(event[1] for event in events if isinstance(event, tuple)) <= 2
+    # The next page of the listing is fetched only when there is room for its attachments
+    assert events[:events.index('done')].count('page') <= 2
@@ -0,0 +1,159 @@
+import asyncio
+import datetime
+
+import pytest
+import toloka.client as client
+from toloka.async_client import AsyncTolokaClient
+from toloka.client.exceptions import DoesNotExistApiError
+from toloka.client.primitives.bulk import iterate_bulk_results
+from toloka.client.primitives.instrumentation import ClientStats
+from toloka.testing import FakeTolokaBackend
+
+ASSIGNMENTS_COUNT = 20
+
+
+@pytest.fixture
+def backend_with_assignments():
+    backend = FakeTolokaBackend(seed=0)
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+    project = toloka_client.create_project(
+        client.Project(
+            public_name='Cats vs dogs',
+            public_description='Choose an animal',
+            task_spec=client.project.task_spec.TaskSpec(
+                input_spec={'image': client.project.field_spec.UrlSpec()},
+                output_spec={'result': client.project.field_spec.StringSpec()},
+            ),
+        )
+    )
+    pool = toloka_client.create_pool(
+        client.Pool(
+            project_id=project.id,
+            private_name='Pool',
+            may_contain_adult_content=False,
+            will_expire=datetime.datetime(2030, 1, 1),
+            reward_per_assignment=0.01,
+            assignment_max_duration_seconds=600,
+            defaults=client.Pool.Defaults(default_overlap_for_new_tasks=1),
+        )
+    )
+    toloka_client.create_tasks(
+        [
+            client.Task(pool_id=pool.id, input_values={'image': f'https://example.com/{i}.png'})
+            for i in range(ASSIGNMENTS_COUNT)
+        ],
+        allow_defaults=True,
+    )
+    backend.generate_assignments(pool.id, solution=lambda task: {'result': 'cat'})
+    assignment_ids = [assignment.id for assignment in toloka_client.get_assignments(pool_id=pool.id)]
+    return backend, assignment_ids
+
+
+def make_accept_kwargs(assignment_ids):
+    return [{'assignment_id': assignment_id, 'public_comment': 'Well done!'} for assignment_id in assignment_ids]
+
+
+def test_bulk(backend_with_assignments):
+    backend, assignment_ids = backend_with_assignments
+    stats = ClientStats()
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend, hooks=stats)
+
+    kwargs_list = make_accept_kwargs(assignment_ids + ['unknown-assignment'])
+    results = list(toloka_client.bulk(
+        toloka_client.accept_assignment, kwargs_list, concurrency=4, ordered=True, return_exceptions=True,
+        disable_progress=True,
+    ))
+
+    assert [item.index for item in results] == list(range(ASSIGNMENTS_COUNT + 1))
+    assert [item.kwargs for item in results] == kwargs_list
+    assert all(item.result.status == client.Assignment.ACCEPTED for item in results[:-1])
+    assert isinstance(results[-1].error, DoesNotExistApiError)
+    assert results[-1].result is None
+    assert all(
+        toloka_client.get_assignment(assignment_id).status == client.Assignment.ACCEPTED
+        for assignment_id in assignment_ids
+    )
+    # Requests are made in an internal event loop in the context of the bulk call
+    assert stats.snapshot()['bulk'].requests == ASSIGNMENTS_COUNT + 1
+
+
+def test_bulk_raises_first_error(backend_with_assignments):
+    backend, assignment_ids = backend_with_assignments
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+
+    with pytest.raises(DoesNotExistApiError):
+        list(toloka_client.bulk('accept_assignment', make_accept_kwargs(['unknown-assignment']), disable_progress=True))
+
+
+@pytest.mark.asyncio
+async def test_async_bulk(backend_with_assignments):
+    backend, assignment_ids = backend_with_assignments
+    async with AsyncTolokaClient('fake-token', 'SANDBOX', transport=backend) as toloka_client:
+        results = [
+            item async for item in toloka_client.bulk(
+                'accept_assignment', make_accept_kwargs(assignment_ids), concurrency=4, disable_progress=True,
+            )
+        ]
+
+    assert sorted(item.index for item in results) == list(range(ASSIGNMENTS_COUNT))
+    assert all(item.error is None and item.result.status == client.Assignment.ACCEPTED for item in results)
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+@pytest.mark.asyncio
+async def test_iterate_bulk_results_limits_concurrency(ordered):
+    in_flight = []
+    max_in_flight = 0
+    taken_kwargs = []
+
+    async def method(delay):
+        nonlocal max_in_flight
+        in_flight.append(delay)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(delay)
+        in_flight.remove(delay)
+        return delay
+
+    def generate_kwargs():
+        for delay in [0.05, 0.01, 0.03, 0.02, 0.0, 0.04]:
+            taken_kwargs.append(delay)
+            yield {'delay': delay}
+
+    results = []
+    async for item in iterate_bulk_results(method, generate_kwargs(), 3, ordered, return_exceptions=False):
+        if ordered:
+            # Arguments are taken only when there is room for a new call
+            assert len(taken_kwargs) <= len(results) + 1 + 3
+        results.append(item)
+
+    assert max_in_flight == 3
+    assert sorted(item.index for item in results) == list(range(6))
+    assert all(item.result == item.kwargs['delay'] for item in results)
+    if ordered:
+        assert [item.index for item in results] == list(range(6))
+    else:
+        assert results[0].index == 1
+
+
+@pytest.mark.asyncio
+async def test_iterate_bulk_results_cancels_calls_on_error():
+    cancelled = []
+
+    async def method(fail):
+        if fail:
+            raise ValueError('Failed')
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(ValueError, match='Failed'):
+        async for _ in iterate_bulk_results(method, [{'fail': False}, {'fail': True}], 2, False, False):
+            pass
+
+    assert cancelled == [True]
+
+    with pytest.raises(ValueError):
+        async for _ in iterate_bulk_results(method, [], 0, False, False):
+            pass
@@ -1,6 +1,7 @@
 import copy
 import pickle
 import ssl
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 import httpx
@@ -8,6 +9,7 @@ import pytest
 import simplejson
 import toloka.client as client
 from pytest_lazyfixture import lazy_fixture
+from toloka.async_client import AsyncTolokaClient
 from toloka.client import TolokaClient
 
 from .conftest import SyncOverAsyncTolokaClient
@@ -133,3 +135,33 @@ def test_client_ssl_verify(toloka_client, verify, expected_ssl_context):
     client = copy.deepcopy(toloka_client)
     client.verify = verify
     assert get_verify_mode(client) == expected_ssl_context
+
+
+def test_client_session_limits(random_url):
+    toloka_client = TolokaClient('fake-token', url=random_url, limits=httpx.Limits(max_connections=5))
+    assert toloka_client._session._transport._pool._max_connections == 5
+
+
+@pytest.mark.parametrize('share_session', [True, False])
+def test_client_share_session(random_url, share_session):
+    toloka_client = TolokaClient('fake-token', url=random_url, share_session=share_session)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread_session = executor.submit(lambda: toloka_client._session).result()
+    assert (other_thread_session is toloka_client._session) == share_session
+
+
+def test_client_close(random_url):
+    with TolokaClient('fake-token', url=random_url) as toloka_client:
+        session = toloka_client._session
+    assert session.is_closed
+    assert not toloka_client._session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_client_close(random_url):
+    async with AsyncTolokaClient('fake-token', url=random_url) as toloka_client:
+        session = toloka_client._session
+        sync_session = toloka_client.sync_client._session
+    assert session.is_closed
+    assert sync_session.is_closed
+    assert not toloka_client._session.is_closed
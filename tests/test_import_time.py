@@ -0,0 +1,43 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Modules that take the most time to import and are not needed to make requests
+HEAVY_MODULES = [
+    'crowdkit',
+    'pandas',
+    'pkg_resources',
+    'pyarrow',
+    'scipy',
+    'sklearn',
+    'toloka.async_client',
+    'toloka.autoquality',
+    'toloka.metrics',
+    'toloka.streaming',
+]
+
+
+def get_imported_heavy_modules(statement):
+    # A new interpreter is used as modules imported by other tests are cached in sys.modules
+    script = f'import json, sys\n{statement}\nprint(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))'
+    return json.loads(subprocess.run([sys.executable, '-c', script], check=True, capture_output=True).stdout)
+
+
+@pytest.mark.parametrize('statement', ['import toloka', 'import toloka.client', 'from toloka.client import TolokaClient'])
+def test_import_does_not_load_heavy_modules(statement):
+    assert get_imported_heavy_modules(statement) == []
+
+
+def test_submodules_are_loaded_on_access():
+    imported_modules = get_imported_heavy_modules('import toloka; toloka.streaming.Pipeline')
+    assert 'toloka.streaming' in imported_modules
+    assert 'toloka.autoquality' not in imported_modules
+
+    import toloka
+    import toloka.async_client
+    assert toloka.async_client.AsyncTolokaClient
+    assert {'async_client', 'client', 'metrics', 'streaming', 'util'} <= set(dir(toloka))
+    with pytest.raises(AttributeError):
+        toloka.unknown_submodule
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from operator import itemgetter
 from urllib.parse import parse_qs, urlparse
 
@@ -142,3 +142,113 @@ def test_get_operations(respx_mock, toloka_client, toloka_url, operation_map):
         submitted_gte=datetime(2022, 7, 7, tzinfo=timezone.utc),
     )
     assert operations == client.unstructure(list(result))
+
+
+@pytest.mark.parametrize('batch_status_checks', [False, True])
+def test_wait_operations(respx_mock, toloka_client, toloka_url, operation_map, batch_status_checks):
+    # Operation 'op-3' completes on the third status check, 'op-2' completes on the first one
+    polls_until_completed = {'op-2': 1, 'op-3': 3}
+    polls_count = {operation_id: 0 for operation_id in polls_until_completed}
+
+    def poll_operation(operation_id):
+        polls_count[operation_id] += 1
+        is_completed = polls_count[operation_id] >= polls_until_completed[operation_id]
+        return dict(operation_map, id=operation_id, status='SUCCESS' if is_completed else 'RUNNING')
+
+    def get_operation(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'wait_operations',
+            'X-Low-Level-Method': 'get_operation',
+        }
+        check_headers(request, expected_headers)
+        return httpx.Response(json=poll_operation(request.url.path.split('/')[-1]), status_code=200)
+
+    def find_operations(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'wait_operations',
+            'X-Low-Level-Method': 'find_operations',
+        }
+        check_headers(request, expected_headers)
+        params = request.url.params
+        assert params['type'] == operation_map['type']
+        assert params['submitted_gte'] == params['submitted_lte'] == operation_map['submitted']
+        assert 'id_gte' not in params
+        items = [dict(operation_map, id='op-0')] + [
+            poll_operation(operation_id) for operation_id in sorted(polls_until_completed)
+        ]
+        return httpx.Response(json={'items': items, 'has_more': False}, status_code=200)
+
+    get_operation_route = respx_mock.get(url__regex=rf'{toloka_url}/operations/op-\d$').mock(side_effect=get_operation)
+    find_operations_route = respx_mock.get(f'{toloka_url}/operations').mock(side_effect=find_operations)
+
+    ops = [
+        Operation.structure(dict(operation_map, id=operation_id, status=status))
+        for operation_id, status in [('op-3', 'RUNNING'), ('op-1', 'SUCCESS'), ('op-2', 'RUNNING')]
+    ]
+    result = toloka_client.wait_operations(ops, polling_interval=timedelta(milliseconds=1),
+                                           batch_status_checks=batch_status_checks)
+    assert ['op-1', 'op-2', 'op-3'] == [op.id for op in result]
+    assert polls_count == {'op-2': 1, 'op-3': 3}
+    if batch_status_checks:
+        # A single pending operation is always requested directly
+        assert find_operations_route.call_count == 1
+        assert get_operation_route.call_count == 2
+    else:
+        assert get_operation_route.call_count == 4
+        assert not find_operations_route.called
+
+
+def test_wait_operations_limits_search_pages(respx_mock, toloka_client, toloka_url, operation_map):
+    def find_operations(request):
+        # Pending operations are hidden behind many unrelated ones
+        id_gt = request.url.params.get('id_gt', 'op-0')
+        items = [dict(operation_map, id=f'{id_gt}-{idx}') for idx in range(3)]
+        return httpx.Response(json={'items': items, 'has_more': True}, status_code=200)
+
+    find_operations_route = respx_mock.get(f'{toloka_url}/operations').mock(side_effect=find_operations)
+    get_operation_route = respx_mock.get(url__regex=rf'{toloka_url}/operations/op-\d$').mock(
+        side_effect=lambda request: httpx.Response(
+            json=dict(operation_map, id=request.url.path.split('/')[-1], status='SUCCESS'), status_code=200,
+        ),
+    )
+
+    ops = [Operation.structure(dict(operation_map, id=f'op-{idx}', status='RUNNING')) for idx in range(1, 4)]
+    result = toloka_client.wait_operations(ops, polling_interval=timedelta(milliseconds=1), batch_status_checks=True)
+    assert sorted(op.id for op in result) == ['op-1', 'op-2', 'op-3']
+    assert find_operations_route.call_count == 2
+    assert get_operation_route.call_count == 3
+
+
+def test_wait_operations_resets_polling_interval(
+    respx_mock, sync_toloka_client, toloka_url, operation_map, monkeypatch,
+):
+    # 'op-1' completes on the third status check, 'op-2' completes on the sixth one
+    polls_until_completed = {'op-1': 3, 'op-2': 6}
+    polls_count = {operation_id: 0 for operation_id in polls_until_completed}
+
+    def get_operation(request):
+        operation_id = request.url.path.split('/')[-1]
+        polls_count[operation_id] += 1
+        is_completed = polls_count[operation_id] >= polls_until_completed[operation_id]
+        return httpx.Response(
+            json=dict(operation_map, id=operation_id, status='SUCCESS' if is_completed else 'RUNNING'), status_code=200,
+        )
+
+    respx_mock.get(url__regex=rf'{toloka_url}/operations/op-\d$').mock(side_effect=get_operation)
+    sleeps = []
+    monkeypatch.setattr(client.time, 'sleep', sleeps.append)
+
+    ops = [Operation.structure(dict(operation_map, id=operation_id, status='RUNNING')) for operation_id in polls_count]
+    list(sync_toloka_client.wait_operations(ops, polling_interval=timedelta(seconds=1)))
+    assert sleeps == [1, 1.5, 2.25, 1, 1.5, 2.25]
+
+
+def test_wait_operations_timeout(respx_mock, toloka_client, toloka_url, operation_map):
+    respx_mock.get(f'{toloka_url}/operations/op-1').mock(
+        httpx.Response(json=dict(operation_map, id='op-1', status='RUNNING'), status_code=200),
+    )
+    op = Operation.structure(dict(operation_map, id='op-1', status='RUNNING'))
+    with pytest.raises(TimeoutError):
+        list(toloka_client.wait_operations([op], timeout=timedelta(0), polling_interval=timedelta(milliseconds=1)))
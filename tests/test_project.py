@@ -707,6 +707,51 @@ def test_get_assignments_df(respx_mock, toloka_client, toloka_api_url):
     assert result.equals(expected_df)
 
 
+def test_get_assignments_df_in_chunks(respx_mock, toloka_client, toloka_api_url, tmp_path):
+    expected_df = pd.DataFrame(data={
+        'ASSIGNMENT:worker_id': [f'worker-{i}' for i in range(10)],
+        'OUTPUT:label': [i % 3 for i in range(10)],
+    })
+    content = expected_df.to_csv(sep='\t', index=False).encode('utf-8')
+    respx_mock.get(f'{toloka_api_url}/new/requester/pools/123/assignments.tsv').mock(
+        httpx.Response(content=content, status_code=200)
+    )
+
+    chunks = list(toloka_client.get_assignments_df(pool_id='123', chunksize=4, dtype={'OUTPUT:label': 'float64'}))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert pd.concat(chunks, ignore_index=True).equals(expected_df.astype({'OUTPUT:label': 'float64'}))
+
+    path = tmp_path / 'assignments.csv'
+    toloka_client.export_assignments(pool_id='123', path=str(path), chunksize=3)
+    assert pd.read_csv(path).equals(expected_df)
+
+
+def test_export_assignments_to_parquet_with_column_empty_in_first_chunk(
+    respx_mock, toloka_client, toloka_api_url, tmp_path,
+):
+    pq = pytest.importorskip('pyarrow.parquet')
+    expected_df = pd.DataFrame(data={
+        'ASSIGNMENT:worker_id': [f'worker-{i}' for i in range(10)],
+        'OUTPUT:comment': [None] * 6 + [f'comment-{i}' for i in range(6, 10)],
+    })
+    content = expected_df.to_csv(sep='\t', index=False).encode('utf-8')
+    respx_mock.get(f'{toloka_api_url}/new/requester/pools/123/assignments.tsv').mock(
+        httpx.Response(content=content, status_code=200)
+    )
+
+    path = tmp_path / 'assignments.parquet'
+    toloka_client.export_assignments(pool_id='123', path=str(path), file_format='parquet', chunksize=3)
+    assert pq.read_table(path).to_pandas().equals(expected_df)
+
+
+def test_get_assignments_df_error(respx_mock, toloka_client, toloka_api_url):
+    respx_mock.get(f'{toloka_api_url}/new/requester/pools/123/assignments.tsv').mock(
+        httpx.Response(json={'code': 'VALIDATION_ERROR', 'message': 'Invalid pool'}, status_code=400)
+    )
+    with pytest.raises(ValidationApiError):
+        toloka_client.get_assignments_df(pool_id='123', chunksize=10)
+
+
 @pytest.fixture
 def simple_localization_config_map():
     return {
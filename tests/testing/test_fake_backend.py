@@ -0,0 +1,133 @@
+import datetime
+import pickle
+import time
+from decimal import Decimal
+
+import httpx
+import pytest
+import toloka.client as client
+from toloka.async_client import AsyncTolokaClient
+from toloka.streaming.cursor import AssignmentCursor
+from toloka.testing import FakeTolokaBackend
+
+
+async def call(toloka_client, method_name, *args, **kwargs):
+    result = getattr(toloka_client, method_name)(*args, **kwargs)
+    if isinstance(toloka_client, AsyncTolokaClient):
+        result = await result
+    return result
+
+
+def make_project():
+    return client.Project(
+        public_name='Cats vs dogs',
+        public_description='Choose an animal',
+        task_spec=client.project.task_spec.TaskSpec(
+            input_spec={'image': client.project.field_spec.UrlSpec()},
+            output_spec={'result': client.project.field_spec.StringSpec()},
+        ),
+    )
+
+
+def make_pool(project_id):
+    return client.Pool(
+        project_id=project_id,
+        private_name='Pool',
+        may_contain_adult_content=False,
+        will_expire=datetime.datetime(2030, 1, 1),
+        reward_per_assignment=0.01,
+        assignment_max_duration_seconds=600,
+        defaults=client.Pool.Defaults(default_overlap_for_new_tasks=3),
+    )
+
+
+@pytest.mark.parametrize('client_class', [client.TolokaClient, AsyncTolokaClient])
+@pytest.mark.asyncio
+async def test_fake_backend_workflow(client_class):
+    backend = FakeTolokaBackend(seed=0)
+    toloka_client = client_class('fake-token', 'SANDBOX', transport=backend)
+
+    project = await call(toloka_client, 'create_project', make_project())
+    pool = await call(toloka_client, 'create_pool', make_pool(project.id))
+    tasks = [client.Task(pool_id=pool.id, input_values={'image': f'https://example.com/{i}.png'}) for i in range(120)]
+    result = await call(toloka_client, 'create_tasks', tasks, allow_defaults=True, open_pool=True)
+    assert [task.input_values for task in result.items.values()] == [task.input_values for task in tasks]
+    assert all(task.overlap == 3 for task in result.items.values())
+    assert (await call(toloka_client, 'get_pool', pool.id)).status == client.Pool.Status.OPEN
+
+    backend.generate_assignments(pool.id, tasks_per_assignment=2, solution=lambda task: {'result': 'cat'})
+    assignments = toloka_client.get_assignments(pool_id=pool.id, status='SUBMITTED', batch_size=50)
+    if isinstance(toloka_client, AsyncTolokaClient):
+        assignments = [assignment async for assignment in assignments]
+    else:
+        assignments = list(assignments)
+    assert len(assignments) == 60
+    assert assignments[0].solutions[0].output_values == {'result': 'cat'}
+
+    accepted = await call(toloka_client, 'accept_assignment', assignments[0].id, 'Well done')
+    assert accepted.status == client.Assignment.ACCEPTED
+
+    operation = await call(toloka_client, 'get_analytics', [
+        client.analytics_request.SubmittedAssignmentsCountPoolAnalytics(subject_id=pool.id),
+        client.analytics_request.ApprovedAssignmentsCountPoolAnalytics(subject_id=pool.id),
+    ])
+    assert [value['result'] for value in operation.details['value']] == [59, 1]
+
+    bonuses = await call(toloka_client, 'create_user_bonuses', [
+        client.UserBonus(user_id=assignments[0].user_id, amount=Decimal('0.5'), assignment_id=assignments[0].id)
+    ])
+    assert bonuses.items['0'].amount == Decimal('0.5')
+
+    closed_pool = await call(toloka_client, 'close_pool', pool.id)
+    assert closed_pool.status == client.Pool.Status.CLOSED
+
+
+def test_fake_backend_with_cursor():
+    backend = FakeTolokaBackend()
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+    pool = toloka_client.create_pool(make_pool(toloka_client.create_project(make_project()).id))
+    toloka_client.create_tasks(
+        [client.Task(pool_id=pool.id, input_values={'image': 'https://example.com/1.png'})] * 10,
+        allow_defaults=True,
+    )
+
+    cursor = AssignmentCursor(pool_id=pool.id, event_type='SUBMITTED', toloka_client=toloka_client)
+    backend.generate_assignments(pool.id)
+    assert len(list(cursor)) == 10
+    backend.generate_assignments(pool.id, count=5)
+    assert len(list(cursor)) == 5
+
+    # The client sends datetimes with microseconds while the backend stores milliseconds
+    submitted = datetime.datetime(2030, 1, 1, 0, 0, 0, 387000)
+    for assignment in backend.storage['assignments'].values():
+        assignment['submitted'] = submitted.isoformat(timespec='milliseconds')
+    assignments = toloka_client.get_assignments(pool_id=pool.id, submitted_gte=submitted, submitted_lte=submitted)
+    assert len(list(assignments)) == 15
+
+
+def test_fake_backend_errors():
+    backend = FakeTolokaBackend(quota=2)
+    with httpx.Client(transport=backend, base_url='https://toloka.dev') as session:
+        response = session.get('/api/v1/pools/1')
+        assert response.status_code == 404
+        assert response.json()['code'] == 'DOES_NOT_EXIST'
+        assert session.get('/api/v1/unknown').status_code == 404
+
+        response = session.get('/api/v1/requester')
+        assert response.status_code == 429
+        assert response.json()['code'] == 'TOO_MANY_REQUESTS'
+        assert 0 < int(response.headers['Retry-After']) <= 60
+    assert backend.request_count == 3
+
+
+def test_fake_backend_latency_and_pickling():
+    backend = FakeTolokaBackend(latency=0.05)
+    toloka_client = client.TolokaClient('fake-token', 'SANDBOX', transport=backend)
+    toloka_client.create_project(make_project())
+
+    start = time.monotonic()
+    toloka_client.get_requester()
+    assert time.monotonic() - start >= 0.05
+
+    backend_copy = pickle.loads(pickle.dumps(backend))
+    assert backend_copy.storage == backend.storage
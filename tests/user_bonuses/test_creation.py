@@ -9,7 +9,7 @@ import simplejson
 import toloka.client as client
 from httpx import QueryParams
 from toloka.client import UserBonus
-from toloka.client.batch_create_results import UserBonusBatchCreateResult
+from toloka.client.batch_create_results import IdsBatchCreateResult, UserBonusBatchCreateResult
 from toloka.client.exceptions import FailedOperation, IncorrectActionsApiError
 from toloka.client.operations import Operation
 
@@ -389,6 +389,43 @@ def test_create_user_bonuses_sync_via_async(
     )
 
 
+def test_create_user_bonuses_sync_via_async_ids_only(
+    respx_mock, toloka_client, toloka_url, no_uuid_random,
+    user_bonus_map_async, create_user_bonuses_operation_id, user_bonus_map_async_with_read_only,
+    create_user_bonuses_operation_running, create_user_bonuses_operation_success, create_user_bonuses_log,
+):
+    def get_user_bonuses(request):
+        pytest.fail('Created user bonuses should not be requested')
+
+    assert_sync_via_async_object_creation_is_successful(
+        respx_mock=respx_mock,
+        toloka_client=toloka_client,
+        toloka_url=toloka_url,
+        create_method=toloka_client.create_user_bonuses,
+        create_method_kwargs={
+            'user_bonuses': client.structure(user_bonus_map_async, List[UserBonus]),
+            'operation_id': create_user_bonuses_operation_id,
+            'ids_only': True,
+        },
+        returned_object=get_user_bonuses,
+        expected_response_object=IdsBatchCreateResult(
+            items={str(i): user_bonus['id'] for i, user_bonus in enumerate(user_bonus_map_async_with_read_only)},
+            validation_errors={},
+        ),
+        operation_log=simplejson.dumps(create_user_bonuses_log),
+        create_object_path='user-bonuses',
+        get_object_path='user-bonuses',
+        operation_running=Operation.structure(create_user_bonuses_operation_running),
+        success_operation=Operation.structure(create_user_bonuses_operation_success),
+        expected_query_params={
+            'async_mode': 'true',
+            'operation_id': str(create_user_bonuses_operation_id),
+        },
+        top_level_method_header='create_user_bonuses',
+        low_level_method_header='create_user_bonuses',
+    )
+
+
 def test_create_user_bonuses_sync_via_async_retry(
     respx_mock, toloka_client, toloka_url, no_uuid_random,
     user_bonus_map_async, create_user_bonuses_operation_id, user_bonus_map_async_with_read_only,
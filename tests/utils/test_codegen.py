@@ -7,7 +7,7 @@ from io import StringIO
 
 import pytest
 from pytest_lazyfixture import lazy_fixture
-from toloka.util._codegen import expand_func_by_argument, universal_decorator
+from toloka.util._codegen import expand, expand_func_by_argument, universal_decorator
 
 
 @pytest.fixture
@@ -64,6 +64,26 @@ def test_generated_source_in_traceback(simple_class):
     assert 1 == len(re.findall(pattern, trace))
 
 
+def test_expand(simple_class):
+    default = object()
+
+    @expand('b')
+    def func(a: int, b: simple_class, c: object = default):
+        return a, b, c
+
+    instance = simple_class(1)
+    assert func(1, instance) == (1, instance, default)
+    assert func(1, b=instance, c=None) == (1, instance, None)
+
+    a, b, c = func(1, x=2, y='y')
+    assert (a, type(b), c) == (1, simple_class, default)
+    a, b, c = func(1, 2)
+    assert (a, type(b), c) == (1, simple_class, default)
+
+    with pytest.raises(TypeError, match=r"func\(\) missing 1 required positional argument: 'b'"):
+        func(1)
+
+
 @pytest.fixture
 def universal_logging_decorator():
     buffer = []
@@ -6,7 +6,9 @@ import pytest
 
 from toloka.util._managing_headers import (
     add_headers,
+    aiterate_in_context,
     form_additional_headers,
+    iterate_in_context,
 )
 
 
@@ -189,3 +191,104 @@ async def test_run_in_pool_executor(executor):
         # Context objects not picklable, so it can't be used in ProcessPoolExecutor (check PEP 567)
         with pytest.raises(Exception):
             await async_wrapper(get_additional_headers)
+
+
+GENERATOR_HEADERS = {
+    'X-Caller-Context': 'GeneratorClient',
+    'X-Top-Level-Method': 'iterate_pages',
+    'X-Low-Level-Method': 'get_page_headers',
+}
+
+
+def test_decorated_generator_keeps_context():
+
+    @add_headers('TestClient')
+    def get_page_headers():
+        return form_additional_headers()
+
+    @add_headers('GeneratorClient')
+    def iterate_pages(n):
+        for _ in range(n):
+            yield get_page_headers()
+
+    @add_headers('ConsumerClient')
+    def consume(generator):
+        return list(generator)
+
+    generator = iterate_pages(3)
+    assert next(generator) == GENERATOR_HEADERS
+    assert consume(generator) == [GENERATOR_HEADERS] * 2
+    assert form_additional_headers() == {'X-Caller-Context': None, 'X-Top-Level-Method': None, 'X-Low-Level-Method': None}
+
+
+@pytest.mark.asyncio
+async def test_decorated_async_generator_keeps_context():
+
+    @add_headers('TestClient')
+    async def get_page_headers():
+        await asyncio.sleep(0)
+        return form_additional_headers()
+
+    @add_headers('GeneratorClient')
+    async def iterate_pages(n):
+        for _ in range(n):
+            yield await get_page_headers()
+
+    @add_headers('ConsumerClient')
+    async def consume(generator):
+        return [headers async for headers in generator]
+
+    generator = iterate_pages(3)
+    assert await generator.__anext__() == GENERATOR_HEADERS
+    assert await consume(generator) == [GENERATOR_HEADERS] * 2
+
+
+NO_HEADERS = {'X-Caller-Context': None, 'X-Top-Level-Method': None, 'X-Low-Level-Method': None}
+CONSUMER_HEADERS = {
+    'X-Caller-Context': 'ConsumerClient',
+    'X-Top-Level-Method': 'consume',
+    'X-Low-Level-Method': 'consume',
+}
+
+
+CAPTURED_HEADERS = {
+    'X-Caller-Context': 'GeneratorClient',
+    'X-Top-Level-Method': 'capture_context',
+    'X-Low-Level-Method': 'capture_context',
+}
+
+
+@add_headers('GeneratorClient')
+def capture_context():
+    return contextvars.copy_context()
+
+
+def test_iterate_in_context():
+
+    def iterate_headers(n):
+        for _ in range(n):
+            yield form_additional_headers()
+
+    @add_headers('ConsumerClient')
+    def consume(iterator):
+        return [(value, form_additional_headers()) for value in iterator]
+
+    # Values are taken from the iterator in the captured context and yielded in the context of the consumer
+    assert consume(iterate_in_context(capture_context(), iterate_headers(2))) == [(CAPTURED_HEADERS, CONSUMER_HEADERS)] * 2
+
+
+@pytest.mark.asyncio
+async def test_aiterate_in_context():
+
+    async def iterate_headers(n):
+        for _ in range(n):
+            await asyncio.sleep(0)
+            yield form_additional_headers()
+
+    @add_headers('ConsumerClient')
+    async def consume(iterator):
+        return [(value, form_additional_headers()) async for value in iterator]
+
+    assert await consume(aiterate_in_context(capture_context(), iterate_headers(2))) == [
+        (CAPTURED_HEADERS, CONSUMER_HEADERS)
+    ] * 2